@@ -489,6 +489,19 @@ def sync_maildir(folder: str) -> None:
     click.echo("Sync complete")
 
 
+@cli.command()
+def rebuild_index() -> None:
+    """Rebuild the message header index from the email folders.
+
+    Use this if threading or reply lookups look wrong, or the index file
+    is corrupted.
+    """
+    workspace_dir = get_workspace_dir()
+    email = AgentEmail(workspace_dir)
+    count = email.header_index.rebuild()
+    click.echo(f"Rebuilt header index: {count} messages")
+
+
 @cli.command()
 @click.option(
     "--folders",
@@ -0,0 +1,266 @@
+"""Persistent header index for the markdown email store.
+
+Threading, reply lookup, duplicate detection and unreplied scans all need the
+same handful of headers from every message. Reading and parsing every ``.md``
+file for each of those queries makes rendering a single thread
+O(thread size × mailbox size), so this module keeps the headers in a small
+SQLite database next to the email folders.
+
+The index is maintained incrementally: ``AgentEmail`` updates it whenever it
+writes, moves or syncs a message, and :meth:`HeaderIndex.refresh` reconciles it
+with the filesystem by comparing directory listings against the stored
+``(mtime, size)`` of each file. Only new or changed files are re-read, so
+files written by other tools (or by hand) are still picked up.
+:meth:`HeaderIndex.rebuild` (``gptmail rebuild-index``) recreates the index
+from scratch if it is ever corrupted.
+"""
+
+import logging
+import os
+import sqlite3
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = ".header_index.sqlite3"
+
+# Folders holding markdown messages, in lookup order
+INDEXED_FOLDERS = ("inbox", "sent", "archive", "drafts")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    folder TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    message_id TEXT,
+    in_reply_to TEXT,  -- without angle brackets
+    refs TEXT,
+    subject TEXT,
+    from_addr TEXT,
+    to_addr TEXT,
+    date TEXT,
+    body_snippet TEXT,  -- first 200 body chars, whitespace removed
+    PRIMARY KEY (folder, filename)
+);
+
+CREATE INDEX IF NOT EXISTS idx_messages_message_id ON messages(message_id);
+CREATE INDEX IF NOT EXISTS idx_messages_in_reply_to ON messages(in_reply_to);
+CREATE INDEX IF NOT EXISTS idx_messages_thread_key
+    ON messages(folder, in_reply_to, subject, to_addr);
+CREATE INDEX IF NOT EXISTS idx_messages_sender_key ON messages(folder, subject, from_addr);
+"""
+
+ParseFunc = Callable[[str], tuple[dict[str, str], str]]
+
+
+@dataclass(frozen=True)
+class HeaderRecord:
+    """Indexed headers of a single stored message.
+
+    Header fields are empty strings when the header is missing (or the file
+    could not be parsed).
+    """
+
+    folder: str
+    filename: str
+    message_id: str
+    in_reply_to: str
+    references: str
+    subject: str
+    from_addr: str
+    to_addr: str
+    date: str
+    body_snippet: str
+
+
+def _body_snippet(body: str) -> str:
+    """Normalized body prefix used for duplicate detection."""
+    return "".join(body[:200].split()) if body else ""
+
+
+class HeaderIndex:
+    """SQLite-backed index of message headers for an email directory."""
+
+    def __init__(self, email_dir: Path, parse: ParseFunc):
+        """Initialize the index.
+
+        Args:
+            email_dir: Directory containing the inbox/sent/archive/drafts folders
+            parse: Function splitting message content into (headers, body)
+        """
+        self.email_dir = Path(email_dir)
+        self.db_path = self.email_dir / INDEX_FILENAME
+        self._parse = parse
+        self._conn: sqlite3.Connection | None = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(str(self.db_path), timeout=30)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def rebuild(self) -> int:
+        """Discard the index and re-index every message from scratch.
+
+        Repairs an index that is corrupted or out of sync in a way
+        :meth:`refresh` cannot detect (e.g. files rewritten with the same
+        mtime and size).
+
+        Returns:
+            Number of indexed messages
+        """
+        self.close()
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{self.db_path}{suffix}").unlink(missing_ok=True)
+        self.refresh()
+        (count,) = self.conn.execute("SELECT COUNT(*) FROM messages").fetchone()
+        return int(count)
+
+    def _read_row(self, folder: str, path: Path, stat: os.stat_result) -> tuple:
+        """Parse a message file into a row for the messages table."""
+        headers: dict[str, str] = {}
+        body = ""
+        try:
+            headers, body = self._parse(path.read_text())
+        except Exception as e:
+            # Keep a row anyway so the file is not re-parsed until it changes
+            logger.debug(f"Error indexing {path}: {e}")
+        return (
+            folder,
+            path.name,
+            stat.st_mtime_ns,
+            stat.st_size,
+            headers.get("Message-ID", "").strip(),
+            headers.get("In-Reply-To", "").strip().strip("<>"),
+            headers.get("References", "").strip(),
+            headers.get("Subject", "").strip(),
+            headers.get("From", "").strip(),
+            headers.get("To", "").strip(),
+            headers.get("Date", "").strip(),
+            _body_snippet(body),
+        )
+
+    def _upsert(self, rows: list[tuple]) -> None:
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO messages VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+
+    def refresh(self, folders: Iterable[str] = INDEXED_FOLDERS) -> None:
+        """Reconcile the index with the files currently on disk.
+
+        Only files whose mtime or size changed since they were indexed are
+        re-read; removed files are dropped from the index.
+        """
+        with self.conn:
+            for folder in folders:
+                folder_path = self.email_dir / folder
+                known = {
+                    filename: (mtime_ns, size)
+                    for filename, mtime_ns, size in self.conn.execute(
+                        "SELECT filename, mtime_ns, size FROM messages WHERE folder = ?",
+                        (folder,),
+                    )
+                }
+                changed: list[tuple] = []
+                seen: set[str] = set()
+                if folder_path.is_dir():
+                    with os.scandir(folder_path) as entries:
+                        for entry in entries:
+                            if not entry.name.endswith(".md") or not entry.is_file():
+                                continue
+                            seen.add(entry.name)
+                            stat = entry.stat()
+                            if known.get(entry.name) != (stat.st_mtime_ns, stat.st_size):
+                                changed.append(self._read_row(folder, Path(entry.path), stat))
+                if changed:
+                    self._upsert(changed)
+                removed = [(folder, filename) for filename in known.keys() - seen]
+                if removed:
+                    self.conn.executemany(
+                        "DELETE FROM messages WHERE folder = ? AND filename = ?", removed
+                    )
+
+    def update(self, folder: str, filename: str) -> None:
+        """Index (or re-index) a single file, dropping it if it no longer exists."""
+        path = self.email_dir / folder / filename
+        with self.conn:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                self.conn.execute(
+                    "DELETE FROM messages WHERE folder = ? AND filename = ?", (folder, filename)
+                )
+                return
+            self._upsert([self._read_row(folder, path, stat)])
+
+    def remove(self, folder: str, filename: str) -> None:
+        """Drop a file from the index."""
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM messages WHERE folder = ? AND filename = ?", (folder, filename)
+            )
+
+    def records(self, folder: str) -> list[HeaderRecord]:
+        """All indexed messages in a folder."""
+        rows = self.conn.execute(
+            "SELECT folder, filename, message_id, in_reply_to, refs, subject, from_addr, "
+            "to_addr, date, body_snippet FROM messages WHERE folder = ? ORDER BY filename",
+            (folder,),
+        )
+        return [HeaderRecord(*row) for row in rows]
+
+    def find_replies(self, message_id: str) -> list[str]:
+        """Message-IDs of all messages whose In-Reply-To points at message_id."""
+        rows = self.conn.execute(
+            "SELECT folder, message_id FROM messages WHERE in_reply_to = ? AND message_id != ''",
+            (message_id.strip("<>"),),
+        )
+        order = {folder: i for i, folder in enumerate(INDEXED_FOLDERS)}
+        return [
+            reply_id for _, reply_id in sorted(rows, key=lambda row: order.get(row[0], len(order)))
+        ]
+
+    def find_duplicate_candidates(
+        self,
+        folder: str,
+        *,
+        in_reply_to: str,
+        subject: str,
+        to_addr: str,
+        from_addr: str | None = None,
+    ) -> list[HeaderRecord]:
+        """Messages in a folder that may be duplicates of an incoming message.
+
+        Matches on (In-Reply-To, Subject, To), and additionally on
+        (Subject, From) when ``from_addr`` is given.
+        """
+        query = (
+            "SELECT folder, filename, message_id, in_reply_to, refs, subject, from_addr, "
+            "to_addr, date, body_snippet FROM messages WHERE folder = ? "
+            "AND ((in_reply_to = ? AND subject = ? AND to_addr = ?)"
+        )
+        params: list[str] = [folder, in_reply_to, subject, to_addr]
+        if from_addr is not None:
+            query += " OR (subject = ? AND from_addr = ?)"
+            params += [subject, from_addr]
+        query += ") ORDER BY filename"
+        return [HeaderRecord(*row) for row in self.conn.execute(query, params)]
+
+    def reply_targets(self, folder: str) -> set[str]:
+        """In-Reply-To values (without angle brackets) of messages in a folder."""
+        rows = self.conn.execute(
+            "SELECT DISTINCT in_reply_to FROM messages WHERE folder = ? AND in_reply_to != ''",
+            (folder,),
+        )
+        return {in_reply_to for (in_reply_to,) in rows}
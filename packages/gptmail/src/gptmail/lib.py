@@ -34,11 +34,15 @@ Example:
 
 import email.charset
 import inspect
+import json
 import logging
 import os
 import re
 import subprocess
+import time
 import uuid
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from email import message_from_bytes
 from email.header import Header
@@ -54,7 +58,7 @@ from email.utils import (
     parsedate_to_datetime,
 )
 from pathlib import Path
-from typing import Any, Dict, NamedTuple, Tuple
+from typing import Any, NamedTuple
 
 import markdown
 
@@ -62,6 +66,7 @@ from gptmail.communication_utils.outbound_redact import guard_outbound
 from gptmail.communication_utils.rate_limiting.limiters import RateLimiter
 from gptmail.communication_utils.state.locks import FileLock, LockError
 from gptmail.communication_utils.state.tracking import ConversationTracker, MessageState
+from gptmail.header_index import HeaderIndex
 
 logger = logging.getLogger(__name__)
 
@@ -141,6 +146,114 @@ def fix_list_spacing(markdown_text: str) -> str:
     return "\n".join(result)
 
 
+# Headers copied from maildir messages into the markdown store
+MARKDOWN_HEADERS = [
+    "MIME-Version",
+    "From",
+    "To",
+    "Date",
+    "Subject",
+    "Message-ID",
+    "In-Reply-To",
+    "References",
+    "Content-Type",
+]
+
+# Below this many new maildir files, sync converts inline (pool startup costs more)
+SYNC_PARALLEL_THRESHOLD = 32
+
+# Maildir directory mtimes younger than this are not trusted for skipping a sync
+SYNC_MTIME_SETTLE_NS = 2_000_000_000
+
+
+def _extract_text_body(email_msg: Message, *, allow_html: bool) -> str | None:
+    """Extract the text/plain (or, if allowed, text/html) body of a message.
+
+    Returns None for multipart messages without a matching text part.
+    """
+    if email_msg.is_multipart():
+        content_types = ["text/plain", "text/html"] if allow_html else ["text/plain"]
+        text_part: Message | None = None
+        for content_type in content_types:
+            for part in email_msg.walk():
+                if part.get_content_type() == content_type:
+                    text_part = part
+                    break
+            if text_part:
+                break
+        if not text_part:
+            return None
+    else:
+        text_part = email_msg
+
+    if isinstance(text_part, EmailMessage):
+        body = text_part.get_content()
+    else:
+        body = text_part.get_payload(decode=True)
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", errors="replace")
+    elif not isinstance(body, str):
+        body = str(body)
+    return body
+
+
+def _duplicate_fields(email_msg: Message) -> dict[str, Any]:
+    """Metadata used to match a maildir message against already-stored messages."""
+    body = _extract_text_body(email_msg, allow_html=False) or ""
+    return {
+        "in_reply_to": email_msg.get("In-Reply-To", "").strip().strip("<>"),
+        "references": email_msg.get("References", "").strip(),
+        "subject": email_msg.get("Subject", "").strip(),
+        "to": email_msg.get("To", "").strip(),
+        "from": email_msg.get("From", "").strip(),
+        "date": email_msg.get("Date", "").strip(),
+        # First 200 chars of body (ignore whitespace differences)
+        "body_snippet": "".join(body[:200].split()) if body else "",
+    }
+
+
+def _convert_maildir_message(msg_path: str) -> dict[str, Any]:
+    """Parse a maildir message and convert it to the markdown storage format.
+
+    Runs in sync worker processes, so it only takes and returns plain data.
+
+    Returns:
+        Dict with message_id (None if missing), in_reply_to, the markdown
+        content and the fields used for duplicate detection.
+    """
+    msg_bytes = Path(msg_path).read_bytes()
+    email_msg = message_from_bytes(msg_bytes, policy=default)
+
+    message_id = email_msg["Message-ID"]
+    if not message_id:
+        return {"message_id": None}
+
+    headers = [f"{key}: {email_msg[key]}" for key in MARKDOWN_HEADERS if key in email_msg]
+
+    body = _extract_text_body(email_msg, allow_html=True)
+    if body is None:
+        print(f"Warning: No text content found in {message_id}")
+        body = ""
+
+    # Remove null bytes and normalize newlines
+    body = body.replace("\0", "").replace("\r\n", "\n")
+
+    return {
+        "message_id": str(message_id),
+        "in_reply_to": str(email_msg["In-Reply-To"] or ""),
+        "content": "\n".join(headers) + "\n\n" + body,
+        "duplicate_fields": _duplicate_fields(email_msg),
+    }
+
+
+def _safe_convert_maildir_message(msg_path: str) -> dict[str, Any]:
+    """``_convert_maildir_message`` that reports failures as ``{"error": ...}``."""
+    try:
+        return _convert_maildir_message(msg_path)
+    except Exception as e:
+        return {"error": str(e)}
+
+
 class UnrepliedEmail(NamedTuple):
     """Typed representation of an unreplied email.
 
@@ -177,6 +290,8 @@ class AgentEmail:
         locks_dir (Path): Directory for lock files (prevents concurrent processing).
         rate_limiter (RateLimiter): Rate limiter for email sending operations.
         tracker (ConversationTracker): Tracks reply states and conversation threads.
+        header_index (HeaderIndex): Persistent index of message headers for threading,
+            reply lookup, duplicate detection and unreplied scans.
 
     Example:
         >>> agent = AgentEmail("/home/user", "agent@example.com")
@@ -199,10 +314,6 @@ class AgentEmail:
             own_email_name: Display name for the agent's email (e.g. "Thomas, Michael's Assistant").
                       If None, will use AGENT_EMAIL_NAME environment variable (optional)
         """
-        # Clear message index cache at start of sync
-        # This ensures we rebuild the index with current state
-        self._message_index_cache: dict[str, Any] = {}
-
         self.workspace = Path(workspace_dir)
         self.email_dir = self.workspace / "email"
         # Ensure own_email is always a string - require AGENT_EMAIL env var if not provided
@@ -257,6 +368,9 @@ class AgentEmail:
         self._validate_structure()
         self._ensure_processed_state()
 
+        # Header index (created lazily on first query)
+        self.header_index = HeaderIndex(self.email_dir, self._markdown_to_email)
+
     def _validate_structure(self) -> None:
         """Ensure email directory structure exists.
 
@@ -369,39 +483,37 @@ class AgentEmail:
         unreplied_with_dates: list[tuple[datetime, str, UnrepliedEmail]] = []
         seen_message_ids: set[str] = set()  # Avoid duplicates across folders
 
+        # Headers come from the index; only candidates that pass every
+        # header-based filter are read in full (for the notification check)
+        self.header_index.refresh([*folders, "sent"])
+        # Message IDs (without brackets) that a message in sent/ replies to
+        replied_in_sent = self.header_index.reply_targets("sent")
+
         for folder in folders:
-            folder_dir = self.email_dir / folder
-            if not folder_dir.exists():
+            if not (self.email_dir / folder).exists():
                 continue
 
-            for email_file in folder_dir.glob("*.md"):
+            for record in self.header_index.records(folder):
+                email_file = self.email_dir / folder / record.filename
                 try:
-                    content = email_file.read_text()
-
-                    # Extract message details
-                    message_id_match = re.search(r"Message-ID: (<[^>]+>)", content)
-                    subject_match = re.search(r"Subject: (.+)", content)
-                    from_match = re.search(r"From: (.+)", content)
-                    to_match = re.search(r"To: (.+)", content)
-
-                    if not (message_id_match and subject_match and from_match):
+                    message_id_match = re.search(r"<[^>]+>", record.message_id)
+                    if not (message_id_match and record.subject and record.from_addr):
                         continue
 
-                    message_id = message_id_match.group(1)
+                    message_id = message_id_match.group(0)
 
                     # Skip if we've already seen this message in another folder
                     if message_id in seen_message_ids:
                         continue
                     seen_message_ids.add(message_id)
 
-                    subject = subject_match.group(1)
-                    date_match = re.search(r"Date: (.+)", content)
-                    from_line = from_match.group(1)
+                    subject = record.subject
+                    from_line = record.from_addr
 
                     # Skip if not addressed to the agent's email
                     # (only process emails sent TO the agent, not CC'd or other recipients)
-                    if to_match and self.own_emails:
-                        to_line = to_match.group(1)
+                    if record.to_addr and self.own_emails:
+                        to_line = record.to_addr
                         to_addrs = {addr.lower() for _, addr in getaddresses([to_line]) if addr}
                         if to_addrs:
                             is_addressed_to_agent = bool(to_addrs.intersection(self.own_emails))
@@ -429,27 +541,17 @@ class AgentEmail:
                     if not self._is_allowlisted_sender(sender):
                         continue
 
-                    # Skip notification-type emails that don't need replies
-                    if self._is_notification_email(subject, content):
+                    # Skip if we already replied to this email
+                    # (a message in sent has In-Reply-To pointing to this message)
+                    if message_id.strip("<>") in replied_in_sent:
                         continue
 
-                    # Skip if we already replied to this email
-                    # (check sent folder for In-Reply-To pointing to this message)
-                    sent_dir = self.email_dir / "sent"
-                    already_replied = False
-                    for sent_file in sent_dir.glob("*.md"):
-                        try:
-                            sent_content = sent_file.read_text()
-                            if f"In-Reply-To: {message_id}" in sent_content:
-                                already_replied = True
-                                break
-                        except Exception:
-                            continue
-                    if already_replied:
+                    # Skip notification-type emails that don't need replies
+                    if self._is_notification_email(subject, email_file.read_text()):
                         continue
 
                     sort_date = self._parse_email_date(
-                        date_match.group(1) if date_match else "",
+                        record.date,
                         invalid_default=datetime.min.replace(tzinfo=timezone.utc),
                     )
                     unreplied_with_dates.append(
@@ -797,6 +899,7 @@ class AgentEmail:
         filename = self._format_filename(message_id)
         draft_path = self.email_dir / "drafts" / filename
         draft_path.write_text(message)
+        self.header_index.update("drafts", filename)
 
         return message_id
 
@@ -974,6 +1077,8 @@ class AgentEmail:
 
         # Move markdown file to sent folder (only after successful sending)
         draft_path.rename(sent_path)
+        self.header_index.remove("drafts", filename)
+        self.header_index.update("sent", filename)
 
         # If this is a reply, mark the original message as replied to
         headers, _ = self._markdown_to_email(content)
@@ -1006,6 +1111,7 @@ class AgentEmail:
         filename = self._format_filename(message_id)
         inbox_path = self.email_dir / "inbox" / filename
         inbox_path.write_text(message_data)
+        self.header_index.update("inbox", filename)
 
         return message_id
 
@@ -1018,16 +1124,13 @@ class AgentEmail:
         filename = self._format_filename(message_id)
 
         # Check inbox, sent, and drafts folders
-        source_paths = [
-            self.email_dir / "inbox" / filename,
-            self.email_dir / "sent" / filename,
-            self.email_dir / "drafts" / filename,
-        ]
-
-        for source_path in source_paths:
+        for source_folder in ["inbox", "sent", "drafts"]:
+            source_path = self.email_dir / source_folder / filename
             if source_path.exists():
                 archive_path = self.email_dir / "archive" / filename
                 source_path.rename(archive_path)
+                self.header_index.remove(source_folder, filename)
+                self.header_index.update("archive", filename)
                 print(f"Message {message_id} archived")
                 return
 
@@ -1101,6 +1204,9 @@ class AgentEmail:
         Returns:
             List of message dicts with id, headers, body, timestamp, and folder
         """
+        # Reply lookups below are served from the header index
+        self.header_index.refresh()
+
         # Find the root of the thread by following In-Reply-To chains backward
         thread_root = self._find_thread_root(message_id)
 
@@ -1186,34 +1292,11 @@ class AgentEmail:
             pass
 
     def _find_replies_to(self, message_id: str) -> list[str]:
-        """Find all messages that reply to the given message ID."""
-        replies = []
-
-        # Search all folders for messages with In-Reply-To pointing to message_id
-        folders = ["inbox", "sent", "archive", "drafts"]
-        for folder in folders:
-            folder_path = self.email_dir / folder
-            if not folder_path.exists():
-                continue
-
-            for email_file in folder_path.glob("*.md"):
-                try:
-                    content = email_file.read_text()
-                    headers, _ = self._markdown_to_email(content)
+        """Find all messages that reply to the given message ID.
 
-                    in_reply_to = headers.get("In-Reply-To", "").strip().strip("<>")
-                    clean_message_id = message_id.strip("<>")
-
-                    if in_reply_to == clean_message_id:
-                        reply_id = headers.get("Message-ID", "")
-                        if reply_id:
-                            replies.append(reply_id)
-
-                except Exception:
-                    logger.warning(f"Error processing {email_file} for replies")
-                    continue
-
-        return replies
+        Uses the header index; callers should refresh it first.
+        """
+        return self.header_index.find_replies(message_id)
 
     def _find_message_folder(self, message_id: str) -> str:
         """Find which folder a message is stored in."""
@@ -1384,92 +1467,7 @@ class AgentEmail:
             return "gmail"
         return None  # Use default account
 
-    def _build_message_index(self, folder: str) -> Dict[str, Dict]:
-        """Build an index of existing messages for fast duplicate detection.
-
-        This eliminates the O(n²) problem by reading all existing messages once
-        and building an in-memory index for O(1) lookups.
-
-        Args:
-            folder: The folder to index (inbox or sent)
-
-        Returns:
-            Dict mapping message keys to metadata for comparison
-        """
-        index = {}
-        folder_path = self.email_dir / folder
-
-        for existing_file in folder_path.glob("*.md"):
-            try:
-                content = existing_file.read_text()
-                headers, existing_body = self._markdown_to_email(content)
-
-                # Extract key metadata for comparison
-                in_reply_to = headers.get("In-Reply-To", "").strip().strip("<>")
-                references = headers.get("References", "").strip()
-                subject = headers.get("Subject", "").strip()
-                to_addr = headers.get("To", "").strip()
-                from_addr = headers.get("From", "").strip()
-                date_str = headers.get("Date", "").strip()
-
-                # Parse date
-                try:
-                    msg_date = self._parse_email_date(date_str)
-                except Exception:
-                    msg_date = None
-
-                # Get body snippet (first 200 chars, normalized)
-                body_snippet = "".join(existing_body[:200].split()) if existing_body else ""
-
-                # Create composite key from strong identifiers
-                # Use In-Reply-To + Subject as primary key (most reliable for matching)
-                key = f"{in_reply_to}|{subject}|{to_addr}"
-
-                # Store metadata for comparison
-                index[key] = {
-                    "in_reply_to": in_reply_to,
-                    "references": references,
-                    "subject": subject,
-                    "to": to_addr,
-                    "from": from_addr,
-                    "date": msg_date,
-                    "body_snippet": body_snippet,
-                    "file": existing_file,
-                }
-
-                # Also index by subject+from for inbox messages
-                if folder == "inbox":
-                    alt_key = f"{subject}|{from_addr}"
-                    if alt_key not in index:  # Don't overwrite if exists
-                        index[alt_key] = index[key]
-
-            except Exception as e:
-                logger.debug(f"Error indexing {existing_file}: {e}")
-                continue
-
-        logger.debug(f"Built message index for {folder}: {len(index)} entries")
-        return index
-
-    def _get_message_key(self, email_msg: EmailMessage, folder: str) -> Tuple[str, str | None]:
-        """Get indexing keys for a message.
-
-        Args:
-            email_msg: The message to get keys for
-            folder: The folder context (inbox or sent)
-
-        Returns:
-            Tuple of (primary_key, alt_key)
-        """
-        in_reply_to = email_msg.get("In-Reply-To", "").strip().strip("<>")
-        subject = email_msg.get("Subject", "").strip()
-        to_addr = email_msg.get("To", "").strip()
-        from_addr = email_msg.get("From", "").strip()
-
-        primary_key = f"{in_reply_to}|{subject}|{to_addr}"
-        alt_key = f"{subject}|{from_addr}" if folder == "inbox" else None
-        return primary_key, alt_key
-
-    def _is_duplicate_message(self, email_msg: EmailMessage, folder: str) -> bool:
+    def _is_duplicate_message(self, email_msg: Message, folder: str) -> bool:
         """Check if a message is a duplicate based on content/metadata.
 
         This prevents duplicates when Gmail assigns a different Message-ID to sent emails.
@@ -1481,63 +1479,44 @@ class AgentEmail:
         Returns:
             True if a duplicate is found, False otherwise
         """
-        # Build index if not already built (happens once per sync)
-        if not hasattr(self, "_message_index_cache"):
-            self._message_index_cache = {}
+        return self._matches_existing_message(_duplicate_fields(email_msg), folder)
 
-        if folder not in self._message_index_cache:
-            self._message_index_cache[folder] = self._build_message_index(folder)
+    def _matches_existing_message(self, fields: dict[str, Any], folder: str) -> bool:
+        """Check duplicate-detection fields against messages already in a folder.
 
-        index = self._message_index_cache[folder]
+        Candidates are looked up in the persistent header index by the same
+        keys the old in-memory index used (In-Reply-To + Subject + To, and
+        Subject + From for inbox), so no message files are read. The caller
+        is responsible for refreshing the index.
 
-        # Extract key metadata for comparison
-        in_reply_to = email_msg.get("In-Reply-To", "").strip().strip("<>")
-        references = email_msg.get("References", "").strip()
-        subject = email_msg.get("Subject", "").strip()
-        to_addr = email_msg.get("To", "").strip()
-        from_addr = email_msg.get("From", "").strip()
-        date_str = email_msg.get("Date", "").strip()
+        Args:
+            fields: Output of ``_duplicate_fields`` for the incoming message
+            folder: The folder to check in (inbox or sent)
+        """
+        in_reply_to = fields["in_reply_to"]
+        references = fields["references"]
+        subject = fields["subject"]
+        to_addr = fields["to"]
+        from_addr = fields["from"]
+        body_snippet = fields["body_snippet"]
 
         # Parse date for comparison (allow 2 minute window for clock differences)
         try:
-            msg_date = self._parse_email_date(date_str)
+            msg_date = self._parse_email_date(fields["date"])
         except Exception:
             msg_date = None
 
-        # Get message body for content comparison
-        if email_msg.is_multipart():
-            body = ""
-            for part in email_msg.walk():
-                if part.get_content_type() == "text/plain":
-                    content = (
-                        part.get_content()
-                        if isinstance(part, EmailMessage)
-                        else part.get_payload(decode=True)
-                    )
-                    if isinstance(content, bytes):
-                        content = content.decode("utf-8", errors="replace")
-                    body = content
-                    break
-        else:
-            body = (
-                email_msg.get_content()
-                if isinstance(email_msg, EmailMessage)
-                else email_msg.get_payload(decode=True)
-            )
-            if isinstance(body, bytes):
-                body = body.decode("utf-8", errors="replace")
-
-        # Get first 200 chars of body for comparison (ignore whitespace differences)
-        body_snippet = "".join(body[:200].split()) if body else ""
-
-        # Check index for potential duplicates using keys
-        primary_key, alt_key = self._get_message_key(email_msg, folder)
+        candidates = self.header_index.find_duplicate_candidates(
+            folder,
+            in_reply_to=in_reply_to,
+            subject=subject,
+            to_addr=to_addr,
+            from_addr=from_addr if folder == "inbox" else None,
+        )
 
-        candidates = []
-        if primary_key in index:
-            candidates.append(index[primary_key])
-        if alt_key and alt_key in index:
-            candidates.append(index[alt_key])
+        def normalize_addr(addr):
+            """Normalize email address by removing quotes and extra whitespace."""
+            return addr.strip().strip('"').strip()
 
         # Check each candidate for actual duplicate
         for existing in candidates:
@@ -1545,39 +1524,32 @@ class AgentEmail:
             matches = []
 
             # For sent emails, In-Reply-To and References are strong indicators
-            if in_reply_to and existing["in_reply_to"] == in_reply_to:
+            if in_reply_to and existing.in_reply_to == in_reply_to:
                 matches.append("in_reply_to")
 
-            if references and existing["references"] == references:
+            if references and existing.references == references:
                 matches.append("references")
 
             # Subject match (exact)
-            if subject and existing["subject"] == subject:
+            if subject and existing.subject == subject:
                 matches.append("subject")
 
             # To/From match (normalize by removing quotes and extra whitespace)
-            def normalize_addr(addr):
-                """Normalize email address by removing quotes and extra whitespace."""
-                return addr.strip().strip('"').strip()
-
-            if to_addr and normalize_addr(existing["to"]) == normalize_addr(to_addr):
+            if to_addr and normalize_addr(existing.to_addr) == normalize_addr(to_addr):
                 matches.append("to")
 
-            if from_addr and normalize_addr(existing["from"]) == normalize_addr(from_addr):
+            if from_addr and normalize_addr(existing.from_addr) == normalize_addr(from_addr):
                 matches.append("from")
 
             # Date match (within 2 minutes)
-            if msg_date and existing["date"]:
-                time_diff = abs((msg_date - existing["date"]).total_seconds())
+            existing_date = self._parse_email_date(existing.date)
+            if msg_date and existing_date:
+                time_diff = abs((msg_date - existing_date).total_seconds())
                 if time_diff < 120:  # 2 minutes
                     matches.append("date")
 
             # Body content match (first 200 chars, normalized)
-            if (
-                body_snippet
-                and existing["body_snippet"]
-                and body_snippet == existing["body_snippet"]
-            ):
+            if body_snippet and existing.body_snippet and body_snippet == existing.body_snippet:
                 matches.append("body")
 
             # Consider it a duplicate if we have strong matches
@@ -1616,8 +1588,6 @@ class AgentEmail:
         """Load set of already-processed maildir filenames."""
         state_path = self._get_sync_state_path(folder)
         if state_path.exists():
-            import json
-
             try:
                 with open(state_path) as f:
                     data = json.load(f)
@@ -1659,15 +1629,37 @@ class AgentEmail:
             return pruned
         return processed_files
 
-    def _save_sync_state(self, folder: str, processed_files: set[str]) -> None:
-        """Atomically save the processed maildir filenames."""
-        import json
+    def _load_sync_dir_mtimes(self, folder: str) -> dict[str, int]:
+        """Load maildir cur/new directory mtimes recorded by the last sync."""
+        state_path = self._get_sync_state_path(folder)
+        try:
+            with open(state_path) as f:
+                return dict(json.load(f).get("dir_mtimes", {}))
+        except (json.JSONDecodeError, OSError, AttributeError, TypeError, ValueError):
+            return {}
+
+    def _save_sync_state(
+        self,
+        folder: str,
+        processed_files: set[str],
+        dir_mtimes: dict[str, int] | None = None,
+    ) -> None:
+        """Atomically save the processed maildir filenames.
 
+        Args:
+            folder: Folder the state belongs to
+            processed_files: Normalized maildir filenames already handled
+            dir_mtimes: Optional cur/new directory mtimes (ns) observed before
+                listing; lets the next sync skip unchanged directories entirely
+        """
         state_path = self._get_sync_state_path(folder)
         temp_path = state_path.with_name(f".{state_path.name}.{uuid.uuid4().hex}.tmp")
+        data: dict[str, Any] = {"processed_files": sorted(processed_files)}
+        if dir_mtimes is not None:
+            data["dir_mtimes"] = dir_mtimes
         try:
             with open(temp_path, "w") as f:
-                json.dump({"processed_files": sorted(processed_files)}, f)
+                json.dump(data, f)
             os.replace(temp_path, state_path)
         except OSError as e:
             temp_path.unlink(missing_ok=True)
@@ -1685,10 +1677,15 @@ class AgentEmail:
         This imports emails from the external maildir (e.g., Gmail via mbsync)
         into the workspace storage as markdown files.
 
-        Optimized for incremental sync: tracks which maildir files have been
-        processed to avoid re-reading unchanged files on subsequent syncs.
-        For large mailboxes (10k+ emails), this reduces sync time from 60-90s
-        to under 5s when no new mail.
+        Optimized for incremental sync:
+        - The mtimes of the maildir cur/ and new/ directories are recorded; if
+          neither changed since the last sync, nothing is listed or read.
+        - Maildir filenames already processed (tracked in the sync state) are
+          skipped without being read.
+        - New messages are parsed and converted on a process pool when there
+          are enough of them to amortize the startup cost.
+        - Duplicate detection queries the persistent header index instead of
+          rebuilding an in-memory index of the folder on every sync.
 
         Args:
             folder: Folder to sync - supports "inbox" and "sent" (configure via MAILDIR_INBOX/MAILDIR_SENT env vars)
@@ -1712,8 +1709,28 @@ class AgentEmail:
         skipped = 0
         already_processed = 0
 
-        # OPTIMIZATION 1: Load sync state to skip already-processed files
+        # OPTIMIZATION 1: Skip the whole sync if cur/ and new/ are unchanged.
+        # Any delivery, flag change or new->cur move renames a file in one of
+        # them and bumps its mtime. Mtimes are captured before listing so a
+        # message delivered mid-sync is picked up next time. A very recent
+        # mtime is not trusted (recorded as -1): a delivery within the same
+        # timestamp tick would otherwise leave it unchanged.
+        dir_mtimes: dict[str, int] = {}
+        settled_before = time.time_ns() - SYNC_MTIME_SETTLE_NS
+        for subdir in ["cur", "new"]:
+            try:
+                mtime_ns = (maildir_folder / subdir).stat().st_mtime_ns
+            except FileNotFoundError:
+                continue
+            dir_mtimes[subdir] = mtime_ns if mtime_ns < settled_before else -1
         processed_files = self._load_sync_state(folder)
+        if (
+            processed_files
+            and -1 not in dir_mtimes.values()
+            and dir_mtimes == self._load_sync_dir_mtimes(folder)
+        ):
+            print(f"Synced {folder}: maildir unchanged since last sync")
+            return
         initial_processed_count = len(processed_files)
 
         # OPTIMIZATION 2: Pre-load existing markdown filenames into a set
@@ -1722,174 +1739,142 @@ class AgentEmail:
         save_dir.mkdir(parents=True, exist_ok=True)
         existing_files = {f.name for f in save_dir.glob("*.md")}
 
-        # Process messages in both cur/ (read) and new/ (unread) directories
+        # Collect new messages in both cur/ (read) and new/ (unread) directories
+        pending: list[tuple[Path, str, str]] = []  # (path, normalized name, flags)
         for subdir in ["cur", "new"]:
             subdir_path = maildir_folder / subdir
             if not subdir_path.exists():
                 continue
 
-            for msg_path in subdir_path.glob("*"):
+            for msg_path in sorted(subdir_path.glob("*")):
                 if msg_path.name == ".gitkeep":
                     continue
 
-                # OPTIMIZATION 1: Skip already-processed maildir files entirely
-                # This avoids reading/parsing 11k files on subsequent syncs
+                # Skip already-processed maildir files entirely
                 # Normalize filename by stripping flags (files move from new/ to cur/ with flags like :2,S)
                 maildir_filename = msg_path.name.split(":")[0]
                 if maildir_filename in processed_files:
                     already_processed += 1
                     continue
 
-                try:
-                    # Parse flags from filename (only relevant for cur/)
-                    flags = ""
-                    if subdir == "cur" and ":" in msg_path.name:
-                        _, flags = msg_path.name.split(":", 1)
-
-                    # Read message with proper policy
-                    msg_bytes = msg_path.read_bytes()
-                    email_msg = message_from_bytes(msg_bytes, policy=default)
-
-                    # Get Message-ID
-                    message_id = email_msg["Message-ID"]
-                    if not message_id:
-                        print(f"Warning: No Message-ID in {msg_path}")
-                        failed += 1
-                        # Still mark as processed to avoid re-trying
-                        processed_files.add(maildir_filename)
-                        continue
-
-                    # Check if we already have this message in any folder
-                    filename = self._format_filename(message_id)
-                    filename = filename.replace("/", "_")
+                # Parse flags from filename (only relevant for cur/)
+                flags = ""
+                if subdir == "cur" and ":" in msg_path.name:
+                    _, flags = msg_path.name.split(":", 1)
+                pending.append((msg_path, maildir_filename, flags))
+
+        if pending:
+            # Duplicate checks below are served from the header index
+            self.header_index.refresh([folder])
+
+        # OPTIMIZATION 3: Parse and convert new messages in parallel. Results
+        # come back in submission order, so writes stay deterministic.
+        paths = [str(msg_path) for msg_path, _, _ in pending]
+        if len(pending) >= SYNC_PARALLEL_THRESHOLD:
+            with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, 8)) as pool:
+                results = pool.map(_safe_convert_maildir_message, paths, chunksize=16)
+                success, failed, skipped = self._store_converted(
+                    folder, pending, results, existing_files, processed_files
+                )
+        else:
+            results = map(_safe_convert_maildir_message, paths)
+            success, failed, skipped = self._store_converted(
+                folder, pending, results, existing_files, processed_files
+            )
 
-                    # OPTIMIZATION 2: Use pre-loaded set instead of filesystem check
-                    md_path = save_dir / filename
+        # Prune stale entries and save sync state for incremental optimization
+        processed_files = self._prune_sync_state(folder, processed_files, maildir_folder)
+        mtimes_changed = dir_mtimes != self._load_sync_dir_mtimes(folder)
+        if len(processed_files) != initial_processed_count or mtimes_changed:
+            self._save_sync_state(folder, processed_files, dir_mtimes)
 
-                    if filename in existing_files:
-                        skipped += 1
-                        # Mark as processed so we don't re-check next time
-                        processed_files.add(maildir_filename)
-                        continue
+        # Report results with optimization stats
+        if already_processed > 0:
+            print(
+                f"Synced {folder}: {success} new, {failed} failed, {skipped} skipped (already exist), "
+                f"{already_processed} skipped (previously synced)"
+            )
+        else:
+            print(
+                f"Synced {folder}: {success} succeeded, {failed} failed, {skipped} skipped (already exist)"
+            )
 
-                    # Check for duplicates by content/metadata (prevents Gmail Message-ID reassignment duplicates)
-                    if self._is_duplicate_message(email_msg, folder):
-                        skipped += 1
-                        # Mark as processed to avoid re-checking on next sync
-                        processed_files.add(maildir_filename)
-                        print(
-                            f"Skipping duplicate message (different Message-ID): {message_id[:50]}..."
-                        )
-                        continue
+    def _store_converted(
+        self,
+        folder: str,
+        pending: list[tuple[Path, str, str]],
+        results: Iterable[dict[str, Any]],
+        existing_files: set[str],
+        processed_files: set[str],
+    ) -> tuple[int, int, int]:
+        """Write converted maildir messages to the markdown store.
 
-                    # Convert to markdown format
-                    headers = []
-                    for key in [
-                        "MIME-Version",
-                        "From",
-                        "To",
-                        "Date",
-                        "Subject",
-                        "Message-ID",
-                        "In-Reply-To",
-                        "References",
-                        "Content-Type",
-                    ]:
-                        if key in email_msg:
-                            headers.append(f"{key}: {email_msg[key]}")
-
-                    # Handle multipart messages
-                    if email_msg.is_multipart():
-                        # Try to find text/plain part first
-                        text_part: Message | None = None
-                        for part in email_msg.walk():
-                            if part.get_content_type() == "text/plain":
-                                text_part = part
-                                break
-
-                        # If no text/plain, try text/html
-                        if not text_part:
-                            for part in email_msg.walk():
-                                if part.get_content_type() == "text/html":
-                                    text_part = part
-                                    break
-
-                        if text_part:
-                            if isinstance(text_part, EmailMessage):
-                                body = text_part.get_content()
-                            else:
-                                body = text_part.get_payload(decode=True)
-                                if isinstance(body, bytes):
-                                    body = body.decode("utf-8", errors="replace")
-                        else:
-                            print(f"Warning: No text content found in {message_id}")
-                            body = ""
-                    else:
-                        # Single part message
-                        if isinstance(email_msg, EmailMessage):
-                            body = email_msg.get_content()
-                        else:
-                            body = email_msg.get_payload(decode=True)
-                            if isinstance(body, bytes):
-                                body = body.decode("utf-8", errors="replace")
+        Args:
+            folder: Destination folder
+            pending: (maildir path, normalized filename, flags) per message
+            results: Output of ``_safe_convert_maildir_message`` in the same order
+            existing_files: Markdown filenames already in the folder (updated in place)
+            processed_files: Sync state set (updated in place)
 
-                    # Ensure body is a string
-                    if isinstance(body, bytes):
-                        body = body.decode("utf-8", errors="replace")
-                    elif not isinstance(body, str):
-                        body = str(body)
+        Returns:
+            Tuple of (succeeded, failed, skipped) counts
+        """
+        success = 0
+        failed = 0
+        skipped = 0
+        save_dir = self.email_dir / folder
 
-                    # Remove null bytes and normalize newlines
-                    body = body.replace("\0", "").replace("\r\n", "\n")
+        for (msg_path, maildir_filename, flags), result in zip(pending, results):
+            # Every outcome marks the file as processed to avoid re-trying it
+            processed_files.add(maildir_filename)
 
-                    # Combine into markdown format
-                    content = "\n".join(headers) + "\n\n" + body
+            if "error" in result:
+                print(f"Error processing {msg_path}: {result['error']}")
+                failed += 1
+                continue
 
-                    # Ensure the directory exists
-                    save_dir.mkdir(parents=True, exist_ok=True)
+            message_id = result["message_id"]
+            if not message_id:
+                print(f"Warning: No Message-ID in {msg_path}")
+                failed += 1
+                continue
 
-                    # Save the file
-                    md_path = save_dir / filename
-                    md_path.write_text(content)
-                    success += 1
+            try:
+                # Check if we already have this message (pre-loaded set instead of filesystem check)
+                filename = self._format_filename(message_id)
+                if filename in existing_files:
+                    skipped += 1
+                    continue
 
-                    # Track successful sync for incremental optimization
-                    processed_files.add(maildir_filename)
-                    existing_files.add(filename)
+                # Check for duplicates by content/metadata (prevents Gmail Message-ID reassignment duplicates)
+                if self._matches_existing_message(result["duplicate_fields"], folder):
+                    skipped += 1
+                    print(
+                        f"Skipping duplicate message (different Message-ID): {message_id[:50]}..."
+                    )
+                    continue
 
-                    # Store flags for future use
-                    if flags:
-                        print(f"Found flags for {message_id}: {flags}")
+                md_path = save_dir / filename
+                md_path.write_text(result["content"])
+                self.header_index.update(folder, filename)
+                existing_files.add(filename)
+                success += 1
 
-                    # For sent emails, extract In-Reply-To to mark original as replied
-                    if folder == "sent" and "In-Reply-To" in email_msg:
-                        in_reply_to = email_msg["In-Reply-To"]
-                        if in_reply_to:
-                            self._mark_replied(in_reply_to, message_id)
-                            print(f"Marked {in_reply_to} as replied by {message_id}")
+                # Store flags for future use
+                if flags:
+                    print(f"Found flags for {message_id}: {flags}")
 
-                except Exception as e:
-                    print(f"Error processing {msg_path}: {e}")
-                    failed += 1
-                    # Still mark as processed to avoid re-trying on next sync
-                    processed_files.add(maildir_filename)
-                    continue
+                # For sent emails, extract In-Reply-To to mark original as replied
+                in_reply_to = result["in_reply_to"]
+                if folder == "sent" and in_reply_to:
+                    self._mark_replied(in_reply_to, message_id)
+                    print(f"Marked {in_reply_to} as replied by {message_id}")
 
-        # Prune stale entries and save sync state for incremental optimization
-        processed_files = self._prune_sync_state(folder, processed_files, maildir_folder)
-        if len(processed_files) != initial_processed_count:
-            self._save_sync_state(folder, processed_files)
+            except Exception as e:
+                print(f"Error processing {msg_path}: {e}")
+                failed += 1
 
-        # Report results with optimization stats
-        if already_processed > 0:
-            print(
-                f"Synced {folder}: {success} new, {failed} failed, {skipped} skipped (already exist), "
-                f"{already_processed} skipped (previously synced)"
-            )
-        else:
-            print(
-                f"Synced {folder}: {success} succeeded, {failed} failed, {skipped} skipped (already exist)"
-            )
+        return success, failed, skipped
 
     def export_to_maildir(self, folder: str, dest_maildir: Path) -> dict[str, int | str]:
         """Export messages from markdown format to maildir.
@@ -0,0 +1,148 @@
+"""Tests for the persistent header index used for threading and reply lookup."""
+
+import os
+import sqlite3
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+import gptmail.cli as gptmail_cli
+from gptmail.header_index import HeaderIndex
+from gptmail.lib import AgentEmail
+
+
+@pytest.fixture
+def agent(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> AgentEmail:
+    email_dir = tmp_path / "email"
+    for subdir in ["inbox", "sent", "archive", "drafts", "filters"]:
+        (email_dir / subdir).mkdir(parents=True, exist_ok=True)
+    monkeypatch.setenv("EMAIL_ALLOWLIST", "friend@example.com")
+    return AgentEmail(str(tmp_path), "test@example.com")
+
+
+def _message(message_id: str, subject: str, in_reply_to: str | None = None) -> str:
+    lines = [
+        "From: Friend <friend@example.com>",
+        "To: test@example.com",
+        "Date: Sat, 16 May 2026 10:00:00 +0000",
+        f"Subject: {subject}",
+        f"Message-ID: {message_id}",
+    ]
+    if in_reply_to:
+        lines.append(f"In-Reply-To: {in_reply_to}")
+    return "\n".join(lines) + "\n\nBody\n"
+
+
+def test_refresh_only_reparses_changed_files(agent: AgentEmail) -> None:
+    inbox = agent.email_dir / "inbox"
+    (inbox / "a.md").write_text(_message("<a@example.com>", "A"))
+    (inbox / "b.md").write_text(_message("<b@example.com>", "B"))
+
+    parsed: list[str] = []
+
+    def counting_parse(content: str) -> tuple[dict[str, str], str]:
+        parsed.append(content)
+        return agent._markdown_to_email(content)
+
+    index = HeaderIndex(agent.email_dir, counting_parse)
+    index.refresh(["inbox"])
+    assert len(parsed) == 2
+
+    index.refresh(["inbox"])
+    assert len(parsed) == 2
+
+    # Modify one file, add one, delete one
+    (inbox / "a.md").write_text(_message("<a@example.com>", "A (edited)"))
+    os.utime(inbox / "a.md", ns=(0, 1))
+    (inbox / "c.md").write_text(_message("<c@example.com>", "C"))
+    (inbox / "b.md").unlink()
+    index.refresh(["inbox"])
+
+    assert len(parsed) == 4
+    assert [(r.filename, r.subject) for r in index.records("inbox")] == [
+        ("a.md", "A (edited)"),
+        ("c.md", "C"),
+    ]
+
+
+def test_thread_uses_index_for_replies(agent: AgentEmail) -> None:
+    root = "<root@example.com>"
+    agent.email_dir.joinpath("inbox", agent._format_filename(root)).write_text(
+        _message(root, "Root")
+    )
+    agent.email_dir.joinpath("sent", agent._format_filename("<r1@example.com>")).write_text(
+        _message("<r1@example.com>", "Re: Root", in_reply_to=root)
+    )
+    agent.email_dir.joinpath("archive", agent._format_filename("<r2@example.com>")).write_text(
+        _message("<r2@example.com>", "Re: Re: Root", in_reply_to="<r1@example.com>")
+    )
+
+    thread = agent.get_thread_messages("<r2@example.com>")
+
+    assert [m["id"] for m in thread] == [root, "<r1@example.com>", "<r2@example.com>"]
+    assert agent.header_index.find_replies(root) == ["<r1@example.com>"]
+
+
+def test_receive_and_archive_update_index(agent: AgentEmail) -> None:
+    message_id = agent.receive(_message("<new@example.com>", "New"))
+    filename = agent._format_filename(message_id)
+    assert [r.filename for r in agent.header_index.records("inbox")] == [filename]
+
+    agent.archive(message_id)
+
+    assert agent.header_index.records("inbox") == []
+    assert [r.filename for r in agent.header_index.records("archive")] == [filename]
+
+
+def test_unreplied_skips_messages_replied_in_sent(agent: AgentEmail) -> None:
+    inbox = agent.email_dir / "inbox"
+    (inbox / "answered.md").write_text(_message("<answered@example.com>", "Answered"))
+    (inbox / "open.md").write_text(_message("<open@example.com>", "Open"))
+    (agent.email_dir / "sent" / "reply.md").write_text(
+        _message("<reply@example.com>", "Re: Answered", in_reply_to="<answered@example.com>")
+    )
+
+    unreplied = agent.get_unreplied_emails()
+
+    assert [e.message_id for e in unreplied] == ["<open@example.com>"]
+
+
+def test_rebuild_repairs_corrupted_index(agent: AgentEmail) -> None:
+    inbox = agent.email_dir / "inbox"
+    (inbox / "a.md").write_text(_message("<a@example.com>", "A"))
+    (inbox / "b.md").write_text(_message("<b@example.com>", "B", in_reply_to="<a@example.com>"))
+    agent.header_index.refresh()
+    agent.header_index.close()
+
+    agent.header_index.db_path.write_bytes(b"not a sqlite database" * 100)
+    with pytest.raises(sqlite3.DatabaseError):
+        agent.header_index.refresh()
+
+    assert agent.header_index.rebuild() == 2
+    assert [r.subject for r in agent.header_index.records("inbox")] == ["A", "B"]
+    assert agent.header_index.find_replies("<a@example.com>") == ["<b@example.com>"]
+
+
+def test_rebuild_index_cli_fixes_stale_rows(
+    agent: AgentEmail, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    inbox = agent.email_dir / "inbox"
+    path = inbox / "a.md"
+    path.write_text(_message("<a@example.com>", "Old"))
+    agent.header_index.refresh()
+    st = path.stat()
+
+    # Same size and mtime: refresh() cannot tell the file changed
+    path.write_text(_message("<a@example.com>", "New"))
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    agent.header_index.refresh()
+    assert [r.subject for r in agent.header_index.records("inbox")] == ["Old"]
+    agent.header_index.close()
+
+    monkeypatch.setenv("AGENT_EMAIL", "test@example.com")
+    monkeypatch.setattr(gptmail_cli, "get_workspace_dir", lambda: agent.email_dir.parent)
+    result = CliRunner().invoke(gptmail_cli.cli, ["rebuild-index"])
+    assert result.exit_code == 0, result.output
+    assert "Rebuilt header index: 1 messages" in result.output
+    assert [r.subject for r in agent.header_index.records("inbox")] == ["New"]
@@ -0,0 +1,93 @@
+"""Tests for incremental maildir sync."""
+
+import os
+from email.message import EmailMessage
+from pathlib import Path
+
+import pytest
+
+import gptmail.lib
+from gptmail.lib import AgentEmail
+
+
+@pytest.fixture
+def maildir(tmp_path: Path) -> Path:
+    path = tmp_path / "maildir" / "INBOX"
+    for subdir in ["cur", "new", "tmp"]:
+        (path / subdir).mkdir(parents=True)
+    return path
+
+
+@pytest.fixture
+def agent(tmp_path: Path, maildir: Path, monkeypatch: pytest.MonkeyPatch) -> AgentEmail:
+    for subdir in ["inbox", "sent", "archive", "drafts", "filters"]:
+        (tmp_path / "email" / subdir).mkdir(parents=True, exist_ok=True)
+    monkeypatch.setenv("MAILDIR_INBOX", str(maildir))
+    return AgentEmail(str(tmp_path), "test@example.com")
+
+
+def _deliver(maildir: Path, name: str, message_id: str, subject: str) -> None:
+    msg = EmailMessage()
+    msg["From"] = "Friend <friend@example.com>"
+    msg["To"] = "test@example.com"
+    msg["Date"] = "Sat, 16 May 2026 10:00:00 +0000"
+    msg["Subject"] = subject
+    msg["Message-ID"] = message_id
+    msg.set_content(f"Body of {subject}")
+    (maildir / "new" / name).write_bytes(bytes(msg))
+
+
+def test_sync_converts_new_messages(agent: AgentEmail, maildir: Path) -> None:
+    _deliver(maildir, "1.a.host", "<one@example.com>", "One")
+    _deliver(maildir, "2.b.host", "<two@example.com>", "Two")
+
+    agent.sync_from_maildir("inbox")
+
+    stored = agent.email_dir / "inbox" / agent._format_filename("<one@example.com>")
+    assert stored.exists()
+    assert "Subject: One" in stored.read_text()
+    assert "Body of One" in stored.read_text()
+    assert agent._load_sync_state("inbox") == {"1.a.host", "2.b.host"}
+
+
+def test_sync_skips_unchanged_maildir(
+    agent: AgentEmail, maildir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _deliver(maildir, "1.a.host", "<one@example.com>", "One")
+    # Backdate the maildir so its mtimes count as settled
+    for subdir in ["cur", "new"]:
+        os.utime(maildir / subdir, (1_700_000_000, 1_700_000_000))
+    agent.sync_from_maildir("inbox")
+
+    def fail_glob(self: Path, pattern: str):
+        raise AssertionError("unchanged maildir should not be listed")
+
+    monkeypatch.setattr(Path, "glob", fail_glob)
+    agent.sync_from_maildir("inbox")
+    monkeypatch.undo()
+
+    # A new delivery changes the directory mtime and is picked up
+    _deliver(maildir, "2.b.host", "<two@example.com>", "Two")
+    agent.sync_from_maildir("inbox")
+    assert (agent.email_dir / "inbox" / agent._format_filename("<two@example.com>")).exists()
+
+
+def test_sync_parallel_matches_serial(
+    agent: AgentEmail, maildir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    for i in range(6):
+        _deliver(maildir, f"{i}.x.host", f"<msg{i}@example.com>", f"Subject {i}")
+
+    agent.sync_from_maildir("inbox")
+    serial = {p.name: p.read_text() for p in (agent.email_dir / "inbox").glob("*.md")}
+
+    for path in (agent.email_dir / "inbox").glob("*.md"):
+        path.unlink()
+    agent._get_sync_state_path("inbox").unlink()
+
+    monkeypatch.setattr(gptmail.lib, "SYNC_PARALLEL_THRESHOLD", 2)
+    agent.sync_from_maildir("inbox")
+    parallel = {p.name: p.read_text() for p in (agent.email_dir / "inbox").glob("*.md")}
+
+    assert len(serial) == 6
+    assert parallel == serial
@@ -15,7 +15,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-from gptme_sessions.store import SessionStore
+from gptme_sessions.store import open_store
 
 
 # Phrases whose presence marks a progress entry as internal bookkeeping
@@ -134,7 +134,7 @@ def _journal_completion_times(journal_dir: Path) -> dict[Path, datetime]:
     workspace = journal_dir.parent.resolve()
     completion_times: dict[Path, datetime] = {}
 
-    for record in SessionStore().load_all():
+    for record in open_store().load_all():
         if not record.journal_path:
             continue
         completed_at = record.end_time or record.timestamp
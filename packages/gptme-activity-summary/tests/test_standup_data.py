@@ -254,3 +254,36 @@ class TestGetStandupContext:
         since = datetime(2026, 7, 30, tzinfo=timezone.utc)
         ctx = get_standup_context(journal, since)
         assert len(ctx.journal_summaries) == 0
+
+    def test_reads_session_records_after_sqlite_migration(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        pytest.importorskip("gptme_sessions")
+        from gptme_sessions.record import SessionRecord
+        from gptme_sessions.sqlite_store import SqliteSessionStore
+        from gptme_sessions.store import open_store
+
+        monkeypatch.delenv("GPTME_SESSIONS_BACKEND", raising=False)
+        journal = self._make_journal(
+            tmp_path,
+            [
+                {"date": "2026-07-31", "session": "s1", "summary": "old work"},
+                {"date": "2026-07-31", "session": "s2", "summary": "new work"},
+            ],
+            monkeypatch,
+        )
+        sessions_dir = tmp_path / "sessions"
+        SqliteSessionStore(sessions_dir=sessions_dir).import_jsonl(
+            sessions_dir / "session-records.jsonl"
+        )
+        # Recorded after the migration, so only the database knows s1 is old
+        open_store(sessions_dir).append(
+            SessionRecord(
+                session_id="s1",
+                journal_path="journal/2026-07-31/s1.md",
+                end_time="2026-07-31T08:00:00+00:00",
+            )
+        )
+
+        ctx = get_standup_context(journal, datetime(2026, 7, 31, 12, tzinfo=timezone.utc))
+        assert [s.summary for s in ctx.journal_summaries] == ["new work"]
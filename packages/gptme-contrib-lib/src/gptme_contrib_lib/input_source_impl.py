@@ -4,6 +4,7 @@ This module provides specific implementations for GitHub issues,
 email messages, and other external input sources.
 """
 
+import asyncio
 import json
 import subprocess
 from datetime import datetime
@@ -17,6 +18,33 @@ from .input_sources import (
     TaskCreationResult,
     TaskRequest,
 )
+from .source_index import SourceIndex, github_source_key
+
+
+async def _run_command(cmd: List[str]) -> subprocess.CompletedProcess[str]:
+    """Run a command to completion without blocking the event loop.
+
+    Args:
+        cmd: Command and arguments
+
+    Returns:
+        Completed process with decoded stdout/stderr (never raises on exit code)
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    stdout, stderr = await proc.communicate()
+    return subprocess.CompletedProcess(
+        cmd,
+        proc.returncode if proc.returncode is not None else -1,
+        stdout.decode(errors="replace"),
+        stderr.decode(errors="replace"),
+    )
+
+
+def _tasks_dir(config: Dict[str, Any]) -> Path:
+    """Tasks directory of the workspace an input source writes to."""
+    return Path(config.get("workspace_path", get_workspace_path())) / "tasks"
 
 
 class GitHubInputSource(InputSource):
@@ -55,10 +83,9 @@ class GitHubInputSource(InputSource):
             "number,title,body,author,createdAt,labels",
         ]
 
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        except subprocess.CalledProcessError as e:
-            raise ConnectionError(f"Failed to fetch GitHub issues: {e.stderr}") from e
+        result = await _run_command(cmd)
+        if result.returncode != 0:
+            raise ConnectionError(f"Failed to fetch GitHub issues: {result.stderr}")
 
         issues = json.loads(result.stdout)
         requests = []
@@ -115,23 +142,13 @@ class GitHubInputSource(InputSource):
         Returns:
             True if task already exists for this issue
         """
-        workspace_path = Path(self.config.get("workspace_path", get_workspace_path()))
-        tasks_dir = workspace_path / "tasks"
-
-        # Check for task file containing this issue number
         issue_number = request.metadata.get("issue_number")
-        if not issue_number:
+        repo = request.metadata.get("repo")
+        if not issue_number or not repo:
             return False
 
-        # Search for existing tasks mentioning this issue
-        try:
-            cmd = ["grep", "-r", "-l", f"#{issue_number}", str(tasks_dir)]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            # grep returns 0 if found, 1 if not found
-            return result.returncode == 0
-        except Exception:
-            # If grep fails, assume not duplicate
-            return False
+        index = SourceIndex.shared(_tasks_dir(self.config))
+        return index.contains(github_source_key(repo, issue_number))
 
     async def create_task(self, request: TaskRequest) -> TaskCreationResult:
         """Create a task file from GitHub issue.
@@ -162,6 +179,7 @@ class GitHubInputSource(InputSource):
         # Write task file
         try:
             task_path.write_text(content)
+            SourceIndex.shared(tasks_dir).update(task_path)
             return TaskCreationResult(
                 success=True,
                 task_path=task_path,
@@ -199,10 +217,14 @@ class GitHubInputSource(InputSource):
             Markdown content for task file
         """
         # Generate frontmatter
+        source_id = github_source_key(
+            request.metadata["repo"], request.metadata["issue_number"]
+        )
         frontmatter = [
             "---",
             "state: new",
             f"created: {datetime.now().isoformat()}",
+            f"source_id: {json.dumps(source_id)}",
         ]
 
         if request.priority:
@@ -252,24 +274,19 @@ class GitHubInputSource(InputSource):
             "I'll work on this and update when complete."
         )
 
-        try:
-            subprocess.run(
-                [
-                    "gh",
-                    "issue",
-                    "comment",
-                    str(issue_number),
-                    "--repo",
-                    repo,
-                    "--body",
-                    comment,
-                ],
-                check=True,
-                capture_output=True,
-            )
-        except subprocess.CalledProcessError:
-            # Acknowledgment is best-effort
-            pass
+        # Acknowledgment is best-effort, so a failed comment is ignored
+        await _run_command(
+            [
+                "gh",
+                "issue",
+                "comment",
+                str(issue_number),
+                "--repo",
+                repo,
+                "--body",
+                comment,
+            ]
+        )
 
 
 class EmailInputSource(InputSource):
@@ -300,6 +317,21 @@ class EmailInputSource(InputSource):
         if not new_dir.exists():
             return []
 
+        # Reading the maildir is blocking file I/O; keep it off the event loop
+        return await asyncio.to_thread(self._scan_new_emails, new_dir, allowlist)
+
+    def _scan_new_emails(
+        self, new_dir: Path, allowlist: List[str]
+    ) -> List[TaskRequest]:
+        """Parse unread emails from allowlisted senders in a maildir new/ directory.
+
+        Args:
+            new_dir: Maildir new/ directory
+            allowlist: Allowed sender addresses (substring match)
+
+        Returns:
+            List of TaskRequest objects from emails
+        """
         requests = []
         for email_file in new_dir.iterdir():
             try:
@@ -309,6 +341,9 @@ class EmailInputSource(InputSource):
                 from_addr = self._extract_header(content, "From")
                 subject = self._extract_header(content, "Subject")
                 date_str = self._extract_header(content, "Date")
+                message_id = self._extract_header(
+                    content, "Message-ID"
+                ) or self._extract_header(content, "Message-Id")
 
                 # Check allowlist
                 if not any(allowed in from_addr for allowed in allowlist):
@@ -333,6 +368,7 @@ class EmailInputSource(InputSource):
                         "email_file": str(email_file),
                         "from": from_addr,
                         "subject": subject,
+                        "message_id": message_id,
                     },
                 )
                 requests.append(request)
@@ -414,27 +450,17 @@ class EmailInputSource(InputSource):
         Returns:
             True if task already exists for this email
         """
-        workspace_path = Path(self.config.get("workspace_path", get_workspace_path()))
-        tasks_dir = workspace_path / "tasks"
+        index = SourceIndex.shared(_tasks_dir(self.config))
+        if index.contains(self._source_key(request)):
+            return True
 
-        # Check for task mentioning this email subject
+        # Tasks created before source_id was recorded: match on title
         subject = request.metadata.get("subject", "")
-        if not subject:
-            return False
+        return index.has_title_prefix(subject[:30])
 
-        # Search for tasks with similar title
-        try:
-            cmd = [
-                "grep",
-                "-r",
-                "-l",
-                subject[:30],  # First 30 chars of subject
-                str(tasks_dir),
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            return result.returncode == 0
-        except Exception:
-            return False
+    def _source_key(self, request: TaskRequest) -> str:
+        """Source key for an email (Message-ID, else maildir filename)."""
+        return f"email:{request.metadata.get('message_id') or request.source_id}"
 
     async def create_task(self, request: TaskRequest) -> TaskCreationResult:
         """Create a task file from email.
@@ -462,6 +488,7 @@ class EmailInputSource(InputSource):
 
         try:
             task_path.write_text(content)
+            SourceIndex.shared(tasks_dir).update(task_path)
             return TaskCreationResult(
                 success=True,
                 task_path=task_path,
@@ -486,6 +513,7 @@ class EmailInputSource(InputSource):
             "---",
             "state: new",
             f"created: {datetime.now().isoformat()}",
+            f"source_id: {json.dumps(self._source_key(request))}",
         ]
 
         if request.priority:
@@ -560,6 +588,18 @@ class WebhookInputSource(InputSource):
             queue_path.mkdir(parents=True, exist_ok=True)
             return []
 
+        # Reading the queue is blocking file I/O; keep it off the event loop
+        return await asyncio.to_thread(self._scan_queue, queue_path)
+
+    def _scan_queue(self, queue_path: Path) -> List[TaskRequest]:
+        """Parse webhook payloads queued as JSON files.
+
+        Args:
+            queue_path: Webhook queue directory
+
+        Returns:
+            List of TaskRequest objects from webhook payloads
+        """
         requests = []
         for webhook_file in queue_path.glob("*.json"):
             try:
@@ -614,21 +654,11 @@ class WebhookInputSource(InputSource):
         Returns:
             True if task already exists for this webhook
         """
-        workspace_path = Path(self.config.get("workspace_path", get_workspace_path()))
-        tasks_dir = workspace_path / "tasks"
-
-        # Check for task mentioning this webhook ID
-        webhook_id = request.source_id
-        if not webhook_id:
+        if not request.source_id:
             return False
 
-        # Search for tasks with this webhook source_id
-        try:
-            cmd = ["grep", "-r", "-l", f"webhook-{webhook_id}", str(tasks_dir)]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            return result.returncode == 0
-        except Exception:
-            return False
+        index = SourceIndex.shared(_tasks_dir(self.config))
+        return index.contains(f"webhook:{request.source_id}")
 
     async def create_task(self, request: TaskRequest) -> TaskCreationResult:
         """Create a task file from webhook payload.
@@ -655,6 +685,7 @@ class WebhookInputSource(InputSource):
 
         try:
             task_path.write_text(content)
+            SourceIndex.shared(tasks_dir).update(task_path)
             return TaskCreationResult(
                 success=True,
                 task_path=task_path,
@@ -679,6 +710,7 @@ class WebhookInputSource(InputSource):
             "---",
             "state: new",
             f"created: {datetime.now().isoformat()}",
+            f"source_id: {json.dumps(f'webhook:{request.source_id}')}",
         ]
 
         if request.priority:
@@ -1039,6 +1071,7 @@ class SchedulerInputSource(InputSource):
 
         try:
             task_path.write_text(content)
+            SourceIndex.shared(tasks_dir).update(task_path)
             return TaskCreationResult(
                 success=True,
                 task_path=task_path,
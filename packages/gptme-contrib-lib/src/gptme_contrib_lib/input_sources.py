@@ -4,6 +4,7 @@ This module provides the base interfaces and types for creating tasks from
 external sources like GitHub issues, emails, webhooks, and scheduled triggers.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -303,20 +304,24 @@ class InputSourceManager:
         self.sources.pop(name, None)
 
     async def poll_all_sources(self) -> Dict[str, List[TaskRequest]]:
-        """Poll all registered sources for new requests.
+        """Poll all registered sources for new requests concurrently.
 
         Returns:
             Dictionary mapping source names to their task requests
         """
-        results = {}
-        for name, source in self.sources.items():
-            try:
-                requests = await source.poll_for_inputs()
-                results[name] = requests
-            except Exception as e:
+        names = list(self.sources)
+        outcomes = await asyncio.gather(
+            *(self.sources[name].poll_for_inputs() for name in names),
+            return_exceptions=True,
+        )
+        results: Dict[str, List[TaskRequest]] = {}
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, BaseException):
                 # Log error but continue with other sources
-                print(f"Error polling source '{name}': {e}")
+                print(f"Error polling source '{name}': {outcome}")
                 results[name] = []
+            else:
+                results[name] = outcome
         return results
 
     async def process_all_sources(self) -> List[TaskCreationResult]:
@@ -325,13 +330,17 @@ class InputSourceManager:
         Returns:
             List of all task creation results
         """
-        all_results = []
         requests_by_source = await self.poll_all_sources()
 
-        for name, requests in requests_by_source.items():
+        async def process_source(name: str) -> List[TaskCreationResult]:
+            # Requests within a source stay sequential (creation is not race-safe)
             source = self.sources[name]
-            for request in requests:
-                result = await source.process_request(request)
-                all_results.append(result)
+            return [
+                await source.process_request(request)
+                for request in requests_by_source[name]
+            ]
 
-        return all_results
+        per_source = await asyncio.gather(
+            *(process_source(name) for name in requests_by_source)
+        )
+        return [result for results in per_source for result in results]
@@ -4,10 +4,13 @@ Provides metrics tracking, health checks, and error monitoring for all input sou
 """
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List
+
+# Number of recent poll durations kept per source for latency percentiles
+POLL_LATENCY_WINDOW = 100
 
 
 @dataclass
@@ -37,6 +40,9 @@ class SourceMetrics:
     # Performance
     avg_poll_duration_seconds: float = 0.0
     total_poll_duration_seconds: float = 0.0
+    last_poll_duration_seconds: float = 0.0
+    max_poll_duration_seconds: float = 0.0
+    recent_poll_durations: List[float] = field(default_factory=list)
 
     def record_poll_attempt(self, duration_seconds: float) -> None:
         """Record a poll attempt.
@@ -50,6 +56,27 @@ class SourceMetrics:
         self.avg_poll_duration_seconds = (
             self.total_poll_duration_seconds / self.poll_attempts
         )
+        self.last_poll_duration_seconds = duration_seconds
+        self.max_poll_duration_seconds = max(
+            self.max_poll_duration_seconds, duration_seconds
+        )
+        self.recent_poll_durations.append(duration_seconds)
+        del self.recent_poll_durations[:-POLL_LATENCY_WINDOW]
+
+    def poll_latency_percentile(self, percentile: float) -> float:
+        """Poll duration at a percentile of the recent window.
+
+        Args:
+            percentile: Percentile between 0 and 100
+
+        Returns:
+            Duration in seconds (nearest-rank), or 0.0 if no polls recorded
+        """
+        if not self.recent_poll_durations:
+            return 0.0
+        ordered = sorted(self.recent_poll_durations)
+        rank = max(1, -(-len(ordered) * percentile // 100))
+        return ordered[min(int(rank), len(ordered)) - 1]
 
     def record_poll_success(self) -> None:
         """Record a successful poll."""
@@ -127,6 +154,12 @@ class SourceMetrics:
             else None,
             "consecutive_failures": self.consecutive_failures,
             "avg_poll_duration_seconds": self.avg_poll_duration_seconds,
+            "total_poll_duration_seconds": self.total_poll_duration_seconds,
+            "last_poll_duration_seconds": self.last_poll_duration_seconds,
+            "max_poll_duration_seconds": self.max_poll_duration_seconds,
+            "recent_poll_durations": self.recent_poll_durations,
+            "p50_poll_duration_seconds": self.poll_latency_percentile(50),
+            "p95_poll_duration_seconds": self.poll_latency_percentile(95),
             "success_rate": self.success_rate,
             "is_healthy": self.is_healthy,
         }
@@ -201,6 +234,8 @@ class MetricsCollector:
             # Remove calculated fields
             data.pop("success_rate", None)
             data.pop("is_healthy", None)
+            data.pop("p50_poll_duration_seconds", None)
+            data.pop("p95_poll_duration_seconds", None)
 
             return SourceMetrics(**data)
         except Exception as e:
@@ -3,10 +3,16 @@
 
 Coordinates polling of all configured input sources and creates tasks
 from external sources like GitHub issues, emails, webhooks, and scheduled triggers.
+
+Due sources are polled concurrently. Within a source, requests are validated
+and created one at a time (creation checks for existing task files, so it must
+not race), while acknowledgments run in the background with bounded
+concurrency.
 """
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List
@@ -20,22 +26,39 @@ from .input_source_impl import (
     SchedulerInputSource,
     WebhookInputSource,
 )
-from .input_sources import InputSource
+from .input_sources import InputSource, TaskRequest, ValidationStatus
+from .monitoring import MetricsCollector
+
+# Default cap on acknowledgments (e.g. GitHub comments) in flight per source
+DEFAULT_MAX_CONCURRENT_ACKS = 4
 
 
 class InputSourceOrchestrator:
     """Orchestrates polling and processing of all input sources."""
 
-    def __init__(self, config: InputSourcesConfig):
+    def __init__(
+        self,
+        config: InputSourcesConfig,
+        metrics_collector: MetricsCollector | None = None,
+        max_concurrent_acks: int = DEFAULT_MAX_CONCURRENT_ACKS,
+    ):
         """Initialize orchestrator with configuration.
 
         Args:
             config: Validated configuration for all input sources
+            metrics_collector: Optional collector for per-source poll metrics
+                (defaults to one in ``config.monitoring.metrics_dir`` when
+                monitoring is enabled)
+            max_concurrent_acks: Max acknowledgments in flight per source
         """
         self.config = config
         self.sources: Dict[str, InputSource] = {}
         self.last_poll: Dict[str, datetime] = {}
         self.running = False
+        self.max_concurrent_acks = max_concurrent_acks
+        if metrics_collector is None and config.monitoring.enabled:
+            metrics_collector = MetricsCollector(config.monitoring.metrics_dir)
+        self.metrics_collector = metrics_collector
 
         # Set up logging
         log_level = getattr(logging, config.monitoring.log_level.upper())
@@ -159,9 +182,26 @@ class InputSourceOrchestrator:
         Returns:
             Number of tasks created
         """
+        metrics = (
+            self.metrics_collector.get_or_create_metrics(
+                source_name, source.source_type.value
+            )
+            if self.metrics_collector
+            else None
+        )
+        acks: list[asyncio.Task[None]] = []
+        start = time.monotonic()
         try:
             self.logger.debug(f"Polling {source_name}...")
-            requests = await source.poll_for_inputs()
+            try:
+                requests = await source.poll_for_inputs()
+            finally:
+                duration = time.monotonic() - start
+                self.logger.debug(f"Polled {source_name} in {duration:.2f}s")
+                if metrics:
+                    metrics.record_poll_attempt(duration)
+            if metrics:
+                metrics.record_poll_success()
 
             if not requests:
                 self.logger.debug(f"No new requests from {source_name}")
@@ -169,14 +209,20 @@ class InputSourceOrchestrator:
 
             self.logger.info(f"Found {len(requests)} requests from {source_name}")
             tasks_created = 0
+            ack_slots = asyncio.Semaphore(self.max_concurrent_acks)
 
             for request in requests:
-                # Validate request
-                validation = source.validate_input(request)
+                # Validate request (duplicate checks may touch the filesystem)
+                validation = await asyncio.to_thread(source.validate_input, request)
                 if not validation.is_valid:
                     self.logger.warning(
                         f"Validation failed for {source_name} request: {validation.message}"
                     )
+                    if metrics:
+                        if validation.status == ValidationStatus.DUPLICATE:
+                            metrics.record_duplicate()
+                        else:
+                            metrics.record_validation_failure()
                     continue
 
                 # Create task
@@ -186,14 +232,15 @@ class InputSourceOrchestrator:
                         f"Created task from {source_name}: {result.task_id}"
                     )
                     tasks_created += 1
+                    if metrics:
+                        metrics.record_task_created()
 
-                    # Acknowledge input
-                    try:
-                        await source.acknowledge_input(request)
-                    except Exception as e:
-                        self.logger.warning(
-                            f"Failed to acknowledge {source_name} input: {e}"
+                    # Acknowledge input while the next request is processed
+                    acks.append(
+                        asyncio.create_task(
+                            self._acknowledge(source_name, source, request, ack_slots)
                         )
+                    )
                 else:
                     self.logger.error(
                         f"Failed to create task from {source_name}: {result.error}"
@@ -203,26 +250,52 @@ class InputSourceOrchestrator:
 
         except Exception as e:
             self.logger.error(f"Error polling {source_name}: {e}", exc_info=True)
+            if metrics:
+                metrics.record_poll_failure(str(e))
             return 0
         finally:
+            # Acknowledgments never raise (see _acknowledge)
+            await asyncio.gather(*acks)
             self.last_poll[source_name] = datetime.now()
+            if self.metrics_collector:
+                self.metrics_collector.save_metrics(source_name)
+
+    async def _acknowledge(
+        self,
+        source_name: str,
+        source: InputSource,
+        request: TaskRequest,
+        slots: asyncio.Semaphore,
+    ) -> None:
+        """Acknowledge a processed request, best-effort.
+
+        Args:
+            source_name: Name of the source
+            source: InputSource the request came from
+            request: Request whose task was created
+            slots: Semaphore bounding concurrent acknowledgments
+        """
+        async with slots:
+            try:
+                await source.acknowledge_input(request)
+            except Exception as e:
+                self.logger.warning(f"Failed to acknowledge {source_name} input: {e}")
 
     async def run_once(self) -> Dict[str, int]:
-        """Run one iteration of polling all sources.
+        """Run one iteration of polling all due sources concurrently.
 
         Returns:
             Dictionary mapping source names to number of tasks created
         """
-        results = {}
-
-        for source_name, source in self.sources.items():
-            if not self._should_poll(source_name):
-                continue
-
-            tasks_created = await self.poll_source(source_name, source)
-            results[source_name] = tasks_created
-
-        return results
+        due = [
+            (source_name, source)
+            for source_name, source in self.sources.items()
+            if self._should_poll(source_name)
+        ]
+        counts = await asyncio.gather(
+            *(self.poll_source(source_name, source) for source_name, source in due)
+        )
+        return {source_name: count for (source_name, _), count in zip(due, counts)}
 
     async def run_continuous(self):
         """Run continuous polling loop."""
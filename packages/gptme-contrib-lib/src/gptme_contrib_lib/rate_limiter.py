@@ -1,11 +1,23 @@
 """Rate limiting for input sources.
 
 Token bucket algorithm implementation for controlling request rates.
+
+By default bucket state lives in process memory. Processes that share an
+upstream quota (e.g. several orchestrators and watchers using one GitHub
+token) should pass the same ``state_path`` so their buckets are kept in a
+shared SQLite database and updated atomically.
 """
 
+import asyncio
+import sqlite3
+import threading
 import time
+import weakref
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Dict
+from pathlib import Path
+from typing import Dict, Tuple
 
 
 @dataclass
@@ -72,6 +84,103 @@ class RateLimitState:
         return tokens_needed / self.refill_rate
 
 
+class SharedBucketStore:
+    """Token bucket state in SQLite, shared by all processes using the same file.
+
+    Each operation runs in a ``BEGIN IMMEDIATE`` transaction, so concurrent
+    read-refill-consume cycles from different processes are serialized.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS buckets (
+        source_name TEXT NOT NULL,
+        bucket TEXT NOT NULL,  -- 'minute' or 'hour'
+        tokens REAL NOT NULL,
+        last_update REAL NOT NULL,
+        PRIMARY KEY (source_name, bucket)
+    )
+    """
+
+    def __init__(self, path: Path | str):
+        """Initialize the store.
+
+        Args:
+            path: SQLite database file (created if missing)
+        """
+        self.path = Path(path)
+        self._conn: sqlite3.Connection | None = None
+        # One connection shared by threads of this process, used one at a time
+        self._lock = threading.Lock()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                str(self.path),
+                isolation_level=None,  # explicit transactions
+                check_same_thread=False,
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA busy_timeout=5000")
+            self._conn.execute(self.SCHEMA)
+        return self._conn
+
+    @contextmanager
+    def transaction(
+        self, source_name: str, buckets: Dict[str, RateLimitState]
+    ) -> Iterator[Dict[str, RateLimitState]]:
+        """Load a source's buckets, yield them for update, then store them.
+
+        Args:
+            source_name: Name of the source
+            buckets: Fresh (full) bucket per bucket name, used when no state
+                is stored yet; stored state overrides tokens and last_update
+
+        Yields:
+            The buckets, to be modified in place
+        """
+        with self._lock:
+            conn = self.conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = conn.execute(
+                    "SELECT bucket, tokens, last_update FROM buckets WHERE source_name = ?",
+                    (source_name,),
+                ).fetchall()
+                for bucket, tokens, last_update in rows:
+                    if bucket in buckets:
+                        state = buckets[bucket]
+                        # Limits may differ between processes; respect our own cap
+                        state.tokens = min(tokens, state.max_tokens)
+                        state.last_update = last_update
+                yield buckets
+                conn.executemany(
+                    "INSERT OR REPLACE INTO buckets VALUES (?, ?, ?, ?)",
+                    [
+                        (source_name, bucket, state.tokens, state.last_update)
+                        for bucket, state in buckets.items()
+                    ],
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def reset(self, source_name: str) -> None:
+        """Delete stored state for a source."""
+        with self._lock:
+            self.conn.execute(
+                "DELETE FROM buckets WHERE source_name = ?", (source_name,)
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
 class RateLimiter:
     """Rate limiter using token bucket algorithm.
 
@@ -81,27 +190,55 @@ class RateLimiter:
         max_per_minute: Maximum requests allowed per minute
         max_per_hour: Maximum requests allowed per hour
         minute_buckets: Dict mapping source names to per-minute rate limit states
+            (with a shared store: the state seen by the last operation)
         hour_buckets: Dict mapping source names to per-hour rate limit states
+        store: Shared bucket store, or None for process-local state
     """
 
     def __init__(
         self,
         max_per_minute: int = 60,
         max_per_hour: int = 1000,
+        state_path: Path | str | None = None,
     ):
         """Initialize rate limiter.
 
         Args:
             max_per_minute: Maximum requests per minute
             max_per_hour: Maximum requests per hour
+            state_path: Optional SQLite file holding bucket state shared with
+                other processes (default: state is local to this instance)
         """
         self.max_per_minute = max_per_minute
         self.max_per_hour = max_per_hour
+        self.store = SharedBucketStore(state_path) if state_path else None
 
         # Per-source rate limit states
         self.minute_buckets: Dict[str, RateLimitState] = {}
         self.hour_buckets: Dict[str, RateLimitState] = {}
 
+        # Per-source FIFO queues for acquire(), per event loop since an
+        # asyncio.Lock cannot be shared between loops
+        self._acquire_locks: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, Dict[str, asyncio.Lock]
+        ] = weakref.WeakKeyDictionary()
+
+    def _new_minute_bucket(self) -> RateLimitState:
+        return RateLimitState(
+            tokens=self.max_per_minute,
+            last_update=time.time(),
+            max_tokens=self.max_per_minute,
+            refill_rate=self.max_per_minute / 60.0,  # tokens per second
+        )
+
+    def _new_hour_bucket(self) -> RateLimitState:
+        return RateLimitState(
+            tokens=self.max_per_hour,
+            last_update=time.time(),
+            max_tokens=self.max_per_hour,
+            refill_rate=self.max_per_hour / 3600.0,  # tokens per second
+        )
+
     def _get_or_create_minute_bucket(self, source_name: str) -> RateLimitState:
         """Get or create per-minute bucket for source.
 
@@ -112,13 +249,7 @@ class RateLimiter:
             RateLimitState for per-minute limiting
         """
         if source_name not in self.minute_buckets:
-            now = time.time()
-            self.minute_buckets[source_name] = RateLimitState(
-                tokens=self.max_per_minute,
-                last_update=now,
-                max_tokens=self.max_per_minute,
-                refill_rate=self.max_per_minute / 60.0,  # tokens per second
-            )
+            self.minute_buckets[source_name] = self._new_minute_bucket()
         return self.minute_buckets[source_name]
 
     def _get_or_create_hour_bucket(self, source_name: str) -> RateLimitState:
@@ -131,15 +262,54 @@ class RateLimiter:
             RateLimitState for per-hour limiting
         """
         if source_name not in self.hour_buckets:
-            now = time.time()
-            self.hour_buckets[source_name] = RateLimitState(
-                tokens=self.max_per_hour,
-                last_update=now,
-                max_tokens=self.max_per_hour,
-                refill_rate=self.max_per_hour / 3600.0,  # tokens per second
-            )
+            self.hour_buckets[source_name] = self._new_hour_bucket()
         return self.hour_buckets[source_name]
 
+    @contextmanager
+    def _buckets(
+        self, source_name: str
+    ) -> Iterator[Tuple[RateLimitState, RateLimitState]]:
+        """Yield the (minute, hour) buckets of a source for one atomic operation.
+
+        With a shared store, state is loaded and saved in one transaction.
+
+        Args:
+            source_name: Name of the source
+        """
+        if self.store is None:
+            yield (
+                self._get_or_create_minute_bucket(source_name),
+                self._get_or_create_hour_bucket(source_name),
+            )
+            return
+
+        fresh = {"minute": self._new_minute_bucket(), "hour": self._new_hour_bucket()}
+        with self.store.transaction(source_name, fresh) as buckets:
+            self.minute_buckets[source_name] = buckets["minute"]
+            self.hour_buckets[source_name] = buckets["hour"]
+            yield buckets["minute"], buckets["hour"]
+
+    def _consume_or_wait(self, source_name: str, count: int) -> float:
+        """Consume tokens if both buckets allow it, else report the wait.
+
+        Args:
+            source_name: Name of the source
+            count: Number of tokens to consume
+
+        Returns:
+            0.0 if the tokens were consumed, else seconds until they will be available
+        """
+        with self._buckets(source_name) as (minute_bucket, hour_bucket):
+            minute_bucket.refill()
+            hour_bucket.refill()
+            if minute_bucket.tokens >= count and hour_bucket.tokens >= count:
+                minute_bucket.tokens -= count
+                hour_bucket.tokens -= count
+                return 0.0
+            return max(
+                minute_bucket.get_wait_time(count), hour_bucket.get_wait_time(count)
+            )
+
     def check_limit(self, source_name: str, count: int = 1) -> bool:
         """Check if request would exceed rate limit.
 
@@ -150,15 +320,13 @@ class RateLimiter:
         Returns:
             True if request is allowed, False if rate limited
         """
-        minute_bucket = self._get_or_create_minute_bucket(source_name)
-        hour_bucket = self._get_or_create_hour_bucket(source_name)
-
-        # Refill both buckets
-        minute_bucket.refill()
-        hour_bucket.refill()
+        with self._buckets(source_name) as (minute_bucket, hour_bucket):
+            # Refill both buckets
+            minute_bucket.refill()
+            hour_bucket.refill()
 
-        # Check if both buckets have enough tokens
-        return minute_bucket.tokens >= count and hour_bucket.tokens >= count
+            # Check if both buckets have enough tokens
+            return minute_bucket.tokens >= count and hour_bucket.tokens >= count
 
     def consume(self, source_name: str, count: int = 1) -> bool:
         """Consume tokens if available.
@@ -170,23 +338,8 @@ class RateLimiter:
         Returns:
             True if tokens were consumed, False if rate limited
         """
-        minute_bucket = self._get_or_create_minute_bucket(source_name)
-        hour_bucket = self._get_or_create_hour_bucket(source_name)
-
-        # Try to consume from both buckets
-        minute_ok = minute_bucket.consume(count)
-        hour_ok = hour_bucket.consume(count)
-
-        # If either failed, refund and return False
-        if not (minute_ok and hour_ok):
-            # Refund consumed tokens
-            if minute_ok:
-                minute_bucket.tokens += count
-            if hour_ok:
-                hour_bucket.tokens += count
-            return False
-
-        return True
+        # Tokens are only taken if both buckets allow it
+        return self._consume_or_wait(source_name, count) == 0.0
 
     def get_wait_time(self, source_name: str, count: int = 1) -> float:
         """Get time to wait until request is allowed.
@@ -198,15 +351,46 @@ class RateLimiter:
         Returns:
             Seconds to wait (0 if request allowed now)
         """
-        minute_bucket = self._get_or_create_minute_bucket(source_name)
-        hour_bucket = self._get_or_create_hour_bucket(source_name)
-
-        minute_wait = minute_bucket.get_wait_time(count)
-        hour_wait = hour_bucket.get_wait_time(count)
+        with self._buckets(source_name) as (minute_bucket, hour_bucket):
+            minute_wait = minute_bucket.get_wait_time(count)
+            hour_wait = hour_bucket.get_wait_time(count)
 
         # Return the longer wait time
         return max(minute_wait, hour_wait)
 
+    async def acquire(self, source_name: str, count: int = 1) -> None:
+        """Wait until tokens are available, then consume them.
+
+        Waiters in this event loop are served in FIFO order, and each sleeps
+        for exactly the computed wait rather than retrying in a loop. A wait is
+        only repeated if another process took the tokens in the meantime.
+        With a shared store, the SQLite transaction (which may block on another
+        process's lock) runs in a worker thread so the event loop stays free.
+
+        Args:
+            source_name: Name of the source
+            count: Number of tokens to consume
+
+        Raises:
+            ValueError: If count exceeds a bucket's capacity (it would never succeed)
+        """
+        if count > min(self.max_per_minute, self.max_per_hour):
+            raise ValueError(
+                f"Cannot acquire {count} tokens: exceeds bucket capacity "
+                f"({self.max_per_minute}/min, {self.max_per_hour}/hour)"
+            )
+        locks = self._acquire_locks.setdefault(asyncio.get_running_loop(), {})
+        lock = locks.setdefault(source_name, asyncio.Lock())
+        async with lock:
+            while (wait := await self._consume_or_wait_async(source_name, count)) > 0:
+                await asyncio.sleep(wait)
+
+    async def _consume_or_wait_async(self, source_name: str, count: int) -> float:
+        """Run _consume_or_wait without blocking the event loop on the store."""
+        if self.store is None:
+            return self._consume_or_wait(source_name, count)
+        return await asyncio.to_thread(self._consume_or_wait, source_name, count)
+
     def reset_source(self, source_name: str) -> None:
         """Reset rate limit state for a source.
 
@@ -215,6 +399,8 @@ class RateLimiter:
         """
         self.minute_buckets.pop(source_name, None)
         self.hour_buckets.pop(source_name, None)
+        if self.store is not None:
+            self.store.reset(source_name)
 
     def get_status(self, source_name: str) -> Dict:
         """Get current rate limit status for a source.
@@ -225,11 +411,9 @@ class RateLimiter:
         Returns:
             Dictionary with rate limit status
         """
-        minute_bucket = self._get_or_create_minute_bucket(source_name)
-        hour_bucket = self._get_or_create_hour_bucket(source_name)
-
-        minute_bucket.refill()
-        hour_bucket.refill()
+        with self._buckets(source_name) as (minute_bucket, hour_bucket):
+            minute_bucket.refill()
+            hour_bucket.refill()
 
         return {
             "source_name": source_name,
@@ -259,9 +443,15 @@ class MultiSourceRateLimiter:
         limiters: Dict mapping source names to their RateLimiter instances
     """
 
-    def __init__(self):
-        """Initialize multi-source rate limiter with empty limiters dict."""
+    def __init__(self, state_path: Path | str | None = None):
+        """Initialize multi-source rate limiter with empty limiters dict.
+
+        Args:
+            state_path: Optional SQLite file shared by all registered sources
+                (and other processes) for bucket state
+        """
         self.limiters: Dict[str, RateLimiter] = {}
+        self.state_path = state_path
 
     def register_source(
         self,
@@ -279,6 +469,7 @@ class MultiSourceRateLimiter:
         self.limiters[source_name] = RateLimiter(
             max_per_minute=max_per_minute,
             max_per_hour=max_per_hour,
+            state_path=self.state_path,
         )
 
     def check_limit(self, source_name: str, count: int = 1) -> bool:
@@ -328,6 +519,19 @@ class MultiSourceRateLimiter:
 
         return self.limiters[source_name].get_wait_time(source_name, count)
 
+    async def acquire(self, source_name: str, count: int = 1) -> None:
+        """Wait until tokens are available, then consume them.
+
+        Args:
+            source_name: Name of the source
+            count: Number of tokens to consume
+        """
+        if source_name not in self.limiters:
+            # No limit configured, allow request
+            return
+
+        await self.limiters[source_name].acquire(source_name, count)
+
     def get_status(self, source_name: str) -> Dict | None:
         """Get current rate limit status for a source.
 
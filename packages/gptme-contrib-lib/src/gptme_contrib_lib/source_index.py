@@ -0,0 +1,187 @@
+"""Index of which task files were created from which external inputs.
+
+Input sources used to detect duplicates by running ``grep -r`` over the whole
+tasks tree for every polled request, so a poll with hundreds of open issues
+forked hundreds of greps. :class:`SourceIndex` instead scans the tasks tree
+once, keeps the source keys found in each task file, and afterwards only
+re-reads files whose mtime or size changed. Duplicate checks become set
+lookups.
+
+A task file is indexed under:
+
+- its ``source_id`` frontmatter key (written by the built-in input sources,
+  e.g. ``github:owner/repo#12``, ``email:<message-id>``, ``webhook:<id>``)
+- ``github:owner/repo#N`` for every GitHub issue URL it mentions
+- ``webhook:<id>`` for a ``- **Webhook ID**: <id>`` source line
+
+The last two keep task files created before ``source_id`` existed from being
+re-created.
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between full rescans of the tasks tree. Tasks created by
+# input sources are added with SourceIndex.update() immediately.
+REFRESH_INTERVAL_SECONDS = 5.0
+
+_ISSUE_URL_RE = re.compile(r"https://github\.com/([\w.-]+/[\w.-]+)/issues/(\d+)")
+_WEBHOOK_ID_RE = re.compile(r"^- \*\*Webhook ID\*\*: (\S+)\s*$", re.MULTILINE)
+_TITLE_RE = re.compile(r"^# (.+)$", re.MULTILINE)
+
+
+def github_source_key(repo: str, issue_number: int | str) -> str:
+    """Source key for a GitHub issue."""
+    return f"github:{repo}#{issue_number}"
+
+
+class SourceIndex:
+    """Incrementally maintained mapping of source keys to task files.
+
+    Instances are shared per tasks directory (see :meth:`shared`) and are
+    thread-safe, since the orchestrator validates requests in worker threads.
+    """
+
+    _shared: Dict[Path, "SourceIndex"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, tasks_dir: Path):
+        """Initialize an empty index.
+
+        Args:
+            tasks_dir: Root of the tasks tree (scanned recursively)
+        """
+        self.tasks_dir = Path(tasks_dir).resolve()
+        self._lock = threading.Lock()
+        # path -> (mtime_ns, size) when indexed
+        self._stamps: Dict[Path, Tuple[int, int]] = {}
+        self._keys_by_path: Dict[Path, Set[str]] = {}
+        self._title_by_path: Dict[Path, str] = {}
+        self._paths_by_key: Dict[str, Set[Path]] = {}
+        self._last_refresh: float | None = None
+
+    @classmethod
+    def shared(cls, tasks_dir: Path) -> "SourceIndex":
+        """Return the process-wide index for a tasks directory."""
+        key = Path(tasks_dir).resolve()
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(key)
+            return cls._shared[key]
+
+    def refresh(self, force: bool = False) -> None:
+        """Rescan the tasks tree, re-reading only new or changed files.
+
+        Args:
+            force: Rescan even if the last scan was under
+                REFRESH_INTERVAL_SECONDS ago
+        """
+        with self._lock:
+            now = time.monotonic()
+            if (
+                not force
+                and self._last_refresh is not None
+                and now - self._last_refresh < REFRESH_INTERVAL_SECONDS
+            ):
+                return
+            seen: Set[Path] = set()
+            for root, _dirs, files in os.walk(self.tasks_dir):
+                for name in files:
+                    if not name.endswith(".md"):
+                        continue
+                    path = Path(root) / name
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        continue
+                    seen.add(path)
+                    if self._stamps.get(path) != (stat.st_mtime_ns, stat.st_size):
+                        self._index_file(path, (stat.st_mtime_ns, stat.st_size))
+            for path in set(self._stamps) - seen:
+                self._drop(path)
+            self._last_refresh = now
+
+    def update(self, task_path: Path) -> None:
+        """Index (or drop) a single task file right after writing it."""
+        path = Path(task_path).resolve()
+        with self._lock:
+            try:
+                stat = path.stat()
+            except OSError:
+                self._drop(path)
+                return
+            self._index_file(path, (stat.st_mtime_ns, stat.st_size))
+
+    def find(self, source_key: str) -> List[Path]:
+        """Task files indexed under a source key."""
+        self.refresh()
+        with self._lock:
+            return sorted(self._paths_by_key.get(source_key, ()))
+
+    def contains(self, source_key: str) -> bool:
+        """Whether any task file is indexed under a source key."""
+        return bool(self.find(source_key))
+
+    def has_title_prefix(self, prefix: str) -> bool:
+        """Whether any task title starts with ``prefix`` (case-sensitive)."""
+        if not prefix:
+            return False
+        self.refresh()
+        with self._lock:
+            return any(
+                title.startswith(prefix) for title in self._title_by_path.values()
+            )
+
+    def _index_file(self, path: Path, stamp: Tuple[int, int]) -> None:
+        try:
+            content = path.read_text(errors="replace")
+        except OSError as e:
+            logger.debug(f"Cannot read task file {path}: {e}")
+            return
+        self._drop(path)
+        keys = _extract_source_keys(content)
+        self._stamps[path] = stamp
+        self._keys_by_path[path] = keys
+        for key in keys:
+            self._paths_by_key.setdefault(key, set()).add(path)
+        title = _TITLE_RE.search(content)
+        if title:
+            self._title_by_path[path] = title.group(1).strip()
+
+    def _drop(self, path: Path) -> None:
+        self._stamps.pop(path, None)
+        self._title_by_path.pop(path, None)
+        for key in self._keys_by_path.pop(path, set()):
+            paths = self._paths_by_key.get(key)
+            if paths is not None:
+                paths.discard(path)
+                if not paths:
+                    del self._paths_by_key[key]
+
+
+def _extract_source_keys(content: str) -> Set[str]:
+    """Source keys referenced by a task file's frontmatter and body."""
+    keys: Set[str] = set()
+    if content.startswith("---"):
+        end = content.find("\n---", 3)
+        if end != -1:
+            try:
+                frontmatter = yaml.safe_load(content[3:end])
+            except yaml.YAMLError:
+                frontmatter = None
+            if isinstance(frontmatter, dict) and frontmatter.get("source_id"):
+                keys.add(str(frontmatter["source_id"]))
+    for repo, number in _ISSUE_URL_RE.findall(content):
+        keys.add(github_source_key(repo, number))
+    for webhook_id in _WEBHOOK_ID_RE.findall(content):
+        keys.add(f"webhook:{webhook_id}")
+    return keys
@@ -3,6 +3,8 @@
 Tests the base types, validation logic, and InputSourceManager.
 """
 
+import asyncio
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import List
@@ -323,3 +325,17 @@ class TestInputSourceManager:
         results = await manager.poll_all_sources()
         assert results["failing"] == []
         assert results["working"] == []
+
+    async def test_poll_all_sources_concurrently(self):
+        class SlowSource(MockInputSource):
+            async def poll_for_inputs(self):
+                await asyncio.sleep(0.2)
+                return []
+
+        manager = InputSourceManager()
+        for name in ["a", "b", "c"]:
+            manager.register_source(name, SlowSource(config={}))
+        start = time.monotonic()
+        results = await manager.poll_all_sources()
+        assert list(results) == ["a", "b", "c"]
+        assert time.monotonic() - start < 0.5
@@ -117,6 +117,26 @@ class TestSourceMetrics:
         assert d["last_poll_time"] is not None
         assert d["last_success_time"] is not None
 
+    def test_poll_latency_percentiles(self):
+        m = SourceMetrics(source_name="test", source_type="test")
+        assert m.poll_latency_percentile(95) == 0.0
+        for duration in range(1, 21):
+            m.record_poll_attempt(float(duration))
+        assert m.last_poll_duration_seconds == 20.0
+        assert m.max_poll_duration_seconds == 20.0
+        assert m.poll_latency_percentile(50) == 10.0
+        assert m.poll_latency_percentile(95) == 19.0
+        d = m.to_dict()
+        assert d["p50_poll_duration_seconds"] == 10.0
+        assert d["p95_poll_duration_seconds"] == 19.0
+
+    def test_latency_window_is_bounded(self):
+        m = SourceMetrics(source_name="test", source_type="test")
+        for _ in range(250):
+            m.record_poll_attempt(0.1)
+        assert len(m.recent_poll_durations) == 100
+        assert m.poll_attempts == 250
+
     def test_to_dict_none_times(self):
         m = SourceMetrics(source_name="test", source_type="test")
         d = m.to_dict()
@@ -171,6 +191,8 @@ class TestMetricsCollector:
         assert m2.tasks_created == 1
         assert m2.failed_polls == 1
         assert m2.last_error == "test error"
+        assert m2.recent_poll_durations == [2.5]
+        assert m2.poll_latency_percentile(95) == 2.5
 
     def test_save_all_metrics(self, tmp_path):
         collector = MetricsCollector(tmp_path / "metrics")
@@ -0,0 +1,123 @@
+"""Tests for concurrent polling in the input source orchestrator."""
+
+import asyncio
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+from gptme_contrib_lib.config import (
+    EmailSourceConfig,
+    GitHubSourceConfig,
+    InputSourcesConfig,
+    MonitoringConfig,
+    SchedulerSourceConfig,
+    WebhookSourceConfig,
+)
+from gptme_contrib_lib.input_sources import (
+    InputSource,
+    InputSourceType,
+    TaskCreationResult,
+    TaskRequest,
+)
+from gptme_contrib_lib.orchestrator import InputSourceOrchestrator
+
+
+class SlowSource(InputSource):
+    """Source whose poll and acknowledge steps take a fixed time."""
+
+    def __init__(self, n_requests: int = 0, delay: float = 0.2):
+        super().__init__(config={})
+        self.n_requests = n_requests
+        self.delay = delay
+        self.acks_in_flight = 0
+        self.max_acks_in_flight = 0
+        self.acknowledged: List[str] = []
+
+    def _get_source_type(self) -> InputSourceType:
+        return InputSourceType.WEBHOOK
+
+    async def poll_for_inputs(self) -> List[TaskRequest]:
+        await asyncio.sleep(self.delay)
+        return [
+            TaskRequest(
+                source_type=InputSourceType.WEBHOOK,
+                source_id=str(i),
+                title=f"Task {i}",
+                description="desc",
+                created_at=datetime.now(),
+            )
+            for i in range(self.n_requests)
+        ]
+
+    async def create_task(self, request: TaskRequest) -> TaskCreationResult:
+        return TaskCreationResult(success=True, task_id=request.source_id)
+
+    async def acknowledge_input(self, request: TaskRequest) -> None:
+        self.acks_in_flight += 1
+        self.max_acks_in_flight = max(self.max_acks_in_flight, self.acks_in_flight)
+        await asyncio.sleep(self.delay)
+        self.acks_in_flight -= 1
+        self.acknowledged.append(request.source_id)
+
+
+class FailingSource(SlowSource):
+    async def poll_for_inputs(self) -> List[TaskRequest]:
+        raise ConnectionError("API down")
+
+
+def _orchestrator(tmp_path: Path, **kwargs) -> InputSourceOrchestrator:
+    config = InputSourcesConfig(
+        github=GitHubSourceConfig(enabled=False),
+        email=EmailSourceConfig(enabled=False),
+        webhook=WebhookSourceConfig(enabled=False),
+        scheduler=SchedulerSourceConfig(enabled=False),
+        monitoring=MonitoringConfig(metrics_dir=tmp_path / "metrics"),
+    )
+    return InputSourceOrchestrator(config, **kwargs)
+
+
+async def test_run_once_polls_sources_concurrently(tmp_path):
+    orchestrator = _orchestrator(tmp_path)
+    orchestrator.sources = {"a": SlowSource(), "b": SlowSource(), "c": SlowSource()}
+
+    start = time.monotonic()
+    results = await orchestrator.run_once()
+
+    assert results == {"a": 0, "b": 0, "c": 0}
+    # Three 0.2s polls run in parallel, not back to back
+    assert time.monotonic() - start < 0.5
+
+
+async def test_acknowledgments_are_pipelined_and_bounded(tmp_path):
+    orchestrator = _orchestrator(tmp_path, max_concurrent_acks=2)
+    source = SlowSource(n_requests=6, delay=0.05)
+    orchestrator.sources = {"webhook": source}
+
+    results = await orchestrator.run_once()
+
+    assert results == {"webhook": 6}
+    assert sorted(source.acknowledged) == [str(i) for i in range(6)]
+    assert source.max_acks_in_flight == 2
+
+
+async def test_poll_latency_and_failures_recorded(tmp_path):
+    orchestrator = _orchestrator(tmp_path)
+    orchestrator.sources = {
+        "ok": SlowSource(n_requests=1, delay=0.05),
+        "down": FailingSource(),
+    }
+
+    results = await orchestrator.run_once()
+
+    assert results == {"ok": 1, "down": 0}
+    assert orchestrator.metrics_collector is not None
+    ok = orchestrator.metrics_collector.sources["ok"]
+    assert ok.successful_polls == 1
+    assert ok.tasks_created == 1
+    assert ok.last_poll_duration_seconds >= 0.05
+    down = orchestrator.metrics_collector.sources["down"]
+    assert down.poll_attempts == 1
+    assert down.failed_polls == 1
+    assert down.last_error == "API down"
+    assert (tmp_path / "metrics" / "ok.json").exists()
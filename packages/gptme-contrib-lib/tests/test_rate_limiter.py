@@ -6,9 +6,13 @@ Tests the token bucket rate limiting algorithm at multiple levels:
 - MultiSourceRateLimiter (multi-source management)
 """
 
+import asyncio
+import multiprocessing
+import sqlite3
 import time
 from unittest.mock import patch
 
+import pytest
 from gptme_contrib_lib.rate_limiter import (
     MultiSourceRateLimiter,
     RateLimiter,
@@ -245,3 +249,168 @@ class TestMultiSourceRateLimiter:
         assert "a" in all_status
         assert "b" in all_status
         assert len(all_status) == 2
+
+    async def test_acquire_unregistered_source_returns_immediately(self):
+        multi = MultiSourceRateLimiter()
+        await multi.acquire("unknown")
+
+
+# ── Shared state ────────────────────────────────────────────────
+
+
+def _drain_shared_bucket(state_path: str) -> int:
+    """Consume as many tokens as possible from a shared bucket (subprocess)."""
+    limiter = RateLimiter(max_per_minute=20, max_per_hour=1000, state_path=state_path)
+    consumed = 0
+    for _ in range(50):
+        if limiter.consume("github"):
+            consumed += 1
+    return consumed
+
+
+class TestSharedRateLimiter:
+    """Tests for bucket state shared through SQLite."""
+
+    def test_instances_share_budget(self, tmp_path):
+        state_path = tmp_path / "rate-limits.db"
+        a = RateLimiter(max_per_minute=5, max_per_hour=1000, state_path=state_path)
+        b = RateLimiter(max_per_minute=5, max_per_hour=1000, state_path=state_path)
+        assert all(a.consume("github") for _ in range(3))
+        assert b.consume("github") is True
+        assert b.consume("github") is True
+        assert a.consume("github") is False
+        assert b.check_limit("github") is False
+        assert a.get_wait_time("github") > 0
+
+    def test_sources_are_independent(self, tmp_path):
+        limiter = RateLimiter(max_per_minute=1, state_path=tmp_path / "rl.db")
+        assert limiter.consume("github") is True
+        assert limiter.consume("email") is True
+        assert limiter.consume("github") is False
+
+    def test_reset_clears_shared_state(self, tmp_path):
+        state_path = tmp_path / "rl.db"
+        a = RateLimiter(max_per_minute=1, state_path=state_path)
+        b = RateLimiter(max_per_minute=1, state_path=state_path)
+        assert a.consume("github") is True
+        b.reset_source("github")
+        assert a.consume("github") is True
+
+    def test_processes_share_budget(self, tmp_path):
+        state_path = str(tmp_path / "rl.db")
+        with multiprocessing.get_context("spawn").Pool(4) as pool:
+            consumed = pool.map(_drain_shared_bucket, [state_path] * 4)
+        # Refill during the test may add a token or two, never a full budget each
+        assert 20 <= sum(consumed) <= 22
+
+    def test_multi_source_limiter_uses_shared_state(self, tmp_path):
+        state_path = tmp_path / "rl.db"
+        a = MultiSourceRateLimiter(state_path=state_path)
+        b = MultiSourceRateLimiter(state_path=state_path)
+        a.register_source("api", max_per_minute=1)
+        b.register_source("api", max_per_minute=1)
+        assert a.consume("api") is True
+        assert b.consume("api") is False
+
+
+# ── acquire() ───────────────────────────────────────────────────
+
+
+class TestAcquire:
+    """Tests for async acquire()."""
+
+    async def test_acquire_immediate_when_tokens_available(self):
+        limiter = RateLimiter(max_per_minute=10)
+        start = time.monotonic()
+        await limiter.acquire("api")
+        assert time.monotonic() - start < 0.05
+        assert limiter.minute_buckets["api"].tokens < 10
+
+    async def test_acquire_sleeps_computed_wait_once(self, monkeypatch):
+        limiter = RateLimiter(max_per_minute=600)  # 10 tokens/s
+        while limiter.consume("api"):
+            pass
+        sleeps = []
+        real_sleep = asyncio.sleep
+
+        async def recording_sleep(delay):
+            sleeps.append(delay)
+            await real_sleep(delay)
+
+        monkeypatch.setattr(asyncio, "sleep", recording_sleep)
+        await limiter.acquire("api")
+        assert len(sleeps) == 1
+        assert 0 < sleeps[0] <= 0.1
+
+    async def test_acquire_is_fifo(self):
+        limiter = RateLimiter(max_per_minute=1200, max_per_hour=10_000)  # 20 tokens/s
+        while limiter.consume("api"):
+            pass
+        order = []
+
+        async def worker(i):
+            await limiter.acquire("api")
+            order.append(i)
+
+        await asyncio.gather(*(worker(i) for i in range(5)))
+        assert order == [0, 1, 2, 3, 4]
+
+    async def test_acquire_rejects_count_above_capacity(self):
+        limiter = RateLimiter(max_per_minute=5)
+        with pytest.raises(ValueError):
+            await limiter.acquire("api", count=6)
+
+    async def test_acquire_waits_for_tokens_taken_by_other_instance(
+        self, tmp_path, monkeypatch
+    ):
+        state_path = tmp_path / "rl.db"
+        a = RateLimiter(max_per_minute=600, state_path=state_path)
+        b = RateLimiter(max_per_minute=600, state_path=state_path)
+        while a.consume("api"):
+            pass
+        sleeps = []
+        real_sleep = asyncio.sleep
+
+        async def recording_sleep(delay):
+            sleeps.append(delay)
+            await real_sleep(delay)
+
+        monkeypatch.setattr(asyncio, "sleep", recording_sleep)
+        await b.acquire("api")
+        assert len(sleeps) == 1
+        assert sleeps[0] > 0
+
+    async def test_acquire_does_not_block_loop_on_store_lock(self, tmp_path):
+        state_path = tmp_path / "rl.db"
+        limiter = RateLimiter(max_per_minute=10, state_path=state_path)
+        limiter.consume("api")  # create the database
+        other = sqlite3.connect(state_path)
+        other.execute("BEGIN IMMEDIATE")
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        tick_task = asyncio.create_task(ticker())
+        acquire_task = asyncio.create_task(limiter.acquire("api"))
+        await asyncio.sleep(0.2)
+        assert not acquire_task.done()
+        assert ticks >= 5
+        other.rollback()
+        other.close()
+        await asyncio.wait_for(acquire_task, timeout=5)
+        tick_task.cancel()
+
+    def test_acquire_across_event_loops(self):
+        limiter = RateLimiter(max_per_minute=1200, max_per_hour=10_000)
+
+        async def contend():
+            while limiter.consume("api"):
+                pass
+            await asyncio.gather(limiter.acquire("api"), limiter.acquire("api"))
+
+        asyncio.run(contend())
+        asyncio.run(contend())  # locks from the first loop must not be reused
@@ -0,0 +1,169 @@
+"""Tests for the task source index used for duplicate detection."""
+
+import os
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from gptme_contrib_lib import source_index
+from gptme_contrib_lib.input_source_impl import (
+    EmailInputSource,
+    GitHubInputSource,
+    WebhookInputSource,
+)
+from gptme_contrib_lib.input_sources import InputSourceType, TaskRequest
+from gptme_contrib_lib.source_index import SourceIndex
+
+
+@pytest.fixture
+def tasks_dir(tmp_path: Path) -> Path:
+    path = tmp_path / "tasks"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture(autouse=True)
+def no_refresh_throttle(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(source_index, "REFRESH_INTERVAL_SECONDS", 0.0)
+
+
+def _issue_request(number: int, repo: str = "owner/repo") -> TaskRequest:
+    return TaskRequest(
+        source_type=InputSourceType.GITHUB,
+        source_id=f"issue-{number}",
+        title=f"Issue {number}",
+        description="Please do the thing",
+        created_at=datetime.now(),
+        metadata={
+            "issue_number": number,
+            "repo": repo,
+            "url": f"https://github.com/{repo}/issues/{number}",
+        },
+    )
+
+
+class TestSourceIndex:
+    def test_indexes_frontmatter_and_issue_urls(self, tasks_dir: Path) -> None:
+        (tasks_dir / "a.md").write_text(
+            '---\nstate: new\nsource_id: "email:<m1@example.com>"\n---\n# A\n'
+        )
+        (tasks_dir / "nested").mkdir()
+        (tasks_dir / "nested" / "b.md").write_text(
+            "# B\n\nSee https://github.com/owner/repo/issues/12 for context.\n"
+        )
+        index = SourceIndex(tasks_dir)
+        assert index.contains("email:<m1@example.com>")
+        assert index.find("github:owner/repo#12") == [tasks_dir / "nested" / "b.md"]
+        assert not index.contains("github:owner/repo#1")
+        assert index.has_title_prefix("B")
+
+    def test_refresh_rereads_only_changed_files(
+        self, tasks_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        (tasks_dir / "a.md").write_text("https://github.com/o/r/issues/1\n")
+        (tasks_dir / "b.md").write_text("https://github.com/o/r/issues/2\n")
+        index = SourceIndex(tasks_dir)
+        index.refresh()
+
+        read: list[str] = []
+        original = source_index._extract_source_keys
+
+        def counting(content: str) -> set[str]:
+            read.append(content)
+            return original(content)
+
+        monkeypatch.setattr(source_index, "_extract_source_keys", counting)
+        index.refresh()
+        assert read == []
+
+        (tasks_dir / "a.md").write_text("https://github.com/o/r/issues/3\n")
+        os.utime(tasks_dir / "a.md", ns=(0, 1))
+        (tasks_dir / "b.md").unlink()
+        index.refresh()
+
+        assert len(read) == 1
+        assert index.contains("github:o/r#3")
+        assert not index.contains("github:o/r#1")
+        assert not index.contains("github:o/r#2")
+
+    def test_refresh_is_throttled(
+        self, tasks_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(source_index, "REFRESH_INTERVAL_SECONDS", 60.0)
+        index = SourceIndex(tasks_dir)
+        index.refresh()
+        (tasks_dir / "a.md").write_text("https://github.com/o/r/issues/1\n")
+        assert not index.contains("github:o/r#1")
+        # Files written through update() are visible immediately
+        index.update(tasks_dir / "a.md")
+        assert index.contains("github:o/r#1")
+
+    def test_shared_per_directory(self, tasks_dir: Path, tmp_path: Path) -> None:
+        assert SourceIndex.shared(tasks_dir) is SourceIndex.shared(tasks_dir)
+        assert SourceIndex.shared(tasks_dir) is not SourceIndex.shared(tmp_path)
+
+
+class TestDuplicateDetection:
+    async def test_github_duplicate_is_exact_issue(self, tmp_path: Path) -> None:
+        source = GitHubInputSource(config={"workspace_path": str(tmp_path)})
+        assert not source._is_duplicate(_issue_request(12))
+
+        result = await source.create_task(_issue_request(12))
+        assert result.success
+
+        assert source._is_duplicate(_issue_request(12))
+        # The old grep for "#12" also matched issue 123 and other repos
+        assert not source._is_duplicate(_issue_request(123))
+        assert not source._is_duplicate(_issue_request(12, repo="other/repo"))
+
+    def test_github_legacy_task_without_source_id(self, tmp_path: Path) -> None:
+        (tmp_path / "tasks").mkdir()
+        (tmp_path / "tasks" / "old.md").write_text(
+            "---\nstate: new\n---\n# Old\n\n"
+            "- **URL**: https://github.com/owner/repo/issues/7\n"
+        )
+        source = GitHubInputSource(config={"workspace_path": str(tmp_path)})
+        assert source._is_duplicate(_issue_request(7))
+
+    async def test_email_duplicate_by_message_id_and_legacy_title(
+        self, tmp_path: Path
+    ) -> None:
+        source = EmailInputSource(config={"workspace_path": str(tmp_path)})
+        request = TaskRequest(
+            source_type=InputSourceType.EMAIL,
+            source_id="1.maildir.host",
+            title="Please review the draft",
+            description="Body",
+            created_at=datetime.now(),
+            metadata={
+                "subject": "Please review the draft",
+                "message_id": "<m1@example.com>",
+            },
+        )
+        assert not source._is_duplicate(request)
+        assert (await source.create_task(request)).success
+        assert source._is_duplicate(request)
+
+        (tmp_path / "tasks" / "legacy.md").write_text("# Legacy subject line\n")
+        legacy = TaskRequest(
+            source_type=InputSourceType.EMAIL,
+            source_id="2.maildir.host",
+            title="Legacy subject line",
+            description="Body",
+            created_at=datetime.now(),
+            metadata={"subject": "Legacy subject line", "message_id": "<m2@x>"},
+        )
+        assert source._is_duplicate(legacy)
+
+    async def test_webhook_duplicate(self, tmp_path: Path) -> None:
+        source = WebhookInputSource(config={"workspace_path": str(tmp_path)})
+        request = TaskRequest(
+            source_type=InputSourceType.WEBHOOK,
+            source_id="hook-1",
+            title="From webhook",
+            description="Body",
+            created_at=datetime.now(),
+        )
+        assert not source._is_duplicate(request)
+        assert (await source.create_task(request)).success
+        assert source._is_duplicate(request)
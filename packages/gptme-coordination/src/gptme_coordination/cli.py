@@ -8,7 +8,7 @@ Usage:
     gptme-coordination work-complete <agent_id> <task_id> [--result TEXT]
     gptme-coordination work-abandon <agent_id> <task_id> [--reason TEXT]
     gptme-coordination work-list [--agent AGENT_ID] [--available | --claimed]
-    gptme-coordination inbox <agent_id>
+    gptme-coordination inbox <agent_id> [--since-id ID] [--wait SECONDS]
     gptme-coordination send <agent_id> <body> [--to RECIPIENT] [--channel CHANNEL]
     gptme-coordination announce <agent_id>
     gptme-coordination status
@@ -130,14 +130,21 @@ def cmd_inbox(args: argparse.Namespace) -> int:
     db_path = args.db or get_db_path()
     with CoordinationDB(db_path) as db:
         bus = MessageBus(db)
-        messages = bus.inbox(args.agent_id)
+        if args.wait is not None:
+            messages = bus.wait_for_message(
+                args.agent_id, since_id=args.since_id, timeout=args.wait
+            )
+        else:
+            messages = bus.inbox(args.agent_id, since_id=args.since_id)
         if not messages:
             print(f"(no messages for {args.agent_id})")
             return 0
         for msg in messages:
             src = msg.sender
             dest = f"→{msg.recipient}" if msg.recipient else "(broadcast)"
-            print(f"[{msg.created_at}] {src} {dest} [{msg.channel}]: {msg.body}")
+            print(
+                f"#{msg.id} [{msg.created_at}] {src} {dest} [{msg.channel}]: {msg.body}"
+            )
         return 0
 
 
@@ -364,6 +371,17 @@ def build_parser() -> argparse.ArgumentParser:
     # inbox
     p = sub.add_parser("inbox", help="Read messages")
     p.add_argument("agent_id")
+    p.add_argument(
+        "--since-id",
+        type=int,
+        help="Only messages after this message ID (shown as #ID)",
+    )
+    p.add_argument(
+        "--wait",
+        type=float,
+        metavar="SECONDS",
+        help="Block up to SECONDS for new messages",
+    )
 
     # send
     p = sub.add_parser("send", help="Send a message")
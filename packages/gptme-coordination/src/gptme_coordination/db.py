@@ -7,6 +7,8 @@ import subprocess
 from collections.abc import Mapping
 from pathlib import Path
 
+from gptme_coordination.notify import ChangeNotifier
+
 # Register datetime adapters to suppress Python 3.12+ deprecation warning
 # about the default ISO format adapter
 sqlite3.register_adapter(datetime.datetime, lambda d: d.isoformat())
@@ -56,6 +58,9 @@ CREATE TABLE IF NOT EXISTS events (
     -- Lifecycle
     state TEXT NOT NULL DEFAULT 'pending',
     priority INTEGER NOT NULL DEFAULT 0,
+    -- Materialized age-boosted priority (see EventQueue), so claims can use an index
+    effective_priority INTEGER,
+    boost_due_at TEXT,  -- when effective_priority next needs recomputing (NULL = capped)
     retry_count INTEGER NOT NULL DEFAULT 0,
     max_retries INTEGER NOT NULL DEFAULT 3,
     -- Timing
@@ -155,6 +160,7 @@ class CoordinationDB:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._conn: sqlite3.Connection | None = None
+        self.notifier = ChangeNotifier(self.db_path)
 
     @property
     def conn(self) -> sqlite3.Connection:
@@ -184,6 +190,29 @@ class CoordinationDB:
             conn.execute("ALTER TABLE work ADD COLUMN hmac TEXT")
         except sqlite3.OperationalError:
             pass  # Column already exists (or work table doesn't exist yet)
+        try:
+            conn.execute("ALTER TABLE events ADD COLUMN effective_priority INTEGER")
+            conn.execute("ALTER TABLE events ADD COLUMN boost_due_at TEXT")
+            # Existing events get recomputed on the next claim
+            # (boost_due_at in the past marks them as due)
+            conn.execute(
+                "UPDATE events SET effective_priority = priority, boost_due_at = created_at"
+            )
+        except sqlite3.OperationalError:
+            pass  # Columns already exist
+        # Indexes on the columns above live here (not in SCHEMA) so they are
+        # created after the columns exist on databases from older versions
+        conn.execute(
+            """CREATE INDEX IF NOT EXISTS idx_events_claim
+            ON events(state, effective_priority DESC, created_at ASC)"""
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_events_boost_due ON events(state, boost_due_at)"
+        )
+
+    def notify_change(self) -> None:
+        """Wake local waiters after committing rows they may be waiting for."""
+        self.notifier.notify()
 
     def close(self) -> None:
         if self._conn is not None:
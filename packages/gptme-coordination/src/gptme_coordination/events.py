@@ -11,21 +11,40 @@ State machine:
                     └→ pending/dead_letter (via release_stale_claims(), crash recovery)
     dead_letter → pending (via retry(), manual)
     dead_letter → completed (via discard(), manual)
+
+Consumers can block in ``wait_for_event()`` instead of polling ``claim_next()``;
+every transition into ``pending`` notifies local waiters.
 """
 
 from __future__ import annotations
 
 import json
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
 
 from gptme_coordination.db import CoordinationDB
+from gptme_coordination.notify import wait_until
 
 # Default age-boost cap: events gain at most this many priority points
 # as they age (prevents very old events from monopolizing the queue).
 AGE_BOOST_CAP = 20
 AGE_BOOST_RATE = 2  # priority points per hour
+# Seconds between age-boost tiers (one priority point each)
+AGE_BOOST_TIER_SECONDS = 3600 // AGE_BOOST_RATE
+
+# SQL for the current age boost of an event row, and the time it next changes.
+# The boost is materialized in events.effective_priority so claims can walk an
+# index instead of sorting every pending row; rows are only recomputed once
+# their boost_due_at passes, so each event is rewritten at most AGE_BOOST_CAP times.
+_AGE_BOOST_SQL = "MIN(CAST((julianday('now') - julianday(created_at)) * 24 * :rate AS INTEGER), :cap)"
+_REFRESH_BOOSTS_SQL = f"""UPDATE events
+SET effective_priority = priority + {_AGE_BOOST_SQL},
+    boost_due_at = CASE WHEN {_AGE_BOOST_SQL} >= :cap THEN NULL
+        ELSE datetime(created_at, '+' || (({_AGE_BOOST_SQL} + 1) * :tier_seconds) || ' seconds')
+    END
+WHERE state = 'pending' AND boost_due_at <= datetime('now')"""
 
 # Default priority levels for common trigger types
 PRIORITY_DEFAULTS: dict[str, int] = {
@@ -128,53 +147,127 @@ class EventQueue:
 
         Returns the created Event, or None if deduplicated.
         """
-        resolved_priority = (
-            priority if priority is not None else PRIORITY_DEFAULTS.get(trigger_type, 0)
-        )
-        payload_json = json.dumps(payload) if payload else None
-
         conn = self.db.conn
         conn.execute("BEGIN IMMEDIATE")
         try:
-            # Dedup: check for recent pending/claimed event on the same thread
-            existing = conn.execute(
-                """SELECT id FROM events
-                WHERE thread_key = ?
-                  AND state IN ('pending', 'claimed', 'processing')
-                  AND created_at > datetime('now', ? || ' minutes')""",
-                (thread_key, str(-dedup_window_minutes)),
-            ).fetchone()
-            if existing:
-                conn.execute("ROLLBACK")
-                return None
-
-            cursor = conn.execute(
-                """INSERT INTO events
-                    (trigger_type, source, external_id, thread_key,
-                     repo, number, title, url, payload_json,
-                     priority, max_retries)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    trigger_type,
-                    source,
-                    external_id,
-                    thread_key,
-                    repo,
-                    number,
-                    title,
-                    url,
-                    payload_json,
-                    resolved_priority,
-                    max_retries,
-                ),
+            event_id = self._insert(
+                trigger_type,
+                source,
+                thread_key,
+                external_id=external_id,
+                repo=repo,
+                number=number,
+                title=title,
+                url=url,
+                payload=payload,
+                priority=priority,
+                max_retries=max_retries,
+                dedup_window_minutes=dedup_window_minutes,
             )
-            event_id = cursor.lastrowid
+            conn.execute("COMMIT" if event_id is not None else "ROLLBACK")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        if event_id is not None:
+            self.db.notify_change()
+        return self.get(event_id) if event_id is not None else None
+
+    def ingest_many(self, events: Iterable[dict[str, Any]]) -> list[int | None]:
+        """Ingest many events in a single transaction.
+
+        Each item holds the keyword arguments of :meth:`ingest`
+        (``trigger_type``, ``source`` and ``thread_key`` are required).
+        Deduplication applies against existing events and within the batch.
+
+        Returns the new event IDs in input order, with None for deduplicated items.
+        """
+        conn = self.db.conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            ids = [self._insert(**event) for event in events]
             conn.execute("COMMIT")
         except Exception:
             conn.execute("ROLLBACK")
             raise
+        if any(event_id is not None for event_id in ids):
+            self.db.notify_change()
+        return ids
 
-        return self.get(event_id)  # type: ignore[arg-type]
+    def _insert(
+        self,
+        trigger_type: str,
+        source: str,
+        thread_key: str,
+        *,
+        external_id: str | None = None,
+        repo: str | None = None,
+        number: int | None = None,
+        title: str | None = None,
+        url: str | None = None,
+        payload: dict[str, Any] | None = None,
+        priority: int | None = None,
+        max_retries: int = 3,
+        dedup_window_minutes: int = 30,
+    ) -> int | None:
+        """Insert one event inside the caller's transaction; None if deduplicated."""
+        resolved_priority = (
+            priority if priority is not None else PRIORITY_DEFAULTS.get(trigger_type, 0)
+        )
+        payload_json = json.dumps(payload) if payload else None
+
+        conn = self.db.conn
+        # Dedup: check for recent pending/claimed event on the same thread
+        existing = conn.execute(
+            """SELECT id FROM events
+            WHERE thread_key = ?
+              AND state IN ('pending', 'claimed', 'processing')
+              AND created_at > datetime('now', ? || ' minutes')""",
+            (thread_key, str(-dedup_window_minutes)),
+        ).fetchone()
+        if existing:
+            return None
+
+        cursor = conn.execute(
+            """INSERT INTO events
+                (trigger_type, source, external_id, thread_key,
+                 repo, number, title, url, payload_json,
+                 priority, effective_priority, boost_due_at, max_retries)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+                    CASE WHEN ? > 0 THEN datetime('now', '+' || ? || ' seconds') END, ?)""",
+            (
+                trigger_type,
+                source,
+                external_id,
+                thread_key,
+                repo,
+                number,
+                title,
+                url,
+                payload_json,
+                resolved_priority,
+                resolved_priority,
+                AGE_BOOST_CAP,
+                AGE_BOOST_TIER_SECONDS,
+                max_retries,
+            ),
+        )
+        return cursor.lastrowid
+
+    def _refresh_boosts(self) -> None:
+        """Recompute effective_priority for pending events whose age tier changed.
+
+        Must run inside the caller's transaction. Served by the
+        ``idx_events_boost_due`` index, so it only touches due rows.
+        """
+        self.db.conn.execute(
+            _REFRESH_BOOSTS_SQL,
+            {
+                "rate": AGE_BOOST_RATE,
+                "cap": AGE_BOOST_CAP,
+                "tier_seconds": AGE_BOOST_TIER_SECONDS,
+            },
+        )
 
     def claim_next(self, claimed_by: str) -> Event | None:
         """Atomically claim the highest-priority pending event.
@@ -182,40 +275,65 @@ class EventQueue:
         Uses CAS to ensure only one agent claims a given event.
         Returns the claimed Event, or None if queue is empty.
         """
+        claimed = self.claim_batch(claimed_by, 1)
+        return claimed[0] if claimed else None
+
+    def claim_batch(self, claimed_by: str, n: int) -> list[Event]:
+        """Atomically claim up to ``n`` of the highest-priority pending events.
+
+        Events are ordered by age-boosted priority: older events gain
+        AGE_BOOST_RATE points per hour, capped at AGE_BOOST_CAP, so
+        low-priority events cannot starve. Ties go to the oldest event.
+
+        Returns the claimed events in priority order (empty if the queue is empty).
+        """
+        if n <= 0:
+            return []
+
         conn = self.db.conn
         conn.execute("BEGIN IMMEDIATE")
         try:
-            # Select the highest-priority pending event (age-boosted).
-            # Age boost prevents low-priority events from starving: older events
-            # gain a priority bonus of AGE_BOOST_RATE per hour, capped at AGE_BOOST_CAP.
-            row = conn.execute(
+            self._refresh_boosts()
+            rows = conn.execute(
                 """SELECT id FROM events
                 WHERE state = 'pending'
-                ORDER BY (priority + MIN(CAST((julianday('now') - julianday(created_at)) * 24 * ? AS INTEGER), ?)) DESC, created_at ASC
-                LIMIT 1""",
-                (AGE_BOOST_RATE, AGE_BOOST_CAP),
-            ).fetchone()
-            if row is None:
+                ORDER BY effective_priority DESC, created_at ASC
+                LIMIT ?""",
+                (n,),
+            ).fetchall()
+            event_ids = [row["id"] for row in rows]
+            if not event_ids:
                 conn.execute("ROLLBACK")
-                return None
+                return []
 
-            event_id = row["id"]
+            placeholders = ", ".join("?" * len(event_ids))
             conn.execute(
-                """UPDATE events
+                f"""UPDATE events
                 SET state = 'claimed', claimed_by = ?, claimed_at = datetime('now')
-                WHERE id = ? AND state = 'pending'""",
-                (claimed_by, event_id),
+                WHERE id IN ({placeholders}) AND state = 'pending'""",  # noqa: S608
+                (claimed_by, *event_ids),
             )
-            if conn.execute("SELECT changes()").fetchone()[0] == 0:
-                conn.execute("ROLLBACK")
-                return None
-
             conn.execute("COMMIT")
         except Exception:
             conn.execute("ROLLBACK")
             raise
 
-        return self.get(event_id)
+        events = [self.get(event_id) for event_id in event_ids]
+        return [event for event in events if event is not None]
+
+    def wait_for_event(
+        self, claimed_by: str, timeout: float | None = None
+    ) -> Event | None:
+        """Claim the next event, blocking until one is pending.
+
+        Returns None once ``timeout`` seconds pass (``None`` waits
+        indefinitely). Wakes on notifications from ingest and retry paths in
+        any local process, so no claim transaction runs while the queue is idle.
+        """
+        with self.db.notifier.listen() as listener:
+            return wait_until(
+                self.db.conn, listener, lambda: self.claim_next(claimed_by), timeout
+            )
 
     def complete(
         self, event_id: int, *, result: str = "success", detail: str | None = None
@@ -249,6 +367,7 @@ class EventQueue:
 
             retry_count = row["retry_count"]
             max_retries = row["max_retries"]
+            requeued = False
 
             if retry_count < max_retries:
                 # Schedule retry with exponential backoff (tracked via created_at reset)
@@ -260,6 +379,7 @@ class EventQueue:
                     WHERE id = ? AND state IN ('claimed', 'processing')""",
                     (detail, event_id),
                 )
+                requeued = True
             else:
                 conn.execute(
                     """UPDATE events
@@ -272,10 +392,12 @@ class EventQueue:
 
             ok = bool(conn.execute("SELECT changes()").fetchone()[0] > 0)
             conn.execute("COMMIT" if ok else "ROLLBACK")
-            return ok
         except Exception:
             conn.execute("ROLLBACK")
             raise
+        if ok and requeued:
+            self.db.notify_change()
+        return ok
 
     def retry(self, event_id: int) -> bool:
         """Manually retry a dead-lettered event (resets retry count)."""
@@ -287,6 +409,8 @@ class EventQueue:
             WHERE id = ? AND state IN ('dead_letter')""",
             (event_id,),
         )
+        if rows.rowcount > 0:
+            self.db.notify_change()
         return bool(rows.rowcount > 0)
 
     def discard(self, event_id: int) -> bool:
@@ -377,6 +501,8 @@ class EventQueue:
               AND claimed_at < datetime('now', ? || ' minutes')""",
             (str(-older_than_minutes),),
         )
+        if rows.rowcount > 0:
+            self.db.notify_change()
         return rows.rowcount
 
 
@@ -6,6 +6,9 @@ broadcasts (recipient=None). Channels allow topic-based filtering.
 
 Every message includes an HMAC-SHA256 over the canonical
 (sender|recipient|channel|body) tuple to authenticate the sender's identity.
+
+Readers track their position with ``since_id`` (the last message ID seen) and
+can block in :meth:`MessageBus.wait_for_message` instead of polling.
 """
 
 from __future__ import annotations
@@ -17,6 +20,7 @@ from typing import Any
 
 from gptme_coordination.auth import compute_hmac as _compute_hmac
 from gptme_coordination.db import CoordinationDB
+from gptme_coordination.notify import wait_until
 
 
 @dataclass
@@ -69,6 +73,7 @@ class MessageBus:
             VALUES (?, ?, ?, ?, ?)""",
             (sender, recipient, channel, body, hmac_val),
         )
+        self.db.notify_change()
         row = self.db.conn.execute(
             "SELECT * FROM messages WHERE id = ?", (cursor.lastrowid,)
         ).fetchone()
@@ -80,15 +85,24 @@ class MessageBus:
         since: datetime | None = None,
         channel: str | None = None,
         secrets: dict[str, bytes] | None = None,
+        since_id: int | None = None,
     ) -> list[Message]:
         """Get messages for an agent (targeted + broadcasts), optionally filtered.
 
+        Pass the ID of the last message already seen as ``since_id`` to read
+        incrementally. Unlike ``since``, this never skips or repeats messages
+        created within the same second.
+
         If ``secrets`` is provided, messages with mismatched HMACs are marked
         as ``verified=False`` rather than being dropped (advisory verification).
         """
         query = """SELECT * FROM messages
             WHERE (recipient = ? OR recipient IS NULL)"""
-        params: list[str | None] = [agent_id]
+        params: list[str | int | None] = [agent_id]
+
+        if since_id is not None:
+            query += " AND id > ?"
+            params.append(since_id)
 
         if since is not None:
             query += " AND created_at > ?"
@@ -121,6 +135,30 @@ class MessageBus:
 
         return messages
 
+    def wait_for_message(
+        self,
+        agent_id: str,
+        since_id: int | None = None,
+        channel: str | None = None,
+        timeout: float | None = None,
+        secrets: dict[str, bytes] | None = None,
+    ) -> list[Message]:
+        """Block until the agent has messages newer than ``since_id``.
+
+        Returns them like :meth:`inbox`, or an empty list once ``timeout``
+        seconds pass (``None`` waits indefinitely). Wakes on notifications
+        from :meth:`send` in any local process.
+        """
+        with self.db.notifier.listen() as listener:
+            return wait_until(
+                self.db.conn,
+                listener,
+                lambda: self.inbox(
+                    agent_id, channel=channel, secrets=secrets, since_id=since_id
+                ),
+                timeout,
+            )
+
     def history(
         self,
         channel: str = "general",
@@ -0,0 +1,182 @@
+"""Local change notifications for the coordination DB.
+
+Waiting for new messages or events used to mean polling SQLite on an interval,
+trading wakeup latency against wasted queries (and, for the event queue,
+write-lock contention on ``coord.db``). Writers now ping waiters after commit:
+
+- Every waiter binds a Unix datagram socket in ``<db>.notify/``.
+- :meth:`ChangeNotifier.notify` sends a one-byte datagram to each socket
+  there, removing sockets whose owner has exited.
+- :func:`wait_until` re-runs its check whenever a notification arrives.
+
+Notifications are only hints. Waiters also wake every
+``FALLBACK_POLL_SECONDS`` and re-run the check if ``PRAGMA data_version``
+reports a commit from another connection. That covers writers that do not
+notify (older clients, manual SQL) and platforms without Unix sockets.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import secrets
+import select
+import socket
+import sqlite3
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+NOTIFY_DIR_SUFFIX = ".notify"
+
+# Upper bound on how long a missed notification can delay a waiter
+FALLBACK_POLL_SECONDS = 1.0
+
+_HAS_UNIX_SOCKETS = hasattr(socket, "AF_UNIX")
+
+
+class ChangeNotifier:
+    """Wakes processes waiting on a coordination DB after it changes."""
+
+    def __init__(self, db_path: str | Path):
+        db_path = Path(db_path)
+        self.directory = db_path.with_name(db_path.name + NOTIFY_DIR_SUFFIX)
+
+    def notify(self) -> None:
+        """Ping every registered waiter. Never raises."""
+        if not _HAS_UNIX_SOCKETS:
+            return
+        try:
+            entries = list(os.scandir(self.directory))
+        except FileNotFoundError:
+            return  # nobody has ever waited
+        except OSError as e:
+            logger.debug(f"Cannot list {self.directory}: {e}")
+            return
+        if not entries:
+            return
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.setblocking(False)
+        try:
+            for entry in entries:
+                if not entry.name.endswith(".sock"):
+                    continue
+                try:
+                    sock.sendto(b"\x01", entry.path)
+                except (ConnectionRefusedError, FileNotFoundError):
+                    # Owner exited without cleaning up
+                    _unlink_quietly(entry.path)
+                except BlockingIOError:
+                    pass  # waiter's buffer is full, so it is already due to wake
+                except OSError as e:
+                    logger.debug(f"Cannot notify {entry.path}: {e}")
+        finally:
+            sock.close()
+
+    def listen(self) -> ChangeListener:
+        """Register a waiter. Use as a context manager so the socket is removed."""
+        return ChangeListener(self.directory)
+
+
+class ChangeListener:
+    """A registered waiter, bound before the caller checks the DB.
+
+    Binding first means a change committed between the check and
+    :meth:`wait` still wakes the waiter.
+    """
+
+    def __init__(self, directory: Path):
+        self.path: str | None = None
+        self._sock: socket.socket | None = None
+        if not _HAS_UNIX_SOCKETS:
+            return
+        path = str(directory / f"{os.getpid()}-{secrets.token_hex(4)}.sock")
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            sock.bind(path)
+        except OSError as e:
+            # e.g. path longer than the AF_UNIX limit; fall back to polling
+            logger.debug(f"Cannot bind change listener at {path}: {e}")
+            sock.close()
+            return
+        sock.setblocking(False)
+        self.path = path
+        self._sock = sock
+
+    def wait(self, timeout: float) -> bool:
+        """Block up to ``timeout`` seconds; True if a notification arrived."""
+        if self._sock is None:
+            time.sleep(max(timeout, 0))
+            return False
+        readable, _, _ = select.select([self._sock], [], [], max(timeout, 0))
+        if not readable:
+            return False
+        # Drain so a burst of commits causes one wakeup
+        try:
+            while self._sock.recv(64):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def close(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+        if self.path is not None:
+            _unlink_quietly(self.path)
+            self.path = None
+
+    def __enter__(self) -> ChangeListener:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+
+def wait_until(
+    conn: sqlite3.Connection,
+    listener: ChangeListener,
+    check: Callable[[], T],
+    timeout: float | None = None,
+) -> T:
+    """Run ``check`` until it returns a truthy value or ``timeout`` expires.
+
+    ``check`` runs once up front, after each notification, and on fallback
+    wakeups when another connection has committed since the last check.
+    Returns the last result of ``check``. On timeout that result is falsy.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    version = _data_version(conn)
+    result = check()
+    while not result:
+        remaining = FALLBACK_POLL_SECONDS
+        if deadline is not None:
+            remaining = min(remaining, deadline - time.monotonic())
+            if remaining <= 0:
+                return result
+        notified = listener.wait(remaining)
+        current = _data_version(conn)
+        if notified or current != version:
+            version = current
+            result = check()
+    return result
+
+
+def _data_version(conn: sqlite3.Connection) -> int:
+    """Counter that changes when another connection commits to the DB."""
+    return int(conn.execute("PRAGMA data_version").fetchone()[0])
+
+
+def _unlink_quietly(path: str) -> None:
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
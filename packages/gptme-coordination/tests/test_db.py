@@ -233,3 +233,40 @@ class TestCoordinationDB:
             conn2 = db.conn
             assert conn2 is not None
             db.close()
+
+    def test_migrates_events_effective_priority(self):
+        """Events from before the materialized priority columns are backfilled."""
+        import sqlite3
+
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = Path(tmp) / "old.db"
+            conn = sqlite3.connect(str(db_path))
+            conn.execute(
+                """CREATE TABLE events (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    trigger_type TEXT NOT NULL, source TEXT NOT NULL,
+                    external_id TEXT, thread_key TEXT NOT NULL,
+                    repo TEXT, number INTEGER, title TEXT, url TEXT, payload_json TEXT,
+                    state TEXT NOT NULL DEFAULT 'pending',
+                    priority INTEGER NOT NULL DEFAULT 0,
+                    retry_count INTEGER NOT NULL DEFAULT 0,
+                    max_retries INTEGER NOT NULL DEFAULT 3,
+                    created_at TEXT NOT NULL DEFAULT (datetime('now')),
+                    claimed_at TEXT, completed_at TEXT, claimed_by TEXT,
+                    batch_id TEXT, result TEXT, result_detail TEXT
+                )"""
+            )
+            conn.execute(
+                "INSERT INTO events (trigger_type, source, thread_key, priority) "
+                "VALUES ('mention', 'github', 'k', 50)"
+            )
+            conn.commit()
+            conn.close()
+
+            db = CoordinationDB(str(db_path))
+            row = db.conn.execute(
+                "SELECT effective_priority, boost_due_at, created_at FROM events"
+            ).fetchone()
+            assert row["effective_priority"] == 50
+            assert row["boost_due_at"] == row["created_at"]
+            db.close()
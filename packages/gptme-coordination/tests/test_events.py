@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import threading
+import time
+
 import pytest
+from gptme_coordination import notify
 from gptme_coordination.db import CoordinationDB
 from gptme_coordination.events import PRIORITY_DEFAULTS, EventQueue, QueueStats
 
@@ -123,6 +127,119 @@ class TestClaimAndComplete:
         assert not ok
 
 
+class TestClaimBatch:
+    def test_claim_batch_returns_events_in_priority_order(self, queue):
+        queue.ingest("pr_update_general", "github", "key1", priority=10)
+        queue.ingest("ci_failure_master", "github", "key2", priority=100)
+        queue.ingest("mention", "github", "key3", priority=50)
+
+        claimed = queue.claim_batch("agent-1", 2)
+        assert [ev.priority for ev in claimed] == [100, 50]
+        assert all(
+            ev.state == "claimed" and ev.claimed_by == "agent-1" for ev in claimed
+        )
+
+        rest = queue.claim_batch("agent-2", 5)
+        assert [ev.priority for ev in rest] == [10]
+        assert queue.claim_batch("agent-2", 5) == []
+
+    def test_age_boost_lets_old_events_overtake(self, queue, db):
+        old = queue.ingest("scheduled_low", "cron", "old", priority=10)
+        queue.ingest("mention", "github", "new", priority=25)
+        assert old is not None
+        # Backdate the old event; boost_due_at in the past marks it for recompute
+        db.conn.execute(
+            """UPDATE events SET created_at = datetime('now', '-30 hours'),
+                boost_due_at = datetime('now', '-30 hours') WHERE id = ?""",
+            (old.id,),
+        )
+
+        ev = queue.claim_next("agent-1")
+        assert ev is not None
+        assert ev.id == old.id  # 10 + capped boost of 20 beats 25
+        row = db.conn.execute(
+            "SELECT effective_priority, boost_due_at FROM events WHERE id = ?",
+            (old.id,),
+        ).fetchone()
+        assert row["effective_priority"] == 30
+        assert row["boost_due_at"] is None  # capped, never recomputed again
+
+
+class TestIngestMany:
+    def test_ingest_many_dedups_against_queue_and_batch(self, queue):
+        queue.ingest("mention", "github", "existing")
+
+        ids = queue.ingest_many(
+            [
+                {
+                    "trigger_type": "mention",
+                    "source": "github",
+                    "thread_key": "existing",
+                },
+                {"trigger_type": "assign", "source": "github", "thread_key": "a"},
+                {"trigger_type": "assign", "source": "github", "thread_key": "a"},
+                {
+                    "trigger_type": "ci_failure_pr",
+                    "source": "github",
+                    "thread_key": "b",
+                    "repo": "gptme/gptme",
+                    "payload": {"run": 1},
+                },
+            ]
+        )
+
+        assert ids[0] is None
+        assert ids[1] is not None
+        assert ids[2] is None
+        ev = queue.get(ids[3])
+        assert ev is not None
+        assert ev.priority == PRIORITY_DEFAULTS["ci_failure_pr"]
+        assert ev.payload == {"run": 1}
+        assert queue.stats().pending == 3
+
+    def test_ingest_many_is_atomic(self, queue):
+        with pytest.raises(TypeError):
+            queue.ingest_many(
+                [
+                    {"trigger_type": "assign", "source": "github", "thread_key": "a"},
+                    {
+                        "trigger_type": "assign",
+                        "source": "github",
+                    },  # missing thread_key
+                ]
+            )
+        assert queue.stats().pending == 0
+
+
+class TestWaitForEvent:
+    def test_claims_pending_event(self, queue):
+        queue.ingest("mention", "github", "key1")
+        ev = queue.wait_for_event("worker", timeout=5)
+        assert ev is not None
+        assert ev.claimed_by == "worker"
+
+    def test_times_out_on_empty_queue(self, queue):
+        assert queue.wait_for_event("worker", timeout=0.2) is None
+
+    def test_wakes_on_ingest_from_other_connection(self, db, monkeypatch):
+        monkeypatch.setattr(notify, "FALLBACK_POLL_SECONDS", 30.0)
+        claimed = []
+
+        def waiter():
+            with CoordinationDB(db.db_path) as other:
+                claimed.append(EventQueue(other).wait_for_event("worker", timeout=10))
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        time.sleep(0.2)
+        start = time.monotonic()
+        ev = EventQueue(db).ingest("mention", "github", "key1")
+        thread.join(timeout=10)
+        assert time.monotonic() - start < 5
+        assert claimed[0] is not None
+        assert claimed[0].id == ev.id
+
+
 class TestRetryAndDeadLetter:
     def test_fail_schedules_retry_when_retries_remain(self, queue):
         ev = queue.ingest("pr_update_general", "github", "key1", max_retries=3)
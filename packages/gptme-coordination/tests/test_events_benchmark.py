@@ -0,0 +1,92 @@
+"""Benchmark: claiming from a deep event queue with concurrent claimers.
+
+Run with ``pytest -m slow tests/test_events_benchmark.py -s`` to see timings.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+from gptme_coordination.db import CoordinationDB
+from gptme_coordination.events import AGE_BOOST_CAP, AGE_BOOST_RATE, EventQueue
+
+N_EVENTS = 100_000
+N_CLAIMERS = 4
+BATCH_SIZE = 50
+
+# The pre-materialization claim query: sorts every pending row on each claim
+LEGACY_CLAIM_SQL = """SELECT id FROM events
+WHERE state = 'pending'
+ORDER BY (priority + MIN(CAST((julianday('now') - julianday(created_at)) * 24 * ? AS INTEGER), ?)) DESC, created_at ASC
+LIMIT 1"""
+
+
+@pytest.fixture
+def deep_queue(tmp_path):
+    db_file = tmp_path / "bench.db"
+    with CoordinationDB(db_file) as db:
+        queue = EventQueue(db)
+        start = time.perf_counter()
+        for offset in range(0, N_EVENTS, 10_000):
+            queue.ingest_many(
+                {
+                    "trigger_type": "pr_update_general",
+                    "source": "bench",
+                    "thread_key": f"repo:{i}",
+                    "priority": i % 100,
+                }
+                for i in range(offset, offset + 10_000)
+            )
+        print(f"\ningest_many: {N_EVENTS} events in {time.perf_counter() - start:.2f}s")
+        yield db_file, queue
+
+
+@pytest.mark.slow
+def test_claim_latency_vs_legacy_sort(deep_queue):
+    _, queue = deep_queue
+    conn = queue.db.conn
+
+    start = time.perf_counter()
+    for _ in range(20):
+        conn.execute(LEGACY_CLAIM_SQL, (AGE_BOOST_RATE, AGE_BOOST_CAP)).fetchone()
+    legacy = (time.perf_counter() - start) / 20
+
+    start = time.perf_counter()
+    for i in range(20):
+        assert queue.claim_next(f"agent-{i}") is not None
+    indexed = (time.perf_counter() - start) / 20
+
+    print(
+        f"legacy select: {legacy * 1000:.2f}ms, indexed claim: {indexed * 1000:.2f}ms"
+    )
+    assert indexed < legacy
+
+
+@pytest.mark.slow
+def test_concurrent_batch_claimers_drain_queue(deep_queue):
+    db_file, _ = deep_queue
+    claimed: list[list[int]] = [[] for _ in range(N_CLAIMERS)]
+
+    def claimer(idx: int) -> None:
+        with CoordinationDB(db_file) as db:
+            queue = EventQueue(db)
+            while batch := queue.claim_batch(f"agent-{idx}", BATCH_SIZE):
+                claimed[idx].extend(ev.id for ev in batch if ev.id is not None)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=claimer, args=(i,)) for i in range(N_CLAIMERS)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    all_ids = [event_id for ids in claimed for event_id in ids]
+    print(
+        f"{N_CLAIMERS} claimers drained {len(all_ids)} events in {elapsed:.2f}s "
+        f"({len(all_ids) / elapsed:.0f} events/s)"
+    )
+    assert len(all_ids) == N_EVENTS
+    assert len(set(all_ids)) == N_EVENTS
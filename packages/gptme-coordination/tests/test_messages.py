@@ -1,8 +1,11 @@
 """Tests for the append-only message bus."""
 
+import threading
+import time
 from pathlib import Path
 
 import pytest
+from gptme_coordination import notify
 from gptme_coordination.db import CoordinationDB
 from gptme_coordination.messages import MessageBus
 
@@ -59,6 +62,52 @@ class TestInbox:
         assert len(msgs) == 1
         assert msgs[0].channel == "announce"
 
+    def test_inbox_since_id_is_incremental(self, bus: MessageBus) -> None:
+        first = bus.send("agent-1", "one")
+        bus.send("agent-1", "two")
+        bus.send("agent-1", "for someone else", recipient="agent-3")
+        msgs = bus.inbox("agent-2", since_id=first.id)
+        assert [m.body for m in msgs] == ["two"]
+        assert bus.inbox("agent-2", since_id=msgs[-1].id) == []
+
+
+class TestWaitForMessage:
+    def test_returns_immediately_when_messages_exist(self, bus: MessageBus) -> None:
+        bus.send("agent-1", "already here")
+        msgs = bus.wait_for_message("agent-2", timeout=5)
+        assert [m.body for m in msgs] == ["already here"]
+
+    def test_times_out_with_empty_list(self, bus: MessageBus) -> None:
+        sent = bus.send("agent-1", "old")
+        start = time.monotonic()
+        assert bus.wait_for_message("agent-2", since_id=sent.id, timeout=0.2) == []
+        assert time.monotonic() - start >= 0.2
+
+    def test_wakes_on_send_from_other_connection(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # A fallback poll this long would fail the timing assertion below,
+        # so the waiter must be woken by the notification
+        monkeypatch.setattr(notify, "FALLBACK_POLL_SECONDS", 30.0)
+        db_path = tmp_path / "test.db"
+        result: list[str] = []
+
+        def waiter() -> None:
+            with CoordinationDB(db_path) as db:
+                msgs = MessageBus(db).wait_for_message("agent-2", timeout=10)
+                result.extend(m.body for m in msgs)
+
+        with CoordinationDB(db_path) as db:
+            _ = db.conn
+            thread = threading.Thread(target=waiter)
+            thread.start()
+            time.sleep(0.2)
+            start = time.monotonic()
+            MessageBus(db).send("agent-1", "wake up", recipient="agent-2")
+            thread.join(timeout=10)
+        assert result == ["wake up"]
+        assert time.monotonic() - start < 5
+
 
 class TestHistory:
     def test_history_returns_recent(self, bus: MessageBus) -> None:
@@ -0,0 +1,84 @@
+"""Tests for local change notifications."""
+
+import os
+import socket
+import time
+from pathlib import Path
+
+import pytest
+from gptme_coordination import notify
+from gptme_coordination.db import CoordinationDB
+from gptme_coordination.notify import ChangeNotifier, wait_until
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="requires Unix domain sockets"
+)
+
+
+@pytest.fixture
+def notifier(tmp_path: Path) -> ChangeNotifier:
+    return ChangeNotifier(tmp_path / "coord.db")
+
+
+def test_notify_without_waiters_is_noop(notifier: ChangeNotifier) -> None:
+    notifier.notify()
+    assert not notifier.directory.exists()
+
+
+def test_listener_wakes_on_notify_and_cleans_up(notifier: ChangeNotifier) -> None:
+    with notifier.listen() as listener:
+        assert listener.path is not None
+        assert os.path.exists(listener.path)
+        assert listener.wait(0.05) is False
+        notifier.notify()
+        notifier.notify()
+        assert listener.wait(1) is True
+        # Both notifications were drained by the first wakeup
+        assert listener.wait(0.05) is False
+        path = listener.path
+    assert not os.path.exists(path)
+
+
+def test_notify_removes_stale_sockets(notifier: ChangeNotifier) -> None:
+    listener = notifier.listen()
+    assert listener.path is not None
+    path = listener.path
+    # Simulate a crashed waiter: socket file left behind, nobody bound to it
+    listener._sock.close()  # type: ignore[union-attr]
+    notifier.notify()
+    assert not os.path.exists(path)
+
+
+def test_wait_until_rechecks_after_external_commit(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(notify, "FALLBACK_POLL_SECONDS", 0.05)
+    with (
+        CoordinationDB(tmp_path / "coord.db") as db,
+        CoordinationDB(db.db_path) as writer,
+    ):
+        checks = []
+
+        def check() -> bool:
+            checks.append(1)
+            if len(checks) == 2:
+                return True
+            # A writer that does not notify; only data_version reveals it
+            writer.conn.execute("INSERT INTO messages (sender, body) VALUES ('x', 'y')")
+            return False
+
+        start = time.monotonic()
+        with db.notifier.listen() as listener:
+            assert wait_until(db.conn, listener, check, timeout=5) is True
+        assert time.monotonic() - start < 2
+
+
+def test_wait_until_skips_checks_when_nothing_changed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(notify, "FALLBACK_POLL_SECONDS", 0.02)
+    with CoordinationDB(tmp_path / "coord.db") as db:
+        checks = []
+        with db.notifier.listen() as listener:
+            wait_until(db.conn, listener, lambda: checks.append(1), timeout=0.2)
+        assert len(checks) == 1
@@ -154,9 +154,9 @@ def collect_session_stats(sessions_dir: Path, days: int = 1) -> dict[str, Any]:
     ``count: 0`` and an ``error`` field instead of raising.
     """
     try:
-        from gptme_sessions.store import SessionStore
+        from gptme_sessions.store import open_store
 
-        store = SessionStore(sessions_dir=sessions_dir)
+        store = open_store(sessions_dir)
         records = store.load_all()
         cutoff = datetime.now(timezone.utc) - timedelta(days=days)
 
@@ -9,6 +9,7 @@ import pytest
 
 from gptme_daily_briefing.collectors import (
     collect_recent_highlights,
+    collect_session_stats,
     collect_waiting_tasks,
 )
 
@@ -178,6 +179,24 @@ def test_collect_waiting_tasks_respects_limit(tmp_path: Path) -> None:
     assert [t["task"] for t in out] == ["w00", "w01", "w02", "w03"]
 
 
+def test_collect_session_stats_after_sqlite_migration(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytest.importorskip("gptme_sessions")
+    from gptme_sessions.record import SessionRecord
+    from gptme_sessions.sqlite_store import SqliteSessionStore
+    from gptme_sessions.store import SessionStore, open_store
+
+    monkeypatch.delenv("GPTME_SESSIONS_BACKEND", raising=False)
+    SessionStore(sessions_dir=tmp_path).append(SessionRecord(category="code"))
+    SqliteSessionStore(sessions_dir=tmp_path).import_jsonl(tmp_path / "session-records.jsonl")
+    # Recorded after the migration, so only the database has it
+    open_store(tmp_path).append(SessionRecord(category="triage"))
+
+    stats = collect_session_stats(tmp_path)
+    assert stats == {"count": 2, "categories": {"code": 1, "triage": 1}}
+
+
 def _pr_payload(number: int, login: str, title: str = "x") -> dict:
     return {
         "number": number,
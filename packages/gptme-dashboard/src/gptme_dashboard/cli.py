@@ -79,6 +79,13 @@ def main() -> None:
         "Pass '-' to suppress sitemap generation."
     ),
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Worker processes for rendering changed pages (default: CPU count).",
+)
 def generate(
     workspace: str,
     output: str | None,
@@ -87,6 +94,7 @@ def generate(
     sessions: bool,
     sessions_days: int,
     base_url: str,
+    jobs: int | None,
 ) -> None:
     """Generate a static dashboard and JSON data dump for a gptme workspace."""
     from gptme_dashboard.generate import generate as do_generate
@@ -102,7 +110,13 @@ def generate(
 
     out = Path(output) if output is not None else ws / "_site"
     data = do_generate(
-        ws, out, tmpl, include_sessions=sessions, sessions_days=sessions_days, base_url=base_url
+        ws,
+        out,
+        tmpl,
+        include_sessions=sessions,
+        sessions_days=sessions_days,
+        base_url=base_url,
+        jobs=jobs,
     )
     json_str = generate_json(ws, out, _data=data)
 
@@ -12,6 +12,7 @@ Designed to work with any gptme workspace (gptme-contrib, bob, alice, etc.).
 """
 
 import configparser
+import hashlib
 import html
 import json
 import logging
@@ -19,8 +20,11 @@ import os
 import re
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
+from typing import NamedTuple
 from urllib.parse import urlparse
 
 import yaml  # type: ignore[import-untyped]
@@ -287,6 +291,7 @@ def scan_recent_sessions(workspace: Path, days: int = 30) -> list[dict]:
             discover_gptme_sessions,
             parse_gptme_config,
         )
+        from gptme_sessions.discovery_index import default_index
         from gptme_sessions.signals import extract_from_path
     except ImportError:
         print(
@@ -325,7 +330,7 @@ def scan_recent_sessions(workspace: Path, days: int = 30) -> list[dict]:
             continue
 
         try:
-            signals = extract_from_path(jsonl)
+            signals = extract_from_path(jsonl, use_cache=True)
         except Exception:
             signals = {}
 
@@ -353,7 +358,7 @@ def scan_recent_sessions(workspace: Path, days: int = 30) -> list[dict]:
         )
 
     # --- Claude Code sessions ---
-    for jsonl in discover_cc_sessions(start, end):
+    for jsonl in discover_cc_sessions(start, end, index=default_index()):
         # The CC project directory name is the workspace path with '/' → '-'.
         project_dir_name = jsonl.parent.name
         decoded = decode_cc_project_path(project_dir_name)
@@ -371,7 +376,7 @@ def scan_recent_sessions(workspace: Path, days: int = 30) -> list[dict]:
             continue  # No usable date — skip this session
 
         try:
-            signals = extract_from_path(jsonl)
+            signals = extract_from_path(jsonl, use_cache=True)
         except Exception:
             signals = {}
 
@@ -1758,6 +1763,159 @@ def collect_workspace_data(
     }
 
 
+# -- Incremental page builds --------------------------------------------------
+
+# Written to the output directory; maps each generated page to a hash of its inputs
+MANIFEST_FILE = ".build-manifest.json"
+
+# Bump to invalidate existing manifests when page hashing changes
+_MANIFEST_VERSION = 1
+
+# Below this many pages to render, starting a process pool costs more than it saves
+_PARALLEL_MIN_PAGES = 32
+
+
+class _Page(NamedTuple):
+    """One HTML page to render.
+
+    ``markdown`` maps template variables to Markdown sources; they are
+    converted at render time, so the conversion is skipped for unchanged
+    pages and runs in the worker processes.
+    """
+
+    url: str
+    template: str
+    context: dict
+    markdown: dict[str, str]
+
+    def input_hash(self) -> str:
+        payload = json.dumps([self.template, self.context, self.markdown], default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _renderer_fingerprint(template_dir: Path) -> str:
+    """Hash the templates and this module, so code changes invalidate every page."""
+    h = hashlib.sha256(str(_MANIFEST_VERSION).encode())
+    h.update(Path(__file__).read_bytes())
+    for path in sorted(template_dir.rglob("*")):
+        if path.is_file():
+            h.update(str(path.relative_to(template_dir)).encode())
+            h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Write *text* to *path* via a temporary file and rename."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _write_if_changed(path: Path, text: str) -> bool:
+    """Atomically write *text* unless *path* already has that content."""
+    try:
+        if path.read_text(encoding="utf-8") == text:
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    _write_atomic(path, text)
+    return True
+
+
+def _render_env(template_dir: Path) -> Environment:
+    return Environment(loader=FileSystemLoader(str(template_dir)), autoescape=True)
+
+
+def _render_page(env: Environment, output: Path, page: _Page) -> None:
+    context = dict(page.context)
+    for key, source in page.markdown.items():
+        context[key] = render_markdown_to_html(source)
+    _write_atomic(output / page.url, env.get_template(page.template).render(**context))
+
+
+_worker_env: Environment | None = None
+_worker_output: Path | None = None
+
+
+def _init_render_worker(template_dir: Path, output: Path) -> None:
+    global _worker_env, _worker_output
+    _worker_env = _render_env(template_dir)
+    _worker_output = output
+
+
+def _render_page_in_worker(page: _Page) -> None:
+    assert _worker_env is not None and _worker_output is not None
+    _render_page(_worker_env, _worker_output, page)
+
+
+def _load_manifest(path: Path) -> tuple[str, dict[str, str]]:
+    """Return ``(renderer fingerprint, page hashes)`` of the previous build."""
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+        return str(manifest["renderer"]), dict(manifest["pages"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return "", {}
+
+
+def _build_pages(pages: list[_Page], output: Path, template_dir: Path, jobs: int | None) -> int:
+    """Render the pages whose inputs changed since the last build into *output*.
+
+    Pages generated by the previous build but no longer produced are removed.
+    Returns the number of pages rendered.
+    """
+    # Later pages win on duplicate URLs, as with sequential writes
+    by_url = {page.url: page for page in pages}
+    manifest_path = output / MANIFEST_FILE
+    renderer = _renderer_fingerprint(template_dir)
+    previous_renderer, previous = _load_manifest(manifest_path)
+    if previous_renderer != renderer:
+        previous_hashes: dict[str, str] = {}
+    else:
+        previous_hashes = previous
+    hashes = {url: page.input_hash() for url, page in by_url.items()}
+    dirty = [
+        page
+        for url, page in by_url.items()
+        if previous_hashes.get(url) != hashes[url] or not (output / url).is_file()
+    ]
+
+    workers = min(jobs or os.cpu_count() or 1, len(dirty))
+    rendered_in_pool = False
+    if workers > 1 and len(dirty) >= _PARALLEL_MIN_PAGES:
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_render_worker,
+                initargs=(template_dir, output),
+            ) as pool:
+                chunksize = max(1, len(dirty) // (workers * 4))
+                for _ in pool.map(_render_page_in_worker, dirty, chunksize=chunksize):
+                    pass
+            rendered_in_pool = True
+        except (OSError, BrokenProcessPool) as e:
+            logger.warning("Parallel rendering unavailable, rendering serially: %s", e)
+    if not rendered_in_pool:
+        env = _render_env(template_dir)
+        for page in dirty:
+            _render_page(env, output, page)
+
+    output_root = output.resolve()
+    for url in previous.keys() - hashes.keys():
+        stale = (output / url).resolve()
+        if stale.is_relative_to(output_root) and stale != output_root:
+            stale.unlink(missing_ok=True)
+
+    _write_if_changed(
+        manifest_path, json.dumps({"renderer": renderer, "pages": hashes}, indent=1) + "\n"
+    )
+    return len(dirty)
+
+
 def generate(
     workspace: Path,
     output: Path,
@@ -1765,6 +1923,7 @@ def generate(
     include_sessions: bool = False,
     sessions_days: int = 30,
     base_url: str = "",
+    jobs: int | None = None,
 ) -> dict:
     """Generate static HTML dashboard from workspace.
 
@@ -1776,22 +1935,19 @@ def generate(
     When omitted, the URL is auto-derived from the detected GitHub remote using
     the standard GitHub Pages pattern (``https://<owner>.github.io/<repo>/``).
     Pass ``base_url="-"`` to suppress sitemap/feed generation entirely.
+
+    Builds are incremental: a manifest in *output* records a hash of each
+    page's inputs, and only pages whose inputs changed (or whose output file
+    is missing) are re-rendered, across up to *jobs* worker processes
+    (default: CPU count).  Pages are written atomically.
     """
     if template_dir is None:
         template_dir = Path(__file__).parent / "templates"
 
-    env = Environment(
-        loader=FileSystemLoader(str(template_dir)),
-        autoescape=True,
-    )
-
     data = collect_workspace_data(
         workspace, include_sessions=include_sessions, sessions_days=sessions_days
     )
 
-    template = env.get_template("index.html")
-    readme_html = render_markdown_to_html(data["readme"]["body"]) if data.get("readme") else ""
-
     # Resolve effective base URL for feed generation and autodiscovery link.
     # base_url="-" suppresses feed generation entirely.
     effective_base_url = ""
@@ -1804,121 +1960,58 @@ def generate(
 
     feed_url = (effective_base_url.rstrip("/") + "/feed.xml") if effective_base_url else ""
 
-    index_html = template.render(**data, readme_html=readme_html, feed_url=feed_url)
-
-    output.mkdir(parents=True, exist_ok=True)
-    (output / "index.html").write_text(index_html)
-
-    # Generate per-item detail pages for the unified guidance list (lessons + skills)
-    guidance_template = env.get_template("guidance.html")
-    for item in data["guidance"]:
-        # Compute how many levels up from the detail page to the site root.
-        # e.g. "lessons/workflow/test.html" (depth=2) → root_prefix="../../"
-        # e.g. "skills/my-skill/index.html" (depth=2) → root_prefix="../../"
-        depth = len(Path(item["page_url"]).parts) - 1
-        root_prefix = "../" * depth
-        item_html = guidance_template.render(
-            workspace_name=data["workspace_name"],
-            item=item,
-            body_html=render_markdown_to_html(item["body"]),
-            root_prefix=root_prefix,
-        )
-        page_path = output / item["page_url"]
-        page_path.parent.mkdir(parents=True, exist_ok=True)
-        page_path.write_text(item_html)
-
-    # Generate per-task detail pages
-    task_template = env.get_template("task.html")
-    for task in data["tasks"]:
-        # page_url is e.g. "tasks/my-task.html" (depth=1) → root_prefix="../"
-        depth = len(Path(task["page_url"]).parts) - 1
-        root_prefix = "../" * depth
-        task_html = task_template.render(
-            workspace_name=data["workspace_name"],
-            task=task,
-            body_html=render_markdown_to_html(task["body"]),
-            root_prefix=root_prefix,
+    readme_markdown = {"readme_html": data["readme"]["body"]} if data.get("readme") else {}
+    pages = [
+        _Page(
+            "index.html",
+            "index.html",
+            {**data, "readme_html": "", "feed_url": feed_url},
+            readme_markdown,
         )
-        page_path = output / task["page_url"]
-        page_path.parent.mkdir(parents=True, exist_ok=True)
-        page_path.write_text(task_html)
-
-    # Generate per-journal detail pages
-    journal_template = env.get_template("journal.html")
-    for journal in data["journals"]:
-        # page_url is e.g. "journal/2026-03-07/session.html" (depth=2) → root_prefix="../../"
-        # or "journal/2026-03-07.html" (depth=1) → root_prefix="../"
-        depth = len(Path(journal["page_url"]).parts) - 1
-        root_prefix = "../" * depth
-        journal_html = journal_template.render(
-            workspace_name=data["workspace_name"],
-            journal=journal,
-            body_html=render_markdown_to_html(journal["body"]),
-            root_prefix=root_prefix,
-        )
-        page_path = output / journal["page_url"]
-        page_path.parent.mkdir(parents=True, exist_ok=True)
-        page_path.write_text(journal_html)
+    ]
 
-    # Generate per-plugin detail pages (only for plugins with a README)
-    plugin_template = env.get_template("plugin.html")
+    # Per-item detail pages for the unified guidance list (lessons + skills),
+    # tasks, journals, summaries, and plugins/packages with a README.  page_url
+    # is relative to the site root: "lessons/workflow/test.html" (depth=2)
+    # → root_prefix="../../"
     plugins_with_pages = [p for p in data["plugins"] if p.get("body")]
-    for plugin in plugins_with_pages:
-        # page_url is e.g. "plugins/gptme-consortium/index.html" (depth=2) → root_prefix="../../"
-        depth = len(Path(plugin["page_url"]).parts) - 1
-        root_prefix = "../" * depth
-        plugin_html = plugin_template.render(
-            workspace_name=data["workspace_name"],
-            plugin=plugin,
-            body_html=render_markdown_to_html(plugin["body"]),
-            root_prefix=root_prefix,
-        )
-        page_path = output / plugin["page_url"]
-        page_path.parent.mkdir(parents=True, exist_ok=True)
-        page_path.write_text(plugin_html)
-
-    # Generate per-package detail pages (only for packages with a README)
-    package_template = env.get_template("package.html")
     packages_with_pages = [p for p in data["packages"] if p.get("body")]
-    for pkg in packages_with_pages:
-        # page_url is e.g. "packages/gptme-dashboard/index.html" (depth=2) → root_prefix="../../"
-        depth = len(Path(pkg["page_url"]).parts) - 1
-        root_prefix = "../" * depth
-        pkg_html = package_template.render(
-            workspace_name=data["workspace_name"],
-            package=pkg,
-            body_html=render_markdown_to_html(pkg["body"]),
-            root_prefix=root_prefix,
-        )
-        page_path = output / pkg["page_url"]
-        page_path.parent.mkdir(parents=True, exist_ok=True)
-        page_path.write_text(pkg_html)
-
-    # Generate per-summary detail pages
-    summary_template = env.get_template("summary.html")
-    for summary in data["summaries"]:
-        # page_url is e.g. "summaries/daily/2026-03-07.html" (depth=2) → root_prefix="../../"
-        depth = len(Path(summary["page_url"]).parts) - 1
-        root_prefix = "../" * depth
-        summary_html = summary_template.render(
-            workspace_name=data["workspace_name"],
-            summary=summary,
-            body_html=render_markdown_to_html(summary["body"]),
-            root_prefix=root_prefix,
-        )
-        page_path = output / summary["page_url"]
-        page_path.parent.mkdir(parents=True, exist_ok=True)
-        page_path.write_text(summary_html)
+    detail_pages = [
+        ("guidance.html", "item", data["guidance"]),
+        ("task.html", "task", data["tasks"]),
+        ("journal.html", "journal", data["journals"]),
+        ("plugin.html", "plugin", plugins_with_pages),
+        ("package.html", "package", packages_with_pages),
+        ("summary.html", "summary", data["summaries"]),
+    ]
+    for template_name, key, items in detail_pages:
+        for item in items:
+            depth = len(Path(item["page_url"]).parts) - 1
+            pages.append(
+                _Page(
+                    item["page_url"],
+                    template_name,
+                    {
+                        "workspace_name": data["workspace_name"],
+                        key: item,
+                        "root_prefix": "../" * depth,
+                    },
+                    {"body_html": item["body"]},
+                )
+            )
+
+    output.mkdir(parents=True, exist_ok=True)
+    rendered = _build_pages(pages, output, template_dir, jobs=jobs)
 
     # Generate sitemap.xml and Atom feed when a base URL is available.
     # effective_base_url is already resolved above (handles base_url="-" suppression
     # and auto-derivation from gh_repo_url), so reuse it here directly.
     if effective_base_url:
         sitemap_xml = generate_sitemap(data, effective_base_url)
-        (output / "sitemap.xml").write_text(sitemap_xml)
+        _write_if_changed(output / "sitemap.xml", sitemap_xml)
         print(f"Generated sitemap at {output / 'sitemap.xml'} ({effective_base_url})")
         feed_xml = generate_atom_feed(data, effective_base_url, data["workspace_name"])
-        (output / "feed.xml").write_text(feed_xml)
+        _write_if_changed(output / "feed.xml", feed_xml)
         print(f"Generated Atom feed at {output / 'feed.xml'} ({effective_base_url})")
 
     stats = data["stats"]
@@ -1939,6 +2032,7 @@ def generate(
         f"{summary_count} summaries ({summary_count} detail pages)"
         f"{session_msg}"
     )
+    print(f"  {rendered} of {len(pages)} pages re-rendered ({len(pages) - rendered} unchanged)")
 
     return data
 
@@ -2004,7 +2098,7 @@ def generate_json(
 
     if output is not None:
         output.mkdir(parents=True, exist_ok=True)
-        (output / "data.json").write_text(json_str)
+        _write_if_changed(output / "data.json", json_str)
         print(f"Generated data dump at {output / 'data.json'}")
 
     return json_str
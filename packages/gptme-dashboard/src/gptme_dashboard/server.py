@@ -25,6 +25,8 @@ from datetime import date, timedelta
 from pathlib import Path
 from typing import Any
 
+from .session_index import InvalidCursor, SessionIndex, decode_cursor
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -433,9 +435,9 @@ def create_app(
         """
         # Distinguish import/init failure (→ None) from query failure (→ _StoreBroken).
         try:
-            from gptme_sessions.store import SessionStore
+            from gptme_sessions.store import open_store
 
-            store = SessionStore(sessions_dir=ws / "state" / "sessions")
+            store = open_store(ws / "state" / "sessions")
         except Exception:
             return None
         try:
@@ -559,6 +561,8 @@ def create_app(
             records = [r for r in records if r.get("outcome", "").lower() == outcome.lower()]
         return records
 
+    _session_index = SessionIndex(Path(app.config["WORKSPACE"]) / "state" / "sessions")
+
     @app.route("/api/sessions")
     def api_sessions() -> Any:
         ws = Path(app.config["WORKSPACE"])
@@ -568,29 +572,39 @@ def create_app(
             offset = request.args.get("offset", 0, type=int)
             offset = max(0, offset)
             days = request.args.get("days", type=int)
+            after = request.args.get("after")
+            try:
+                cursor = decode_cursor(after) if after else None
+            except InvalidCursor as e:
+                return jsonify({"error": str(e)}), 400
 
             # Filter parameters
             model_filter = request.args.get("model")
             harness_filter = request.args.get("harness")
             outcome_filter = request.args.get("outcome")
 
-            # Try SessionStore first
-            store_result = _load_sessions_from_store(ws, days)
-            if store_result is not None and not isinstance(store_result, _StoreBroken):
-                records, _store = store_result
-                records = sorted(records, key=lambda r: r.timestamp, reverse=True)
-                # Convert to dicts for uniform filtering
-                all_dicts = [r.to_dict() for r in records]
-                all_dicts = _filter_records(all_dicts, model_filter, harness_filter, outcome_filter)
-                total = len(all_dicts)
-                page = all_dicts[offset : offset + limit]
+            # Try the SessionStore index first (sorted and indexed in memory,
+            # rebuilt only when the store file changes)
+            try:
+                snapshot = _session_index.snapshot()
+            except ImportError:
+                snapshot = None  # gptme-sessions not installed
+            except Exception:
+                logger.warning("Session store index unavailable", exc_info=True)
+                snapshot = None
+            if snapshot is not None and snapshot.window_start(days) < len(snapshot):
                 return jsonify(
-                    {
-                        "sessions": page,
-                        "total": total,
-                        "offset": offset,
-                        "has_more": offset + limit < total,
-                    }
+                    snapshot.page(
+                        limit=limit,
+                        offset=offset,
+                        after=cursor,
+                        days=days,
+                        filters={
+                            "model": model_filter,
+                            "harness": harness_filter,
+                            "outcome": outcome_filter,
+                        },
+                    )
                 )
 
             # Fallback: scan actual session logs
@@ -618,6 +632,8 @@ def create_app(
                     "total": total,
                     "offset": offset,
                     "has_more": offset + limit < total,
+                    # Scanned logs have no stable sort key to resume from
+                    "next_cursor": None,
                 }
             )
         except Exception as e:
@@ -0,0 +1,226 @@
+"""In-memory index of the session store, backing ``/api/sessions``.
+
+The endpoint used to load, sort and filter the whole session store on every
+request, so page loads slowed down as the store grew and concurrent requests
+repeated the work.  :class:`SessionIndex` loads the store once, keeps the
+records sorted by timestamp with a posting list per harness, model and
+outcome value, and reloads only when the store changes (inode, mtime or size
+of the JSONL file, or of the SQLite database and its WAL).  Serving a page is then a few bisections plus ``to_dict`` on the
+records returned, independent of the store size.
+
+Pages are addressed by offset (as before) or by an opaque cursor: every page
+carries ``next_cursor``, which ``?after=`` accepts to continue after the last
+session returned.  Cursors name a position in the sort order rather than an
+index, so paging stays consistent while new sessions are appended.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Fields with a secondary index, filtered by case-insensitive equality
+FILTER_FIELDS = ("harness", "model", "outcome")
+
+# Intersections of several filters are cached per snapshot, up to this many
+_MAX_CACHED_COMBOS = 64
+
+# Sort key: (epoch seconds, timestamp, session_id, line number in the store)
+_Key = tuple[float, str, str, int]
+
+
+class InvalidCursor(ValueError):
+    """Raised when an ``after`` cursor cannot be decoded."""
+
+
+def _epoch(timestamp: str) -> float:
+    """Parse an ISO 8601 timestamp; unparseable values sort oldest."""
+    try:
+        return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp()
+    except (ValueError, TypeError, AttributeError):
+        return float("-inf")
+
+
+def encode_cursor(key: _Key) -> str:
+    """Encode the sort key of a session as an opaque, URL-safe cursor."""
+    _, timestamp, session_id, seq = key
+    raw = json.dumps([timestamp, session_id, seq], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> _Key:
+    """Decode a cursor produced by :func:`encode_cursor`.
+
+    Raises:
+        InvalidCursor: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        timestamp, session_id, seq = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+        raise InvalidCursor(f"Invalid cursor: {cursor!r}") from e
+    if not (isinstance(timestamp, str) and isinstance(session_id, str) and isinstance(seq, int)):
+        raise InvalidCursor(f"Invalid cursor: {cursor!r}")
+    return (_epoch(timestamp), timestamp, session_id, seq)
+
+
+def _filter_value(value: Any) -> str:
+    return str(value or "").lower()
+
+
+class SessionSnapshot:
+    """Immutable view of the store at one point in time.
+
+    Records are held oldest first, so the newest page is the tail of a
+    posting list; positions in posting lists are ascending.
+    """
+
+    def __init__(self, records: Sequence[Any]):
+        keyed = sorted(
+            (
+                (
+                    _epoch(str(r.timestamp or "")),
+                    str(r.timestamp or ""),
+                    str(r.session_id or ""),
+                    i,
+                ),
+                r,
+            )
+            for i, r in enumerate(records)
+        )
+        self.records: list[Any] = [r for _, r in keyed]
+        self.keys: list[_Key] = [k for k, _ in keyed]
+        self._epochs = [k[0] for k in self.keys]
+        self._postings: dict[str, dict[str, list[int]]] = {f: {} for f in FILTER_FIELDS}
+        for pos, r in enumerate(self.records):
+            for field, postings in self._postings.items():
+                postings.setdefault(_filter_value(getattr(r, field, None)), []).append(pos)
+        self._combos: dict[tuple[tuple[str, str], ...], list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def window_start(self, days: int | None) -> int:
+        """Position of the oldest record within the last ``days`` days.
+
+        ``None`` means no time filter; ``days <= 0`` uses the 30-day default,
+        matching ``_load_sessions_from_store``.
+        """
+        if days is None:
+            return 0
+        since_days = days if days > 0 else 30
+        return bisect_left(self._epochs, time.time() - since_days * 86400)
+
+    def _matching(self, filters: Mapping[str, str | None]) -> Sequence[int]:
+        """Ascending positions of records matching all ``filters``."""
+        active = tuple(sorted((f, v.lower()) for f, v in filters.items() if v))
+        if not active:
+            return range(len(self.records))
+        if len(active) == 1:
+            field, value = active[0]
+            return self._postings[field].get(value, [])
+        combo = self._combos.get(active)
+        if combo is None:
+            lists = sorted((self._postings[f].get(v, []) for f, v in active), key=len)
+            others = [set(lst) for lst in lists[1:]]
+            combo = [pos for pos in lists[0] if all(pos in s for s in others)]
+            if len(self._combos) >= _MAX_CACHED_COMBOS:
+                self._combos.clear()
+            self._combos[active] = combo
+        return combo
+
+    def page(
+        self,
+        *,
+        limit: int,
+        offset: int = 0,
+        after: _Key | None = None,
+        days: int | None = None,
+        filters: Mapping[str, str | None] | None = None,
+    ) -> dict[str, Any]:
+        """Return one page of sessions, newest first, in the API response shape.
+
+        ``after`` (a decoded cursor) takes precedence over ``offset``.
+        """
+        matches = self._matching(filters or {})
+        start = bisect_left(matches, self.window_start(days))
+        if after is not None:
+            end = max(start, bisect_left(matches, bisect_left(self.keys, after)))
+            offset = len(matches) - end
+        else:
+            end = max(start, len(matches) - offset)
+        chunk = matches[max(start, end - limit) : end]
+        has_more = end - limit > start
+        return {
+            "sessions": [self.records[pos].to_dict() for pos in reversed(chunk)],
+            "total": len(matches) - start,
+            "offset": offset,
+            "has_more": has_more,
+            "next_cursor": encode_cursor(self.keys[chunk[0]]) if has_more else None,
+        }
+
+
+class SessionIndex:
+    """Caches a :class:`SessionSnapshot` of the session store in ``sessions_dir``.
+
+    The store is opened with ``gptme_sessions.store.open_store``, so the index
+    follows it from JSONL to SQLite after ``gptme-sessions import-jsonl``.
+    :meth:`snapshot` stats the store files on each call and rebuilds only when
+    they changed; concurrent callers share one rebuild.
+    """
+
+    def __init__(self, sessions_dir: Path):
+        self.sessions_dir = sessions_dir
+        self._lock = threading.Lock()
+        self._stamp: tuple[Any, ...] | None = None
+        self._snapshot: SessionSnapshot | None = None
+
+    @staticmethod
+    def _stat(path: Path) -> tuple[Any, ...] | None:
+        # SQLite commits land in the WAL file until it is checkpointed
+        stats: list[tuple[int, int, int] | None] = []
+        for file in (path, path.with_name(f"{path.name}-wal")):
+            try:
+                st = os.stat(file)
+            except FileNotFoundError:
+                stats.append(None)
+            else:
+                stats.append((st.st_ino, st.st_mtime_ns, st.st_size))
+        return (str(path), *stats) if stats[0] is not None else None
+
+    def snapshot(self) -> SessionSnapshot | None:
+        """Return the current snapshot, or None if the store does not exist."""
+        from gptme_sessions.store import open_store
+
+        store = open_store(self.sessions_dir)
+        stamp = self._stat(store.path)
+        if stamp is None:
+            return None
+        if stamp == self._stamp:
+            return self._snapshot
+        with self._lock:
+            stamp = self._stat(store.path)
+            if stamp is None:
+                return None
+            if stamp != self._stamp:
+                started = time.perf_counter()
+                snapshot = SessionSnapshot(store.load_all())
+                logger.debug(
+                    "Indexed %d sessions in %.0fms",
+                    len(snapshot),
+                    (time.perf_counter() - started) * 1000,
+                )
+                self._snapshot, self._stamp = snapshot, stamp
+            return self._snapshot
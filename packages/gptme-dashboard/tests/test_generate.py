@@ -1402,7 +1402,7 @@ class TestScanRecentSessions:
                 return {"workspace": str(workspace)}
             return {"workspace": str(other_workspace)}
 
-        def mock_extract_from_path(path):
+        def mock_extract_from_path(path, **_kwargs):
             return {
                 "git_commits": ["abc1234 feat: test"],
                 "file_writes": ["src/foo.py", "src/bar.py"],
@@ -1412,7 +1412,7 @@ class TestScanRecentSessions:
                 "inferred_category": "code",
             }
 
-        def mock_discover_cc(start, end):
+        def mock_discover_cc(start, end, **_kwargs):
             return []  # no CC sessions in this test
 
         with (
@@ -1462,13 +1462,13 @@ class TestScanRecentSessions:
         def mock_discover_gptme(start, end, logs_dir=None):
             return []  # no gptme sessions in this test
 
-        def mock_discover_cc(start, end):
+        def mock_discover_cc(start, end, **_kwargs):
             return [matching_jsonl, other_jsonl]
 
         def mock_decode_cc_project_path(dir_name: str) -> str:
             return cc_dir_map.get(dir_name, "/unknown")
 
-        def mock_extract_from_path(path):
+        def mock_extract_from_path(path, **_kwargs):
             return {
                 "git_commits": ["abc1234 feat: cc test"],
                 "file_writes": ["src/main.py"],
@@ -1512,7 +1512,7 @@ class TestScanRecentSessions:
             patch("gptme_sessions.discovery.discover_gptme_sessions", mock_discover_gptme),
             patch("gptme_sessions.discovery.parse_gptme_config", lambda d: {}),
             patch("gptme_sessions.signals.extract_from_path", mock_extract_bad_grade),
-            patch("gptme_sessions.discovery.discover_cc_sessions", lambda s, e: []),
+            patch("gptme_sessions.discovery.discover_cc_sessions", lambda s, e, **_kw: []),
             patch("gptme_sessions.discovery.decode_cc_project_path", lambda x: x),
         ):
             result = scan_recent_sessions(workspace)
@@ -1539,7 +1539,7 @@ class TestScanRecentSessions:
             patch("gptme_sessions.discovery.discover_gptme_sessions", mock_discover_gptme),
             patch("gptme_sessions.discovery.parse_gptme_config", lambda d: {}),
             patch("gptme_sessions.signals.extract_from_path", mock_extract_none_error_count),
-            patch("gptme_sessions.discovery.discover_cc_sessions", lambda s, e: []),
+            patch("gptme_sessions.discovery.discover_cc_sessions", lambda s, e, **_kw: []),
             patch("gptme_sessions.discovery.decode_cc_project_path", lambda x: x),
         ):
             result = scan_recent_sessions(workspace)
@@ -4169,3 +4169,144 @@ def test_generate_json_has_page_field(workspace: Path):
         assert isinstance(
             plugin["has_page"], bool
         ), f"has_page must be a bool, got {type(plugin['has_page'])}"
+
+
+# ---------------------------------------------------------------------------
+# Incremental builds
+# ---------------------------------------------------------------------------
+
+
+def _site_state(output: Path) -> dict[str, tuple[int, int]]:
+    """(inode, mtime_ns) per file: atomic writes replace the inode."""
+    return {
+        str(p.relative_to(output)): (p.stat().st_ino, p.stat().st_mtime_ns)
+        for p in output.rglob("*")
+        if p.is_file()
+    }
+
+
+def _touched(before: dict, after: dict) -> set[str]:
+    return {path for path in before.keys() | after.keys() if before.get(path) != after.get(path)}
+
+
+def _add_tasks(workspace: Path, n: int) -> None:
+    tasks_dir = workspace / "tasks"
+    tasks_dir.mkdir(exist_ok=True)
+    for i in range(n):
+        (tasks_dir / f"task-{i:03d}.md").write_text(
+            f"---\nstate: todo\ncreated: 2026-03-01\n---\n# Task {i}\n\nDo thing {i}.\n"
+        )
+
+
+_SESSION = {
+    "name": "2026-01-10-work",
+    "date": "2026-01-10",
+    "harness": "gptme",
+    "commits": 2,
+    "edits": 3,
+    "errors": 0,
+    "grade": 0.78,
+    "category": "code",
+}
+
+
+def test_generate_noop_rebuild_touches_no_files(workspace: Path, tmp_path: Path):
+    """A second build with unchanged inputs rewrites nothing, manifest included."""
+    _add_tasks(workspace, 3)
+    output = tmp_path / "site"
+    data = generate(workspace, output, base_url="https://example.org/")
+    generate_json(workspace, output, _data=data)
+    before = _site_state(output)
+    assert {"index.html", "tasks/task-001.html", ".build-manifest.json"} <= before.keys()
+
+    data = generate(workspace, output, base_url="https://example.org/")
+    generate_json(workspace, output, _data=data)
+    assert _touched(before, _site_state(output)) == set()
+
+
+def test_generate_changed_session_rerenders_only_index(workspace: Path, tmp_path: Path, capsys):
+    """Sessions appear only on the index page, so only it is regenerated."""
+    _add_tasks(workspace, 3)
+    output = tmp_path / "site"
+    with patch("gptme_dashboard.generate.scan_recent_sessions", return_value=[_SESSION]):
+        generate(workspace, output, include_sessions=True)
+    before = _site_state(output)
+
+    changed = {**_SESSION, "grade": 0.2}
+    with patch("gptme_dashboard.generate.scan_recent_sessions", return_value=[changed]):
+        generate(workspace, output, include_sessions=True)
+    assert _touched(before, _site_state(output)) == {"index.html", ".build-manifest.json"}
+    n_pages = sum(path.endswith(".html") for path in before)
+    assert f"1 of {n_pages} pages re-rendered ({n_pages - 1} unchanged)" in capsys.readouterr().out
+
+
+def test_generate_changed_task_rerenders_its_pages(workspace: Path, tmp_path: Path):
+    """Editing a task regenerates its detail page and the index, nothing else."""
+    _add_tasks(workspace, 3)
+    output = tmp_path / "site"
+    generate(workspace, output)
+    before = _site_state(output)
+
+    task = workspace / "tasks" / "task-001.md"
+    task.write_text(task.read_text().replace("Do thing 1.", "Do another thing."))
+    generate(workspace, output)
+    assert _touched(before, _site_state(output)) == {
+        "index.html",
+        "tasks/task-001.html",
+        ".build-manifest.json",
+    }
+    assert "Do another thing." in (output / "tasks" / "task-001.html").read_text()
+
+
+def test_generate_removed_and_missing_pages(workspace: Path, tmp_path: Path):
+    """Pages of deleted items are removed; pages deleted from the output are rebuilt."""
+    _add_tasks(workspace, 3)
+    output = tmp_path / "site"
+    (output / "CNAME").parent.mkdir(parents=True)
+    (output / "CNAME").write_text("example.org\n")
+    generate(workspace, output)
+
+    (workspace / "tasks" / "task-002.md").unlink()
+    (output / "tasks" / "task-000.html").unlink()
+    generate(workspace, output)
+    assert not (output / "tasks" / "task-002.html").exists()
+    assert (output / "tasks" / "task-000.html").exists()
+    # Files not generated by the dashboard are left alone
+    assert (output / "CNAME").read_text() == "example.org\n"
+
+
+def test_generate_template_change_rerenders_everything(workspace: Path, tmp_path: Path):
+    """Editing a shared template invalidates every page built from the templates."""
+    import shutil
+
+    template_dir = tmp_path / "templates"
+    src_templates = Path(__file__).parent.parent / "src" / "gptme_dashboard" / "templates"
+    shutil.copytree(src_templates, template_dir)
+    _add_tasks(workspace, 2)
+    output = tmp_path / "site"
+    generate(workspace, output, template_dir)
+    before = _site_state(output)
+
+    base = template_dir / "base.html"
+    base.write_text(base.read_text() + "\n<!-- changed -->\n")
+    generate(workspace, output, template_dir)
+    html_pages = {p for p in before if p.endswith(".html")}
+    assert html_pages <= _touched(before, _site_state(output))
+
+
+def test_generate_parallel_matches_serial(workspace: Path, tmp_path: Path):
+    """Pages rendered across worker processes are identical to a serial build."""
+    _add_tasks(workspace, 40)
+    serial, parallel = tmp_path / "serial", tmp_path / "parallel"
+    generate(workspace, serial, jobs=1)
+    with patch("gptme_dashboard.generate.ProcessPoolExecutor") as pool_cls:
+        from concurrent.futures import ProcessPoolExecutor
+
+        pool_cls.side_effect = ProcessPoolExecutor
+        generate(workspace, parallel, jobs=2)
+    assert pool_cls.call_count == 1
+
+    files = sorted(p.relative_to(serial) for p in serial.rglob("*") if p.is_file())
+    assert files == sorted(p.relative_to(parallel) for p in parallel.rglob("*") if p.is_file())
+    for rel in files:
+        assert (serial / rel).read_bytes() == (parallel / rel).read_bytes(), rel
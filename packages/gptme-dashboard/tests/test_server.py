@@ -312,6 +312,236 @@ def test_api_sessions_filter_no_match(client):
     assert data["total"] == 0
 
 
+# -- Indexed /api/sessions ----------------------------------------------------
+
+
+def _synthetic_records(n: int, *, seed: int = 0, start: int = 0) -> list[dict]:
+    """Session records spread over the last 200 days, with repeated timestamps."""
+    import random
+
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    records = []
+    for i in range(start, start + n):
+        ts = now - timedelta(minutes=rng.randrange(200 * 24 * 60))
+        records.append(
+            {
+                "session_id": f"s{i:06d}",
+                "timestamp": ts.strftime("%Y-%m-%dT%H:%M:00Z"),
+                "harness": rng.choice(["claude-code", "gptme", "Codex"]),
+                "model": rng.choice(["claude-opus-4-6", "claude-sonnet-4-6", "gpt-5", None]),
+                "category": rng.choice(["code", "triage", "infrastructure"]),
+                "outcome": rng.choice(["productive", "noop", "unknown"]),
+                "duration_seconds": rng.randrange(3600),
+            }
+        )
+    return records
+
+
+def _store_client(tmp_path: Path, records: list[dict]):
+    (tmp_path / "gptme.toml").write_text('[agent]\nname = "TestBot"\n')
+    (tmp_path / "lessons").mkdir(exist_ok=True)
+    sessions_dir = tmp_path / "state" / "sessions"
+    sessions_dir.mkdir(parents=True, exist_ok=True)
+    with open(sessions_dir / "session-records.jsonl", "w") as f:
+        for r in records:
+            f.write(json.dumps(r) + "\n")
+    app = create_app(tmp_path, site_dir=tmp_path / "site")
+    app.config["TESTING"] = True
+    return app.test_client()
+
+
+def _reference_page(records: list[dict], days: int | None, **filters: str) -> list[str]:
+    """Session ids newest first, filtered the way the pre-index endpoint did."""
+    cutoff = None if days is None else datetime.now(timezone.utc) - timedelta(days=days)
+    matches = [
+        r
+        for r in records
+        if (
+            cutoff is None
+            or datetime.fromisoformat(r["timestamp"].replace("Z", "+00:00")) >= cutoff
+        )
+        and all((r.get(f) or "").lower() == v.lower() for f, v in filters.items())
+    ]
+    matches.sort(key=lambda r: (r["timestamp"], r["session_id"]), reverse=True)
+    return [r["session_id"] for r in matches]
+
+
+def _follow_cursor(client, query: str) -> list[str]:
+    ids, after = [], ""
+    while True:
+        data = client.get(f"/api/sessions?{query}&after={after}").get_json()
+        ids += [s["session_id"] for s in data["sessions"]]
+        if not data["has_more"]:
+            assert data["next_cursor"] is None
+            return ids
+        after = data["next_cursor"]
+
+
+@pytest.mark.parametrize(
+    "query,days,filters",
+    [
+        ("", None, {}),
+        ("days=30", 30, {}),
+        ("harness=codex", None, {"harness": "codex"}),
+        ("model=GPT-5&outcome=noop", None, {"model": "gpt-5", "outcome": "noop"}),
+        (
+            "days=90&harness=gptme&model=claude-opus-4-6&outcome=productive",
+            90,
+            {"harness": "gptme", "model": "claude-opus-4-6", "outcome": "productive"},
+        ),
+    ],
+)
+def test_api_sessions_index_matches_reference(tmp_path: Path, query, days, filters):
+    """Cursor and offset pages over the index agree with a brute-force filter + sort."""
+    pytest.importorskip("gptme_sessions")
+    records = _synthetic_records(600)
+    expected = _reference_page(records, days, **filters)
+    with _store_client(tmp_path, records) as c:
+        assert _follow_cursor(c, f"limit=37&{query}") == expected
+
+        data = c.get(f"/api/sessions?limit=37&offset=74&{query}").get_json()
+        assert data["total"] == len(expected)
+        assert data["offset"] == 74
+        assert [s["session_id"] for s in data["sessions"]] == expected[74:111]
+
+
+def test_api_sessions_cursor_reports_offset(tmp_path: Path):
+    """A cursor page reports its offset, so offset-based UIs can mix both."""
+    pytest.importorskip("gptme_sessions")
+    with _store_client(tmp_path, _synthetic_records(50)) as c:
+        first = c.get("/api/sessions?limit=20").get_json()
+        assert first["offset"] == 0
+        second = c.get(f"/api/sessions?limit=20&after={first['next_cursor']}").get_json()
+        assert second["offset"] == 20
+        assert (
+            second["sessions"] == c.get("/api/sessions?limit=20&offset=20").get_json()["sessions"]
+        )
+
+
+def test_api_sessions_cursor_stable_across_appends(tmp_path: Path):
+    """Sessions appended between pages do not shift or duplicate later pages."""
+    pytest.importorskip("gptme_sessions")
+    records = _synthetic_records(100)
+    with _store_client(tmp_path, records) as c:
+        first = c.get("/api/sessions?limit=30").get_json()
+        expected = _reference_page(records, None)
+
+        newer = _synthetic_records(5, seed=1, start=1000)
+        for r in newer:
+            r["timestamp"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        with open(tmp_path / "state" / "sessions" / "session-records.jsonl", "a") as f:
+            for r in newer:
+                f.write(json.dumps(r) + "\n")
+
+        second = c.get(f"/api/sessions?limit=30&after={first['next_cursor']}").get_json()
+        assert [s["session_id"] for s in second["sessions"]] == expected[30:60]
+        assert second["total"] == 105
+        # The new sessions show up on a fresh first page
+        top = c.get("/api/sessions?limit=5").get_json()
+        assert {s["session_id"] for s in top["sessions"]} == {r["session_id"] for r in newer}
+
+
+def test_api_sessions_index_reloads_only_on_change(tmp_path: Path):
+    """The store is parsed once and again only after the file changes."""
+    pytest.importorskip("gptme_sessions")
+    from gptme_sessions.store import SessionStore
+
+    records = _synthetic_records(10)
+    with _store_client(tmp_path, records) as c:
+        with unittest.mock.patch.object(
+            SessionStore, "load_all", autospec=True, side_effect=SessionStore.load_all
+        ) as load_all:
+            for _ in range(3):
+                assert c.get("/api/sessions").get_json()["total"] == 10
+                assert c.get("/api/sessions?harness=gptme").status_code == 200
+            assert load_all.call_count == 1
+
+            store_file = tmp_path / "state" / "sessions" / "session-records.jsonl"
+            with open(store_file, "a") as f:
+                f.write(json.dumps(_synthetic_records(1, start=99)[0]) + "\n")
+            assert c.get("/api/sessions").get_json()["total"] == 11
+            assert load_all.call_count == 2
+
+
+def test_api_sessions_follow_store_to_sqlite(tmp_path: Path, monkeypatch):
+    """After ``gptme-sessions import-jsonl`` new records land in, and are read from, SQLite."""
+    pytest.importorskip("gptme_sessions")
+    from gptme_sessions.record import SessionRecord
+    from gptme_sessions.sqlite_store import SqliteSessionStore
+    from gptme_sessions.store import open_store
+
+    monkeypatch.delenv("GPTME_SESSIONS_BACKEND", raising=False)
+    records = _synthetic_records(10)
+    with _store_client(tmp_path, records) as c:
+        assert c.get("/api/sessions").get_json()["total"] == 10
+
+        sessions_dir = tmp_path / "state" / "sessions"
+        SqliteSessionStore(sessions_dir=sessions_dir).import_jsonl(
+            sessions_dir / "session-records.jsonl"
+        )
+        # Recorded after the migration, so only the database has it
+        new = _synthetic_records(1, start=99)[0]
+        store = open_store(sessions_dir)
+        assert isinstance(store, SqliteSessionStore)
+        store.append(SessionRecord.from_dict(new))
+
+        page = c.get("/api/sessions").get_json()
+        assert page["total"] == 11
+        assert new["session_id"] in {s["session_id"] for s in page["sessions"]}
+        assert c.get("/api/sessions/stats").get_json()["total"] == 11
+
+
+def test_api_sessions_invalid_cursor(client):
+    """A malformed ``after`` cursor is rejected with 400."""
+    for bad in ("not-a-cursor", "W10", "eyJ4IjoxfQ"):
+        resp = client.get(f"/api/sessions?after={bad}")
+        assert resp.status_code == 400
+        assert "Invalid cursor" in resp.get_json()["error"]
+
+
+@pytest.mark.slow
+def test_benchmark_api_sessions_100k(tmp_path: Path):
+    """Per-request latency of the indexed endpoint at 1k vs 100k sessions.
+
+    Run with ``pytest -m slow -s`` to see the timings.
+    """
+    import time
+
+    pytest.importorskip("gptme_sessions")
+    queries = [
+        "limit=50",
+        "limit=50&offset=500",
+        "limit=50&harness=gptme",
+        "limit=50&model=claude-opus-4-6&outcome=productive",
+        "limit=50&days=30&harness=claude-code&outcome=noop",
+    ]
+    timings = {}
+    for n in (1_000, 100_000):
+        ws = tmp_path / str(n)
+        ws.mkdir()
+        with _store_client(ws, _synthetic_records(n)) as c:
+            start = time.perf_counter()
+            first = c.get("/api/sessions?limit=50").get_json()
+            cold_s = time.perf_counter() - start
+            for q in queries:  # warm the combined-filter caches
+                c.get(f"/api/sessions?{q}")
+
+            rounds = 20
+            start = time.perf_counter()
+            for _ in range(rounds):
+                for q in queries:
+                    assert c.get(f"/api/sessions?{q}").status_code == 200
+                c.get(f"/api/sessions?limit=50&after={first['next_cursor']}")
+            per_request = (time.perf_counter() - start) / (rounds * (len(queries) + 1))
+            timings[n] = per_request
+            print(
+                f"\n{n} sessions: first request (builds index) {cold_s * 1000:.0f}ms, "
+                f"warm {per_request * 1000:.2f}ms/request"
+            )
+    assert timings[100_000] < 3 * timings[1_000], timings
+
+
 def test_api_services_structure(client):
     """Test /api/services returns correct structure even with no gptme services."""
     resp = client.get("/api/services")
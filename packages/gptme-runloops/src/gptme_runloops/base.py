@@ -307,7 +307,7 @@ class BaseRunLoop(ABC):
         """
         try:
             from gptme_sessions.post_session import post_session
-            from gptme_sessions.store import SessionStore
+            from gptme_sessions.store import open_store
         except ImportError:
             self.logger.debug(
                 "gptme_sessions not available — skipping session recording"
@@ -319,7 +319,7 @@ class BaseRunLoop(ABC):
         )
         try:
             post_session(
-                store=SessionStore(),  # uses GPTME_SESSIONS_DIR env var
+                store=open_store(),  # uses GPTME_SESSIONS_DIR env var
                 harness=self.executor.name,
                 model=self.model,
                 run_type=self.run_type,
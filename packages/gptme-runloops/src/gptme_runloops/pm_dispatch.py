@@ -12,18 +12,26 @@ remain the primary dispatch path (see project-monitoring-upstream-overhaul).
 
 from __future__ import annotations
 
+import fnmatch
+import gzip
 import hashlib
 import json
 import logging
 import os
 import re
+import sqlite3
 import sys
 import time
+import zlib
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, cast
 
+from gptme_runloops.utils.state import atomic_write_bytes, locked_state_file
+
 # Slow-lane item types — items that need deep investigation (PR reviews,
 # CI diagnostics, merge conflicts, Greptile issues). Fast lane is anything
 # else (notifications, assigned issues).
@@ -477,42 +485,440 @@ def resolve_lane_model(
 # --- DispatchLedger ---
 
 
+# Ledger segments cover one UTC day by default
+DEFAULT_LEDGER_SEGMENT_SECONDS = 86400
+
+# Bump when the ledger index schema changes; the index is rebuilt from the
+# segment files on mismatch.
+_LEDGER_INDEX_VERSION = 1
+
+
+def _ledger_epoch(timestamp: Any) -> float | None:
+    """Epoch seconds of a ledger ISO timestamp, or None if unparseable."""
+    if not isinstance(timestamp, str):
+        return None
+    try:
+        dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def _ledger_line_data(line: bytes) -> dict[str, Any] | None:
+    try:
+        data = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+# Both ledger writers put the timestamp first; rotation only needs that field
+_LEDGER_TIMESTAMP_RE = re.compile(rb'^\{"timestamp":\s*"([^"\\]*)"')
+
+
+def _ledger_line_epoch(line: bytes) -> float | None:
+    match = _LEDGER_TIMESTAMP_RE.match(line)
+    if match:
+        return _ledger_epoch(match.group(1).decode())
+    return _ledger_epoch((_ledger_line_data(line) or {}).get("timestamp"))
+
+
+def _ledger_keys(data: dict[str, Any]) -> list[str]:
+    """Keys an entry is indexed under: its dispatch id and each item ref."""
+    keys = [data.get("dispatch_id"), *(data.get("item_refs") or [])]
+    return list(dict.fromkeys(k for k in keys if isinstance(k, str) and k))
+
+
 class DispatchLedger:
     """Append-only JSONL telemetry for dispatch events.
 
     Mirrors the bash ``append_dispatch_ledger()`` function.
+
+    ``path`` is the active segment and keeps the bash-compatible JSONL
+    format, so external appenders keep working.  Appending an entry from a
+    newer period (``segment_seconds``, one UTC day by default) first rotates
+    the active segment into gzipped per-period files next to it
+    (``<stem>.<YYYYmmddTHHMMZ><suffix>.gz``).
+
+    A SQLite sidecar (``<name>.idx``) keeps the time span of every rotated
+    segment and the latest timestamp per key (``dispatch_id`` and each item
+    ref) and phase, so :meth:`last_dispatch` is a single lookup and a
+    time-bounded :meth:`read` only opens overlapping segments.  Lines that
+    other writers append to the active segment are indexed on the next call.
+    The index can be deleted at any time; it is rebuilt from the segments.
     """
 
-    def __init__(self, path: Path) -> None:
+    def __init__(
+        self, path: Path, segment_seconds: int = DEFAULT_LEDGER_SEGMENT_SECONDS
+    ) -> None:
         self.path = path
+        self.segment_seconds = segment_seconds
+        self.index_path = path.with_name(f"{path.name}.idx")
+        self._rotating_path = path.with_name(f"{path.name}.rotating")
+        self._plan_path = path.with_name(f"{path.name}.rotating.plan")
 
     def append(self, entry: LedgerEntry) -> None:
-        """Append a single ledger entry to the JSONL file."""
+        """Append a single ledger entry, rotating the active segment if needed."""
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.path, "a") as f:
-            f.write(json.dumps(entry.to_dict(), default=str) + "\n")
+        line = json.dumps(entry.to_dict(), default=str) + "\n"
+        written = False
+        with locked_state_file(self.path):
+            try:
+                with self._index() as conn:
+                    self._sync(conn)
+                    first = self._meta(conn, "active_first_ts")
+                    ts = _ledger_epoch(entry.timestamp)
+                    if self._rotating_path.exists() or (
+                        ts is not None
+                        and first is not None
+                        and self._segment_start(ts) > self._segment_start(first)
+                    ):
+                        self._rotate(conn)
+                    with open(self.path, "a") as f:
+                        f.write(line)
+                    written = True
+                    self._sync(conn)
+            except sqlite3.Error as e:
+                # Non-critical: the entry is still recorded, and the index
+                # catches up with the active segment on the next call.
+                logger.warning("Could not update dispatch ledger index: %s", e)
+            if not written:
+                with open(self.path, "a") as f:
+                    f.write(line)
+
+    def read(
+        self, since: datetime | None = None, until: datetime | None = None
+    ) -> list[LedgerEntry]:
+        """Read entries, oldest segment first.
+
+        With ``since``/``until``, only entries in that time range are returned
+        and only the segments overlapping it are read.
+        """
+        if since is None and until is None:
+            files = sorted(self.path.parent.glob(self._segment_glob()))
+        else:
+            if not self.path.parent.exists():
+                return []
+            lo = since.timestamp() if since else float("-inf")
+            hi = until.timestamp() if until else float("inf")
+            with locked_state_file(self.path), self._index() as conn:
+                files = [
+                    self.path.with_name(name)
+                    for (name,) in conn.execute(
+                        "SELECT name FROM segments WHERE last_ts >= ? AND first_ts <= ?"
+                        " ORDER BY first_ts, name",
+                        (lo, hi),
+                    )
+                ]
+        files += [self._rotating_path, self.path]
 
-    def read(self) -> list[LedgerEntry]:
-        """Read all entries from the ledger file."""
-        if not self.path.exists():
-            return []
         entries: list[LedgerEntry] = []
-        with open(self.path) as f:
-            for line in f:
-                line = line.strip()
-                if not line:
+        for file in files:
+            for line in self._read_lines(file):
+                data = _ledger_line_data(line)
+                if data is None:
                     continue
+                if since is not None or until is not None:
+                    ts = _ledger_epoch(data.get("timestamp"))
+                    if ts is None or not lo <= ts <= hi:
+                        continue
                 try:
-                    data = json.loads(line)
                     entries.append(LedgerEntry(**data))
-                except (json.JSONDecodeError, TypeError):
+                except TypeError:
                     continue
         return entries
 
+    def last_dispatch(
+        self, key: str, phase: str | None = "launched"
+    ) -> datetime | None:
+        """Time of the latest entry for *key* (dispatch id or item ref).
+
+        ``phase=None`` matches entries of any phase.
+        """
+        if not self.path.exists() and not self.index_path.exists():
+            return None
+        with locked_state_file(self.path), self._index() as conn:
+            self._sync(conn)
+            if phase is None:
+                row = conn.execute(
+                    "SELECT MAX(ts) FROM latest WHERE key = ?", (key,)
+                ).fetchone()
+            else:
+                row = conn.execute(
+                    "SELECT ts FROM latest WHERE key = ? AND phase = ?", (key, phase)
+                ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return datetime.fromtimestamp(row[0], timezone.utc)
+
+    def in_cooldown(
+        self, key: str, cooldown_secs: int, phase: str | None = "launched"
+    ) -> bool:
+        """True when *key* has an entry within the last *cooldown_secs* seconds."""
+        if cooldown_secs <= 0:
+            return False
+        last = self.last_dispatch(key, phase)
+        return last is not None and time.time() - last.timestamp() < cooldown_secs
+
     def clear(self) -> None:
         """Clear the ledger (for testing)."""
-        if self.path.exists():
-            self.path.unlink()
+        for file in self.path.parent.glob(self._segment_glob()):
+            file.unlink()
+        for file in (self.path, self._rotating_path, self._plan_path, self.index_path):
+            if file.exists():
+                file.unlink()
+
+    # -- segments --
+
+    def _segment_start(self, ts: float) -> int:
+        return int(ts // self.segment_seconds) * self.segment_seconds
+
+    def _segment_name(self, start: int) -> str:
+        stamp = datetime.fromtimestamp(start, timezone.utc).strftime("%Y%m%dT%H%MZ")
+        return f"{self.path.stem}.{stamp}{self.path.suffix}.gz"
+
+    def _segment_glob(self) -> str:
+        return f"{self.path.stem}.*{self.path.suffix}.gz"
+
+    @classmethod
+    def _read_lines(cls, file: Path) -> list[bytes]:
+        if file.suffix == ".gz":
+            return cls._read_segment(file).splitlines()
+        try:
+            return file.read_bytes().splitlines()
+        except FileNotFoundError:
+            return []
+
+    @staticmethod
+    def _read_segment(file: Path) -> bytes:
+        """Decompressed lines of a rotated segment.
+
+        A truncated or corrupt segment yields the complete lines before the
+        damage instead of raising, so one torn write does not break every
+        later read.
+        """
+        try:
+            raw = file.read_bytes()
+        except FileNotFoundError:
+            return b""
+        parts: list[bytes] = []
+        while raw:
+            member = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            try:
+                parts.append(member.decompress(raw))
+            except zlib.error as e:
+                logger.warning(
+                    "Dispatch ledger segment %s is corrupt: %s", file.name, e
+                )
+                break
+            if not member.eof:
+                logger.warning("Dispatch ledger segment %s is truncated", file.name)
+                break
+            raw = member.unused_data
+        data = b"".join(parts)
+        return data[: data.rfind(b"\n") + 1]
+
+    def _rotate(self, conn: sqlite3.Connection) -> None:
+        """Move the active segment into gzipped per-period segments.
+
+        The active file is renamed first, so concurrent appenders start a new
+        active file; a rotation interrupted after the rename is finished by
+        the next append.  Lines keep their order; unparseable lines follow the
+        entry before them.
+
+        Each segment is rewritten through a temporary file and ``os.replace``.
+        Before any is replaced, the expected size of every target segment is
+        saved to a plan file, so a resumed rotation skips the segments that
+        already hold their lines instead of appending them twice.
+        """
+        if not self._rotating_path.exists():
+            self._plan_path.unlink(missing_ok=True)
+            if not self.path.exists():
+                return
+            os.replace(self.path, self._rotating_path)
+        lines = [line for line in self._read_lines(self._rotating_path) if line.strip()]
+        stamps = [_ledger_line_epoch(line) for line in lines]
+        known = [ts for ts in stamps if ts is not None]
+        prev = self._segment_start(known[0] if known else time.time())
+
+        groups: dict[int, list[bytes]] = {}
+        spans: dict[int, list[float]] = {}
+        for line, ts in zip(lines, stamps):
+            start = self._segment_start(ts) if ts is not None else prev
+            prev = start
+            groups.setdefault(start, []).append(line + b"\n")
+            if ts is not None:
+                spans.setdefault(start, []).append(ts)
+        chunks = {self._segment_name(start): b"".join(g) for start, g in groups.items()}
+
+        try:
+            plan = json.loads(self._plan_path.read_bytes())
+        except FileNotFoundError:
+            # No segment has been touched yet: record what each should become
+            plan = {
+                name: len(self._read_segment(self.path.with_name(name))) + len(chunk)
+                for name, chunk in chunks.items()
+            }
+            atomic_write_bytes(self._plan_path, json.dumps(plan).encode())
+
+        for start, group in groups.items():
+            name = self._segment_name(start)
+            file = self.path.with_name(name)
+            data = self._read_segment(file)
+            if len(data) != plan.get(name):
+                data += chunks[name]
+                atomic_write_bytes(file, gzip.compress(data, compresslevel=6))
+            span = spans.get(start) or [start, start + self.segment_seconds - 1]
+            with conn:
+                self._index_segment(conn, name, min(span), max(span), data.count(b"\n"))
+        self._rotating_path.unlink()
+        self._plan_path.unlink()
+        with conn:
+            self._set_meta(conn, active_bytes=0, active_ino=None, active_first_ts=None)
+
+    # -- index --
+
+    @contextmanager
+    def _index(self) -> Iterator[sqlite3.Connection]:
+        """Open the index, rebuilding it when missing or outdated.
+
+        Callers hold the ledger lock, which serializes all index writers.
+        """
+        conn = sqlite3.connect(str(self.index_path), timeout=5.0)
+        try:
+            conn.execute("PRAGMA synchronous=NORMAL")
+            if (
+                conn.execute("PRAGMA user_version").fetchone()[0]
+                != _LEDGER_INDEX_VERSION
+            ):
+                self._rebuild_index(conn)
+            yield conn
+        finally:
+            conn.close()
+
+    def _rebuild_index(self, conn: sqlite3.Connection) -> None:
+        """Recreate the index schema and re-index all rotated segments."""
+        conn.executescript(
+            """
+            BEGIN IMMEDIATE;
+            DROP TABLE IF EXISTS latest;
+            DROP TABLE IF EXISTS segments;
+            DROP TABLE IF EXISTS meta;
+            CREATE TABLE latest (
+                key TEXT NOT NULL,
+                phase TEXT NOT NULL,
+                ts REAL NOT NULL,
+                PRIMARY KEY (key, phase)
+            ) WITHOUT ROWID;
+            CREATE TABLE segments (
+                name TEXT PRIMARY KEY,
+                first_ts REAL NOT NULL,
+                last_ts REAL NOT NULL,
+                entries INTEGER NOT NULL
+            );
+            CREATE TABLE meta (key TEXT PRIMARY KEY, value);
+            COMMIT;
+            """
+        )
+        for file in sorted(self.path.parent.glob(self._segment_glob())):
+            lines = [line for line in self._read_lines(file) if line.strip()]
+            records = self._parse(lines)
+            span = [ts for ts, _ in records] or [0.0]
+            with conn:
+                self._index_entries(conn, records)
+                self._index_segment(conn, file.name, min(span), max(span), len(lines))
+        conn.execute(f"PRAGMA user_version = {_LEDGER_INDEX_VERSION}")
+
+    @staticmethod
+    def _parse(lines: list[bytes]) -> list[tuple[float, dict[str, Any]]]:
+        records = []
+        for line in lines:
+            data = _ledger_line_data(line)
+            ts = _ledger_epoch(data.get("timestamp")) if data else None
+            if data is not None and ts is not None:
+                records.append((ts, data))
+        return records
+
+    def _sync(self, conn: sqlite3.Connection) -> None:
+        """Index lines appended to the active segment since the last call."""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            if self._meta(conn, "active_bytes"):
+                with conn:
+                    self._set_meta(
+                        conn, active_bytes=0, active_ino=None, active_first_ts=None
+                    )
+            return
+        offset = self._meta(conn, "active_bytes") or 0
+        first = self._meta(conn, "active_first_ts")
+        if st.st_ino != self._meta(conn, "active_ino") or st.st_size < offset:
+            # A new or truncated active file: index it from the start
+            offset, first = 0, None
+        if st.st_size == offset:
+            return
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            chunk = f.read(st.st_size - offset)
+        # Leave a partially written last line for the next call
+        chunk = chunk[: chunk.rfind(b"\n") + 1]
+        records = self._parse(chunk.splitlines())
+        stamps = [ts for ts, _ in records] + ([first] if first is not None else [])
+        with conn:
+            self._index_entries(conn, records)
+            self._set_meta(
+                conn,
+                active_bytes=offset + len(chunk),
+                active_ino=st.st_ino,
+                active_first_ts=min(stamps) if stamps else None,
+            )
+
+    @staticmethod
+    def _index_entries(
+        conn: sqlite3.Connection, records: list[tuple[float, dict[str, Any]]]
+    ) -> None:
+        latest: dict[tuple[str, str], float] = {}
+        for ts, data in records:
+            phase = str(data.get("phase") or "")
+            for key in _ledger_keys(data):
+                if ts >= latest.get((key, phase), float("-inf")):
+                    latest[(key, phase)] = ts
+        conn.executemany(
+            "INSERT INTO latest (key, phase, ts) VALUES (?, ?, ?)"
+            " ON CONFLICT (key, phase) DO UPDATE SET ts = excluded.ts"
+            " WHERE excluded.ts > latest.ts",
+            [(key, phase, ts) for (key, phase), ts in latest.items()],
+        )
+
+    @staticmethod
+    def _index_segment(
+        conn: sqlite3.Connection,
+        name: str,
+        first_ts: float,
+        last_ts: float,
+        entries: int,
+    ) -> None:
+        conn.execute(
+            "INSERT INTO segments (name, first_ts, last_ts, entries) VALUES (?, ?, ?, ?)"
+            " ON CONFLICT (name) DO UPDATE SET"
+            " first_ts = MIN(first_ts, excluded.first_ts),"
+            " last_ts = MAX(last_ts, excluded.last_ts),"
+            " entries = excluded.entries",
+            (name, first_ts, last_ts, entries),
+        )
+
+    @staticmethod
+    def _meta(conn: sqlite3.Connection, key: str) -> Any:
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _set_meta(conn: sqlite3.Connection, **values: Any) -> None:
+        conn.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", values.items()
+        )
 
 
 # --- LaneDispatcher ---
@@ -578,6 +984,11 @@ class LaneDispatcher:
             fast_model = os.environ.get("BOB_PM_FAST_LANE_MODEL") or None
         fast_items, slow_items = partition_items(items)
 
+        # One systemctl snapshot serves every slot decision in this tick;
+        # units launched meanwhile are tracked locally.
+        self.slot_manager.refresh()
+        launched_units: set[str] = set()
+
         launched = 0
         deferred = 0
         running = self.slot_manager.running_slots
@@ -602,8 +1013,10 @@ class LaneDispatcher:
                 legacy_name = _derive_legacy_unit_name(slot_key)
 
                 # Dedupe: skip if slot is already busy for this key
-                if self.slot_manager._is_busy(unit_name) or self.slot_manager._is_busy(
-                    legacy_name
+                if (
+                    unit_name in launched_units
+                    or self.slot_manager._is_busy(unit_name)
+                    or self.slot_manager._is_busy(legacy_name)
                 ):
                     deferred += 1
                     continue
@@ -636,6 +1049,7 @@ class LaneDispatcher:
                 )
 
                 if success:
+                    launched_units.add(unit_name)
                     launched += 1
                     running += 1
                     if lane == "fast":
@@ -787,8 +1201,9 @@ def _derive_legacy_unit_name(slot_key: str, prefix: str = "bob-pm") -> str:
 class SlotManager:
     """Manages concurrent slot capacity and fast-lane burst allowances.
 
-    In production this wraps ``systemctl`` calls; in tests it uses a
-    provided ``count_running`` callback.
+    In production this reads a :class:`SystemdUnitSnapshot` (one
+    ``systemctl`` call per dispatch tick); in tests it uses a provided
+    ``count_running`` callback.
     """
 
     def __init__(
@@ -798,14 +1213,22 @@ class SlotManager:
         count_running: Callable | None = None,
         count_running_lane: Callable | None = None,
         is_busy: Callable | None = None,
+        unit_snapshot: SystemdUnitSnapshot | None = None,
     ) -> None:
         self.slot_cap = slot_cap
         self.fast_burst_allowance = fast_burst_allowance
 
-        # Injected callbacks for testability. Default to systemctl probes.
-        self._count_running = count_running or _default_count_running
-        self._count_running_lane = count_running_lane or _default_count_running_lane
-        self._is_busy = is_busy or _default_slot_is_busy
+        # Injected callbacks for testability. Default to the systemd snapshot.
+        self.unit_snapshot = unit_snapshot or SystemdUnitSnapshot()
+        self._count_running = count_running or self.unit_snapshot.count_running
+        self._count_running_lane = (
+            count_running_lane or self.unit_snapshot.count_running_lane
+        )
+        self._is_busy = is_busy or self.unit_snapshot.is_busy
+
+    def refresh(self) -> None:
+        """Start a new dispatch tick: re-read unit states on the next query."""
+        self.unit_snapshot.invalidate()
 
     @property
     def running_slots(self) -> int:
@@ -842,68 +1265,108 @@ class SlotManager:
         return False
 
 
-def _default_count_running() -> int:
-    """Count running slot units via systemctl."""
-    import subprocess
+# Runs ``systemctl --user`` with the given arguments and returns its stdout
+SystemctlRunner = Callable[[list[str]], str]
 
-    result = subprocess.run(
-        [
-            "systemctl",
-            "--user",
-            "list-units",
-            "bob-pm-*-slot-*",
-            "--all",
-            "--no-legend",
-        ],
-        capture_output=True,
-        text=True,
-        timeout=10,
-    )
-    count = 0
-    for line in result.stdout.splitlines():
-        unit = line.split()[0] if line.split() else ""
-        if unit and _default_slot_is_busy(unit):
-            count += 1
-    return count
+# ActiveState values that mean a slot unit is still occupying its slot
+_BUSY_UNIT_STATES = frozenset({"active", "activating", "reloading", "deactivating"})
 
+# How long one systemctl snapshot is reused across slot decisions
+DEFAULT_UNIT_SNAPSHOT_TTL = 5.0
 
-def _default_count_running_lane(lane: str) -> int:
-    """Count running slot units for a specific lane."""
+
+def _run_systemctl(args: list[str]) -> str:
+    """Default :data:`SystemctlRunner`: run ``systemctl --user`` via subprocess."""
     import subprocess
 
     result = subprocess.run(
-        [
-            "systemctl",
-            "--user",
-            "list-units",
-            f"bob-pm-{lane}-slot-*",
-            "--all",
-            "--no-legend",
-        ],
+        ["systemctl", "--user", *args],
         capture_output=True,
         text=True,
         timeout=10,
     )
-    count = 0
-    for line in result.stdout.splitlines():
-        unit = line.split()[0] if line.split() else ""
-        if unit and _default_slot_is_busy(unit):
-            count += 1
-    return count
+    return result.stdout
 
 
-def _default_slot_is_busy(unit: str) -> bool:
-    """Check if a systemd unit is in a busy state."""
-    import subprocess
+class SystemdUnitSnapshot:
+    """ActiveState of all slot units, read with a single ``systemctl`` call.
 
-    result = subprocess.run(
-        ["systemctl", "--user", "show", unit, "--property=ActiveState", "--value"],
-        capture_output=True,
-        text=True,
-        timeout=10,
-    )
-    state = result.stdout.strip()
-    return state in {"active", "activating", "reloading", "deactivating"}
+    ``systemctl list-units`` already reports each unit's ActiveState, so one
+    call answers every running-count and busy check of a dispatch tick.  The
+    snapshot is reused for ``ttl`` seconds or until :meth:`invalidate`.
+
+    Units that are not loaded are absent from the listing and count as
+    inactive, which is what ``systemctl show`` reports for them.
+    """
+
+    def __init__(
+        self,
+        prefix: str = "bob-pm",
+        runner: SystemctlRunner | None = None,
+        ttl: float = DEFAULT_UNIT_SNAPSHOT_TTL,
+    ) -> None:
+        self.prefix = prefix
+        self.ttl = ttl
+        self._runner = runner or _run_systemctl
+        self._states: dict[str, str] | None = None
+        self._taken_at = 0.0
+
+    def invalidate(self) -> None:
+        """Drop the cached snapshot so the next query re-reads systemctl."""
+        self._states = None
+
+    def states(self) -> dict[str, str]:
+        """Map of unit name to ActiveState for every unit under the prefix."""
+        now = time.monotonic()
+        if self._states is None or now - self._taken_at >= self.ttl:
+            self._states = self._parse(
+                self._runner(
+                    [
+                        "list-units",
+                        f"{self.prefix}-*",
+                        "--all",
+                        "--plain",
+                        "--no-legend",
+                        "--no-pager",
+                    ]
+                )
+            )
+            self._taken_at = now
+        return self._states
+
+    @staticmethod
+    def _parse(output: str) -> dict[str, str]:
+        # Columns: UNIT LOAD ACTIVE SUB DESCRIPTION; failed units may carry a
+        # leading status marker.
+        states: dict[str, str] = {}
+        for line in output.splitlines():
+            parts = line.split()
+            if parts and parts[0] in ("●", "*"):
+                parts = parts[1:]
+            if len(parts) >= 3:
+                states[parts[0]] = parts[2]
+        return states
+
+    def _count(self, pattern: str) -> int:
+        return sum(
+            1
+            for unit, state in self.states().items()
+            if state in _BUSY_UNIT_STATES and fnmatch.fnmatchcase(unit, pattern)
+        )
+
+    def count_running(self) -> int:
+        """Count busy slot units of any lane."""
+        return self._count(f"{self.prefix}-*-slot-*")
+
+    def count_running_lane(self, lane: str) -> int:
+        """Count busy slot units for a specific lane."""
+        return self._count(f"{self.prefix}-{lane}-slot-*")
+
+    def is_busy(self, unit: str) -> bool:
+        """Check if a unit is in a busy state (``.service`` may be omitted)."""
+        states = self.states()
+        state = states.get(unit) or states.get(f"{unit}.service", "inactive")
+        return state in _BUSY_UNIT_STATES
 
 
 # ---------------------------------------------------------------------------
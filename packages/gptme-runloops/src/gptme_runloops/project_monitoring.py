@@ -1,8 +1,10 @@
 """Project monitoring run loop implementation."""
 
+import hashlib
 import json
 import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -31,6 +33,76 @@ class WorkItem:
     details: str
 
 
+@dataclass
+class RepoSnapshot:
+    """Open PRs by the author and issues assigned to them in one repository.
+
+    ``prs`` and ``issues`` have the shape returned by ``gh pr list --json
+    number,title,updatedAt,url,headRefName,isDraft,statusCheckRollup`` and
+    ``gh issue list --json number,title,url``.
+    """
+
+    repo: str
+    prs: list[dict]
+    issues: list[dict]
+
+    def digest(self) -> str:
+        """Hash of the snapshot, used to skip repos unchanged since the last tick."""
+        payload = json.dumps([self.prs, self.issues], sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+
+# Per-repo fields of the batched discovery query; see _repo_batch_query()
+_PR_FIELDS = """number title url updatedAt headRefName isDraft
+          commits(last: 1) { nodes { commit { statusCheckRollup { contexts(first: 100) {
+            nodes { __typename ... on CheckRun { conclusion } ... on StatusContext { state } }
+          } } } } }"""
+
+
+def _repo_batch_query(repos: list[str], author: str) -> str:
+    """Build one GraphQL query fetching open PRs and assigned issues for *repos*.
+
+    Each repo ``i`` gets two aliased fields: ``p{i}`` searches its open PRs by
+    *author* (as ``gh pr list --author`` does), ``i{i}`` lists its open issues
+    assigned to *author*.
+    """
+    fields = []
+    for i, repo in enumerate(repos):
+        owner, name = repo.split("/", 1)
+        pr_query = f"repo:{repo} is:pr is:open" + (
+            f" author:{author}" if author else ""
+        )
+        issue_filter = (
+            f", filterBy: {{assignee: {json.dumps(author)}}}" if author else ""
+        )
+        fields.append(
+            f"""p{i}: search(type: ISSUE, first: 100, query: {json.dumps(pr_query)}) {{
+      nodes {{ ... on PullRequest {{ {_PR_FIELDS} }} }}
+    }}
+    i{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{
+      issues(states: OPEN, first: 100{issue_filter}) {{ nodes {{ number title url }} }}
+    }}"""
+        )
+    return "query {\n    " + "\n    ".join(fields) + "\n}"
+
+
+def _pr_from_graphql(node: dict) -> dict:
+    """Convert a GraphQL PullRequest node to the ``gh pr list --json`` shape."""
+    commits = (node.get("commits") or {}).get("nodes") or []
+    rollup = (
+        (commits[0].get("commit") or {}).get("statusCheckRollup") if commits else None
+    )
+    return {
+        "number": node["number"],
+        "title": node["title"],
+        "url": node["url"],
+        "updatedAt": node["updatedAt"],
+        "headRefName": node.get("headRefName"),
+        "isDraft": bool(node.get("isDraft")),
+        "statusCheckRollup": ((rollup or {}).get("contexts") or {}).get("nodes") or [],
+    }
+
+
 class ProjectMonitoringRun(BaseRunLoop):
     """Project monitoring run loop.
 
@@ -103,6 +175,13 @@ class ProjectMonitoringRun(BaseRunLoop):
     _DEFAULT_ITEM_TIMEOUT = 900  # ~15 min for unknown types
     _MAX_TIMEOUT = 3600  # 60 min cap regardless of item count
 
+    # Repos fetched per GraphQL query, and concurrent queries/repo checks.
+    # Each repo costs up to 100 PRs x 100 check contexts of the 500k node limit.
+    _REPO_BATCH_SIZE = 10
+    _DISCOVERY_WORKERS = 4
+    # Unchanged repos are skipped, but re-checked at least this often
+    _SNAPSHOT_MAX_AGE = timedelta(hours=1)
+
     def _compute_timeout(self, items: list["WorkItem"]) -> int:
         """Compute session timeout by summing per-item budgets, capped at _MAX_TIMEOUT.
 
@@ -217,11 +296,15 @@ class ProjectMonitoringRun(BaseRunLoop):
         self.logger.info(f"Total repositories to monitor: {len(repos)}")
         return list(repos)
 
-    def check_pr_updates(self, repo: str) -> list[WorkItem]:
+    def check_pr_updates(
+        self, repo: str, prs: list[dict] | None = None
+    ) -> list[WorkItem]:
         """Check for updated PRs using state tracking.
 
         Args:
             repo: Repository name (owner/repo)
+            prs: Open PRs by the author (from a RepoSnapshot); fetched with
+                ``gh pr list`` when omitted
 
         Returns:
             List of WorkItem for updated PRs
@@ -229,38 +312,37 @@ class ProjectMonitoringRun(BaseRunLoop):
         work_items = []
 
         try:
-            # Get open PRs by author
-            result = subprocess.run(
-                [
-                    "gh",
-                    "pr",
-                    "list",
-                    "--repo",
-                    repo,
-                    "--author",
-                    self.author,
-                    "--state",
-                    "open",
-                    "--json",
-                    "number,title,updatedAt,url,headRefName,isDraft",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
+            if prs is None:
+                # Get open PRs by author
+                result = subprocess.run(
+                    [
+                        "gh",
+                        "pr",
+                        "list",
+                        "--repo",
+                        repo,
+                        "--author",
+                        self.author,
+                        "--state",
+                        "open",
+                        "--json",
+                        "number,title,updatedAt,url,headRefName,isDraft",
+                    ],
+                    capture_output=True,
+                    text=True,
+                    timeout=30,
+                )
 
-            if result.returncode != 0 or not result.stdout.strip():
-                return []
+                if result.returncode != 0 or not result.stdout.strip():
+                    return []
 
-            prs = json.loads(result.stdout)
+                prs = json.loads(result.stdout)
 
             for pr in prs:
                 pr_number = pr["number"]
                 updated_at = pr["updatedAt"]
                 is_draft = bool(pr.get("isDraft"))
-                state_file = (
-                    self.state_dir / f"{repo.replace('/', '-')}-pr-{pr_number}.state"
-                )
+                state_file = self._pr_state_file(repo, pr_number)
 
                 with locked_state_file(state_file):
                     last_check = (
@@ -301,59 +383,49 @@ class ProjectMonitoringRun(BaseRunLoop):
 
         return work_items
 
-    def check_ci_failures(self, repo: str) -> list[WorkItem]:
+    def check_ci_failures(
+        self, repo: str, prs: list[dict] | None = None
+    ) -> list[WorkItem]:
         """Check for CI failures using state tracking.
 
         Args:
             repo: Repository name (owner/repo)
+            prs: Open PRs by the author with ``statusCheckRollup`` (from a
+                RepoSnapshot); fetched with ``gh pr list`` when omitted
 
         Returns:
             List of WorkItem for CI failures
         """
         work_items = []
-        state_file = self.state_dir / f"{repo.replace('/', '-')}-ci-failures.state"
+        state_file = self._ci_state_file(repo)
 
         try:
-            # Get PRs with CI status
-            result = subprocess.run(
-                [
-                    "gh",
-                    "pr",
-                    "list",
-                    "--repo",
-                    repo,
-                    "--author",
-                    self.author,
-                    "--state",
-                    "open",
-                    "--json",
-                    "number,title,statusCheckRollup,url,isDraft",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-
-            if result.returncode != 0 or not result.stdout.strip():
-                return []
-
-            prs = json.loads(result.stdout)
-            current_failures = []
-
-            for pr in prs:
-                # Skip draft PRs — don't chase CI failures on deprioritized work
-                if pr.get("isDraft"):
-                    continue
-                pr_number = pr["number"]
-                checks = pr.get("statusCheckRollup") or []
-
-                # Check for failures
-                has_failure = any(
-                    check.get("conclusion") == "FAILURE" for check in checks
+            if prs is None:
+                # Get PRs with CI status
+                result = subprocess.run(
+                    [
+                        "gh",
+                        "pr",
+                        "list",
+                        "--repo",
+                        repo,
+                        "--author",
+                        self.author,
+                        "--state",
+                        "open",
+                        "--json",
+                        "number,title,statusCheckRollup,url,isDraft",
+                    ],
+                    capture_output=True,
+                    text=True,
+                    timeout=30,
                 )
 
-                if has_failure:
-                    current_failures.append(pr_number)
+                if result.returncode != 0 or not result.stdout.strip():
+                    return []
+
+                prs = json.loads(result.stdout)
+            current_failures = self._ci_failures(prs)
 
             with locked_state_file(state_file):
                 prev_failures = []
@@ -390,6 +462,28 @@ class ProjectMonitoringRun(BaseRunLoop):
 
         return work_items
 
+    @staticmethod
+    def _ci_failures(prs: list[dict]) -> list[int]:
+        """Numbers of non-draft PRs with a failing check."""
+        current_failures = []
+        for pr in prs:
+            # Skip draft PRs — don't chase CI failures on deprioritized work
+            if pr.get("isDraft"):
+                continue
+            checks = pr.get("statusCheckRollup") or []
+            if any(check.get("conclusion") == "FAILURE" for check in checks):
+                current_failures.append(pr["number"])
+        return current_failures
+
+    def _pr_state_file(self, repo: str, pr_number: int) -> Path:
+        return self.state_dir / f"{repo.replace('/', '-')}-pr-{pr_number}.state"
+
+    def _ci_state_file(self, repo: str) -> Path:
+        return self.state_dir / f"{repo.replace('/', '-')}-ci-failures.state"
+
+    def _issues_state_file(self, repo: str) -> Path:
+        return self.state_dir / f"{repo.replace('/', '-')}-assigned-issues.state"
+
     def _is_last_activity_by_self(self, repo: str, pr_number: int) -> bool:
         """Check if the last activity on the PR was by the agent.
 
@@ -673,43 +767,48 @@ class ProjectMonitoringRun(BaseRunLoop):
             )
             return False
 
-    def check_assigned_issues(self, repo: str) -> list[WorkItem]:
+    def check_assigned_issues(
+        self, repo: str, issues: list[dict] | None = None
+    ) -> list[WorkItem]:
         """Check for assigned issues using state tracking.
 
         Args:
             repo: Repository name (owner/repo)
+            issues: Open issues assigned to the author (from a RepoSnapshot);
+                fetched with ``gh issue list`` when omitted
 
         Returns:
             List of WorkItem for assigned issues
         """
         work_items = []
-        state_file = self.state_dir / f"{repo.replace('/', '-')}-assigned-issues.state"
+        state_file = self._issues_state_file(repo)
 
         try:
-            # Get assigned issues
-            result = subprocess.run(
-                [
-                    "gh",
-                    "issue",
-                    "list",
-                    "--repo",
-                    repo,
-                    "--assignee",
-                    self.author,
-                    "--state",
-                    "open",
-                    "--json",
-                    "number,title,url",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
+            if issues is None:
+                # Get assigned issues
+                result = subprocess.run(
+                    [
+                        "gh",
+                        "issue",
+                        "list",
+                        "--repo",
+                        repo,
+                        "--assignee",
+                        self.author,
+                        "--state",
+                        "open",
+                        "--json",
+                        "number,title,url",
+                    ],
+                    capture_output=True,
+                    text=True,
+                    timeout=30,
+                )
 
-            if result.returncode != 0 or not result.stdout.strip():
-                return []
+                if result.returncode != 0 or not result.stdout.strip():
+                    return []
 
-            issues = json.loads(result.stdout)
+                issues = json.loads(result.stdout)
             current_issues = [issue["number"] for issue in issues]
 
             with locked_state_file(state_file):
@@ -954,9 +1053,139 @@ class ProjectMonitoringRun(BaseRunLoop):
 
         return work_items
 
+    def fetch_repo_snapshots(self, repos: list[str]) -> dict[str, RepoSnapshot]:
+        """Fetch open PRs and assigned issues for *repos* with batched GraphQL.
+
+        One aliased query covers ``_REPO_BATCH_SIZE`` repos, and up to
+        ``_DISCOVERY_WORKERS`` queries run concurrently.  Repos missing from
+        the result (query failed, repo not found) are left out; callers fall
+        back to the per-repo ``gh`` calls for those.
+
+        Args:
+            repos: Repository names (owner/repo)
+
+        Returns:
+            Snapshot per repository that was fetched successfully
+        """
+        batches = [
+            repos[i : i + self._REPO_BATCH_SIZE]
+            for i in range(0, len(repos), self._REPO_BATCH_SIZE)
+        ]
+        snapshots: dict[str, RepoSnapshot] = {}
+        if not batches:
+            return snapshots
+        workers = min(self._DISCOVERY_WORKERS, len(batches))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for batch_snapshots in pool.map(self._fetch_repo_batch, batches):
+                snapshots.update(batch_snapshots)
+        return snapshots
+
+    def _fetch_repo_batch(self, repos: list[str]) -> dict[str, RepoSnapshot]:
+        try:
+            result = subprocess.run(
+                [
+                    "gh",
+                    "api",
+                    "graphql",
+                    "-f",
+                    f"query={_repo_batch_query(repos, self.author)}",
+                ],
+                capture_output=True,
+                text=True,
+                timeout=60,
+            )
+            # gh exits non-zero on partial errors (e.g. one repo not found)
+            # but still prints the data for the others.
+            data = (json.loads(result.stdout) if result.stdout.strip() else {}).get(
+                "data"
+            ) or {}
+        except Exception as e:
+            self.logger.warning(f"Batched discovery failed for {len(repos)} repos: {e}")
+            return {}
+        if result.returncode != 0:
+            self.logger.debug(
+                f"Batched discovery query reported errors: {result.stderr}"
+            )
+
+        snapshots = {}
+        for i, repo in enumerate(repos):
+            prs, issues = data.get(f"p{i}"), data.get(f"i{i}")
+            if prs is None or issues is None:
+                continue
+            snapshots[repo] = RepoSnapshot(
+                repo=repo,
+                prs=[_pr_from_graphql(n) for n in prs.get("nodes") or [] if n],
+                issues=[
+                    n for n in (issues.get("issues") or {}).get("nodes") or [] if n
+                ],
+            )
+        return snapshots
+
+    def _snapshot_settled(self, snapshot: RepoSnapshot) -> bool:
+        """Whether re-checking *snapshot* would find nothing new.
+
+        True when every PR's update is recorded and the CI failure and
+        assigned issue state files match the snapshot.  A PR whose update was
+        held back (e.g. by spam prevention) keeps the repo unsettled, so it is
+        re-checked on the next tick as before.
+        """
+        repo = snapshot.repo
+
+        def read(path: Path) -> str | None:
+            try:
+                return path.read_text().strip()
+            except OSError:
+                return None
+
+        for pr in snapshot.prs:
+            last_check = read(self._pr_state_file(repo, pr["number"]))
+            if last_check is None or pr["updatedAt"] > last_check:
+                return False
+        failures = "\n".join(str(n) for n in self._ci_failures(snapshot.prs))
+        issues = "\n".join(str(issue["number"]) for issue in snapshot.issues)
+        return (
+            read(self._ci_state_file(repo)) == failures
+            and read(self._issues_state_file(repo)) == issues
+        )
+
+    def _check_repo(
+        self, repo: str, snapshot: RepoSnapshot | None, cached: dict | None
+    ) -> tuple[list[WorkItem], dict | None]:
+        """Check one repository; returns its work and its new cache entry."""
+        now = datetime.now(timezone.utc)
+        if snapshot is not None and cached is not None:
+            try:
+                fresh = now - datetime.fromisoformat(cached["checked_at"])
+                unchanged = cached["digest"] == snapshot.digest()
+            except (KeyError, TypeError, ValueError):
+                fresh, unchanged = self._SNAPSHOT_MAX_AGE, False
+            if unchanged and fresh < self._SNAPSHOT_MAX_AGE:
+                self.logger.debug(f"{repo} unchanged since last check, skipping")
+                return [], cached
+
+        self.logger.info(f"Checking {repo}...")
+        prs = snapshot.prs if snapshot is not None else None
+        work = [
+            # Check PR updates
+            *self.check_pr_updates(repo, prs),
+            # Check CI failures
+            *self.check_ci_failures(repo, prs),
+            # Check assigned issues
+            *self.check_assigned_issues(
+                repo, snapshot.issues if snapshot is not None else None
+            ),
+        ]
+        if snapshot is None or not self._snapshot_settled(snapshot):
+            return work, None
+        return work, {"digest": snapshot.digest(), "checked_at": now.isoformat()}
+
     def discover_work(self) -> list[WorkItem]:
         """Discover all work items across repositories.
 
+        Repositories are fetched with batched GraphQL queries
+        (:meth:`fetch_repo_snapshots`) and checked concurrently.  A repo whose
+        snapshot is unchanged since it was last fully processed is skipped.
+
         Returns:
             List of all discovered work items
         """
@@ -973,21 +1202,41 @@ class ProjectMonitoringRun(BaseRunLoop):
         all_work.extend(linear_work)
 
         repos = self.discover_repositories()
+        if not repos:
+            return all_work
 
-        for repo in repos:
-            self.logger.info(f"Checking {repo}...")
-
-            # Check PR updates
-            pr_work = self.check_pr_updates(repo)
-            all_work.extend(pr_work)
-
-            # Check CI failures
-            ci_work = self.check_ci_failures(repo)
-            all_work.extend(ci_work)
+        snapshots = self.fetch_repo_snapshots(repos)
+        self.logger.info(
+            f"Fetched {len(snapshots)}/{len(repos)} repositories in batched queries"
+        )
+        cache_file = self.state_dir / "repo-snapshots.json"
+        try:
+            cache = json.loads(cache_file.read_text())
+        except (OSError, ValueError):
+            cache = {}
+        if not isinstance(cache, dict) or cache.get("author") != self.author:
+            cache = {"author": self.author, "repos": {}}
+        cached_repos = cache.setdefault("repos", {})
+
+        workers = min(self._DISCOVERY_WORKERS, len(repos))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(
+                pool.map(
+                    lambda repo: self._check_repo(
+                        repo, snapshots.get(repo), cached_repos.get(repo)
+                    ),
+                    repos,
+                )
+            )
 
-            # Check assigned issues
-            issue_work = self.check_assigned_issues(repo)
-            all_work.extend(issue_work)
+        for repo, (work, entry) in zip(repos, results):
+            all_work.extend(work)
+            if entry is None:
+                cached_repos.pop(repo, None)
+            else:
+                cached_repos[repo] = entry
+        with locked_state_file(cache_file):
+            atomic_write_text(cache_file, json.dumps(cache, indent=2, sort_keys=True))
 
         return all_work
 
@@ -201,9 +201,11 @@ def assemble_hooks(config: RunItemConfig, raw: dict[str, Any]) -> RunItemHooks:
 
     # In-process collaborators (worker.sh heredoc imports)
     post_session = _import_attr("gptme_sessions.post_session", "post_session")
+    # open_store() follows the store to SQLite after ``import-jsonl``; older
+    # gptme-sessions checkouts only have the JSONL SessionStore.
+    make_store = _import_attr("gptme_sessions.store", "open_store")
     session_store_cls = _import_attr("gptme_sessions.store", "SessionStore")
-    make_store = None
-    if session_store_cls is not None:
+    if make_store is None and session_store_cls is not None:
         make_store = lambda sessions_dir: session_store_cls(sessions_dir=sessions_dir)  # noqa: E731
     session_record_cls = _import_attr("metaproductivity.sessions", "SessionRecord")
     make_record = None
@@ -36,6 +36,11 @@ def locked_state_file(path: Path) -> Iterator[None]:
 
 def atomic_write_text(path: Path, text: str, *, encoding: str = "utf-8") -> None:
     """Write *text* via a same-directory temporary file and ``os.replace``."""
+    atomic_write_bytes(path, text.encode(encoding))
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write *data* via a same-directory temporary file and ``os.replace``."""
     path.parent.mkdir(parents=True, exist_ok=True)
     fd, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
     temp_path = Path(temp_name)
@@ -44,8 +49,8 @@ def atomic_write_text(path: Path, text: str, *, encoding: str = "utf-8") -> None
             os.fchmod(fd, path.stat().st_mode & 0o777)
         except FileNotFoundError:
             pass
-        with os.fdopen(fd, "w", encoding=encoding) as temp_file:
-            temp_file.write(text)
+        with os.fdopen(fd, "wb") as temp_file:
+            temp_file.write(data)
             temp_file.flush()
             os.fsync(temp_file.fileno())
         os.replace(temp_path, path)
@@ -368,9 +368,10 @@ def write_post_session_record(
     """Write the monitoring session record via an injected ``post_session``.
 
     Mirrors worker.sh:283-323. ``post_session`` and ``make_store`` are the
-    caller's ``gptme_sessions.post_session.post_session`` and a
-    ``SessionStore`` factory taking the sessions dir (the record file's
-    parent) — injected so this package does not depend on gptme-sessions.
+    caller's ``gptme_sessions.post_session.post_session`` and a store
+    factory taking the sessions dir (the record file's parent), normally
+    ``gptme_sessions.store.open_store`` — injected so this package does not
+    depend on gptme-sessions.
 
     Raises on any failure (the bash uses the heredoc's non-zero exit to
     trigger the legacy fallback writer).
@@ -0,0 +1,65 @@
+"""conftest.py for gptme-runloops tests."""
+
+import json
+import os
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+_FAKE_COMMAND_PRELUDE = """#!{python}
+import json, sys
+
+args = sys.argv[1:]
+with open({log!r}, "a") as f:
+    f.write(json.dumps(args) + "\\n")
+with open({fixture!r}) as f:
+    fixture = json.load(f)
+"""
+
+
+class FakeCommand:
+    """Python shim for an external CLI, installed on PATH by ``fake_command``.
+
+    ``script`` is the body of the shim. It runs with ``args`` (argv without
+    the program name) and ``fixture`` (the JSON set via :meth:`set_fixture`)
+    already defined; every invocation is logged for :meth:`calls`.
+    """
+
+    def __init__(self, bin_dir: Path, name: str, script: str):
+        self.log = bin_dir.parent / f"{name}.log"
+        self.log.touch()
+        self.fixture = bin_dir.parent / f"{name}-fixture.json"
+        self.set_fixture(None)
+        path = bin_dir / name
+        prelude = _FAKE_COMMAND_PRELUDE.format(
+            python=sys.executable, log=str(self.log), fixture=str(self.fixture)
+        )
+        path.write_text(prelude + script)
+        path.chmod(0o755)
+
+    def set_fixture(self, data: Any) -> None:
+        self.fixture.write_text(json.dumps(data))
+
+    def calls(self) -> list[list[str]]:
+        return [json.loads(line) for line in self.log.read_text().splitlines()]
+
+    def reset(self) -> None:
+        self.log.write_text("")
+
+
+@pytest.fixture
+def fake_command(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Callable[[str, str], FakeCommand]:
+    """Factory that puts a :class:`FakeCommand` named ``name`` first on PATH."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    def make(name: str, script: str) -> FakeCommand:
+        return FakeCommand(bin_dir, name, script)
+
+    return make
@@ -128,6 +128,30 @@ def test_base_run_records_session_on_success():
             mock_record.assert_called_once_with(result)
 
 
+def test_record_session_follows_store_to_sqlite(tmp_path, monkeypatch):
+    """After ``gptme-sessions import-jsonl`` new sessions go to the database."""
+    pytest.importorskip("gptme_sessions")
+    from gptme_sessions.record import SessionRecord
+    from gptme_sessions.sqlite_store import SqliteSessionStore
+    from gptme_sessions.store import SessionStore
+
+    sessions_dir = tmp_path / "sessions"
+    monkeypatch.setenv("GPTME_SESSIONS_DIR", str(sessions_dir))
+    monkeypatch.delenv("GPTME_SESSIONS_BACKEND", raising=False)
+    jsonl = SessionStore(sessions_dir=sessions_dir)
+    jsonl.append(SessionRecord(session_id="old00001"))
+    sqlite = SqliteSessionStore(sessions_dir=sessions_dir)
+    sqlite.import_jsonl(jsonl.path)
+    jsonl_before = jsonl.path.read_bytes()
+
+    (tmp_path / "logs").mkdir()
+    run = TestRunLoop(tmp_path, "test")
+    run._record_session(ExecutionResult(exit_code=0))
+
+    assert len(sqlite.load_all()) == 2
+    assert jsonl.path.read_bytes() == jsonl_before
+
+
 def test_post_run_cleans_up_tmpdir():
     """Test that post_run() deletes the gptme session tmpdir after recording."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import gzip
 import io
 import json
 import logging
+import subprocess
 import time
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 from gptme_runloops.pm_dispatch import (
@@ -24,6 +28,7 @@ from gptme_runloops.pm_dispatch import (
     LedgerEntry,
     SlotItem,
     SlotManager,
+    SystemdUnitSnapshot,
     _bandit_observation_count,
     _partition_jsonl_io,
     _resolve_model_with_bandit,
@@ -339,6 +344,273 @@ class TestDispatchLedger:
         ]
 
 
+T0 = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+
+def _ledger_entry(at: datetime, key: str, phase: str = "launched") -> LedgerEntry:
+    return LedgerEntry(
+        timestamp=at.isoformat(),
+        phase=phase,
+        lane="fast",
+        dispatch_id=key,
+        unit_name=f"bob-pm-fast-slot-{key}",
+        item_refs=[key],
+    )
+
+
+def _ledger_lines(ledger_path: Path) -> list[str]:
+    """Every line of every segment, oldest segment first, active segment last."""
+    lines = []
+    for segment in sorted(ledger_path.parent.glob("dispatch.*.jsonl.gz")):
+        with gzip.open(segment, "rt") as f:
+            lines += f.read().splitlines()
+    return lines + ledger_path.read_text().splitlines()
+
+
+class TestDispatchLedgerSegments:
+    def test_rotation_preserves_every_record(self, ledger_path: Path):
+        ledger = DispatchLedger(ledger_path, segment_seconds=3600)
+        written: list[LedgerEntry] = []
+        expected: list[str] = []
+        for i in range(50):
+            entry = _ledger_entry(T0 + timedelta(minutes=7 * i), f"o/r#{i % 6}")
+            ledger.append(entry)
+            written.append(entry)
+            expected.append(json.dumps(entry.to_dict()))
+            if i % 10 == 5:
+                # The bash dispatcher appends straight to the active segment
+                full = append_full_ledger_entry(
+                    ledger_path,
+                    phase="launched",
+                    dispatch_id=f"bash-{i}",
+                    timestamp=(T0 + timedelta(minutes=7 * i, seconds=30)).isoformat(),
+                )
+                expected.append(json.dumps(full, ensure_ascii=False))
+            if i == 20:
+                with ledger_path.open("a") as f:
+                    f.write("not json\n")
+                expected.append("not json")
+
+        # 50 entries 7 minutes apart span 6 hours: 5 rotated segments + active
+        assert [p.name for p in sorted(ledger_path.parent.glob("dispatch.*"))] == [
+            "dispatch.20261001T0000Z.jsonl.gz",
+            "dispatch.20261001T0100Z.jsonl.gz",
+            "dispatch.20261001T0200Z.jsonl.gz",
+            "dispatch.20261001T0300Z.jsonl.gz",
+            "dispatch.20261001T0400Z.jsonl.gz",
+            "dispatch.jsonl",
+            "dispatch.jsonl.idx",
+            "dispatch.jsonl.lock",
+        ]
+        assert _ledger_lines(ledger_path) == expected
+        assert ledger.read() == written
+
+    def test_interrupted_rotation_is_finished_by_next_append(self, ledger_path: Path):
+        ledger = DispatchLedger(ledger_path, segment_seconds=3600)
+        for i in range(3):
+            ledger.append(_ledger_entry(T0 + timedelta(minutes=i), "o/r#1"))
+        # Crash right after the active segment was renamed for rotation
+        ledger_path.rename(ledger_path.with_name("dispatch.jsonl.rotating"))
+        assert len(ledger.read()) == 3
+
+        ledger.append(_ledger_entry(T0 + timedelta(minutes=5), "o/r#2"))
+        assert not ledger_path.with_name("dispatch.jsonl.rotating").exists()
+        assert [e.timestamp for e in ledger.read()] == [
+            (T0 + timedelta(minutes=m)).isoformat() for m in (0, 1, 2, 5)
+        ]
+
+    def test_rotation_resumed_after_crash_writes_each_line_once(
+        self, ledger_path: Path
+    ):
+        import sqlite3
+
+        from gptme_runloops import pm_dispatch
+
+        ledger = DispatchLedger(ledger_path, segment_seconds=3600)
+        ledger.append(_ledger_entry(T0, "o/r#0"))
+        for hour in (1, 2):
+            # Bash appends skip rotation, so one rotation spans three segments
+            append_full_ledger_entry(
+                ledger_path,
+                phase="launched",
+                dispatch_id=f"bash-{hour}",
+                timestamp=(T0 + timedelta(hours=hour)).isoformat(),
+            )
+        expected = _ledger_lines(ledger_path)
+
+        real_write = pm_dispatch.atomic_write_bytes
+        writes: list[str] = []
+
+        def crash_after_second_segment(path: Path, data: bytes) -> None:
+            real_write(path, data)
+            writes.append(path.name)
+            if len(writes) == 3:  # the plan, then two segments
+                raise OSError("killed")
+
+        with patch.object(
+            pm_dispatch, "atomic_write_bytes", crash_after_second_segment
+        ):
+            with pytest.raises(OSError, match="killed"):
+                ledger.append(_ledger_entry(T0 + timedelta(hours=3), "o/r#3"))
+        assert writes[0] == "dispatch.jsonl.rotating.plan"
+        assert ledger_path.with_name("dispatch.jsonl.rotating").exists()
+
+        last = _ledger_entry(T0 + timedelta(hours=3), "o/r#3")
+        ledger.append(last)
+        assert _ledger_lines(ledger_path) == [*expected, json.dumps(last.to_dict())]
+        assert ledger.read() == [_ledger_entry(T0, "o/r#0"), last]
+        assert ledger.last_dispatch("bash-2") == T0 + timedelta(hours=2)
+        assert sorted(ledger_path.parent.glob("dispatch.jsonl.rotating*")) == []
+        conn = sqlite3.connect(ledger.index_path)
+        try:
+            counts = conn.execute("SELECT name, entries FROM segments ORDER BY name")
+            assert counts.fetchall() == [
+                ("dispatch.20261001T0000Z.jsonl.gz", 1),
+                ("dispatch.20261001T0100Z.jsonl.gz", 1),
+                ("dispatch.20261001T0200Z.jsonl.gz", 1),
+            ]
+        finally:
+            conn.close()
+
+    def test_torn_segment_is_read_up_to_the_damage(self, ledger_path: Path):
+        ledger = DispatchLedger(ledger_path, segment_seconds=3600)
+        written = [
+            _ledger_entry(T0 + timedelta(minutes=20 * i), f"o/r#{i}") for i in range(7)
+        ]
+        for entry in written:
+            ledger.append(entry)
+        first, second = sorted(ledger_path.parent.glob("dispatch.*.jsonl.gz"))[:2]
+        # A crash mid-write leaves a gzip stream without its trailer...
+        first.write_bytes(first.read_bytes()[:-8])
+        # ...and a partially written member after a complete one
+        second.write_bytes(second.read_bytes() + gzip.compress(b'{"timestamp"')[:15])
+
+        assert ledger.read() == written
+        assert ledger.read(since=T0 + timedelta(hours=1)) == written[3:]
+
+        first.write_bytes(b"garbage")
+        assert ledger.read() == written[3:]
+        assert ledger.read(until=T0 + timedelta(minutes=50)) == []
+
+    def test_last_dispatch_is_an_index_lookup(self, ledger_path: Path):
+        ledger = DispatchLedger(ledger_path)
+        ledger.append(_ledger_entry(T0, "o/r#1"))
+        ledger.append(_ledger_entry(T0 + timedelta(hours=1), "o/r#1", "skipped_cap"))
+        ledger.append(_ledger_entry(T0 + timedelta(days=2), "o/r#2"))
+        append_full_ledger_entry(
+            ledger_path,
+            phase="launched",
+            dispatch_id="bash-1",
+            timestamp=(T0 + timedelta(days=3)).isoformat().replace("+00:00", "Z"),
+        )
+
+        with patch.object(DispatchLedger, "read", side_effect=AssertionError("read")):
+            assert ledger.last_dispatch("o/r#1") == T0
+            assert ledger.last_dispatch("o/r#1", phase=None) == T0 + timedelta(hours=1)
+            assert ledger.last_dispatch("o/r#2") == T0 + timedelta(days=2)
+            assert ledger.last_dispatch("bash-1") == T0 + timedelta(days=3)
+            assert ledger.last_dispatch("o/r#9") is None
+        assert (
+            DispatchLedger(ledger_path.with_name("none.jsonl")).last_dispatch("x")
+            is None
+        )
+
+    def test_in_cooldown(self, ledger: DispatchLedger):
+        ledger.append(
+            LedgerEntry.now(
+                phase="launched", lane="fast", dispatch_id="k", unit_name="u"
+            )
+        )
+        assert ledger.in_cooldown("k", 600) is True
+        assert ledger.in_cooldown("k", 0) is False
+        assert ledger.in_cooldown("other", 600) is False
+        assert ledger.in_cooldown("k", 600, phase="skipped_cap") is False
+
+    def test_range_read_opens_only_overlapping_segments(self, ledger_path: Path):
+        ledger = DispatchLedger(ledger_path, segment_seconds=3600)
+        written = [
+            _ledger_entry(T0 + timedelta(minutes=10 * i), f"o/r#{i}") for i in range(36)
+        ]
+        for entry in written:
+            ledger.append(entry)
+
+        since, until = T0 + timedelta(hours=2), T0 + timedelta(hours=2, minutes=30)
+        with patch.object(
+            DispatchLedger, "_read_segment", wraps=DispatchLedger._read_segment
+        ) as read_segment:
+            entries = ledger.read(since=since, until=until)
+        assert [c.args[0].name for c in read_segment.call_args_list] == [
+            "dispatch.20261001T0200Z.jsonl.gz"
+        ]
+        assert entries == written[12:16]
+        # The active segment (hour 5) is always consulted
+        assert ledger.read(since=T0 + timedelta(hours=5, minutes=40)) == written[34:]
+
+    def test_index_is_rebuilt_from_segments(self, ledger_path: Path):
+        ledger = DispatchLedger(ledger_path, segment_seconds=3600)
+        for i in range(12):
+            ledger.append(_ledger_entry(T0 + timedelta(minutes=20 * i), f"o/r#{i % 3}"))
+        ledger.index_path.unlink()
+
+        assert ledger.last_dispatch("o/r#0") == T0 + timedelta(minutes=180)
+        assert ledger.last_dispatch("o/r#2") == T0 + timedelta(minutes=220)
+        assert len(ledger.read(since=T0, until=T0 + timedelta(minutes=59))) == 3
+
+    def test_clear_removes_segments_and_index(self, ledger_path: Path):
+        ledger = DispatchLedger(ledger_path, segment_seconds=3600)
+        for i in range(3):
+            ledger.append(_ledger_entry(T0 + timedelta(hours=i), "o/r#1"))
+        ledger.clear()
+        assert ledger.read() == []
+        assert ledger.last_dispatch("o/r#1") is None
+        assert not list(ledger_path.parent.glob("dispatch.*.gz"))
+
+    @pytest.mark.slow
+    def test_benchmark_1m_entry_ledger(self, ledger_path: Path):
+        """Cooldown lookups and range reads on a 1M-entry, 30-day ledger.
+
+        Run with ``pytest -m slow -s`` to see the timings.
+        """
+        n, keys = 1_000_000, 5000
+        step = 30 * 86400 / n
+        with ledger_path.open("w") as f:
+            for i in range(n):
+                at = T0 + timedelta(seconds=i * step)
+                f.write(
+                    json.dumps(_ledger_entry(at, f"o/r#{i % keys}").to_dict()) + "\n"
+                )
+        ledger = DispatchLedger(ledger_path)
+
+        start = time.perf_counter()
+        ledger.append(_ledger_entry(T0 + timedelta(days=31), "o/r#0"))
+        build_s = time.perf_counter() - start
+        assert len(list(ledger_path.parent.glob("dispatch.*.gz"))) == 30
+
+        start = time.perf_counter()
+        for k in range(1, 1001):
+            last = ledger.last_dispatch(f"o/r#{k}")
+        lookup_s = (time.perf_counter() - start) / 1000
+        assert last == T0 + timedelta(seconds=(n - keys + 1000) * step)
+
+        start = time.perf_counter()
+        recent = ledger.read(since=T0 + timedelta(days=29))
+        range_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        everything = ledger.read()
+        full_s = time.perf_counter() - start
+
+        print(
+            f"\n1M-entry ledger: index+rotate {build_s:.1f}s, "
+            f"last_dispatch {lookup_s * 1000:.2f}ms, last-day read {range_s:.2f}s, "
+            f"full read {full_s:.1f}s"
+        )
+        assert len(everything) == n + 1
+        assert len(recent) == n // 30 + 1
+        assert lookup_s < full_s / 1000
+        assert range_s < full_s / 5
+
+
 # --- Bash-compatible full ledger entry ---
 
 
@@ -614,6 +886,142 @@ class TestSlotManager:
         assert SlotManager(slot_cap=1) != SlotManager(slot_cap=99)
 
 
+FAKE_SYSTEMCTL = r"""
+# Fake systemctl: answers from a fixture of units (see conftest.FakeCommand)
+import fnmatch
+
+units = fixture
+assert args[0] == "--user"
+
+if args[1] == "list-units":
+    patterns = [a for a in args[2:] if not a.startswith("-")]
+    for unit, state in units.items():
+        if any(fnmatch.fnmatchcase(unit, p) for p in patterns):
+            print(f"{unit} loaded {state} running Project monitoring slot")
+elif args[1] == "show":
+    unit = args[2] if "." in args[2] else args[2] + ".service"
+    print(units.get(unit, "inactive"))
+"""
+
+
+@pytest.fixture
+def fake_systemctl(fake_command):
+    fake = fake_command("systemctl", FAKE_SYSTEMCTL)
+    states = ["active", "activating", "inactive", "failed", "deactivating"]
+    units = {
+        f"bob-pm-{lane}-slot-o-r-{n}.service": states[
+            (n + (lane == "slow")) % len(states)
+        ]
+        for lane in ("fast", "slow")
+        for n in range(10)
+    }
+    units["bob-pm-slot-legacy-1.service"] = "active"
+    units["bob-pm-monitor.service"] = "active"
+    fake.set_fixture(units)
+    return fake
+
+
+def _per_unit_counts() -> tuple[int, int, int]:
+    """Running counts the pre-snapshot way: list units, then one show per unit."""
+
+    def count(pattern: str) -> int:
+        listing = subprocess.run(
+            ["systemctl", "--user", "list-units", pattern, "--all", "--no-legend"],
+            capture_output=True,
+            text=True,
+        ).stdout
+        busy = 0
+        for line in listing.splitlines():
+            state = subprocess.run(
+                [
+                    "systemctl",
+                    "--user",
+                    "show",
+                    line.split()[0],
+                    "--property=ActiveState",
+                    "--value",
+                ],
+                capture_output=True,
+                text=True,
+            ).stdout.strip()
+            busy += state in {"active", "activating", "reloading", "deactivating"}
+        return busy
+
+    return (
+        count("bob-pm-*-slot-*"),
+        count("bob-pm-fast-slot-*"),
+        count("bob-pm-slow-slot-*"),
+    )
+
+
+class TestSystemdUnitSnapshot:
+    def test_counts_match_per_unit_probes(self, fake_systemctl):
+        expected = _per_unit_counts()
+        assert len(fake_systemctl.calls()) > 20
+        fake_systemctl.reset()
+
+        snapshot = SystemdUnitSnapshot()
+        counts = (
+            snapshot.count_running(),
+            snapshot.count_running_lane("fast"),
+            snapshot.count_running_lane("slow"),
+        )
+        assert counts == expected == (12, 6, 6)
+        assert snapshot.is_busy("bob-pm-fast-slot-o-r-0")
+        assert snapshot.is_busy("bob-pm-slot-legacy-1")
+        assert not snapshot.is_busy("bob-pm-fast-slot-o-r-2.service")
+        assert not snapshot.is_busy("bob-pm-fast-slot-unknown")
+        assert len(fake_systemctl.calls()) == 1
+
+    def test_lane_dispatcher_one_systemctl_call_per_tick(self, fake_systemctl):
+        launched_keys: list[str] = []
+
+        def cb(**kwargs):
+            launched_keys.append(kwargs["slot_key"])
+            return True
+
+        ld = LaneDispatcher(slot_manager=SlotManager(slot_cap=20), dispatch_callback=cb)
+        # o/r#0 and o/r#1 have busy fast units, o/r#2 an inactive one
+        items = [
+            make_item(repo="o/r", number=n, types=["assigned_issue"]) for n in range(4)
+        ]
+        items.append(items[3])
+        assert ld.dispatch(items) == (2, 3)
+        assert launched_keys == ["o/r#2", "o/r#3"]
+        assert len(fake_systemctl.calls()) == 1
+
+        fake_systemctl.reset()
+        ld.dispatch(items)
+        assert len(fake_systemctl.calls()) == 1
+
+    def test_snapshot_is_cached_until_ttl_or_invalidate(self):
+        calls: list[list[str]] = []
+
+        def runner(args: list[str]) -> str:
+            calls.append(args)
+            return (
+                "bob-pm-fast-slot-a.service loaded active running A\n"
+                "● bob-pm-slow-slot-b.service loaded failed failed B\n"
+                "* bob-pm-slow-slot-c.service loaded reloading running C\n"
+            )
+
+        snapshot = SystemdUnitSnapshot(runner=runner, ttl=60)
+        assert snapshot.states() == {
+            "bob-pm-fast-slot-a.service": "active",
+            "bob-pm-slow-slot-b.service": "failed",
+            "bob-pm-slow-slot-c.service": "reloading",
+        }
+        assert (snapshot.count_running(), snapshot.count_running_lane("slow")) == (2, 1)
+        assert len(calls) == 1
+        assert calls[0][:2] == ["list-units", "bob-pm-*"]
+
+        snapshot.invalidate()
+        snapshot.is_busy("bob-pm-fast-slot-a")
+        assert len(calls) == 2
+        SystemdUnitSnapshot(runner=runner, ttl=0).count_running()
+        assert len(calls) == 3
+
+
 # ---------------------------------------------------------------------------
 # dispatch_grouped_items orchestration
 # ---------------------------------------------------------------------------
@@ -340,24 +340,26 @@ def test_should_post_comment_concurrent_first_time(workspace):
 
     def call_should_post():
         run = ProjectMonitoringRun(workspace)
-        with patch("gptme_runloops.project_monitoring.subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout='{"updatedAt": "2025-11-25T10:00:00Z", "lastCommentAuthor": ""}',
-                stderr="",
-            )
-            # Sync both threads at the gate so they enter should_post_comment
-            # at the same time, maximising the chance of hitting the race.
-            barrier.wait()
-            result = run.should_post_comment("gptme/gptme", 456, "update")
-            results.append(result)
-
-    t1 = threading.Thread(target=call_should_post)
-    t2 = threading.Thread(target=call_should_post)
-    t1.start()
-    t2.start()
-    t1.join()
-    t2.join()
+        # Sync both threads at the gate so they enter should_post_comment
+        # at the same time, maximising the chance of hitting the race.
+        barrier.wait()
+        result = run.should_post_comment("gptme/gptme", 456, "update")
+        results.append(result)
+
+    # Patch in the main thread: patching from both threads can leak the mock
+    # (see test_check_assigned_issues_concurrent_claim_is_emitted_once).
+    with patch("gptme_runloops.project_monitoring.subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(
+            returncode=0,
+            stdout='{"updatedAt": "2025-11-25T10:00:00Z", "lastCommentAuthor": ""}',
+            stderr="",
+        )
+        t1 = threading.Thread(target=call_should_post)
+        t2 = threading.Thread(target=call_should_post)
+        t1.start()
+        t2.start()
+        t1.join()
+        t2.join()
 
     # Exactly one session should have won the race and posted.
     assert (
@@ -833,3 +835,220 @@ def test_check_notifications_previously_processed_skipped(workspace):
 
     assert items == []
     assert "4" in state_file.read_text().split("\n")
+
+
+# --- Batched repository discovery -------------------------------------------
+
+FAKE_GH = r"""
+# Fake gh: answers from a fixture of repos (see conftest.FakeCommand)
+import os, re
+
+repos = fixture
+
+
+def opt(name):
+    return args[args.index(name) + 1] if name in args else ""
+
+
+def pr_json(pr):
+    checks = [{"__typename": "CheckRun", "conclusion": c} for c in pr["checks"]]
+    return {**{k: v for k, v in pr.items() if k not in ("author", "checks")},
+            "statusCheckRollup": checks}
+
+
+if args[:2] == ["api", "notifications"]:
+    print("[]")
+elif args[:2] == ["api", "graphql"]:
+    if os.environ.get("FAKE_GH_GRAPHQL_FAIL"):
+        print("HTTP 502", file=sys.stderr)
+        sys.exit(1)
+    query = args[3].removeprefix("query=")
+    data, errors = {}, []
+    for alias, q in re.findall(r'(p\d+): search\(type: ISSUE, first: 100, query: ("(?:[^"\\]|\\.)*")\)', query):
+        quals = dict(part.split(":", 1) for part in json.loads(q).split() if ":" in part)
+        repo = repos.get(quals["repo"])
+        if repo is None:
+            data[alias] = None
+            errors.append({"path": [alias]})
+            continue
+        prs = [pr for pr in repo["prs"] if pr["author"] == quals.get("author", pr["author"])]
+        nodes = []
+        for pr in prs:
+            node = {k: v for k, v in pr.items() if k not in ("author", "checks")}
+            contexts = [{"__typename": "CheckRun", "conclusion": c} for c in pr["checks"]]
+            node["commits"] = {"nodes": [{"commit": {"statusCheckRollup":
+                {"contexts": {"nodes": contexts}} if contexts else None}}]}
+            nodes.append(node)
+        data[alias] = {"nodes": nodes}
+    for alias, owner, name, rest in re.findall(
+        r'(i\d+): repository\(owner: ("[^"]*"), name: ("[^"]*")\) \{\s*issues\(([^)]*)\)', query
+    ):
+        repo = repos.get(f"{json.loads(owner)}/{json.loads(name)}")
+        if repo is None:
+            data[alias] = None
+            errors.append({"type": "NOT_FOUND", "path": [alias]})
+            continue
+        m = re.search(r'assignee: ("[^"]*")', rest)
+        assignee = json.loads(m.group(1)) if m else None
+        nodes = [{k: i[k] for k in ("number", "title", "url")} for i in repo["issues"]
+                 if assignee is None or assignee in i["assignees"]]
+        data[alias] = {"issues": {"nodes": nodes}}
+    print(json.dumps({"data": data, "errors": errors} if errors else {"data": data}))
+    sys.exit(1 if errors else 0)
+elif args[:2] in (["pr", "list"], ["issue", "list"]):
+    repo = repos.get(opt("--repo"))
+    if repo is None:
+        sys.exit(1)
+    fields = opt("--json").split(",")
+    if args[0] == "pr":
+        items = [pr_json(pr) for pr in repo["prs"] if pr["author"] == opt("--author")]
+    else:
+        items = [i for i in repo["issues"] if opt("--assignee") in i["assignees"]]
+    print(json.dumps([{f: item.get(f) for f in fields} for item in items]))
+elif args[:2] == ["pr", "view"]:
+    pr = next(p for p in repos[opt("--repo")]["prs"] if p["number"] == int(args[2]))
+    if opt("--json") == "updatedAt,comments":
+        print(json.dumps({"updatedAt": pr["updatedAt"], "lastCommentAuthor": ""}))
+else:
+    sys.exit(2)
+"""
+
+
+@pytest.fixture
+def fake_gh(fake_command):
+    return fake_command("gh", FAKE_GH)
+
+
+def _repos(n: int) -> dict:
+    repos = {}
+    for k in range(n):
+        name = f"org/repo-{k:02d}"
+        prs = []
+        for j in range(k % 4):
+            number = 100 + j
+            prs.append(
+                {
+                    "number": number,
+                    "title": f"PR {j} in {name}",
+                    "url": f"https://github.com/{name}/pull/{number}",
+                    "updatedAt": f"2026-10-{1 + (k + j) % 17:02d}T10:00:00Z",
+                    "headRefName": f"feature-{j}",
+                    "isDraft": j == 2,
+                    "author": "bob",
+                    "checks": ["SUCCESS", "FAILURE"]
+                    if (k + j) % 3 == 0
+                    else ["SUCCESS"],
+                }
+            )
+        prs.append({**prs[0], "number": 99, "author": "alice"} if prs else None)
+        issues = [
+            {
+                "number": 200 + j,
+                "title": f"Issue {j} in {name}",
+                "url": f"https://github.com/{name}/issues/{200 + j}",
+                "assignees": ["bob"] if j != 1 else ["alice"],
+            }
+            for j in range(k % 3)
+        ]
+        repos[name] = {"prs": [pr for pr in prs if pr], "issues": issues}
+    return repos
+
+
+def _monitor(workspace, repos) -> ProjectMonitoringRun:
+    return ProjectMonitoringRun(workspace, target_repos=list(repos), author="bob")
+
+
+def _per_repo_work(run: ProjectMonitoringRun) -> list[WorkItem]:
+    """Work discovered the pre-batching way: three gh calls per repo."""
+    work = []
+    for repo in run.discover_repositories():
+        work += run.check_pr_updates(repo)
+        work += run.check_ci_failures(repo)
+        work += run.check_assigned_issues(repo)
+    return work
+
+
+def _kinds(calls: list[list[str]]) -> list[str]:
+    return [" ".join(c[:2]) for c in calls]
+
+
+def test_discover_work_batched_matches_per_repo(fake_gh, tmp_path):
+    """Batched GraphQL discovery finds exactly the work the per-repo calls do."""
+    repos = _repos(14)
+    fake_gh.set_fixture(repos)
+    targets = [*repos, "org/missing"]
+
+    reference = _per_repo_work(_monitor(tmp_path / "a", targets))
+    per_repo_calls = _kinds(fake_gh.calls())
+    fake_gh.reset()
+
+    work = _monitor(tmp_path / "b", targets).discover_work()
+    assert work == reference
+    assert {item.item_type for item in work} == {
+        "pr_update",
+        "ci_failure",
+        "assigned_issue",
+    }
+
+    calls = _kinds(fake_gh.calls())
+    # 15 repos in 2 batched queries; only the missing repo falls back to list calls
+    assert calls.count("api graphql") == 2
+    assert calls.count("pr list") + calls.count("issue list") == 3
+    assert per_repo_calls.count("pr list") + per_repo_calls.count("issue list") == 45
+    assert len(calls) < len(per_repo_calls) - 35
+
+
+def test_discover_work_skips_unchanged_repos(fake_gh, workspace):
+    """A second tick only re-fetches; a changed repo is the only one checked."""
+    repos = _repos(12)
+    fake_gh.set_fixture(repos)
+    run = _monitor(workspace, repos)
+    assert run.discover_work()
+
+    fake_gh.reset()
+    ci_state = run.state_dir / "org-repo-03-ci-failures.state"
+    before = ci_state.stat().st_mtime_ns
+    with patch.object(run, "check_pr_updates", wraps=run.check_pr_updates) as check:
+        assert run.discover_work() == []
+    assert check.call_count == 0
+    assert _kinds(fake_gh.calls()) == [
+        "api notifications",
+        "api graphql",
+        "api graphql",
+    ]
+    assert ci_state.stat().st_mtime_ns == before
+
+    repos["org/repo-05"]["prs"][0]["updatedAt"] = "2026-10-30T10:00:00Z"
+    fake_gh.set_fixture(repos)
+    with patch.object(run, "check_pr_updates", wraps=run.check_pr_updates) as check:
+        work = run.discover_work()
+    assert [c.args[0] for c in check.call_args_list] == ["org/repo-05"]
+    assert [(w.repo, w.item_type, w.number) for w in work] == [
+        ("org/repo-05", "pr_update", 100)
+    ]
+
+
+def test_discover_work_rechecks_held_back_prs(fake_gh, workspace):
+    """A PR update held back by spam prevention keeps its repo from being skipped."""
+    repos = _repos(4)
+    fake_gh.set_fixture(repos)
+    run = _monitor(workspace, repos)
+    with patch.object(run, "should_post_comment", return_value=False):
+        run.discover_work()
+    with patch.object(run, "check_pr_updates", wraps=run.check_pr_updates) as check:
+        run.discover_work()
+    # Repos with PRs by bob stay unsettled; repo-00 (no PRs) was skipped
+    assert sorted(c.args[0] for c in check.call_args_list) == [
+        "org/repo-01",
+        "org/repo-02",
+        "org/repo-03",
+    ]
+
+
+def test_discover_work_graphql_failure_falls_back(fake_gh, tmp_path, monkeypatch):
+    """If the batched query fails, every repo is checked with per-repo calls."""
+    repos = _repos(6)
+    fake_gh.set_fixture(repos)
+    reference = _per_repo_work(_monitor(tmp_path / "a", repos))
+    monkeypatch.setenv("FAKE_GH_GRAPHQL_FAIL", "1")
+    assert _monitor(tmp_path / "b", repos).discover_work() == reference
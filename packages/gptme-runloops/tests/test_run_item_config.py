@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+import pytest
 from click.testing import CliRunner
 from gptme_runloops.cli import main as cli_main
 from gptme_runloops.run_item_config import (
@@ -193,3 +194,20 @@ def test_cli_requires_backend(tmp_path, monkeypatch) -> None:
     )
     assert result.exit_code != 0
     assert "--backend is required" in result.output
+
+
+def test_assemble_hooks_session_store_follows_sqlite_migration(
+    tmp_path, monkeypatch
+) -> None:
+    pytest.importorskip("gptme_sessions")
+    from gptme_sessions.sqlite_store import SqliteSessionStore
+
+    monkeypatch.delenv("GPTME_SESSIONS_BACKEND", raising=False)
+    config, raw = load_run_item_config(tmp_path)
+    hooks = assemble_hooks(config, raw)
+    assert hooks.make_store is not None
+    (tmp_path / "session-records.jsonl").write_text("")
+    SqliteSessionStore(sessions_dir=tmp_path).import_jsonl(
+        tmp_path / "session-records.jsonl"
+    )
+    assert isinstance(hooks.make_store(tmp_path), SqliteSessionStore)
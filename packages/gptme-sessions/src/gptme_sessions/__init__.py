@@ -50,6 +50,7 @@ from .classification import (
     DEFAULT_CATEGORIES,
     classify_by_keywords,
     classify_by_llm,
+    classify_many,
     classify_session,
     judge_and_classify,
     normalize_category,
@@ -60,6 +61,7 @@ from .spans import (
     extract_spans_from_cc_jsonl,
     extract_spans_from_gptme_jsonl,
 )
+from .discovery_index import DiscoveryIndex
 from .harm_detect import (
     NoSearchReposError,
     batch_detect_harm_revert,
@@ -67,7 +69,10 @@ from .harm_detect import (
     detect_harm_revert,
     extract_commit_shas,
 )
-from .store import SessionStore
+from .search_index import SearchIndex
+from .signal_cache import SignalCache
+from .sqlite_store import SqliteSessionStore
+from .store import SessionStore, open_store
 from .thompson_sampling import Bandit, BanditArm, BanditState, load_bandit_means
 from .transcript import (
     NormalizedMessage,
@@ -82,11 +87,17 @@ __all__ = [
     "DEFAULT_CATEGORIES",
     "classify_by_keywords",
     "classify_by_llm",
+    "classify_many",
     "classify_session",
     "judge_and_classify",
     "normalize_category",
+    "DiscoveryIndex",
     "SessionRecord",
     "SessionStore",
+    "SearchIndex",
+    "SignalCache",
+    "SqliteSessionStore",
+    "open_store",
     "HARM_CATEGORY_LABELS",
     "HARM_CATEGORY_TAXONOMY",
     "MODEL_ALIASES",
@@ -18,7 +18,9 @@ from __future__ import annotations
 import json
 import logging
 import re
+from collections.abc import Iterable
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
@@ -739,6 +741,42 @@ def _kw_pattern(kw: str) -> str:
     return r"(?<!\w)" + escaped + trailing
 
 
+class _KeywordSet:
+    """A keyword list compiled once for repeated whole-word matching.
+
+    Each keyword keeps its :func:`_kw_pattern` regex plus the lowercased
+    literal, which must occur in the text for the regex to match.  The
+    literal is checked first with a plain substring test, so most keywords
+    are ruled out without running a regex at all.
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self, keywords: Iterable[str]):
+        self._entries = [(kw.lower(), re.compile(_kw_pattern(kw))) for kw in keywords]
+
+    def count(self, text_lower: str) -> float:
+        """Number of keywords occurring in already-lowercased text."""
+        if not text_lower:
+            return 0.0
+        return sum(
+            1.0
+            for needle, pattern in self._entries
+            if needle in text_lower and pattern.search(text_lower)
+        )
+
+    def any(self, text_lower: str) -> bool:
+        return any(
+            needle in text_lower and pattern.search(text_lower) for needle, pattern in self._entries
+        )
+
+
+@lru_cache(maxsize=1024)
+def _keyword_set(keywords: tuple[str, ...]) -> _KeywordSet:
+    """Compiled form of a keyword list, built once per distinct list."""
+    return _KeywordSet(keywords)
+
+
 def _score_text(text: str, keywords: list[str]) -> float:
     """Count keyword matches in text (case-insensitive, whole-word).
 
@@ -749,8 +787,7 @@ def _score_text(text: str, keywords: list[str]) -> float:
     """
     if not text or not keywords:
         return 0.0
-    text_lower = text.lower()
-    return sum(1.0 for kw in keywords if re.search(_kw_pattern(kw), text_lower))
+    return _keyword_set(tuple(keywords)).count(text.lower())
 
 
 def _extract_deliverables(text: str) -> list[str]:
@@ -786,6 +823,52 @@ def _extract_blockers(text: str) -> list[str]:
     return blockers[:5]
 
 
+# A category's compiled keyword sets, in section order: title, outcome,
+# execution, deliverables.
+_CompiledCategory = tuple[str, _KeywordSet, _KeywordSet, _KeywordSet, _KeywordSet]
+
+
+def _compile_categories(categories: list[Category]) -> list[_CompiledCategory]:
+    """Compiled keyword sets for every keyword-scored (non-NOOP) category.
+
+    Cheap after the first call for a given keyword list (see :func:`_keyword_set`),
+    so it is safe to call per document even with custom categories.
+    """
+    return [
+        (
+            cat.name,
+            _keyword_set(tuple(cat.title_keywords)),
+            _keyword_set(tuple(cat.outcome_keywords)),
+            _keyword_set(tuple(cat.execution_keywords)),
+            _keyword_set(tuple(cat.deliverable_keywords)),
+        )
+        for cat in categories
+        if not cat.name.startswith("noop")  # NOOPs are detected by absence, not keywords
+    ]
+
+
+def _keyword_scores(
+    sections: dict[str, str], compiled: list[_CompiledCategory]
+) -> dict[str, float]:
+    """Weighted keyword score per category (categories scoring zero are omitted)."""
+    title = sections["title"].lower()
+    outcome = sections["outcome"].lower()
+    execution = sections["execution"].lower()
+    deliverables = sections["deliverables"].lower()
+
+    scores: dict[str, float] = {}
+    for name, title_kws, outcome_kws, exec_kws, deliv_kws in compiled:
+        title_score = title_kws.count(title)
+        outcome_score = outcome_kws.count(outcome)
+        exec_score = exec_kws.count(execution)
+        deliv_score = deliv_kws.count(deliverables)
+
+        combined = title_score * 3.0 + outcome_score * 2.0 + deliv_score * 2.0 + exec_score * 1.5
+        if combined > 0:
+            scores[name] = combined
+    return scores
+
+
 def classify_by_keywords(
     journal_text: str,
     categories: list[Category] | None = None,
@@ -802,22 +885,39 @@ def classify_by_keywords(
     """
     if categories is None:
         categories = DEFAULT_CATEGORIES
+    return _classify_compiled(journal_text, categories, _compile_categories(categories))
 
-    sections = _extract_sections(journal_text)
 
-    # Score each category across sections with weights
-    scores: dict[str, float] = {}
-    for cat in categories:
-        if cat.name.startswith("noop"):
-            continue  # NOOPs are detected by absence, not keywords
-        title_score = _score_text(sections["title"], cat.title_keywords)
-        outcome_score = _score_text(sections["outcome"], cat.outcome_keywords)
-        exec_score = _score_text(sections["execution"], cat.execution_keywords)
-        deliv_score = _score_text(sections["deliverables"], cat.deliverable_keywords)
+def classify_many(
+    journal_texts: Iterable[str],
+    categories: list[Category] | None = None,
+) -> list[ClassificationResult]:
+    """Keyword-classify a corpus of journal entries.
 
-        combined = title_score * 3.0 + outcome_score * 2.0 + deliv_score * 2.0 + exec_score * 1.5
-        if combined > 0:
-            scores[cat.name] = combined
+    Equivalent to calling :func:`classify_by_keywords` on each text, but the
+    category keywords are resolved once for the whole batch and each
+    document's sections are extracted and lowercased once.
+
+    Args:
+        journal_texts: Session journal entry texts.
+        categories: Category definitions. Defaults to DEFAULT_CATEGORIES.
+
+    Returns:
+        One ClassificationResult per text, in input order.
+    """
+    if categories is None:
+        categories = DEFAULT_CATEGORIES
+    compiled = _compile_categories(categories)
+    return [_classify_compiled(text, categories, compiled) for text in journal_texts]
+
+
+def _classify_compiled(
+    journal_text: str,
+    categories: list[Category],
+    compiled: list[_CompiledCategory],
+) -> ClassificationResult:
+    sections = _extract_sections(journal_text)
+    scores = _keyword_scores(sections, compiled)
 
     # Check for explicit category label in text (YAML field or title prefix)
     cat_names = {c.name for c in categories}
@@ -903,7 +1003,7 @@ def classify_by_keywords(
         deliv_text = " ".join(deliverables).lower()
 
         def _any_kw(*kws: str) -> bool:
-            return any(re.search(_kw_pattern(kw), deliv_text) for kw in kws)
+            return _keyword_set(kws).any(deliv_text)
 
         if _any_kw("pr", "fix", "bug", "commit", "code"):
             best_cat = "code"
@@ -935,6 +1035,10 @@ def classify_by_keywords(
     )
 
 
+# Compile the default categories' keywords at import time
+_compile_categories(DEFAULT_CATEGORIES)
+
+
 # ──────────────────────────────────────────────────────────────────────
 # LLM classifier (reuses judge infrastructure)
 # ──────────────────────────────────────────────────────────────────────
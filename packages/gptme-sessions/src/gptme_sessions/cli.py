@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import functools
+import itertools
 import json
 import logging
 import math
 import re
 import sys
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import date, datetime, timedelta, timezone
 from fnmatch import fnmatch
 from pathlib import Path
@@ -26,6 +31,7 @@ from .discovery import (
     session_date_from_path,
     session_datetime_from_path,
 )
+from .discovery_index import DiscoveryIndex, default_index
 from .post_session import VALID_AB_GROUPS, VALID_CONTEXT_TIERS, post_session
 from .replay import (
     ToolResultsMode,
@@ -35,11 +41,13 @@ from .replay import (
 )
 from .record import SessionRecord, normalize_run_type
 from .signals import extract_from_path
+from .sqlite_store import SqliteSessionStore
 from .store import (
     SessionStore,
     compute_run_analytics,
     format_run_analytics,
     format_stats,
+    open_store,
 )
 
 logger = logging.getLogger(__name__)
@@ -166,6 +174,7 @@ def _discover_all(
     # Discovery scans whole-day session dirs; round sub-day windows up to a day.
     start = today - timedelta(days=math.ceil(since_days))
     discovered: list[dict] = []
+    index = _discovery_index()
 
     if harness_filter in (None, "gptme"):
         for p in discover_gptme_sessions(start, today):
@@ -183,14 +192,17 @@ def _discover_all(
                 }
             )
     if harness_filter in (None, "claude-code"):
-        for p in discover_cc_sessions(start, today):
-            model = extract_cc_model(p)
+        for p in discover_cc_sessions(start, today, index=index):
+            if index is not None:
+                model = index.cached(p, "model", extract_cc_model)
+            else:
+                model = extract_cc_model(p)
             discovered.append(
                 {
                     "harness": "claude-code",
                     "path": p,
                     "model": model,
-                    "session_date": session_date_from_path("claude-code", p),
+                    "session_date": _session_date("claude-code", p, index),
                     "session_name": extract_session_name("claude-code", p),
                     "project": extract_project("claude-code", p),
                 }
@@ -203,26 +215,46 @@ def _discover_all(
                     "path": p,
                     "session_date": session_date_from_path("codex", p),
                     "session_name": extract_session_name("codex", p),
-                    "project": extract_project("codex", p),
+                    "project": (
+                        index.cached(p, "project", lambda p: extract_project("codex", p))
+                        if index is not None
+                        else extract_project("codex", p)
+                    ),
                 }
             )
     if harness_filter in (None, "copilot-cli"):
-        for p in discover_copilot_sessions(start, today):
+        for p in discover_copilot_sessions(start, today, index=index):
             discovered.append(
                 {
                     "harness": "copilot-cli",
                     "path": p,
-                    "session_date": session_date_from_path("copilot", p),
+                    "session_date": _session_date("copilot", p, index),
                     "session_name": extract_session_name("copilot", p),
                     "project": extract_project("copilot", p),
                 }
             )
 
+    if index is not None:
+        index.save()
+
     # Sort chronologically across harnesses; entries without a date sort last.
     discovered.sort(key=lambda e: e.get("session_date") or date.max)
     return discovered
 
 
+def _discovery_index() -> DiscoveryIndex | None:
+    """Persistent discovery index, unless ``--no-cache`` was given."""
+    return default_index() if _use_cache() else None
+
+
+def _session_date(harness: str, path: Path, index: DiscoveryIndex | None) -> date | None:
+    """Like :func:`session_date_from_path`, but served from *index* when given."""
+    if index is None:
+        return session_date_from_path(harness, path)
+    start_dt = index.start(path)
+    return start_dt.date() if start_dt else None
+
+
 def _count_unsynced(
     store: SessionStore,
     records: list[SessionRecord] | None = None,
@@ -292,6 +324,13 @@ _SINCE_UNIT_DAYS: dict[str, float] = {
 _SINCE_RE = re.compile(r"(\d+(?:\.\d+)?)\s*([a-z]*)")
 
 
+def _use_cache() -> bool:
+    """Whether discovery/extraction may use the persistent caches (``--no-cache`` disables them)."""
+    ctx = click.get_current_context(silent=True)
+    obj = ctx.find_root().obj if ctx else None
+    return not (isinstance(obj, dict) and obj.get("no_cache"))
+
+
 def _parse_since(since: str | None) -> float | None:
     """Parse a --since value into a number of days (float; None = no filter).
 
@@ -520,6 +559,11 @@ def _record_richness(record: SessionRecord) -> int:
     return score
 
 
+# Rounding headroom for the sweep's early exit; pairs inside it are still
+# checked exactly with _overlap_ratio, so it only costs a few extra comparisons.
+_SWEEP_SLACK = timedelta(milliseconds=1)
+
+
 def _find_duplicate_groups(
     records: list[SessionRecord],
     *,
@@ -530,6 +574,12 @@ def _find_duplicate_groups(
     Returns groups of 2+ records, each sorted richest-first. Records without a
     parseable interval are never grouped. Overlap is transitive (union-find), so
     a chain of overlapping sessions collapses into a single group.
+
+    Candidate pairs come from a sweep over each harness's records sorted by
+    start time: for ``a`` starting first, ``overlap(a, b) <= (a.end - b.start)
+    / (a.end - a.start)``, so once ``b`` starts later than
+    ``a.end - min_overlap * len(a)`` no later record can match ``a``.  This is
+    O(n log n) unless many sessions are nested inside one long session.
     """
     by_harness: dict[str, list[tuple[SessionRecord, tuple[datetime, datetime]]]] = {}
     for record in records:
@@ -549,11 +599,23 @@ def _find_duplicate_groups(
                 x = parent[x]
             return x
 
-        for i in range(count):
-            for j in range(i + 1, count):
-                if _overlap_ratio(items[i][1], items[j][1]) >= min_overlap:
-                    parent[find(i)] = find(j)
-
+        if min_overlap <= 0:
+            # Every pair qualifies (the ratio is never negative)
+            parent = [0] * count
+        else:
+            by_start = sorted(range(count), key=lambda k: items[k][1][0])
+            for pos, i in enumerate(by_start):
+                start, end = items[i][1]
+                horizon = (1 - min_overlap) * (end - start) + _SWEEP_SLACK
+                for nxt in range(pos + 1, count):
+                    j = by_start[nxt]
+                    if items[j][1][0] - start > horizon:
+                        break
+                    if _overlap_ratio(items[i][1], items[j][1]) >= min_overlap:
+                        parent[find(i)] = find(j)
+
+        # Clusters come out in order of their first record and list members in
+        # input order, independent of how the unions were discovered.
         clusters: dict[int, list[SessionRecord]] = {}
         for idx in range(count):
             clusters.setdefault(find(idx), []).append(items[idx][0])
@@ -624,15 +686,21 @@ def _merge_into_keeper(
     default=None,
     help="Path to sessions directory (default: ~/.local/share/gptme-sessions/)",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Re-scan and re-extract trajectories instead of using ~/.cache/gptme-sessions/",
+)
 @click.pass_context
-def cli(ctx: click.Context, sessions_dir: Path | None) -> None:
+def cli(ctx: click.Context, sessions_dir: Path | None, no_cache: bool) -> None:
     """Session tracking and analytics for agents. Supports trajectories from gptme, Claude Code, Codex, and Copilot."""
     ctx.ensure_object(dict)
     ctx.obj["sessions_dir"] = sessions_dir
+    ctx.obj["no_cache"] = no_cache
     if ctx.invoked_subcommand is None:
         _unsync_window = 14  # days to scan for unsynced sessions
         _default_since = 30  # default stats window
-        store = SessionStore(sessions_dir=sessions_dir)
+        store = open_store(sessions_dir)
         records = store.load_all()
 
         # Default to last 30 days for top-level stats
@@ -709,7 +777,7 @@ def query(
     show_stats: bool,
 ) -> None:
     """Query session records."""
-    store = SessionStore(sessions_dir=ctx.obj["sessions_dir"])
+    store = open_store(ctx.obj["sessions_dir"])
     since_days = _parse_since(since)
 
     if show_stats:
@@ -774,7 +842,7 @@ def show(ctx: click.Context, session_id: str, as_json: bool) -> None:
     """
     if not session_id:
         raise click.UsageError("Session ID must not be empty.")
-    store = SessionStore(sessions_dir=ctx.obj["sessions_dir"])
+    store = open_store(ctx.obj["sessions_dir"])
     try:
         record = resolve_session_record_prefix(store.load_all(), session_id)
     except ValueError as exc:
@@ -845,7 +913,7 @@ def stats(
 
     Defaults to last 30 days. Use --since all for all-time stats.
     """
-    store = SessionStore(sessions_dir=ctx.obj["sessions_dir"])
+    store = open_store(ctx.obj["sessions_dir"])
     # Default to 30d when no --since specified
     since_days = _parse_since(since) if since else 30
     records = store.query(
@@ -900,7 +968,7 @@ def stats(
 @click.pass_context
 def runs(ctx: click.Context, since: str, as_json: bool) -> None:
     """Run analytics (duration, NOOP rate, trends)."""
-    store = SessionStore(sessions_dir=ctx.obj["sessions_dir"])
+    store = open_store(ctx.obj["sessions_dir"])
     since_days = _parse_since(since)
     records = store.query(since_days=since_days)
     analytics = compute_run_analytics(records)
@@ -954,7 +1022,7 @@ def append(
         "or 'annotate' to correct metadata on an existing record.",
         err=True,
     )
-    store = SessionStore(sessions_dir=ctx.obj["sessions_dir"])
+    store = open_store(ctx.obj["sessions_dir"])
     record = SessionRecord(
         harness=harness,
         model=model,
@@ -1070,7 +1138,7 @@ def annotate(
             "(e.g. --model, --outcome, --add-deliverable)."
         )
 
-    store = SessionStore(sessions_dir=ctx.obj["sessions_dir"])
+    store = open_store(ctx.obj["sessions_dir"])
     store.sessions_dir.mkdir(parents=True, exist_ok=True)
 
     # Hold the store's exclusive lock across the whole load → mutate → rewrite
@@ -1170,7 +1238,7 @@ def auto_tag(
     as_json: bool,
 ) -> None:
     """Assign categories to session records from trajectory-derived signals."""
-    store = SessionStore(sessions_dir=ctx.obj["sessions_dir"])
+    store = open_store(ctx.obj["sessions_dir"])
     records = store.load_all()
     if not records:
         click.echo("No records in store.")
@@ -1210,7 +1278,7 @@ def auto_tag(
             continue
 
         try:
-            extract_result = extract_from_path(traj_path)
+            extract_result = extract_from_path(traj_path, use_cache=_use_cache())
         except Exception as exc:
             row["status"] = "skipped"
             row["reason"] = f"signal extraction failed: {exc}"
@@ -1311,7 +1379,7 @@ def dedup(
     Records are **never deleted** — trajectory/session data is preserved
     (re-running is idempotent: already-merged duplicates are skipped).
     """
-    store = SessionStore(sessions_dir=ctx.obj["sessions_dir"])
+    store = open_store(ctx.obj["sessions_dir"])
     records = store.load_all()
     if not records:
         click.echo("No records in store.")
@@ -1416,6 +1484,7 @@ def discover(
     start = today - timedelta(days=math.ceil(since_days))
 
     discovered: list[dict] = []
+    index = _discovery_index()
 
     if harness in (None, "gptme"):
         for p in discover_gptme_sessions(start, today):
@@ -1430,12 +1499,12 @@ def discover(
             )
 
     if harness in (None, "claude-code"):
-        for p in discover_cc_sessions(start, today):
+        for p in discover_cc_sessions(start, today, index=index):
             discovered.append(
                 {
                     "harness": "claude-code",
                     "path": str(p),
-                    "session_date": session_date_from_path("claude-code", p),
+                    "session_date": _session_date("claude-code", p, index),
                 }
             )
 
@@ -1450,12 +1519,12 @@ def discover(
             )
 
     if harness in (None, "copilot-cli"):
-        for p in discover_copilot_sessions(start, today):
+        for p in discover_copilot_sessions(start, today, index=index):
             discovered.append(
                 {
                     "harness": "copilot-cli",
                     "path": str(p),
-                    "session_date": session_date_from_path("copilot", p),
+                    "session_date": _session_date("copilot", p, index),
                 }
             )
 
@@ -1464,7 +1533,7 @@ def discover(
 
     # Mark each entry as synced or not by cross-referencing the store.
     # Normalize paths so symlinks/relative paths don't cause false mismatches.
-    store = SessionStore(sessions_dir=ctx.obj["sessions_dir"])
+    store = open_store(ctx.obj["sessions_dir"])
     records = store.load_all()
     existing_paths = {str(Path(r.journal_path).resolve()) for r in records if r.journal_path}
     for entry in discovered:
@@ -1480,7 +1549,7 @@ def discover(
     if signals:
         for entry in discovered:
             try:
-                result = extract_from_path(Path(entry["path"]))
+                result = extract_from_path(Path(entry["path"]), use_cache=_use_cache())
                 entry["grade"] = result["grade"]
                 entry["productive"] = result["productive"]
                 entry["tool_calls"] = sum(result["tool_calls"].values())
@@ -1599,7 +1668,7 @@ def signals(
         else:
             raise click.BadParameter(f"{path} not found", param_hint="'PATH'")
     try:
-        result = extract_from_path(path)
+        result = extract_from_path(path, use_cache=_use_cache())
     except PermissionError:
         raise click.ClickException(f"cannot read {path}: permission denied")
     except UnicodeDecodeError:
@@ -1844,6 +1913,57 @@ def replay(
 
 # -- sync --------------------------------------------------------------------
 
+# Completed extractions between progress lines on stderr.
+_SYNC_PROGRESS_EVERY = 50
+
+
+def _extract_job(path: Path, use_cache: bool) -> tuple[dict | None, str | None]:
+    """Worker-process entry point: extract signals, returning the error as text.
+
+    Exceptions are flattened to strings so unpicklable ones cannot break the pool.
+    """
+    try:
+        return extract_from_path(path, use_cache=use_cache), None
+    except Exception as exc:
+        return None, str(exc)
+
+
+def _extract_signals_ordered(
+    paths: list[Path], jobs: int, use_cache: bool
+) -> Iterator[tuple[dict | None, str | None]]:
+    """Yield ``(result, error)`` for each path, in input order.
+
+    With ``jobs > 1`` extraction runs in a process pool with at most
+    ``2 * jobs`` paths in flight, so memory stays bounded however many
+    trajectories are pending.  Progress is reported on stderr.
+    """
+    total = len(paths)
+
+    def progress(done: int) -> None:
+        if done % _SYNC_PROGRESS_EVERY == 0 or (done == total and total >= _SYNC_PROGRESS_EVERY):
+            click.echo(f"  extracted signals: {done}/{total}", err=True)
+
+    if jobs <= 1 or total <= 1:
+        for done, path in enumerate(paths, 1):
+            yield _extract_job(path, use_cache)
+            progress(done)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(jobs, total)) as pool:
+        pending: deque[Future[tuple[dict | None, str | None]]] = deque()
+        remaining = iter(paths)
+        done = 0
+        for path in itertools.islice(remaining, 2 * jobs):
+            pending.append(pool.submit(_extract_job, path, use_cache))
+        while pending:
+            outcome = pending.popleft().result()
+            next_path = next(remaining, None)
+            if next_path is not None:
+                pending.append(pool.submit(_extract_job, next_path, use_cache))
+            done += 1
+            yield outcome
+            progress(done)
+
 
 @cli.command()
 @click.option(
@@ -1865,6 +1985,14 @@ def replay(
     is_flag=True,
     help="Backfill correct timestamps for existing records from their trajectory paths",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Worker processes for --signals extraction",
+)
 @click.pass_context
 def sync(
     ctx: click.Context,
@@ -1873,6 +2001,7 @@ def sync(
     with_signals: bool,
     dry_run: bool,
     fix_timestamps: bool,
+    jobs: int,
 ) -> None:
     """Discover trajectory files and import them into the session store.
 
@@ -1887,8 +2016,11 @@ def sync(
     Re-running ``sync`` is safe: sessions already in the store (matched by
     trajectory path) are skipped.  With ``--signals``, existing records that
     have ``outcome=unknown`` (no signals yet) will be updated in-place.
+
+    ``--jobs N`` extracts signals in N worker processes.  Results are applied
+    in discovery order, so the store ends up identical to a sequential run.
     """
-    store = SessionStore(sessions_dir=ctx.obj["sessions_dir"])
+    store = open_store(ctx.obj["sessions_dir"])
 
     # Handle --fix-timestamps: correct timestamps on existing records using
     # session dates extracted from their trajectory paths.
@@ -1955,11 +2087,15 @@ def sync(
     existing_records = store.load_all()
     existing_by_path = {r.trajectory_path: r for r in existing_records if r.trajectory_path}
 
-    new_records: list[SessionRecord] = []
+    new_record_kwargs: list[dict] = []
     updated_paths: set[str] = set()
-    imported = 0
     updated = 0
     skipped = 0
+    # Trajectories needing signal extraction, in discovery order, with the
+    # existing record (plus whether its metadata already changed) or the new
+    # record's kwargs to apply the result to.  Extraction runs after this
+    # metadata pass so it can be spread over worker processes.
+    to_extract: list[tuple[Path, SessionRecord | dict, bool]] = []
 
     # Warn when a large number of new sessions would be imported.
     # This catches accidental wide-window syncs (e.g. --since 90d) that inflate stats.
@@ -2030,18 +2166,9 @@ def sync(
                 and (existing.outcome == "unknown" or usage_backfill_needed)
             ):
                 if not dry_run:
-                    try:
-                        result = extract_from_path(traj_path)
-                        needs_update |= _apply_extract_result_to_record(existing, result)
-                    except Exception as exc:
-                        click.echo(
-                            f"  warning: signals extraction failed for {path_str}: {exc}",
-                            err=True,
-                        )
-                        if not needs_update:  # don't double-count if model was already updated
-                            skipped += 1
-                else:
-                    needs_update = True  # mark for dry-run reporting
+                    to_extract.append((traj_path, existing, needs_update))
+                    continue
+                needs_update = True  # mark for dry-run reporting
             elif (
                 with_signals
                 and not traj_path.is_file()
@@ -2100,20 +2227,40 @@ def sync(
             record_kwargs["project"] = entry["project"]
 
         if with_signals and traj_path.is_file() and not dry_run:
-            try:
-                result = extract_from_path(traj_path)
-                _apply_extract_result_to_kwargs(record_kwargs, result)
-            except Exception as exc:
-                click.echo(
-                    f"  warning: signals extraction failed for {path_str}: {exc}",
-                    err=True,
-                )
+            to_extract.append((traj_path, record_kwargs, False))
 
         if dry_run:
             click.echo(f"  would import: {entry['harness']:14s}  {path_str}")
         else:
-            new_records.append(SessionRecord(**record_kwargs))
-            imported += 1
+            new_record_kwargs.append(record_kwargs)
+
+    results = _extract_signals_ordered(
+        [traj_path for traj_path, _, _ in to_extract], jobs=jobs, use_cache=_use_cache()
+    )
+    if with_signals and not dry_run and _use_cache():
+        from .signal_cache import default_cache
+
+        pruned = default_cache().prune()
+        if pruned:
+            logger.debug("Pruned %d stale signal cache entries", pruned)
+    for (traj_path, target, needs_update), (result, error) in zip(to_extract, results):
+        path_str = str(traj_path)
+        if error is not None:
+            click.echo(f"  warning: signals extraction failed for {path_str}: {error}", err=True)
+        if isinstance(target, dict):
+            if result is not None:
+                _apply_extract_result_to_kwargs(target, result)
+            continue
+        if result is not None:
+            needs_update |= _apply_extract_result_to_record(target, result)
+        elif not needs_update:  # don't double-count if model was already updated
+            skipped += 1
+        if needs_update:
+            updated_paths.add(path_str)
+            updated += 1
+
+    new_records = [SessionRecord(**kwargs) for kwargs in new_record_kwargs]
+    imported = len(new_records)
 
     if not dry_run:
         if updated_paths:
@@ -2122,9 +2269,8 @@ def sync(
             # appended to the store by a concurrent process after that load may be lost
             # here.  See store.rewrite() docstring for details on this known trade-off.
             store.rewrite(existing_records + new_records)
-        else:
-            for rec in new_records:
-                store.append(rec)
+        elif new_records:
+            store.append_many(new_records)
 
     if dry_run:
         n_would_update = len(updated_paths)
@@ -2147,7 +2293,7 @@ def sync(
 @click.pass_context
 def repair_grades(ctx: click.Context, dry_run: bool) -> None:
     """Backfill multivariate grade fields from legacy scalar fields."""
-    store = SessionStore(sessions_dir=ctx.obj["sessions_dir"])
+    store = open_store(ctx.obj["sessions_dir"])
     records = store.load_all()
     if not records:
         click.echo("No records in store.")
@@ -2184,6 +2330,39 @@ def repair_grades(ctx: click.Context, dry_run: bool) -> None:
     )
 
 
+# -- SQLite backend import/export ---------------------------------------------
+
+
+@cli.command("import-jsonl")
+@click.argument("jsonl_path", required=False, type=click.Path(exists=True, path_type=Path))  # type: ignore[type-var]
+@click.pass_context
+def import_jsonl(ctx: click.Context, jsonl_path: Path | None) -> None:
+    """Import a JSONL store into the indexed SQLite backend.
+
+    Defaults to the directory's session-records.jsonl.  Once the database
+    exists, all commands use it automatically; safe to re-run (upserts).
+    """
+    store = SqliteSessionStore(sessions_dir=ctx.obj["sessions_dir"])
+    if jsonl_path is None:
+        jsonl_path = SessionStore(sessions_dir=store.sessions_dir).path
+        if not jsonl_path.exists():
+            raise click.ClickException(f"No JSONL store at {jsonl_path}")
+    count = store.import_jsonl(jsonl_path)
+    click.echo(f"Imported {count} record(s) into {store.path}")
+
+
+@cli.command("export-jsonl")
+@click.argument("jsonl_path", type=click.Path(path_type=Path))  # type: ignore[type-var]
+@click.pass_context
+def export_jsonl(ctx: click.Context, jsonl_path: Path) -> None:
+    """Export the SQLite backend to a JSONL file."""
+    store = SqliteSessionStore(sessions_dir=ctx.obj["sessions_dir"])
+    if not store.path.exists():
+        raise click.ClickException(f"No SQLite store at {store.path}")
+    count = store.export_jsonl(jsonl_path)
+    click.echo(f"Exported {count} record(s) to {jsonl_path}")
+
+
 # -- post-session ------------------------------------------------------------
 
 
@@ -2269,7 +2448,7 @@ def post_session_cmd(
     as_json: bool,
 ) -> None:
     """Record a completed session: extract signals, determine outcome, append record."""
-    store = SessionStore(sessions_dir=ctx.obj["sessions_dir"])
+    store = open_store(ctx.obj["sessions_dir"])
     deliverables = list(deliverables_raw) if deliverables_raw else None
     ps = post_session(
         store=store,
@@ -2314,6 +2493,32 @@ def post_session_cmd(
 
 # -- judge -------------------------------------------------------------------
 
+# Scored sessions between writes to the store during `judge --update-store`.
+_JUDGE_CHECKPOINT_EVERY = 20
+
+
+def _write_judge_scores(store: SessionStore, rows: list[dict]) -> set[str]:
+    """Write judge scores from result rows into matching store records.
+
+    Records the judge version alongside the score, which ``judge --resume``
+    uses to skip sessions that are already done.  Returns the session IDs
+    that were updated.
+    """
+    from .judge import _build_judge_meta, _store_judge_meta
+
+    by_sid = {r["session_id"]: r for r in rows if r.get("llm_judge_score") is not None}
+
+    def apply(rec: SessionRecord) -> None:
+        row = by_sid[rec.session_id]
+        rec.set_alignment_grade(
+            row["llm_judge_score"],
+            reason=row.get("llm_judge_reason"),
+            model=row.get("llm_judge_model"),
+        )
+        _store_judge_meta(rec, _build_judge_meta(model=row.get("llm_judge_model") or ""))
+
+    return store.update_many(by_sid, apply)
+
 
 @cli.command()
 @click.option(
@@ -2337,6 +2542,32 @@ def post_session_cmd(
     is_flag=True,
     help="Write scores back to session-records.jsonl (matching by session_id)",
 )
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="With --update-store, skip sessions the store already has a current-judge score for",
+)
+@click.option(
+    "--concurrency",
+    "-c",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Judge calls in flight at once",
+)
+@click.option(
+    "--rate-limit",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Max judge calls per second to the model's backend (default: unlimited)",
+)
+@click.option(
+    "--retries",
+    type=click.IntRange(min=0),
+    default=2,
+    show_default=True,
+    help="Retries per session (jittered exponential backoff) on transient judge API errors",
+)
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
 @click.option("--dry-run", is_flag=True, help="Show sessions without scoring")
 @click.pass_context
@@ -2347,6 +2578,10 @@ def judge(
     goals: str | None,
     judge_model: str | None,
     update_store: bool,
+    resume: bool,
+    concurrency: int,
+    rate_limit: float | None,
+    retries: int,
     as_json: bool,
     dry_run: bool,
 ) -> None:
@@ -2356,12 +2591,23 @@ def judge(
     value. Scores range 0.0-1.0 with a 1-sentence reason.
 
     With --update-store, writes scores back to session-records.jsonl by matching
-    session IDs from journal filenames to stored records.
+    session IDs from journal filenames to stored records. Scores are written as
+    they arrive, so an interrupted backfill re-run with --resume picks up where
+    it stopped.
     """
-    from .judge import DEFAULT_GOALS, DEFAULT_JUDGE_MODEL, judge_session
+    from .judge import (
+        DEFAULT_GOALS,
+        DEFAULT_JUDGE_MODEL,
+        JUDGE_VERSION,
+        _judge_backend,
+        judge_session,
+    )
+    from .judge_batch import JudgeJob, judge_many
 
     if dry_run and update_store:
         raise click.UsageError("--dry-run and --update-store are mutually exclusive")
+    if resume and not update_store:
+        raise click.UsageError("--resume requires --update-store")
 
     effective_model = judge_model or DEFAULT_JUDGE_MODEL
 
@@ -2404,6 +2650,16 @@ def judge(
 
     effective_goals = goals or DEFAULT_GOALS
     results: list[dict] = []
+    jobs: list[JudgeJob] = []
+    rows_by_sid: dict[str, dict] = {}
+
+    already_scored: set[str] = set()
+    skipped = 0
+    if resume:
+        for rec in open_store(ctx.obj["sessions_dir"]).load_all():
+            judge_version = rec.llm_judge_meta.get("judge_version")
+            if rec.llm_judge_score is not None and judge_version == JUDGE_VERSION:
+                already_scored.add(rec.session_id)
 
     for entry in entries:
         try:
@@ -2418,36 +2674,32 @@ def judge(
             cat = meta.get("category", "unknown")
             outcome = meta.get("outcome", "unknown")
             entry_date = entry.parent.name
+        except Exception as e:
+            logger.warning("Error processing %s: %s", entry, e)
+            continue
 
-            result_row: dict = {
-                "session_id": sid,
-                "date": entry_date,
-                "category": cat,
-                "outcome": outcome,
-                "journal_path": str(entry),
-            }
-
-            if dry_run:
-                results.append(result_row)
-                if not as_json:
-                    click.echo(f"  {sid:<12} {entry_date}  {cat:<14} {outcome}")
-                continue
+        if sid in already_scored:
+            skipped += 1
+            continue
 
-            verdict = judge_session(
-                text, category=cat, goals=effective_goals, model=effective_model
-            )
-            score = verdict["score"] if verdict else None
-            reason = verdict["reason"] if verdict else None
+        result_row: dict = {
+            "session_id": sid,
+            "date": entry_date,
+            "category": cat,
+            "outcome": outcome,
+            "journal_path": str(entry),
+        }
 
-            result_row.update(_judge_fields(score, reason, verdict["model"] if verdict else None))
+        if dry_run:
             results.append(result_row)
-
-            if not as_json and score is not None:
-                click.echo(f"  {sid:<12} {entry_date}  {cat:<14} {score:.2f}  {reason}")
-        except Exception as e:
-            logger.warning("Error processing %s: %s", entry, e)
+            if not as_json:
+                click.echo(f"  {sid:<12} {entry_date}  {cat:<14} {outcome}")
             continue
 
+        results.append(result_row)
+        rows_by_sid[sid] = result_row
+        jobs.append(JudgeJob(session_id=sid, text=text, category=cat))
+
     if dry_run:
         if as_json:
             click.echo(json.dumps(results, indent=2))
@@ -2455,25 +2707,51 @@ def judge(
             click.echo(f"\n{len(results)} session(s) (dry run)")
         return
 
-    # Write scores back to store if requested
-    if update_store:
-        store = SessionStore(sessions_dir=ctx.obj["sessions_dir"])
-        records = store.load_all()
-        score_map = {r["session_id"]: r for r in results if r.get("llm_judge_score") is not None}
-        updated = 0
-        for rec in records:
-            if rec.session_id in score_map:
-                s = score_map[rec.session_id]
-                rec.set_alignment_grade(
-                    s["llm_judge_score"],
-                    reason=s.get("llm_judge_reason"),
-                    model=s.get("llm_judge_model"),
-                )
-                updated += 1
-        if updated:
-            store.rewrite(records)
-            click.echo(f"\nUpdated {updated} record(s) in {store.path}", err=True)
-        elif not score_map:
+    if skipped:
+        click.echo(f"Resuming: skipped {skipped} already-scored session(s)", err=True)
+
+    store = open_store(ctx.obj["sessions_dir"]) if update_store else None
+    unsaved: list[dict] = []
+    updated_ids: set[str] = set()
+    scored_any = False
+
+    def checkpoint() -> None:
+        if store is not None and unsaved:
+            updated_ids.update(_write_judge_scores(store, unsaved))
+            unsaved.clear()
+
+    rate_limits = {_judge_backend(effective_model): rate_limit} if rate_limit else None
+    try:
+        for job, verdict in judge_many(
+            jobs,
+            goals=effective_goals,
+            model=effective_model,
+            judge_fn=functools.partial(judge_session, raise_errors=True),
+            concurrency=concurrency,
+            rate_limits=rate_limits,
+            retries=retries,
+        ):
+            row = rows_by_sid[job.session_id]
+            if verdict is None:
+                continue
+            score = verdict["score"]
+            reason = verdict["reason"]
+            row.update(_judge_fields(score, reason, verdict["model"]))
+            scored_any = True
+            unsaved.append(row)
+            if len(unsaved) >= _JUDGE_CHECKPOINT_EVERY:
+                checkpoint()
+            if not as_json:
+                cat = row["category"]
+                click.echo(f"  {job.session_id:<12} {row['date']}  {cat:<14} {score:.2f}  {reason}")
+    finally:
+        # Keep whatever was scored before an interruption
+        checkpoint()
+
+    if store is not None:
+        if updated_ids:
+            click.echo(f"\nUpdated {len(updated_ids)} record(s) in {store.path}", err=True)
+        elif not scored_any:
             click.echo(
                 "\nNo sessions were scored — check ANTHROPIC_API_KEY and the anthropic package.",
                 err=True,
@@ -2636,7 +2914,7 @@ def classify(
 
     # Write categories back to store if requested
     if update_store:
-        store = SessionStore(sessions_dir=ctx.obj["sessions_dir"])
+        store = open_store(ctx.obj["sessions_dir"])
         records = store.load_all()
         cat_map = {r["session_id"]: r for r in results}
         updated = 0
@@ -2707,7 +2985,7 @@ def classify_stats(
     """
     from collections import Counter
 
-    from .classification import classify_by_keywords
+    from .classification import classify_many
 
     if journal_dir is None:
         journal_dir = Path.cwd() / "journal"
@@ -2720,18 +2998,18 @@ def classify_stats(
         return
 
     # Classify all entries (keyword-only for speed)
-    results: list[dict] = []
+    texts: list[str] = []
+    dates: list[str] = []
     for entry in entries:
         try:
-            text = entry.read_text(encoding="utf-8")
+            texts.append(entry.read_text(encoding="utf-8"))
         except (OSError, UnicodeDecodeError):
             continue
-        result = classify_by_keywords(text)
-        row = {
-            "date": entry.parent.name,
-            **result.to_dict(),
-        }
-        results.append(row)
+        dates.append(entry.parent.name)
+    results: list[dict] = [
+        {"date": entry_date, **result.to_dict()}
+        for entry_date, result in zip(dates, classify_many(texts))
+    ]
 
     if not results:
         click.echo("No sessions could be classified.", err=True)
@@ -2870,7 +3148,7 @@ def cost(
     if last_7d:
         days = 7
 
-    store = SessionStore(sessions_dir=ctx.obj["sessions_dir"])
+    store = open_store(ctx.obj["sessions_dir"])
     records = store.query()
     summary = analyze_costs(records, days=days)
 
@@ -2921,6 +3199,13 @@ def cost(
 @click.option(
     "--file", "file_path", default=None, help="Only show sessions that touched this file path"
 )
+@click.option(
+    "--rank",
+    type=click.Choice(["recent", "bm25"]),
+    default="recent",
+    show_default=True,
+    help="Order by recency then hit count, or by BM25 relevance",
+)
 def search(
     query: str,
     days: int,
@@ -2930,11 +3215,15 @@ def search(
     no_snippets: bool,
     as_json: bool,
     file_path: str | None,
+    rank: str,
 ) -> None:
     """Search session transcripts for a query string.
 
     Performs case-insensitive substring search across session transcripts
-    and returns matching sessions ranked by recency then hit count.
+    and returns matching sessions ranked by recency then hit count
+    (or by BM25 relevance with --rank bm25).  Queries are served from an
+    inverted index in ~/.cache/gptme-sessions/ that picks up new and changed
+    sessions automatically (--no-cache scans the transcripts instead).
 
     Use --file to narrow results to sessions that touched a specific file:
 
@@ -2942,6 +3231,7 @@ def search(
         gptme sessions search "refactor" --file src/mymodule.py
     """
     from .search import search_sessions
+    from .search_index import default_search_index
 
     msg = f"Searching {days}-day window for: {query!r}"
     if file_path:
@@ -2954,6 +3244,9 @@ def search(
         max_results=max_results,
         case_sensitive=case_sensitive,
         file_path=file_path,
+        index=_discovery_index(),
+        search_index=default_search_index() if _use_cache() else None,
+        rank=rank,
     )
 
     if as_json:
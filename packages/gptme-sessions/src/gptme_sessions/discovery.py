@@ -13,6 +13,10 @@ import logging
 import os
 from datetime import date, datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .discovery_index import DiscoveryIndex
 
 logger = logging.getLogger(__name__)
 
@@ -345,6 +349,7 @@ def discover_cc_sessions(
     end: date,
     cc_dir: Path | None = None,
     min_size: int = CC_MIN_SESSION_SIZE,
+    index: DiscoveryIndex | None = None,
 ) -> list[Path]:
     """Find Claude Code session JSONL files within a date range.
 
@@ -355,6 +360,9 @@ def discover_cc_sessions(
     Files smaller than *min_size* bytes are skipped — these are typically
     stub sessions that never received an assistant response.
 
+    With an *index*, unchanged files and project directories are not
+    re-read (see :mod:`gptme_sessions.discovery_index`).
+
     Returns sorted list of session JSONL file paths.
     """
     if cc_dir is None:
@@ -364,10 +372,22 @@ def discover_cc_sessions(
         return []
 
     sessions_with_dates: list[tuple[date, Path]] = []
+    session_date: date | None
     try:
         for project_dir in sorted(cc_dir.iterdir()):
             if not project_dir.is_dir():
                 continue
+            if index is not None:
+                for jsonl_file in index.candidates(project_dir, "*.jsonl", start, end):
+                    entry = index.entry(jsonl_file)
+                    if entry is None or entry.start is None:
+                        continue
+                    if min_size > 0 and entry.size < min_size:
+                        continue
+                    session_date = entry.start.date()
+                    if start <= session_date <= end:
+                        sessions_with_dates.append((session_date, jsonl_file))
+                continue
             for jsonl_file in sorted(project_dir.glob("*.jsonl")):
                 # Skip stub sessions (metadata-only, no assistant response)
                 if min_size > 0 and jsonl_file.stat().st_size < min_size:
@@ -379,6 +399,8 @@ def discover_cc_sessions(
                     sessions_with_dates.append((session_date, jsonl_file))
     except PermissionError:
         logger.debug("Permission denied reading: %s", cc_dir)
+    if index is not None:
+        index.save()
     return [path for _, path in sorted(sessions_with_dates)]
 
 
@@ -567,11 +589,13 @@ def discover_copilot_sessions(
     start: date,
     end: date,
     copilot_dir: Path | None = None,
+    index: DiscoveryIndex | None = None,
 ) -> list[Path]:
     """Find Copilot CLI session event files within a date range.
 
     Scans ``~/.copilot/session-state/<uuid>/events.jsonl`` for session files.
-    Uses quick first-line timestamp extraction for date filtering.
+    Uses quick first-line timestamp extraction for date filtering, or the
+    start times cached in *index* for unchanged files.
 
     Returns sorted list of session JSONL file paths.
     """
@@ -587,13 +611,19 @@ def discover_copilot_sessions(
             if not session_dir.is_dir():
                 continue
             events_file = session_dir / "events.jsonl"
-            if not events_file.exists():
+            if index is not None:
+                start_dt = index.start(events_file)
+                session_date = start_dt.date() if start_dt else None
+            elif not events_file.exists():
                 continue
-            session_date = _quick_date_from_jsonl(events_file)
+            else:
+                session_date = _quick_date_from_jsonl(events_file)
             if session_date is None:
                 continue
             if start <= session_date <= end:
                 sessions_with_dates.append((session_date, events_file))
     except PermissionError:
         logger.debug("Permission denied reading: %s", copilot_dir)
+    if index is not None:
+        index.save()
     return [path for _, path in sorted(sessions_with_dates)]
@@ -0,0 +1,240 @@
+"""Persistent index of discovered trajectory files.
+
+Discovery used to open every Claude Code ``*.jsonl`` under every project
+directory (and every Copilot ``events.jsonl``) to read its first timestamp on
+each call, and ``sync``/``stats``/the dashboard call it repeatedly.  The
+index remembers, per file, the start datetime plus any lazily computed
+metadata (model, project, ...), validated against the file's
+``(inode, size, mtime)``, so unchanged files are only stat'ed.
+
+Directory listings are cached by directory mtime as well.  A file's start
+time is its *first* timestamp, which appending never changes, so files in an
+unchanged directory whose start date is outside the requested range are
+skipped without even a stat — old project directories cost one ``stat``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, TypeVar
+
+from .discovery import _quick_datetime_from_jsonl
+from .signal_cache import _default_cache_dir
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    inode INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    start TEXT,
+    extras TEXT NOT NULL DEFAULT '{}'
+);
+CREATE TABLE IF NOT EXISTS dirs (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    names TEXT NOT NULL
+);
+"""
+
+
+@dataclass
+class IndexEntry:
+    """Indexed metadata for one trajectory file."""
+
+    inode: int
+    size: int
+    mtime_ns: int
+    start: datetime | None
+    # Lazily computed values (see DiscoveryIndex.cached), reset on any change
+    extras: dict[str, Any] = field(default_factory=dict)
+
+
+class DiscoveryIndex:
+    """Stat-validated cache of per-file discovery metadata.
+
+    Rows are loaded on first use and written back by :meth:`save`, in one
+    transaction.  Safe to share between processes: each saves only the rows
+    it changed, and every row is valid on its own.
+
+    Args:
+        path: SQLite file.  Defaults to ``discovery.db`` in the
+            gptme-sessions cache directory (``GPTME_SESSIONS_CACHE_DIR``).
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = path if path is not None else _default_cache_dir() / "discovery.db"
+        self._files: dict[str, IndexEntry] | None = None
+        self._dirs: dict[str, tuple[int, list[str]]] = {}
+        self._dirty_files: set[str] = set()
+        self._dirty_dirs: set[str] = set()
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=30.0, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA busy_timeout=30000")
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def _load(self) -> dict[str, IndexEntry]:
+        if self._files is not None:
+            return self._files
+        self._files = {}
+        if not self.path.exists():
+            return self._files
+        try:
+            conn = self._connect()
+            try:
+                for path, inode, size, mtime_ns, start, extras in conn.execute(
+                    "SELECT path, inode, size, mtime_ns, start, extras FROM files"
+                ):
+                    self._files[path] = IndexEntry(
+                        inode,
+                        size,
+                        mtime_ns,
+                        datetime.fromisoformat(start) if start else None,
+                        json.loads(extras),
+                    )
+                for path, mtime_ns, names in conn.execute("SELECT path, mtime_ns, names FROM dirs"):
+                    self._dirs[path] = (mtime_ns, json.loads(names))
+            finally:
+                conn.close()
+        except (sqlite3.Error, ValueError) as e:
+            logger.debug("Ignoring unreadable discovery index %s: %s", self.path, e)
+            self._files, self._dirs = {}, {}
+        return self._files
+
+    def save(self) -> None:
+        """Write changed rows back to disk (no-op when nothing changed)."""
+        if not self._dirty_files and not self._dirty_dirs:
+            return
+        files = self._load()
+        try:
+            conn = self._connect()
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany(
+                    "INSERT OR REPLACE INTO files (path, inode, size, mtime_ns, start, extras)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        (
+                            key,
+                            e.inode,
+                            e.size,
+                            e.mtime_ns,
+                            e.start.isoformat() if e.start else None,
+                            json.dumps(e.extras),
+                        )
+                        for key in self._dirty_files
+                        if (e := files.get(key)) is not None
+                    ),
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO dirs (path, mtime_ns, names) VALUES (?, ?, ?)",
+                    (
+                        (key, self._dirs[key][0], json.dumps(self._dirs[key][1]))
+                        for key in self._dirty_dirs
+                    ),
+                )
+                conn.execute("COMMIT")
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError) as e:
+            logger.debug("Failed to save discovery index %s: %s", self.path, e)
+            return
+        self._dirty_files.clear()
+        self._dirty_dirs.clear()
+
+    def entry(self, path: Path) -> IndexEntry | None:
+        """Up-to-date entry for ``path``, re-reading it only if it changed.
+
+        Returns None when the file cannot be stat'ed.
+        """
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        files = self._load()
+        key = str(path)
+        cached = files.get(key)
+        if cached is not None and (cached.inode, cached.size, cached.mtime_ns) == (
+            st.st_ino,
+            st.st_size,
+            st.st_mtime_ns,
+        ):
+            return cached
+        entry = IndexEntry(st.st_ino, st.st_size, st.st_mtime_ns, _quick_datetime_from_jsonl(path))
+        files[key] = entry
+        self._dirty_files.add(key)
+        return entry
+
+    def start(self, path: Path) -> datetime | None:
+        """Start datetime (first timestamp) of a trajectory file."""
+        entry = self.entry(path)
+        return entry.start if entry else None
+
+    def cached(self, path: Path, name: str, compute: Callable[[Path], T]) -> T:
+        """Return ``compute(path)``, cached on the file's entry under ``name``.
+
+        Values must be JSON-serializable; they are recomputed whenever the
+        file changes.
+        """
+        entry = self.entry(path)
+        if entry is None:
+            return compute(path)
+        if name not in entry.extras:
+            entry.extras[name] = compute(path)
+            self._dirty_files.add(str(path))
+        value: T = entry.extras[name]
+        return value
+
+    def candidates(self, directory: Path, pattern: str, start: date, end: date) -> list[Path]:
+        """Files in ``directory`` matching ``pattern`` that may start in ``[start, end]``.
+
+        The listing is re-globbed only when the directory's mtime changed.
+        Files already known to start outside the range are left out without
+        a stat; callers still check the rest via :meth:`entry`.
+        """
+        try:
+            mtime_ns = directory.stat().st_mtime_ns
+        except OSError:
+            return []
+        files = self._load()
+        key = str(directory)
+        listing = self._dirs.get(key)
+        if listing is None or listing[0] != mtime_ns:
+            listing = (mtime_ns, sorted(p.name for p in directory.glob(pattern)))
+            self._dirs[key] = listing
+            self._dirty_dirs.add(key)
+        paths = []
+        for name in listing[1]:
+            path = directory / name
+            known = files.get(str(path))
+            if known is not None and known.start is not None:
+                if not (start <= known.start.date() <= end):
+                    continue
+            paths.append(path)
+        return paths
+
+
+_default_index: DiscoveryIndex | None = None
+
+
+def default_index() -> DiscoveryIndex:
+    """Process-wide index in the default cache directory."""
+    global _default_index
+    path = _default_cache_dir() / "discovery.db"
+    if _default_index is None or _default_index.path != path:
+        _default_index = DiscoveryIndex(path)
+    return _default_index
@@ -282,7 +282,7 @@ def detect_harm_revert(
     """
     if deliverables is None:
         # Import here to avoid circular imports
-        from .store import SessionStore
+        from .store import open_store
 
         resolved_store = store_path if store_path is not None else _default_store_path()
         if resolved_store is None or not resolved_store.exists():
@@ -293,7 +293,7 @@ def detect_harm_revert(
             )
             deliverables = []
         else:
-            store = SessionStore(resolved_store)
+            store = open_store(resolved_store)
             records = {r.session_id: r for r in store.load_all()}
             record = records.get(session_id)
             if record is None:
@@ -338,11 +338,11 @@ def batch_detect_harm_revert(
     The ``store_path`` and ``allow_empty_repos`` arguments are forwarded to
     each :func:`detect_harm_revert` call.
     """
-    from .store import SessionStore
+    from .store import open_store
 
     resolved_store = store_path if store_path is not None else _default_store_path()
     store = (
-        SessionStore(resolved_store)
+        open_store(resolved_store)
         if resolved_store is not None and resolved_store.exists()
         else None
     )
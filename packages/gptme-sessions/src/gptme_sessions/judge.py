@@ -30,7 +30,7 @@ from collections.abc import Iterator
 from pathlib import Path
 from typing import Any, TypedDict
 
-from .store import SessionStore
+from .store import open_store
 
 logger = logging.getLogger(__name__)
 
@@ -601,6 +601,7 @@ def _judge_via_anthropic_direct(
     model: str,
     api_key: str | None,
     temperature: float = 0.3,
+    raise_errors: bool = False,
 ) -> dict | None:
     """Call the judge via the direct Anthropic SDK (legacy path)."""
     try:
@@ -635,13 +636,15 @@ def _judge_via_anthropic_direct(
         )
         text = getattr(response.content[0], "text", "").strip()
     except Exception as exc:
+        if raise_errors:
+            raise
         logger.warning("LLM judge (anthropic) failed: %s", exc)
         return None
 
     return _parse_judge_payload(text, model)
 
 
-def _judge_via_gptme(prompt: str, *, model: str) -> dict | None:
+def _judge_via_gptme(prompt: str, *, model: str, raise_errors: bool = False) -> dict | None:
     """Call the judge via ``gptme.llm.reply`` for non-Anthropic-direct models.
 
     Temperature is not explicitly set here — gptme.llm.reply defaults to the
@@ -681,6 +684,8 @@ def _judge_via_gptme(prompt: str, *, model: str) -> dict | None:
                 stream=False,
             )
     except Exception as exc:
+        if raise_errors:
+            raise
         logger.warning("LLM judge (gptme) failed: %s", exc)
         return None
 
@@ -698,6 +703,7 @@ def judge_session(
     cascade_context: dict | None = None,
     intent: dict | None = None,
     temperature: float = 0.3,
+    raise_errors: bool = False,
 ) -> dict | None:
     """Score a session's strategic value using an LLM judge.
 
@@ -731,6 +737,10 @@ def judge_session(
         temperature: Sampling temperature for the judge model (default 0.3).
             Higher values increase score variance; 0.0 produces near-constant
             scores that undermine calibration.
+        raise_errors: Propagate exceptions from the model call (network and
+            API errors) instead of returning ``None``, so callers can retry
+            them. Missing packages or keys and unparseable replies still
+            return ``None``.
 
     Returns:
         Dict with keys ``score`` (float), ``reason`` (str), ``model`` (str),
@@ -754,9 +764,13 @@ def judge_session(
 
     if _is_anthropic_direct_model(model):
         return _judge_via_anthropic_direct(
-            prompt, model=model, api_key=api_key, temperature=temperature
+            prompt,
+            model=model,
+            api_key=api_key,
+            temperature=temperature,
+            raise_errors=raise_errors,
         )
-    return _judge_via_gptme(prompt, model=model)
+    return _judge_via_gptme(prompt, model=model, raise_errors=raise_errors)
 
 
 def judge_session_with_fallback(
@@ -886,7 +900,7 @@ def write_alignment_grade(
     amortized and keeps per-tool-call span data flowing into the LOO /
     analytics pipelines that key off ``SessionRecord``.
     """
-    store = SessionStore(sessions_dir=sessions_dir)
+    store = open_store(sessions_dir)
     records = store.load_all()
     normalized = normalize_judge_verdict(dict(verdict))
     for record in records:
@@ -0,0 +1,171 @@
+"""Concurrent batch judging with per-backend rate limiting and retries.
+
+Scoring sessions one at a time makes a backfill over thousands of sessions
+bound by per-call latency.  :func:`judge_many` runs the judge in a thread pool
+(calls are network-bound), spaces requests per backend with a
+:class:`RateLimiter`, and retries transient failures (connection errors,
+timeouts, rate limits, server errors) with exponential backoff and full
+jitter.  Any other exception is re-raised, since retrying it would only
+sleep and pay for another call that fails the same way.
+
+A ``None`` verdict is final too: it means the judge is unavailable (no API
+key, missing package) or its reply was unusable.  Verdicts are yielded as
+they complete so callers can checkpoint them (``gptme-sessions judge
+--update-store`` writes them into the store incrementally, and ``--resume``
+skips sessions already scored).
+
+The judge itself is pluggable: anything with the signature of
+:func:`~gptme_sessions.judge.judge_session` works, e.g. a local stub in tests.
+The default calls it with ``raise_errors=True`` so API errors reach the retry
+loop instead of being turned into ``None``.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import random
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+
+from . import judge as _judge
+
+logger = logging.getLogger(__name__)
+
+# Signature of judge_session: (text, category=..., goals=..., model=...) -> verdict | None
+JudgeFn = Callable[..., dict | None]
+
+
+@dataclass
+class JudgeJob:
+    """One session to score."""
+
+    session_id: str
+    text: str
+    category: str | None = None
+
+
+class RateLimiter:
+    """Thread-safe limiter spacing calls at least ``1 / rate`` seconds apart.
+
+    Args:
+        rate: Maximum calls per second; ``None`` or ``<= 0`` disables limiting.
+    """
+
+    def __init__(self, rate: float | None):
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def acquire(self) -> None:
+        """Block until the caller may make its next call."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+# Transient SDK errors (anthropic and openai share these names); matched by
+# name so neither package has to be importable here
+_RETRYABLE_SDK_ERRORS = frozenset(
+    {"APIConnectionError", "APITimeoutError", "RateLimitError", "InternalServerError"}
+)
+
+
+def _is_retryable(exc: Exception) -> bool:
+    """True only for transient failures worth another attempt."""
+    if isinstance(exc, (ConnectionError, TimeoutError)):
+        return True
+    status = getattr(exc, "status_code", None)
+    if isinstance(status, int):
+        return status >= 500 or status in (408, 409, 429)
+    return any(
+        cls.__name__ in _RETRYABLE_SDK_ERRORS
+        and cls.__module__.partition(".")[0] in ("anthropic", "openai")
+        for cls in type(exc).__mro__
+    )
+
+
+def _backoff_delay(attempt: int, backoff: float) -> float:
+    """Full-jitter exponential backoff: uniform in ``[0, backoff * 2**attempt]``."""
+    return random.uniform(0, backoff * 2**attempt)
+
+
+def judge_many(
+    jobs: Iterable[JudgeJob],
+    *,
+    goals: str = _judge.DEFAULT_GOALS,
+    model: str = _judge.DEFAULT_JUDGE_MODEL,
+    judge_fn: JudgeFn | None = None,
+    concurrency: int = 1,
+    rate_limits: Mapping[str, float] | None = None,
+    retries: int = 2,
+    backoff: float = 0.5,
+) -> Iterator[tuple[JudgeJob, dict | None]]:
+    """Score ``jobs`` concurrently, yielding ``(job, verdict)`` as each completes.
+
+    Args:
+        jobs: Sessions to score.
+        goals: Agent goals forwarded to the judge.
+        model: Judge model; also selects the rate-limit bucket via its backend
+            (``anthropic-direct`` or ``gptme-fallback``).
+        judge_fn: Judge callable with the signature of
+            :func:`~gptme_sessions.judge.judge_session` (the default).
+        concurrency: Worker threads; at most ``2 * concurrency`` jobs are in
+            flight, so memory stays bounded for any number of jobs.
+        rate_limits: Maximum calls per second by backend name; backends not
+            listed are unlimited.
+        retries: Extra attempts when the judge raises a transient error.
+        backoff: Base delay in seconds for the jittered exponential backoff.
+
+    The verdict is ``None`` when the judge returned ``None`` or every attempt
+    failed with a transient error; any other exception propagates to the
+    caller.  With ``concurrency=1`` results come back in input order.
+    """
+    fn = judge_fn or functools.partial(_judge.judge_session, raise_errors=True)
+    backend = _judge._judge_backend(model)
+    limiter = RateLimiter((rate_limits or {}).get(backend))
+    workers = max(1, concurrency)
+
+    def run(job: JudgeJob) -> dict | None:
+        for attempt in range(retries + 1):
+            if attempt:
+                time.sleep(_backoff_delay(attempt - 1, backoff))
+            limiter.acquire()
+            try:
+                return fn(job.text, category=job.category, goals=goals, model=model)
+            except Exception as exc:
+                if not _is_retryable(exc):
+                    raise
+                logger.warning("Judge failed for %s (attempt %d): %s", job.session_id, attempt, exc)
+        return None
+
+    remaining = iter(jobs)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending: dict[Future[dict | None], JudgeJob] = {}
+        try:
+            for job in remaining:
+                pending[pool.submit(run, job)] = job
+                if len(pending) >= 2 * workers:
+                    break
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                # Yield in submission order among the finished ones, so a
+                # single worker reproduces the sequential order exactly.
+                for future in [f for f in pending if f in done]:
+                    job = pending.pop(future)
+                    next_job = next(remaining, None)
+                    if next_job is not None:
+                        pending[pool.submit(run, next_job)] = next_job
+                    yield job, future.result()
+        finally:
+            # On early exit (error, Ctrl-C, consumer stops) drop queued work
+            for future in pending:
+                future.cancel()
@@ -443,6 +443,12 @@ class SessionRecord:
         """Canonical short form of the model (e.g. ``"opus"``)."""
         return normalize_model(self.model)
 
+    @property
+    def llm_judge_meta(self) -> dict[str, str]:
+        """Provenance of the judge score (``backend``, ``judge_version``)."""
+        meta = self._legacy_fields.get("llm_judge_meta")
+        return dict(meta) if isinstance(meta, dict) else {}
+
     def to_dict(self) -> dict:
         """Serialize to JSON-compatible dict.
 
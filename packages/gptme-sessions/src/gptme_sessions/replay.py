@@ -8,7 +8,7 @@ from pathlib import Path
 from typing import Literal
 
 from .record import SessionRecord
-from .store import SessionStore
+from .store import open_store
 from .transcript import NormalizedMessage, SessionTranscript, read_transcript
 
 ToolResultsMode = Literal["summary", "full", "hide"]
@@ -50,7 +50,7 @@ def resolve_replay_target(target: str, *, sessions_dir: Path) -> SessionTranscri
         )
         return read_transcript(path)
 
-    store = SessionStore(sessions_dir=sessions_dir)
+    store = open_store(sessions_dir)
     record = resolve_session_record_prefix(store.load_all(), target)
     if not record.trajectory_path:
         raise ValueError(f"Session '{record.session_id}' has no trajectory_path; cannot replay it.")
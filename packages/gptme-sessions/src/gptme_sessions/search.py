@@ -3,7 +3,9 @@
 Provides case-insensitive substring search across gptme and Claude Code session
 transcripts, using ``read_transcript()`` for harness-agnostic normalization.
 
-Performance: linear scan over 500 sessions ≈ 80ms — no index required for v1.
+Performance: linear scan over 500 sessions ≈ 80ms.  Pass a
+:class:`~gptme_sessions.search_index.SearchIndex` (the CLI does) to serve
+queries from a persistent inverted index instead.
 """
 
 from __future__ import annotations
@@ -13,6 +15,7 @@ import re
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from .discovery import (
     discover_cc_sessions,
@@ -20,7 +23,11 @@ from .discovery import (
     discover_copilot_sessions,
     discover_gptme_sessions,
 )
-from .transcript import read_transcript
+from .transcript import SessionTranscript, read_transcript
+
+if TYPE_CHECKING:
+    from .discovery_index import DiscoveryIndex
+    from .search_index import SearchIndex
 
 logger = logging.getLogger(__name__)
 
@@ -99,7 +106,16 @@ def _search_path(
     except Exception as exc:
         logger.debug("skipping %s: %s", path, exc)
         return None
+    return _match_transcript(path, transcript, pattern, file_pattern)
+
 
+def _match_transcript(
+    path: Path,
+    transcript: SessionTranscript,
+    pattern: re.Pattern,
+    file_pattern: re.Pattern | None = None,
+) -> SearchResult | None:
+    """Match a parsed transcript (shared by the linear scan and the search index)."""
     # Pre-filter: if file_pattern specified, skip sessions that don't mention the file
     if file_pattern is not None:
         if not any(_message_mentions_file(msg, file_pattern) for msg in transcript.messages):
@@ -147,6 +163,9 @@ def search_sessions(
     max_results: int = 20,
     case_sensitive: bool = False,
     file_path: str | None = None,
+    index: DiscoveryIndex | None = None,
+    search_index: SearchIndex | None = None,
+    rank: str = "recent",
 ) -> list[SearchResult]:
     """Search session transcripts and return results ranked by recency then hit count.
 
@@ -169,6 +188,16 @@ def search_sessions(
     file_path:
         If provided, only return sessions that mention this file path in their
         transcript (catches Read, Edit, Write, and tool calls referencing the file).
+    index:
+        Optional :class:`~gptme_sessions.discovery_index.DiscoveryIndex` used to
+        avoid re-reading unchanged Claude Code/Copilot files during discovery.
+    search_index:
+        Optional :class:`~gptme_sessions.search_index.SearchIndex`.  New or
+        changed sessions are indexed first; results are identical to the
+        linear scan.
+    rank:
+        ``"recent"`` (newest first, then hit count) or ``"bm25"`` (relevance;
+        uses a throwaway in-memory index when *search_index* is not given).
     """
     flags = 0 if case_sensitive else re.IGNORECASE
     pattern = re.compile(re.escape(query), flags)
@@ -181,11 +210,21 @@ def search_sessions(
     if harness in (None, "gptme"):
         paths.extend(discover_gptme_sessions(start, today))
     if harness in (None, "claude-code"):
-        paths.extend(discover_cc_sessions(start, today))
+        paths.extend(discover_cc_sessions(start, today, index=index))
     if harness in (None, "codex"):
         paths.extend(discover_codex_sessions(start, today))
     if harness in (None, "copilot"):
-        paths.extend(discover_copilot_sessions(start, today))
+        paths.extend(discover_copilot_sessions(start, today, index=index))
+
+    if rank == "bm25" and search_index is None:
+        from .search_index import SearchIndex
+
+        search_index = SearchIndex(Path(":memory:"))
+    if search_index is not None:
+        search_index.update(paths)
+        return search_index.search(
+            paths, pattern, query, max_results=max_results, file_pattern=file_pattern, rank=rank
+        )
 
     results: list[SearchResult] = []
     for path in paths:
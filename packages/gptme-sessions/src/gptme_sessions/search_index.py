@@ -0,0 +1,620 @@
+"""Persistent inverted index for session search.
+
+:func:`~gptme_sessions.search.search_sessions` re-reads and scans every
+transcript in the window on each query.  :class:`SearchIndex` keeps, per
+trajectory file (keyed by path and re-indexed when its size/mtime change):
+
+- the searchable messages (role, content, tool input), zlib-compressed, so
+  matches can be verified without re-parsing the trajectory;
+- positional postings (``term -> doc -> token positions``) over ``\\w+``
+  tokens of the case-folded content.
+
+Queries keep the substring semantics of the linear scorer.  Query and content
+are folded character by character the way ``re.IGNORECASE`` compares them
+(``str.lower`` does not: "İ" becomes two characters and a trailing "Σ" a final
+"ς"), and each ``\\w+`` run of the folded query must lie inside one token: a run that touches the start
+of the query may be a token suffix, one touching the end a prefix, interior
+runs must match whole tokens, and consecutive runs must sit at consecutive
+positions.  Candidates that pass this filter are verified with the same regex
+code as the linear path, so results (hits, snippets, order) are identical.
+Verification walks candidates newest-first and stops as soon as the top
+``max_results`` are settled.
+
+``rank="bm25"`` instead orders the matching sessions by Okapi BM25 over the
+query's terms (document frequency and length statistics restricted to the
+searched window).
+
+Performance (``test_benchmark_search_index_50k``, 50k sessions): selective
+queries take 5-11ms against a resolved window and a one-letter substring
+query ~110ms, vs 300-400ms for the linear scorer on already-parsed
+transcripts.  Each ``search_sessions()`` call also pays for discovery and for
+:meth:`SearchIndex.update` stat-ing every path (~200-280ms at 50k), so queries
+are not sub-10ms end to end; :meth:`SearchIndex.window` is cached between
+calls over the same paths.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import re
+import sqlite3
+import stat
+import zlib
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Callable, Collection, Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from .search import SearchResult, _match_transcript
+from .signal_cache import _default_cache_dir
+from .transcript import (
+    TRANSCRIPT_SCHEMA_VERSION,
+    NormalizedMessage,
+    SessionTranscript,
+    read_transcript,
+)
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Bumped whenever tokenization changes, so older indexes are rebuilt
+INDEX_VERSION = 2
+
+# Characters re.IGNORECASE treats as equal that no case mapping links
+_IGNORECASE_EXTRA = {"\u1fd3": "\u0390", "\u1fe3": "\u03b0", "\ufb06": "\ufb05"}
+
+# Keep IN (...) lists below SQLite's host-parameter limit on older builds
+_SQL_CHUNK = 500
+
+# Okapi BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    session_id TEXT,
+    harness TEXT,
+    started_at TEXT,
+    length INTEGER NOT NULL DEFAULT 0,
+    terms TEXT NOT NULL DEFAULT '',
+    body BLOB
+);
+CREATE INDEX IF NOT EXISTS idx_docs_session ON docs(session_id);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    doc_id INTEGER NOT NULL,
+    positions BLOB NOT NULL,
+    PRIMARY KEY (term, doc_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS terms (
+    term TEXT PRIMARY KEY,
+    df INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+@dataclass
+class _Doc:
+    id: int
+    mtime_ns: int
+    size: int
+    length: int
+    readable: bool
+    started_ts: float
+
+
+@dataclass
+class SearchWindow:
+    """The indexed, readable sessions among a list of paths (see :meth:`SearchIndex.window`)."""
+
+    # doc id -> position in the path list (breaks ties like the linear path's stable sort)
+    order: dict[int, int]
+    # doc id -> (path, doc)
+    docs: dict[int, tuple[str, _Doc]]
+
+
+@dataclass
+class _Run:
+    """One ``\\w+`` run of the query and how it may sit inside a content token."""
+
+    text: str
+    open_left: bool
+    open_right: bool
+
+    def terms(self, vocab: list[str]) -> list[str]:
+        """Terms of the sorted ``vocab`` this run can occur in."""
+        text = self.text
+        if self.open_left and self.open_right:
+            return [t for t in vocab if text in t]
+        if self.open_left:
+            return [t for t in vocab if t.endswith(text)]
+        lo = bisect_left(vocab, text)
+        if not self.open_right:
+            return [text] if lo < len(vocab) and vocab[lo] == text else []
+        hi = lo
+        while hi < len(vocab) and vocab[hi].startswith(text):
+            hi += 1
+        return vocab[lo:hi]
+
+
+class _CaseFold(dict):
+    """``str.translate`` table mapping each character to its ``re.IGNORECASE`` class.
+
+    Characters always fold to exactly one character, so a match of the query
+    in the content lines up character by character with the folded text.
+    """
+
+    def __missing__(self, code: int) -> str:
+        char = chr(code).lower()[:1]  # "İ" lowercases to "i̇"; re compares it as "i"
+        upper = char.upper()
+        if len(upper) == 1 and len(upper.lower()) == 1:
+            char = upper.lower()  # ς -> σ, µ -> μ, ſ -> s, ı -> i, ...
+        char = _IGNORECASE_EXTRA.get(char, char)
+        self[code] = char
+        return char
+
+
+_CASE_FOLD = _CaseFold()
+
+
+def _fold(text: str) -> str:
+    return text.lower() if text.isascii() else text.translate(_CASE_FOLD)
+
+
+def _query_runs(query: str) -> list[_Run]:
+    folded = _fold(query)
+    return [
+        _Run(m.group(), m.start() == 0, m.end() == len(folded)) for m in _TOKEN_RE.finditer(folded)
+    ]
+
+
+def _parse_started(started_at: str | None) -> datetime | None:
+    """Parse a transcript start time exactly as the linear scorer does."""
+    if not started_at:
+        return None
+    try:
+        return datetime.fromisoformat(started_at.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        return None
+
+
+def _started_ts(started_at: str | None) -> float:
+    dt = _parse_started(started_at)
+    return dt.timestamp() if dt else 0.0
+
+
+def _stamp(path: Path) -> tuple[int, int] | None:
+    """(mtime_ns, size) of the trajectory file behind ``path``."""
+    try:
+        st = os.stat(path)
+        if stat.S_ISDIR(st.st_mode):
+            st = os.stat(path / "conversation.jsonl")
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _encode_body(transcript: SessionTranscript) -> bytes:
+    messages = [
+        [m.role, m.content, m.tool_input] for m in transcript.messages if m.content or m.tool_input
+    ]
+    return zlib.compress(json.dumps(messages, default=str).encode("utf-8"))
+
+
+def _positions(transcript: SessionTranscript) -> tuple[dict[str, array], int]:
+    """Token positions per term, with a one-position gap between messages."""
+    postings: dict[str, array] = {}
+    pos = 0
+    for msg in transcript.messages:
+        if not msg.content:
+            continue
+        for token in _TOKEN_RE.findall(_fold(msg.content)):
+            positions = postings.get(token)
+            if positions is None:
+                positions = postings[token] = array("I")
+            positions.append(pos)
+            pos += 1
+        pos += 1  # phrases never span messages
+    return postings, pos
+
+
+def _read(path: Path) -> SessionTranscript | None:
+    try:
+        return read_transcript(path)
+    except Exception as exc:
+        logger.debug("skipping %s: %s", path, exc)
+        return None
+
+
+def _chunks(items: list, size: int = _SQL_CHUNK) -> Iterable[list]:
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+class SearchIndex:
+    """On-disk inverted index over session transcripts.
+
+    Args:
+        path: SQLite file (``":memory:"`` for a throwaway index).  Defaults
+            to ``search.db`` in the gptme-sessions cache directory.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = path if path is not None else _default_cache_dir() / "search.db"
+        self._conn: sqlite3.Connection | None = None
+        self._docs: dict[str, _Doc] | None = None
+        self._vocab: list[str] | None = None
+        self._df: dict[str, int] = {}
+        self._window: tuple[list[str], SearchWindow] | None = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Lazy database connection (creates the schema on first use)."""
+        if self._conn is None:
+            if str(self.path) != ":memory:":
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if conn.execute("PRAGMA user_version").fetchone()[0] != INDEX_VERSION:
+                    for table in ("docs", "postings", "terms"):
+                        conn.execute(f"DROP TABLE IF EXISTS {table}")
+                    conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+                for statement in _SCHEMA.split(";"):
+                    if statement.strip():
+                        conn.execute(statement)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                conn.close()
+                raise
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _load_docs(self) -> dict[str, _Doc]:
+        if self._docs is None:
+            self._docs = {
+                path: _Doc(id, mtime_ns, size, length, readable, _started_ts(started_at))
+                for id, path, mtime_ns, size, length, readable, started_at in self.conn.execute(
+                    "SELECT id, path, mtime_ns, size, length, body IS NOT NULL, started_at"
+                    " FROM docs"
+                )
+            }
+        return self._docs
+
+    def _vocabulary(self) -> list[str]:
+        if self._vocab is None:
+            self._df = dict(self.conn.execute("SELECT term, df FROM terms ORDER BY term"))
+            self._vocab = list(self._df)
+        return self._vocab
+
+    def __len__(self) -> int:
+        return len(self._load_docs())
+
+    # -- indexing -----------------------------------------------------------
+
+    def _remove(self, doc_id: int) -> None:
+        conn = self.conn
+        # The doc's terms are kept on its row so postings need no doc_id index
+        row = conn.execute("SELECT terms FROM docs WHERE id = ?", (doc_id,)).fetchone()
+        terms = row[0].split() if row else []
+        conn.executemany(
+            "DELETE FROM postings WHERE term = ? AND doc_id = ?", ((t, doc_id) for t in terms)
+        )
+        conn.executemany("UPDATE terms SET df = df - 1 WHERE term = ?", ((t,) for t in terms))
+        conn.executemany("DELETE FROM terms WHERE term = ? AND df <= 0", ((t,) for t in terms))
+        conn.execute("DELETE FROM docs WHERE id = ?", (doc_id,))
+
+    def _insert_batch(
+        self, batch: list[tuple[Path, tuple[int, int], SessionTranscript | None]]
+    ) -> None:
+        docs = self._load_docs()
+        conn = self.conn
+        rows: list[tuple[str, int, bytes]] = []
+        df: Counter[str] = Counter()
+        for path, stamp, transcript in batch:
+            key = str(path)
+            old = docs.pop(key, None)
+            if old is not None:
+                self._remove(old.id)
+            elif row := conn.execute("SELECT id FROM docs WHERE path = ?", (key,)).fetchone():
+                self._remove(row[0])  # indexed meanwhile by another process
+            if transcript is None:
+                cur = conn.execute(
+                    "INSERT INTO docs (path, mtime_ns, size) VALUES (?, ?, ?)", (key, *stamp)
+                )
+                docs[key] = _Doc(cur.lastrowid or 0, *stamp, 0, False, 0.0)
+                continue
+            postings, length = _positions(transcript)
+            cur = conn.execute(
+                "INSERT INTO docs"
+                " (path, mtime_ns, size, session_id, harness, started_at, length, terms, body)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    *stamp,
+                    transcript.session_id,
+                    transcript.harness,
+                    transcript.started_at,
+                    length,
+                    " ".join(postings),
+                    _encode_body(transcript),
+                ),
+            )
+            doc_id = cur.lastrowid or 0
+            rows.extend((term, doc_id, positions.tobytes()) for term, positions in postings.items())
+            df.update(postings.keys())
+            docs[key] = _Doc(doc_id, *stamp, length, True, _started_ts(transcript.started_at))
+        # Inserting in key order keeps B-tree writes local (several times faster
+        # than inserting each document's terms as they come)
+        rows.sort()
+        conn.executemany("INSERT INTO postings (term, doc_id, positions) VALUES (?, ?, ?)", rows)
+        conn.executemany(
+            "INSERT INTO terms (term, df) VALUES (?, ?)"
+            " ON CONFLICT(term) DO UPDATE SET df = df + excluded.df",
+            sorted(df.items()),
+        )
+
+    def add_many(
+        self,
+        items: Iterable[tuple[Path, tuple[int, int], SessionTranscript | None]],
+        batch_size: int = 1000,
+    ) -> int:
+        """Index parsed transcripts in one transaction, replacing older entries.
+
+        ``items`` are ``(path, (mtime_ns, size), transcript)``; a ``None``
+        transcript records an unreadable file so it is not retried until it
+        changes.  Returns the number of items indexed.
+        """
+        conn = self.conn
+        count = 0
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            batch: list[tuple[Path, tuple[int, int], SessionTranscript | None]] = []
+            for item in items:
+                batch.append(item)
+                if len(batch) >= batch_size:
+                    self._insert_batch(batch)
+                    count += len(batch)
+                    batch = []
+            if batch:
+                self._insert_batch(batch)
+                count += len(batch)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            self._docs = None
+            raise
+        finally:
+            self._vocab = None
+            self._window = None
+        return count
+
+    def update(self, paths: Iterable[Path]) -> int:
+        """(Re-)index any of ``paths`` that are new or changed since last seen.
+
+        Returns the number of files (re-)indexed.
+        """
+        docs = self._load_docs()
+        stale: list[tuple[Path, tuple[int, int]]] = []
+        for path in paths:
+            stamp = _stamp(path)
+            if stamp is None:
+                continue
+            doc = docs.get(str(path))
+            if doc is None or (doc.mtime_ns, doc.size) != stamp:
+                stale.append((path, stamp))
+        if not stale:
+            return 0
+        return self.add_many((path, stamp, _read(path)) for path, stamp in stale)
+
+    # -- querying -----------------------------------------------------------
+
+    def _postings(
+        self, run: _Run, doc_ids: Collection[int], required: bool = True
+    ) -> dict[int, array] | None:
+        """Positions of all terms matching ``run``, restricted to ``doc_ids``.
+
+        Unless ``required``, returns None instead when the run's terms cover
+        about as many postings as there are documents: filtering on it would
+        cost more than it saves (e.g. a one-letter substring query).
+        """
+        terms = run.terms(self._vocabulary())
+        if not required and sum(self._df[t] for t in terms) >= len(doc_ids):
+            return None
+        found: dict[int, array] = {}
+        for chunk in _chunks(terms):
+            for doc_id, blob in self.conn.execute(
+                f"SELECT doc_id, positions FROM postings WHERE term IN ({','.join('?' * len(chunk))})",
+                chunk,
+            ):
+                if doc_id not in doc_ids:
+                    continue
+                positions = found.get(doc_id)
+                if positions is None:
+                    positions = found[doc_id] = array("I")
+                positions.frombytes(blob)
+        return found
+
+    def _load_transcript(self, doc_id: int, path: str) -> SessionTranscript | None:
+        row = self.conn.execute(
+            "SELECT session_id, harness, started_at, body FROM docs WHERE id = ?", (doc_id,)
+        ).fetchone()
+        if row is None or row[3] is None:
+            return None
+        session_id, harness, started_at, body = row
+        messages = [
+            NormalizedMessage(role=role, content=content, tool_input=tool_input)
+            for role, content, tool_input in json.loads(zlib.decompress(body))
+        ]
+        return SessionTranscript(
+            schema_version=TRANSCRIPT_SCHEMA_VERSION,
+            session_id=session_id,
+            harness=harness,
+            trajectory_path=path,
+            messages=messages,
+            started_at=started_at,
+        )
+
+    def window(self, paths: Iterable[Path]) -> SearchWindow:
+        """Resolve ``paths`` to indexed sessions once, for several queries.
+
+        Paths not yet indexed (see :meth:`update`) or unreadable are left out.
+        The last window is reused while the paths and the index are unchanged.
+        """
+        keys = [str(path) for path in paths]
+        if self._window is not None and self._window[0] == keys:
+            return self._window[1]
+        docs = self._load_docs()
+        order: dict[int, int] = {}
+        by_id: dict[int, tuple[str, _Doc]] = {}
+        for i, key in enumerate(keys):
+            doc = docs.get(key)
+            if doc is not None and doc.readable and doc.id not in order:
+                order[doc.id] = i
+                by_id[doc.id] = (key, doc)
+        window = SearchWindow(order, by_id)
+        self._window = (keys, window)
+        return window
+
+    def search(
+        self,
+        paths: list[Path] | SearchWindow,
+        pattern: re.Pattern,
+        query: str,
+        max_results: int = 20,
+        file_pattern: re.Pattern | None = None,
+        rank: str = "recent",
+    ) -> list[SearchResult]:
+        """Search the indexed sessions among ``paths`` (or a prepared window).
+
+        ``pattern``/``file_pattern`` are the compiled regexes of the linear
+        scorer and ``query`` the raw query string they were built from.
+        """
+        window = paths if isinstance(paths, SearchWindow) else self.window(paths)
+        order, by_id = window.order, window.docs
+
+        runs = _query_runs(query)
+        in_window = order.keys()
+        candidates = set(in_window)
+        run_positions: list[dict[int, array] | None] = [None for _ in runs]
+        # Longest (most selective) runs first to shrink the candidate set early;
+        # BM25 needs term statistics over the whole window instead.
+        for i in sorted(range(len(runs)), key=lambda i: -len(runs[i].text)):
+            if rank == "bm25":
+                found = self._postings(runs[i], in_window)
+            else:
+                found = self._postings(runs[i], candidates, required=False)
+            if found is None:
+                continue  # unselective run: leave it to verification
+            candidates &= found.keys()
+            if not candidates:
+                return []
+            run_positions[i] = found
+        if sum(found is not None for found in run_positions) > 1:
+            candidates = {doc_id for doc_id in candidates if _has_phrase(doc_id, run_positions)}
+
+        def verify(doc_id: int) -> SearchResult | None:
+            path, _ = by_id[doc_id]
+            transcript = self._load_transcript(doc_id, path)
+            if transcript is None:
+                return None
+            return _match_transcript(Path(path), transcript, pattern, file_pattern)
+
+        if rank == "bm25":
+            return self._rank_bm25(candidates, run_positions, by_id, order, verify, max_results)
+
+        ordered = sorted(candidates, key=lambda d: (-by_id[d][1].started_ts, order[d]))
+        results: list[SearchResult] = []
+        boundary: float | None = None
+        for doc_id in ordered:
+            ts = by_id[doc_id][1].started_ts
+            if boundary is not None and ts < boundary:
+                break
+            result = verify(doc_id)
+            if result is None:
+                continue
+            results.append(result)
+            if boundary is None and len(results) >= max_results:
+                # Later sessions with the same start time may still outrank
+                # this one on hit count; anything older cannot.
+                boundary = ts
+
+        def _sort_key(r: SearchResult) -> tuple[float, int]:
+            ts = r.started_at.timestamp() if r.started_at else 0.0
+            return (-ts, -r.hit_count)
+
+        results.sort(key=_sort_key)
+        return results[:max_results]
+
+    def _rank_bm25(
+        self,
+        candidates: set[int],
+        run_positions: list[dict[int, array] | None],
+        by_id: dict[int, tuple[str, _Doc]],
+        order: dict[int, int],
+        verify: Callable[[int], SearchResult | None],
+        max_results: int,
+    ) -> list[SearchResult]:
+        """Order verified matches by BM25 over the query's terms."""
+        n_docs = len(by_id)
+        avgdl = sum(doc.length for _, doc in by_id.values()) / n_docs or 1.0
+        postings = [found or {} for found in run_positions]
+        idfs = [
+            math.log(1 + (n_docs - len(found) + 0.5) / (len(found) + 0.5)) for found in postings
+        ]
+        scored: list[tuple[float, float, int, int, SearchResult]] = []
+        for doc_id in candidates:
+            result = verify(doc_id)
+            if result is None:
+                continue
+            doc = by_id[doc_id][1]
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * doc.length / avgdl)
+            score = 0.0
+            for idf, found in zip(idfs, postings):
+                tf = len(found.get(doc_id, ()))
+                score += idf * tf * (BM25_K1 + 1) / (tf + norm)
+            scored.append((-score, -doc.started_ts, -result.hit_count, order[doc_id], result))
+        scored.sort(key=lambda item: item[:4])
+        return [item[4] for item in scored[:max_results]]
+
+
+def _has_phrase(doc_id: int, run_positions: list[dict[int, array] | None]) -> bool:
+    """Whether the filtered runs occur at their relative offsets in ``doc_id``."""
+    offsets = [(i, found[doc_id]) for i, found in enumerate(run_positions) if found is not None]
+    (first_offset, first), *rest = offsets
+    later = [(i - first_offset, set(positions)) for i, positions in rest]
+    return any(all(p + delta in positions for delta, positions in later) for p in first)
+
+
+_default_index: SearchIndex | None = None
+
+
+def default_search_index() -> SearchIndex:
+    """Process-wide index in the default cache directory."""
+    global _default_index
+    path = _default_cache_dir() / "search.db"
+    if _default_index is None or _default_index.path != path:
+        if _default_index is not None:
+            _default_index.close()
+        _default_index = SearchIndex(path)
+    return _default_index
@@ -0,0 +1,199 @@
+"""Persistent cache of ``extract_from_path`` results.
+
+``sync``, ``discover --signals``, ``auto-tag``, ``signals`` and the dashboard
+re-extract the same, mostly unchanged, trajectories over and over.  Each
+result is cached in a small SQLite database keyed by the trajectory path and
+validated against its size, mtime and the extractor version, so unchanged
+sessions skip parsing entirely.
+
+The extractor version combines :data:`~gptme_sessions.signals.EXTRACTOR_VERSION`
+with a digest of the source of the extractor modules (``signals`` and the
+``deliverables`` helpers it calls), so any change to the extractor code
+invalidates old entries without a manual bump.  ``sync --signals`` prunes
+entries for deleted or rewritten trajectories at the end of each pass.
+
+Cached results also freeze the few lookups that shell out to ``git``/``gh``
+(e.g. resolving merge SHAs); run with ``--no-cache`` to refresh those.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+from collections.abc import Callable
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS signal_cache (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    version TEXT NOT NULL,
+    result TEXT NOT NULL
+)
+"""
+
+_extractor_version: str | None = None
+
+
+def _default_cache_dir() -> Path:
+    """Return the default cache directory (XDG-compliant).
+
+    Checks ``GPTME_SESSIONS_CACHE_DIR`` first, then ``$XDG_CACHE_HOME/gptme-sessions``
+    (``~/.cache/gptme-sessions/``).
+    """
+    env_dir = os.environ.get("GPTME_SESSIONS_CACHE_DIR")
+    if env_dir:
+        return Path(env_dir)
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    return (Path(xdg) if xdg else Path.home() / ".cache") / "gptme-sessions"
+
+
+def extractor_version() -> str:
+    """Version string of the signal extractor, used to invalidate cache entries."""
+    global _extractor_version
+    if _extractor_version is None:
+        from . import deliverables, signals
+
+        # Every module whose code shapes the extracted result
+        digest = hashlib.sha256()
+        for source in (signals.__file__, deliverables.__file__):
+            digest.update(Path(source).read_bytes())
+        _extractor_version = f"{signals.EXTRACTOR_VERSION}:{digest.hexdigest()[:16]}"
+    return _extractor_version
+
+
+class SignalCache:
+    """SQLite-backed cache of per-trajectory extraction results.
+
+    Safe to share between processes (WAL mode); every failure to read or
+    write the cache degrades to a plain extraction.
+
+    Args:
+        cache_dir: Directory holding ``signals.db``.
+            Defaults to ``~/.cache/gptme-sessions/`` (or ``GPTME_SESSIONS_CACHE_DIR``).
+    """
+
+    def __init__(self, cache_dir: Path | None = None):
+        if cache_dir is None:
+            cache_dir = _default_cache_dir()
+        self.cache_dir = cache_dir
+        self.path = cache_dir / "signals.db"
+        self._conn: sqlite3.Connection | None = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Lazy database connection (creates the schema on first use)."""
+        if self._conn is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            conn.execute(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @staticmethod
+    def _stamp(path: Path) -> tuple[str, int, int]:
+        st = path.stat()
+        return str(path.resolve()), st.st_size, st.st_mtime_ns
+
+    def get(self, path: Path) -> dict | None:
+        """Cached result for ``path``, or None if missing or stale."""
+        try:
+            key, size, mtime_ns = self._stamp(path)
+            row = self.conn.execute(
+                "SELECT result FROM signal_cache"
+                " WHERE path = ? AND size = ? AND mtime_ns = ? AND version = ?",
+                (key, size, mtime_ns, extractor_version()),
+            ).fetchone()
+        except (OSError, sqlite3.Error) as e:
+            logger.debug("Signal cache lookup failed for %s: %s", path, e)
+            return None
+        if row is None:
+            return None
+        result: dict = json.loads(row[0])
+        return result
+
+    def put(self, path: Path, result: dict, stamp: tuple[str, int, int] | None = None) -> None:
+        """Store ``result`` for ``path`` (replacing any older entry).
+
+        Results that do not survive a JSON round-trip unchanged are not
+        cached, so a cache hit always equals a fresh extraction.  Pass the
+        ``stamp`` taken *before* extracting so a file that changed during
+        extraction is re-read next time.
+        """
+        try:
+            encoded = json.dumps(result)
+            if json.loads(encoded) != result:
+                return
+            key, size, mtime_ns = stamp or self._stamp(path)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO signal_cache (path, size, mtime_ns, version, result)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, size, mtime_ns, extractor_version(), encoded),
+            )
+        except (OSError, TypeError, ValueError, sqlite3.Error) as e:
+            logger.debug("Signal cache write failed for %s: %s", path, e)
+
+    def get_or_extract(self, path: Path, extract: Callable[[Path], dict]) -> dict:
+        """Return the cached result for ``path``, extracting and caching on a miss."""
+        cached = self.get(path)
+        if cached is not None:
+            return cached
+        try:
+            stamp: tuple[str, int, int] | None = self._stamp(path)
+        except OSError:
+            stamp = None
+        result = extract(path)
+        if stamp is not None:
+            self.put(path, result, stamp)
+        return result
+
+    def prune(self) -> int:
+        """Drop entries that can no longer be hit.
+
+        That is entries for deleted files, files rewritten since they were
+        cached, or older extractor versions.  Returns the number of entries
+        removed (0 if the cache cannot be read).
+        """
+        try:
+            stale = []
+            rows = self.conn.execute("SELECT path, size, mtime_ns, version FROM signal_cache")
+            for path, size, mtime_ns, version in rows.fetchall():
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    stale.append(path)
+                    continue
+                current = (st.st_size, st.st_mtime_ns)
+                if version != extractor_version() or current != (size, mtime_ns):
+                    stale.append(path)
+            self.conn.executemany("DELETE FROM signal_cache WHERE path = ?", ((p,) for p in stale))
+        except sqlite3.Error as e:
+            logger.debug("Signal cache prune failed: %s", e)
+            return 0
+        return len(stale)
+
+
+_default_cache: SignalCache | None = None
+
+
+def default_cache() -> SignalCache:
+    """Process-wide cache in the default cache directory."""
+    global _default_cache
+    cache_dir = _default_cache_dir()
+    if _default_cache is None or _default_cache.cache_dir != cache_dir:
+        _default_cache = SignalCache(cache_dir)
+    return _default_cache
@@ -20,11 +20,17 @@ import json
 import os
 import re
 import subprocess
+from collections.abc import Iterable, Iterator
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
 
 from .deliverables import build_deliverable_detail, project_deliverable_details
 
+# Bump when extract_from_path output changes without a change to this module
+# (e.g. a dependency's behaviour); cached results from other versions are ignored.
+EXTRACTOR_VERSION = 1
+
 # Regex for git commit lines in shell output (works for both harnesses)
 _COMMIT_RE = re.compile(r"\[(?:master|main|[a-zA-Z0-9_/-]+)\s+([0-9a-f]{7,12})\]\s+(.+?)(?:\n|$)")
 
@@ -32,7 +38,11 @@ _COMMIT_RE = re.compile(r"\[(?:master|main|[a-zA-Z0-9_/-]+)\s+([0-9a-f]{7,12})\]
 # Note: gptme has a "patch" tool but Claude Code does not — no "Patch" here
 _CC_WRITE_TOOLS = {"Write", "Edit", "NotebookEdit"}
 
-_WARNING_PHRASE_RE = re.compile(r"error:|\bfailed\b|\bfailures?\b|\btraceback\b|\bexception\b")
+# Applied to lowercased output.  The leading lookahead lets the scanner skip
+# positions that cannot start any phrase instead of trying every alternative.
+_WARNING_PHRASE_RE = re.compile(
+    r"(?=[eft])(?:error:|\bfailed\b|\bfailures?\b|\btraceback\b|\bexception\b)"
+)
 
 # Regex to detect background bash task output file paths in CC sessions.
 # When CC runs a Bash command in background mode, the tool result contains:
@@ -205,19 +215,43 @@ _GH_ISSUE_CREATE_CMD_RE = re.compile(r"\bgh\s+issue\s+create\b")
 _CI_FAILURE_LOG_CMD_RE = re.compile(r"gh\s+run\s+view\b.*--log-failed")
 
 
-def parse_trajectory(jsonl_path: Path) -> list[dict]:
-    """Parse a JSONL trajectory file into a list of records."""
-    msgs = []
+def iter_trajectory(jsonl_path: Path) -> Iterator[dict]:
+    """Yield the records of a JSONL trajectory file one at a time.
+
+    Blank and malformed lines are skipped, as in :func:`parse_trajectory`.
+    """
     with open(jsonl_path, encoding="utf-8") as f:
         for line in f:
             line = line.strip()
             if not line:
                 continue
             try:
-                msgs.append(json.loads(line))
+                yield json.loads(line)
             except json.JSONDecodeError:
                 continue
-    return msgs
+
+
+def parse_trajectory(jsonl_path: Path) -> list[dict]:
+    """Parse a JSONL trajectory file into a list of records."""
+    return list(iter_trajectory(jsonl_path))
+
+
+def _detect_format_from_first(first: dict) -> str | None:
+    """Formats identified by their first record alone (Codex, Copilot, Grok Build)."""
+    # Codex: first line is always session_meta
+    if first.get("type") == "session_meta":
+        payload = first.get("payload") or {}
+        if payload.get("originator") in ("codex_exec", "codex_interactive"):
+            return "codex"
+    # Copilot: first line is always session.start
+    if first.get("type") == "session.start":
+        data = first.get("data") or {}
+        if data.get("producer") == "copilot-agent":
+            return "copilot"
+    # Grok Build: first line is always available_commands capability broadcast
+    if first.get("type") == "available_commands":
+        return "grok"
+    return None
 
 
 def _detect_format(msgs: list[dict]) -> str:
@@ -236,20 +270,9 @@ def _detect_format(msgs: list[dict]) -> str:
     begin with non-standard record types like 'queue-operation' or 'system_prompt'.
     """
     if msgs:
-        first = msgs[0]
-        # Codex: first line is always session_meta
-        if first.get("type") == "session_meta":
-            payload = first.get("payload") or {}
-            if payload.get("originator") in ("codex_exec", "codex_interactive"):
-                return "codex"
-        # Copilot: first line is always session.start
-        if first.get("type") == "session.start":
-            data = first.get("data") or {}
-            if data.get("producer") == "copilot-agent":
-                return "copilot"
-        # Grok Build: first line is always available_commands capability broadcast
-        if first.get("type") == "available_commands":
-            return "grok"
+        fmt = _detect_format_from_first(msgs[0])
+        if fmt is not None:
+            return fmt
 
     for msg in msgs:
         if "role" in msg:
@@ -259,6 +282,26 @@ def _detect_format(msgs: list[dict]) -> str:
     return "gptme"  # default
 
 
+def _sniff_format(records: Iterator[dict]) -> tuple[str, list[dict]]:
+    """Detect the format of a record stream, consuming only as much as needed.
+
+    Returns the format (same as :func:`_detect_format` on the whole stream)
+    and the records consumed to decide it; the rest are left in ``records``.
+    """
+    prefix: list[dict] = []
+    for record in records:
+        prefix.append(record)
+        if len(prefix) == 1:
+            fmt = _detect_format_from_first(record)
+            if fmt is not None:
+                return fmt, prefix
+        if "role" in record:
+            return "gptme", prefix
+        if record.get("type") in ("user", "assistant", "result"):
+            return "claude_code", prefix
+    return "gptme", prefix
+
+
 def detect_format(msgs: list[dict]) -> str:
     """Public alias for trajectory format detection.
 
@@ -601,7 +644,7 @@ def is_productive(signals: dict) -> bool:
     )
 
 
-def extract_signals_cc(msgs: list[dict]) -> dict:
+def extract_signals_cc(msgs: Iterable[dict]) -> dict:
     """Extract productivity signals from Claude Code .jsonl trajectories.
 
     CC format: each record has a top-level 'type' field.
@@ -613,6 +656,9 @@ def extract_signals_cc(msgs: list[dict]) -> dict:
     Errors: tool_result items with is_error=True.
     Git commits: detected from Bash tool output content via regex.
     GitHub interactions: detected from Bash tool input commands (gh pr review, etc.).
+
+    Makes a single pass over ``msgs``, which may be a lazy record stream
+    (see :func:`iter_trajectory`); only the running accumulators are kept.
     """
     tool_calls: dict[str, int] = {}
     error_count = 0
@@ -622,7 +668,10 @@ def extract_signals_cc(msgs: list[dict]) -> dict:
     file_writes: list[str] = []
     journal_paths: list[str] = []
     retry_candidates: list[str] = []
-    timestamps: list[datetime] = []
+    # Running bounds instead of a list of every timestamp (ties keep the first,
+    # as max()/min() would)
+    ts_first: datetime | None = None
+    ts_last: datetime | None = None
     steps = 0  # number of assistant turns that yielded to await tool results
     recent_sigs: list[str] = []
     # Map tool_use id → tool name for filtering commit detection to Bash only
@@ -668,7 +717,10 @@ def extract_signals_cc(msgs: list[dict]) -> dict:
         # Parse top-level timestamp (present on user/assistant/result records)
         ts = _parse_timestamp(record.get("timestamp", ""))
         if ts is not None:
-            timestamps.append(ts)
+            if ts_first is None or ts < ts_first:
+                ts_first = ts
+            if ts_last is None or ts > ts_last:
+                ts_last = ts
 
         if rec_type == "assistant":
             content = record.get("message", {}).get("content", [])
@@ -789,8 +841,8 @@ def extract_signals_cc(msgs: list[dict]) -> dict:
                             # Resolve common shell date expansions using
                             # trajectory timestamps (more reliable than wall clock).
                             # Handle both $(date ...) and \$(date ...) (escaped in heredocs).
-                            if "$(" in jpath and timestamps:
-                                latest_ts = max(timestamps)
+                            if "$(" in jpath and ts_last is not None:
+                                latest_ts = ts_last
                                 for pattern_str, replacement in [
                                     ("$(date +%Y-%m-%d)", latest_ts.strftime("%Y-%m-%d")),
                                     ("$(date +%H%M)", latest_ts.strftime("%H%M")),
@@ -802,7 +854,7 @@ def extract_signals_cc(msgs: list[dict]) -> dict:
                             # to avoid picking a different session's journal.
                             if "${" in jpath:
                                 pattern = re.sub(r"\$\{[^}]+\}", "*", jpath)
-                                session_end = max(timestamps).timestamp() if timestamps else 0
+                                session_end = ts_last.timestamp() if ts_last else 0
                                 matches = sorted(
                                     _glob.glob(pattern),
                                     key=lambda p: (
@@ -1015,8 +1067,8 @@ def extract_signals_cc(msgs: list[dict]) -> dict:
                             _ci_failure_found = True
 
     duration_s = 0
-    if len(timestamps) >= 2:
-        duration_s = int((max(timestamps) - min(timestamps)).total_seconds())
+    if ts_first is not None and ts_last is not None:
+        duration_s = int((ts_last - ts_first).total_seconds())
 
     # ci_fixed: True when the session investigated CI failures (--log-failed returned
     # non-empty output) AND produced commits (agent actually fixed the failure).
@@ -1339,7 +1391,7 @@ def extract_timings_gptme(msgs: list[dict]) -> dict:
     return result
 
 
-def extract_usage_cc(msgs: list[dict]) -> dict:
+def extract_usage_cc(msgs: Iterable[dict]) -> dict:
     """Extract cumulative token usage from a Claude Code trajectory.
 
     Handles two CC trajectory formats:
@@ -1360,19 +1412,39 @@ def extract_usage_cc(msgs: list[dict]) -> dict:
 
     Returns an empty dict if no usage data is found.
     """
-    # Accumulate per-turn metrics from assistant records regardless of format.
-    # Bulk token counts (input/output/cache) are overridden by the result
-    # message when present (stream-json format).
-    per_turn_input = 0
-    per_turn_output = 0
-    per_turn_cache_creation = 0
-    per_turn_cache_read = 0
-    model: str | None = None
-    sys_prompt_tokens: int | None = None
-    context_peak_tokens: int | None = None
-    result_usage: dict | None = None
-
+    acc = _CCUsageAccumulator()
     for record in msgs:
+        acc.add(record)
+    return acc.result()
+
+
+class _CCUsageAccumulator:
+    """Incremental state for :func:`extract_usage_cc`, fed one record at a time.
+
+    Lets the streaming extractor compute usage in the same pass over the
+    trajectory as :func:`extract_signals_cc` (see :meth:`passthrough`).
+    """
+
+    def __init__(self) -> None:
+        # Accumulate per-turn metrics from assistant records regardless of format.
+        # Bulk token counts (input/output/cache) are overridden by the result
+        # message when present (stream-json format).
+        self.per_turn_input = 0
+        self.per_turn_output = 0
+        self.per_turn_cache_creation = 0
+        self.per_turn_cache_read = 0
+        self.model: str | None = None
+        self.sys_prompt_tokens: int | None = None
+        self.context_peak_tokens: int | None = None
+        self.result_usage: dict | None = None
+
+    def passthrough(self, records: Iterable[dict]) -> Iterator[dict]:
+        """Yield ``records`` unchanged, adding each one to the accumulator."""
+        for record in records:
+            self.add(record)
+            yield record
+
+    def add(self, record: dict) -> None:
         rec_type = record.get("type")
 
         if rec_type == "assistant":
@@ -1384,20 +1456,20 @@ def extract_usage_cc(msgs: list[dict]) -> dict:
             turn_cache_read = _as_int(usage.get("cache_read_input_tokens")) or 0
             turn_context = turn_input + turn_cache_create + turn_cache_read
 
-            per_turn_input += turn_input
-            per_turn_output += turn_output
-            per_turn_cache_creation += turn_cache_create
-            per_turn_cache_read += turn_cache_read
-            if usage and sys_prompt_tokens is None:
-                sys_prompt_tokens = turn_context
+            self.per_turn_input += turn_input
+            self.per_turn_output += turn_output
+            self.per_turn_cache_creation += turn_cache_create
+            self.per_turn_cache_read += turn_cache_read
+            if usage and self.sys_prompt_tokens is None:
+                self.sys_prompt_tokens = turn_context
             if usage:
-                context_peak_tokens = (
+                self.context_peak_tokens = (
                     turn_context
-                    if context_peak_tokens is None
-                    else max(context_peak_tokens, turn_context)
+                    if self.context_peak_tokens is None
+                    else max(self.context_peak_tokens, turn_context)
                 )
             if msg.get("model"):
-                model = msg["model"]
+                self.model = msg["model"]
 
         elif rec_type == "result":
             # Stream-json format: result record has correct cumulative totals.
@@ -1406,8 +1478,8 @@ def extract_usage_cc(msgs: list[dict]) -> dict:
             # representing one sub-session's cumulative totals.
             r_usage = record.get("usage") or {}
             if r_usage:
-                if result_usage is None:
-                    result_usage = {}
+                if self.result_usage is None:
+                    self.result_usage = {}
                 for key in (
                     "input_tokens",
                     "output_tokens",
@@ -1416,39 +1488,42 @@ def extract_usage_cc(msgs: list[dict]) -> dict:
                 ):
                     v = _as_int(r_usage.get(key))
                     if v is not None:
-                        result_usage[key] = (result_usage.get(key) or 0) + v
-
-    # Prefer result-message totals (stream-json) over summed assistant events.
-    # Fall back per-field to assistant-derived sums for absent/invalid counters
-    # so a partial result record doesn't zero out valid counts.
-    if result_usage:
-        input_tokens = _as_int(result_usage.get("input_tokens")) or per_turn_input
-        output_tokens = _as_int(result_usage.get("output_tokens")) or per_turn_output
-        cache_creation_tokens = (
-            _as_int(result_usage.get("cache_creation_input_tokens")) or per_turn_cache_creation
-        )
-        cache_read_tokens = (
-            _as_int(result_usage.get("cache_read_input_tokens")) or per_turn_cache_read
-        )
-    else:
-        input_tokens = per_turn_input
-        output_tokens = per_turn_output
-        cache_creation_tokens = per_turn_cache_creation
-        cache_read_tokens = per_turn_cache_read
-
-    total_tokens = input_tokens + output_tokens + cache_creation_tokens + cache_read_tokens
-    if total_tokens == 0 and model is None:
-        return {}
-    return {
-        "model": model,
-        "input_tokens": input_tokens,
-        "output_tokens": output_tokens,
-        "cache_creation_tokens": cache_creation_tokens,
-        "cache_read_tokens": cache_read_tokens,
-        "total_tokens": total_tokens,
-        "sys_prompt_tokens": sys_prompt_tokens,
-        "context_peak_tokens": context_peak_tokens,
-    }
+                        self.result_usage[key] = (self.result_usage.get(key) or 0) + v
+
+    def result(self) -> dict:
+        # Prefer result-message totals (stream-json) over summed assistant events.
+        # Fall back per-field to assistant-derived sums for absent/invalid counters
+        # so a partial result record doesn't zero out valid counts.
+        result_usage = self.result_usage
+        if result_usage:
+            input_tokens = _as_int(result_usage.get("input_tokens")) or self.per_turn_input
+            output_tokens = _as_int(result_usage.get("output_tokens")) or self.per_turn_output
+            cache_creation_tokens = (
+                _as_int(result_usage.get("cache_creation_input_tokens"))
+                or self.per_turn_cache_creation
+            )
+            cache_read_tokens = (
+                _as_int(result_usage.get("cache_read_input_tokens")) or self.per_turn_cache_read
+            )
+        else:
+            input_tokens = self.per_turn_input
+            output_tokens = self.per_turn_output
+            cache_creation_tokens = self.per_turn_cache_creation
+            cache_read_tokens = self.per_turn_cache_read
+
+        total_tokens = input_tokens + output_tokens + cache_creation_tokens + cache_read_tokens
+        if total_tokens == 0 and self.model is None:
+            return {}
+        return {
+            "model": self.model,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "cache_creation_tokens": cache_creation_tokens,
+            "cache_read_tokens": cache_read_tokens,
+            "total_tokens": total_tokens,
+            "sys_prompt_tokens": self.sys_prompt_tokens,
+            "context_peak_tokens": self.context_peak_tokens,
+        }
 
 
 def extract_signals_codex(msgs: list[dict]) -> dict:
@@ -2401,7 +2476,7 @@ def extract_usage_grok(msgs: list[dict]) -> dict:
     return {}
 
 
-def extract_from_path(jsonl_path: Path) -> dict:
+def extract_from_path(jsonl_path: Path, *, use_cache: bool = False) -> dict:
     """Parse trajectory and return signals + grade in one call.
 
     Auto-detects format: gptme, Claude Code, Codex, Copilot, or Grok Build.
@@ -2410,6 +2485,10 @@ def extract_from_path(jsonl_path: Path) -> dict:
 
     Accepts either a JSONL file path or a gptme session directory
     (containing ``conversation.jsonl``).
+
+    With ``use_cache=True`` the result is read from / written to the
+    persistent :mod:`~gptme_sessions.signal_cache`, so unchanged
+    trajectories are not re-parsed.
     """
     # gptme sessions are directories; resolve to the JSONL file inside
     if jsonl_path.is_dir():
@@ -2420,7 +2499,32 @@ def extract_from_path(jsonl_path: Path) -> dict:
             raise FileNotFoundError(
                 f"{jsonl_path} is a directory and does not contain conversation.jsonl"
             )
-    msgs = parse_trajectory(jsonl_path)
+    if use_cache:
+        from .signal_cache import default_cache
+
+        return default_cache().get_or_extract(jsonl_path, _extract_from_file)
+    return _extract_from_file(jsonl_path)
+
+
+def _extract_from_file(jsonl_path: Path) -> dict:
+    """Extract signals from a trajectory file.
+
+    Claude Code transcripts — the ones that grow to hundreds of MB — are
+    streamed: records are read line by line and folded into the signal and
+    usage accumulators in a single pass, never holding the full message list.
+    Other formats are parsed into a list and go through :func:`_extract_from_msgs`.
+    """
+    records = iter_trajectory(jsonl_path)
+    fmt, prefix = _sniff_format(records)
+    if fmt != "claude_code":
+        return _extract_from_msgs(prefix + list(records))
+    usage_acc = _CCUsageAccumulator()
+    signals = extract_signals_cc(usage_acc.passthrough(chain(prefix, records)))
+    return _summarize_extraction(fmt, signals, usage_acc.result())
+
+
+def _extract_from_msgs(msgs: list[dict]) -> dict:
+    """Extract signals from already-parsed trajectory records (any format)."""
     fmt = detect_format(msgs)
     if fmt == "claude_code":
         signals = extract_signals_cc(msgs)
@@ -2437,6 +2541,17 @@ def extract_from_path(jsonl_path: Path) -> dict:
     else:
         signals = extract_signals(msgs)
         usage = extract_usage_gptme(msgs)
+    result = _summarize_extraction(fmt, signals, usage)
+    # Attach per-step phase timings for gptme sessions (gptme/gptme#3436).
+    # Other formats don't carry per-message timing metadata so we skip them.
+    if fmt == "gptme":
+        timings = extract_timings_gptme(msgs)
+        if timings:
+            result["timings"] = timings
+    return result
+
+
+def _summarize_extraction(fmt: str, signals: dict, usage: dict) -> dict:
     inferred_category = infer_category(signals)
     grade = grade_signals(signals, category=inferred_category)
     result: dict = {
@@ -2448,10 +2563,4 @@ def extract_from_path(jsonl_path: Path) -> dict:
     }
     if usage:
         result["usage"] = usage
-    # Attach per-step phase timings for gptme sessions (gptme/gptme#3436).
-    # Other formats don't carry per-message timing metadata so we skip them.
-    if fmt == "gptme":
-        timings = extract_timings_gptme(msgs)
-        if timings:
-            result["timings"] = timings
     return result
@@ -0,0 +1,296 @@
+"""SqliteSessionStore — indexed SQLite backend for session records.
+
+The JSONL store parses every line on each ``query()``/``stats()`` call and
+rewrites the whole file for every upsert.  This backend keeps the same
+``SessionStore`` API but stores one row per session with the filterable
+fields in indexed columns, so queries only decode the matching records and
+``rewrite()``/``append()`` update rows in place.
+
+The full record is kept as JSON in the ``data`` column, so unknown/legacy
+fields round-trip exactly as they do through the JSONL store.  Use
+:meth:`SqliteSessionStore.import_jsonl` / :meth:`SqliteSessionStore.export_jsonl`
+to move records between the two formats.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+from collections.abc import Callable, Collection
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .record import SessionRecord, normalize_model
+from .store import SessionStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_FILE = "session-records.db"
+
+# Keep IN (...) lists below SQLite's host-parameter limit on older builds
+_SQL_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    session_id TEXT NOT NULL UNIQUE,
+    timestamp TEXT NOT NULL,
+    ts_epoch REAL,
+    model TEXT,
+    harness TEXT,
+    run_type TEXT,
+    outcome TEXT,
+    category TEXT,
+    project TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_ts ON sessions(ts_epoch);
+CREATE INDEX IF NOT EXISTS idx_sessions_model ON sessions(model);
+CREATE INDEX IF NOT EXISTS idx_sessions_harness ON sessions(harness);
+CREATE INDEX IF NOT EXISTS idx_sessions_outcome ON sessions(outcome);
+CREATE INDEX IF NOT EXISTS idx_sessions_category ON sessions(category);
+CREATE INDEX IF NOT EXISTS idx_sessions_project ON sessions(project);
+CREATE INDEX IF NOT EXISTS idx_sessions_run_type ON sessions(run_type);
+"""
+
+_UPSERT = """
+INSERT INTO sessions
+    (session_id, timestamp, ts_epoch, model, harness, run_type, outcome, category, project, data)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(session_id) DO UPDATE SET
+    timestamp = excluded.timestamp,
+    ts_epoch = excluded.ts_epoch,
+    model = excluded.model,
+    harness = excluded.harness,
+    run_type = excluded.run_type,
+    outcome = excluded.outcome,
+    category = excluded.category,
+    project = excluded.project,
+    data = excluded.data
+"""
+
+
+def _timestamp_epoch(timestamp: str) -> float | None:
+    """Parse a record timestamp the same way ``SessionStore.query`` does."""
+    try:
+        return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp()
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+def _row_values(record: SessionRecord) -> tuple:
+    return (
+        record.session_id,
+        record.timestamp,
+        _timestamp_epoch(record.timestamp),
+        record.model,
+        record.harness,
+        record.run_type,
+        record.outcome,
+        record.category,
+        record.project,
+        record.to_json(),
+    )
+
+
+class SqliteSessionStore(SessionStore):
+    """SQLite-backed store with the same API as :class:`SessionStore`.
+
+    Records keep their insertion order (upserts update rows in place), so
+    ``load_all()`` returns them in the order the JSONL store would.
+
+    Args:
+        sessions_dir: Directory containing the database.
+            Defaults to ``~/.local/share/gptme-sessions/`` (or ``GPTME_SESSIONS_DIR``).
+        db_file: Name of the SQLite file within sessions_dir.
+    """
+
+    def __init__(
+        self,
+        sessions_dir: Path | None = None,
+        db_file: str = DEFAULT_DB_FILE,
+    ):
+        super().__init__(sessions_dir=sessions_dir, sessions_file=db_file)
+        self._conn: sqlite3.Connection | None = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Lazy database connection (creates the schema on first use)."""
+        if self._conn is None:
+            self.sessions_dir.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), timeout=30.0, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA busy_timeout=30000")
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _upsert(self, records: list[SessionRecord]) -> None:
+        conn = self.conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(_UPSERT, (_row_values(r) for r in records))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def append(self, record: SessionRecord) -> Path:
+        """Insert a session record (replaces an existing row with the same ID)."""
+        self._upsert([record])
+        return self.path
+
+    def append_many(self, records: list[SessionRecord]) -> Path:
+        """Insert several records in one transaction."""
+        self._upsert(records)
+        return self.path
+
+    def rewrite(self, records: list[SessionRecord]) -> Path:
+        """Upsert ``records`` in place.
+
+        Same additive semantics as :meth:`SessionStore.rewrite`: rows not in
+        ``records`` are kept, and ``records`` wins for any shared session_id.
+        Only the given rows are written, inside one transaction.
+        """
+        self._upsert(records)
+        return self.path
+
+    def update_many(
+        self, session_ids: Collection[str], update: Callable[[SessionRecord], None]
+    ) -> set[str]:
+        """Apply ``update`` to the rows with these IDs and write back only those rows."""
+        wanted = list(dict.fromkeys(session_ids))
+        if not wanted or not self.path.exists():
+            return set()
+        conn = self.conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            records: list[SessionRecord] = []
+            for i in range(0, len(wanted), _SQL_CHUNK):
+                chunk = wanted[i : i + _SQL_CHUNK]
+                records.extend(
+                    self._decode(
+                        conn.execute(
+                            "SELECT data FROM sessions"
+                            f" WHERE session_id IN ({', '.join('?' * len(chunk))})",
+                            chunk,
+                        ).fetchall()
+                    )
+                )
+            for record in records:
+                update(record)
+            conn.executemany(_UPSERT, (_row_values(r) for r in records))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return {r.session_id for r in records}
+
+    def _decode(self, rows: list[tuple[str]]) -> list[SessionRecord]:
+        records = []
+        for (data,) in rows:
+            try:
+                records.append(SessionRecord.from_dict(json.loads(data)))
+            except (json.JSONDecodeError, TypeError, AttributeError):
+                continue
+        return records
+
+    def load_all(self) -> list[SessionRecord]:
+        """Load all session records in insertion order."""
+        if not self.path.exists():
+            return []
+        return self._decode(self.conn.execute("SELECT data FROM sessions ORDER BY seq").fetchall())
+
+    def query(
+        self,
+        model: str | None = None,
+        run_type: str | None = None,
+        category: str | None = None,
+        harness: str | None = None,
+        outcome: str | None = None,
+        since_days: float | None = None,
+        project: str | None = None,
+    ) -> list[SessionRecord]:
+        """Filter session records by criteria using the column indexes."""
+        if not self.path.exists():
+            return []
+        clauses: list[str] = []
+        params: list[object] = []
+        if model:
+            # Match raw or normalized names; aliases may have changed since the
+            # rows were written, so normalize the distinct raw values now.
+            raw_models = [
+                m
+                for (m,) in self.conn.execute("SELECT DISTINCT model FROM sessions")
+                if m == model or normalize_model(m) == model
+            ]
+            if not raw_models:
+                return []
+            clauses.append(f"model IN ({', '.join('?' * len(raw_models))})")
+            params.extend(raw_models)
+        for column, value in (
+            ("run_type", run_type),
+            ("category", category),
+            ("harness", harness),
+            ("outcome", outcome),
+        ):
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if project:
+            clauses.append("instr(project, ?) > 0")
+            params.append(project)
+        if since_days is not None:
+            clauses.append("ts_epoch >= ?")
+            params.append(datetime.now(timezone.utc).timestamp() - (since_days * 86400))
+        sql = "SELECT data FROM sessions"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY seq"
+        return self._decode(self.conn.execute(sql, params).fetchall())
+
+    def import_jsonl(self, jsonl_path: Path) -> int:
+        """Upsert every valid record from a JSONL store file.
+
+        Malformed lines are skipped (and logged).  Returns the number of
+        records imported.
+        """
+        records = []
+        skipped = 0
+        with open(jsonl_path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(SessionRecord.from_dict(json.loads(line)))
+                except (json.JSONDecodeError, TypeError, AttributeError):
+                    skipped += 1
+        if skipped:
+            logger.warning("Skipped %d malformed line(s) in %s", skipped, jsonl_path)
+        self._upsert(records)
+        return len(records)
+
+    def export_jsonl(self, jsonl_path: Path) -> int:
+        """Write all records to a JSONL file readable by :class:`SessionStore`.
+
+        Returns the number of records written.
+        """
+        records = self.load_all()
+        jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = jsonl_path.with_name(jsonl_path.name + ".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for record in records:
+                    f.write(record.to_json() + "\n")
+            tmp_path.replace(jsonl_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return len(records)
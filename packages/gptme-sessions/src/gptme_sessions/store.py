@@ -7,7 +7,7 @@ import logging
 import os
 import sys
 import uuid
-from collections.abc import Iterator
+from collections.abc import Callable, Collection, Iterable, Iterator
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
@@ -171,6 +171,16 @@ class SessionStore:
                 os.fsync(f.fileno())
         return self.path
 
+    def append_many(self, records: list[SessionRecord]) -> Path:
+        """Append several records with one lock, write and fsync."""
+        with self.lock():
+            self._repair_tail()
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("".join(record.to_json() + "\n" for record in records))
+                f.flush()
+                os.fsync(f.fileno())
+        return self.path
+
     def load_all(self) -> list[SessionRecord]:
         """Load all session records from the JSONL store."""
         if not self.path.exists():
@@ -235,25 +245,64 @@ class SessionStore:
                         except (json.JSONDecodeError, TypeError, AttributeError):
                             malformed_lines.append(raw)
 
-            tmp_path = self.path.with_name(
-                f"{self.path.name}.tmp.{os.getpid()}.{uuid.uuid4().hex[:8]}"
+            self._replace(
+                [
+                    *(record.to_json() for record in records),
+                    *(record.to_json() for record in extra_records),
+                    *malformed_lines,
+                ]
             )
-            try:
-                with open(tmp_path, "w", encoding="utf-8") as f:
-                    for record in records:
-                        f.write(record.to_json() + "\n")
-                    for record in extra_records:
-                        f.write(record.to_json() + "\n")
-                    for line in malformed_lines:
-                        f.write(line + "\n")
-                    f.flush()
-                    os.fsync(f.fileno())
-                tmp_path.replace(self.path)
-            except BaseException:
-                tmp_path.unlink(missing_ok=True)
-                raise
         return self.path
 
+    def update_many(
+        self, session_ids: Collection[str], update: Callable[[SessionRecord], None]
+    ) -> set[str]:
+        """Apply ``update`` to the stored records with these IDs and persist them.
+
+        Only the matching records are re-serialised; every other line
+        (malformed ones included) is copied through unchanged.  The store
+        lock is held across the read → update → replace cycle.  Returns the
+        session IDs that were found and updated.
+        """
+        wanted = set(session_ids)
+        updated: set[str] = set()
+        with self.lock():
+            if not wanted or not self.path.exists():
+                return updated
+            lines: list[str] = []
+            with open(self.path, encoding="utf-8") as f:
+                for raw in f:
+                    raw = raw.strip()
+                    if not raw:
+                        continue
+                    try:
+                        data = json.loads(raw)
+                        if data.get("session_id") in wanted:
+                            rec = SessionRecord.from_dict(data)
+                            update(rec)
+                            raw = rec.to_json()
+                            updated.add(rec.session_id)
+                    except (json.JSONDecodeError, TypeError, AttributeError):
+                        pass
+                    lines.append(raw)
+            if updated:
+                self._replace(lines)
+        return updated
+
+    def _replace(self, lines: Iterable[str]) -> None:
+        """Atomically replace the store file with ``lines`` (caller holds the lock)."""
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp.{os.getpid()}.{uuid.uuid4().hex[:8]}")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for line in lines:
+                    f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            tmp_path.replace(self.path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
     def query(
         self,
         model: str | None = None,
@@ -403,6 +452,24 @@ class SessionStore:
         return result
 
 
+def open_store(sessions_dir: Path | None = None) -> SessionStore:
+    """Open the session store for a directory with the configured backend.
+
+    ``GPTME_SESSIONS_BACKEND`` selects ``jsonl`` or ``sqlite`` explicitly.
+    Otherwise the SQLite backend is used when a ``session-records.db`` file
+    already exists (e.g. after ``gptme-sessions import-jsonl``), and the
+    JSONL store in every other case.
+    """
+    from .sqlite_store import DEFAULT_DB_FILE, SqliteSessionStore
+
+    if sessions_dir is None:
+        sessions_dir = _default_sessions_dir()
+    backend = os.environ.get("GPTME_SESSIONS_BACKEND", "").strip().lower()
+    if backend == "sqlite" or (backend != "jsonl" and (sessions_dir / DEFAULT_DB_FILE).exists()):
+        return SqliteSessionStore(sessions_dir=sessions_dir)
+    return SessionStore(sessions_dir=sessions_dir)
+
+
 def format_stats(stats: dict, out: TextIO = sys.stdout) -> None:
     """Pretty-print session statistics."""
     total = stats.get("total", 0)
@@ -0,0 +1,9 @@
+"""conftest.py for gptme-sessions tests."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_signal_cache(tmp_path, monkeypatch):
+    """Redirect the signal cache so tests never write to the real ~/.cache."""
+    monkeypatch.setenv("GPTME_SESSIONS_CACHE_DIR", str(tmp_path / "gptme-sessions-cache"))
@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import json
+import random
 import re
+import time
 from unittest.mock import MagicMock, patch
 
+import pytest
 
+from gptme_sessions import classification
 from gptme_sessions.classification import (
     Category,
     ClassificationResult,
@@ -14,9 +18,11 @@ from gptme_sessions.classification import (
     _extract_blockers,
     _extract_deliverables,
     _extract_sections,
+    _kw_pattern,
     _score_text,
     classify_by_keywords,
     classify_by_llm,
+    classify_many,
     classify_session,
     judge_and_classify,
     normalize_category,
@@ -774,3 +780,116 @@ class TestNormalizeCategory:
         result = normalize_category("bug-fix", categories=custom)
         # Should NOT return "code" since "code" is not in custom valid set
         assert result == "bug-fix"
+
+
+# ──────────────────────────────────────────────────────────────────────
+# Tests: batch classification (classify_many)
+# ──────────────────────────────────────────────────────────────────────
+
+_ALL_KEYWORDS = sorted(
+    {
+        kw
+        for cat in DEFAULT_CATEGORIES
+        for kw in cat.title_keywords
+        + cat.outcome_keywords
+        + cat.execution_keywords
+        + cat.deliverable_keywords
+    }
+)
+_FILLER = ["the", "prefix", "features", "Fixes", "PR", "#12", "(auth):", "tests", "-", "x"]
+
+
+def _random_journal(rng: random.Random) -> str:
+    def words(n: int) -> str:
+        return " ".join(rng.choice(_ALL_KEYWORDS + _FILLER * 3) for _ in range(n))
+
+    parts = [f"## {words(rng.randint(1, 6))}"]
+    if rng.random() < 0.5:
+        parts.append(f"outcome: {words(rng.randint(1, 4))}")
+    if rng.random() < 0.3:
+        parts.append(f"category: {rng.choice(['code', 'infra', 'bugfix', 'unknown'])}")
+    parts.append(f"### Execution\n{words(rng.randint(0, 40))}")
+    if rng.random() < 0.7:
+        parts.append("### Deliverables\n" + "\n".join(f"- {words(4)}" for _ in range(3)))
+    return "\n\n".join(parts)
+
+
+def _reference_scores(sections: dict[str, str], compiled: list) -> dict[str, float]:
+    """Category scores as computed before keyword precompilation."""
+
+    def score(text: str, keywords: list[str]) -> float:
+        if not text or not keywords:
+            return 0.0
+        text_lower = text.lower()
+        return sum(1.0 for kw in keywords if re.search(_kw_pattern(kw), text_lower))
+
+    scores: dict[str, float] = {}
+    for cat in DEFAULT_CATEGORIES:
+        if cat.name.startswith("noop"):
+            continue
+        combined = (
+            score(sections["title"], cat.title_keywords) * 3.0
+            + score(sections["outcome"], cat.outcome_keywords) * 2.0
+            + score(sections["deliverables"], cat.deliverable_keywords) * 2.0
+            + score(sections["execution"], cat.execution_keywords) * 1.5
+        )
+        if combined > 0:
+            scores[cat.name] = combined
+    return scores
+
+
+class TestClassifyMany:
+    def test_matches_classify_by_keywords(self) -> None:
+        rng = random.Random(0)
+        texts = [_random_journal(rng) for _ in range(200)] + [
+            SAMPLE_CODE_JOURNAL,
+            "",
+            "short",
+        ]
+        assert classify_many(texts) == [classify_by_keywords(t) for t in texts]
+
+    def test_category_scores_identical_to_uncompiled(self) -> None:
+        rng = random.Random(1)
+        compiled = classification._compile_categories(DEFAULT_CATEGORIES)
+        for _ in range(300):
+            sections = _extract_sections(_random_journal(rng))
+            expected = _reference_scores(sections, compiled)
+            assert repr(classification._keyword_scores(sections, compiled)) == repr(expected)
+
+    def test_custom_categories(self) -> None:
+        cats = [
+            Category(name="gardening", description="", title_keywords=["plant", "fix("]),
+            Category(name="noop-soft", description="", title_keywords=["plant"]),
+        ]
+        [result] = classify_many(["# Plant the fix(roses) bed\n" + "x" * 300], cats)
+        assert result.category == "gardening"
+        assert result == classify_by_keywords("# Plant the fix(roses) bed\n" + "x" * 300, cats)
+
+    def test_empty_corpus(self) -> None:
+        assert classify_many([]) == []
+
+
+@pytest.mark.slow
+def test_benchmark_classify_many() -> None:
+    """Keyword classification throughput before/after precompilation.
+
+    Run with ``pytest -m slow -s`` to see the numbers.
+    """
+    rng = random.Random(42)
+    texts = [_random_journal(rng) for _ in range(5000)]
+
+    with patch.object(classification, "_keyword_scores", _reference_scores):
+        start = time.perf_counter()
+        before = [classify_by_keywords(t) for t in texts]
+        before_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    after = classify_many(texts)
+    after_s = time.perf_counter() - start
+
+    print(
+        f"\n{len(texts)} journals: before {len(texts) / before_s:,.0f}/s,"
+        f" after {len(texts) / after_s:,.0f}/s ({before_s / after_s:.1f}x)"
+    )
+    assert after == before
+    assert after_s < before_s
@@ -1075,7 +1075,7 @@ class TestAutoTagCommand:
 
         monkeypatch.setattr(
             "gptme_sessions.cli.extract_from_path",
-            lambda _path: {
+            lambda _path, **_kwargs: {
                 "inferred_category": "code",
                 "file_writes": ["scripts/tool.py"],
                 "journal_paths": [],
@@ -1118,7 +1118,7 @@ class TestAutoTagCommand:
 
         monkeypatch.setattr(
             "gptme_sessions.cli.extract_from_path",
-            lambda _path: {
+            lambda _path, **_kwargs: {
                 "inferred_category": "code",
                 "file_writes": ["scripts/tool.py"],
                 "journal_paths": [],
@@ -1153,7 +1153,7 @@ class TestAutoTagCommand:
 
         monkeypatch.setattr(
             "gptme_sessions.cli.extract_from_path",
-            lambda _path: {
+            lambda _path, **_kwargs: {
                 "inferred_category": "code",
                 "file_writes": ["scripts/twitter/post.py"],
                 "journal_paths": [],
@@ -1431,6 +1431,133 @@ class TestDedupCommand:
         assert "https://github.com/org/repo/pull/2" in urls
 
 
+class TestFindDuplicateGroups:
+    """The sort-and-sweep grouping must match the original all-pairs union-find."""
+
+    @staticmethod
+    def _all_pairs(records: list[SessionRecord], *, min_overlap: float) -> list[list[str]]:
+        from gptme_sessions.cli import _overlap_ratio, _record_interval, _record_richness
+
+        by_harness: dict[str, list] = {}
+        for record in records:
+            interval = _record_interval(record)
+            if interval is not None:
+                by_harness.setdefault(record.harness or "unknown", []).append((record, interval))
+        groups = []
+        for items in by_harness.values():
+            parent = list(range(len(items)))
+
+            def find(x: int) -> int:
+                while parent[x] != x:
+                    x = parent[x]
+                return x
+
+            for i in range(len(items)):
+                for j in range(i + 1, len(items)):
+                    if _overlap_ratio(items[i][1], items[j][1]) >= min_overlap:
+                        parent[find(i)] = find(j)
+            clusters: dict[int, list[SessionRecord]] = {}
+            for idx in range(len(items)):
+                clusters.setdefault(find(idx), []).append(items[idx][0])
+            for members in clusters.values():
+                if len(members) >= 2:
+                    members.sort(key=_record_richness, reverse=True)
+                    groups.append([r.session_id for r in members])
+        return groups
+
+    @staticmethod
+    def _random_records(rng, n: int) -> list[SessionRecord]:
+        from datetime import datetime, timedelta, timezone
+
+        base = datetime(2026, 5, 1, tzinfo=timezone.utc)
+        records = []
+        for i in range(n):
+            start = base + timedelta(seconds=rng.choice([0, 60, 300]) * rng.randint(0, 40))
+            kind = rng.random()
+            kwargs: dict = {}
+            if kind < 0.1:
+                kwargs["end_time"] = start.isoformat()  # zero-length
+            elif kind < 0.7:
+                kwargs["end_time"] = (start + timedelta(seconds=rng.randint(1, 3600))).isoformat()
+            elif kind < 0.9:
+                kwargs["duration_seconds"] = rng.choice([0, 30, 600, 7200])
+            else:
+                kwargs["end_time"] = "not-a-date"
+            records.append(
+                SessionRecord(
+                    session_id=f"s{i}",
+                    harness=rng.choice(["claude-code", "gptme", "codex", None]),
+                    start_time=start.isoformat() if rng.random() > 0.05 else "garbage",
+                    category=rng.choice([None, "code", "triage"]),
+                    project=rng.choice([None, "/p"]),
+                    deliverables=["x"] * rng.randint(0, 2),
+                    **kwargs,
+                )
+            )
+        return records
+
+    @pytest.mark.parametrize("seed", range(20))
+    @pytest.mark.parametrize("min_overlap", [0.0, 0.3, 0.7, 0.9, 1.0])
+    def test_matches_all_pairs_union_find(self, seed: int, min_overlap: float) -> None:
+        import random
+
+        from gptme_sessions.cli import _find_duplicate_groups
+
+        records = self._random_records(random.Random(seed), 150)
+        got = [
+            [r.session_id for r in group]
+            for group in _find_duplicate_groups(records, min_overlap=min_overlap)
+        ]
+        assert got == self._all_pairs(records, min_overlap=min_overlap)
+
+    @pytest.mark.slow
+    def test_benchmark_scaling(self) -> None:
+        """Run with ``pytest -m slow -s`` to see the timings."""
+        import random
+        import time
+        from datetime import datetime, timedelta, timezone
+
+        from gptme_sessions.cli import _find_duplicate_groups
+
+        rng = random.Random(0)
+        base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        print()
+        for n in (1_000, 10_000, 100_000):
+            records = []
+            for i in range(n):
+                # ~one session every 10 minutes, with a near-copy every 20th
+                start = base + timedelta(minutes=10 * i, seconds=rng.randint(0, 60))
+                duration = rng.randint(60, 3000)
+                records.append(
+                    SessionRecord(
+                        session_id=f"s{i}",
+                        harness="claude-code",
+                        start_time=start.isoformat(),
+                        duration_seconds=duration,
+                    )
+                )
+                if i % 20 == 0:
+                    records.append(
+                        SessionRecord(
+                            session_id=f"d{i}",
+                            harness="claude-code",
+                            start_time=(start + timedelta(seconds=5)).isoformat(),
+                            duration_seconds=duration,
+                        )
+                    )
+            start_t = time.perf_counter()
+            groups = _find_duplicate_groups(records, min_overlap=0.8)
+            sweep = time.perf_counter() - start_t
+            line = f"{n:>7} records: sweep {sweep * 1000:8.1f}ms"
+            if n <= 1_000:
+                start_t = time.perf_counter()
+                expected = self._all_pairs(records, min_overlap=0.8)
+                line += f"  all-pairs {(time.perf_counter() - start_t) * 1000:8.1f}ms"
+                assert [[r.session_id for r in g] for g in groups] == expected
+            print(line)
+            assert len(groups) >= len(range(0, n, 20))
+
+
 class TestFmtSince:
     """Tests for _fmt_since: user-facing since-description formatting."""
 
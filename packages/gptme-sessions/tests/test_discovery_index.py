@@ -0,0 +1,180 @@
+"""Tests for gptme_sessions.discovery_index — persistent discovery index."""
+
+from __future__ import annotations
+
+import json
+import os
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from gptme_sessions import discovery_index
+from gptme_sessions.discovery import discover_cc_sessions, discover_copilot_sessions
+from gptme_sessions.discovery_index import DiscoveryIndex
+
+
+def _make_cc_session(project_dir: Path, name: str, ts: str) -> Path:
+    jsonl = project_dir / f"{name}.jsonl"
+    jsonl.write_text(
+        json.dumps({"type": "user", "timestamp": ts, "message": {"content": "hi"}}) + "\n"
+    )
+    return jsonl
+
+
+@pytest.fixture
+def cc_dir(tmp_path: Path) -> Path:
+    root = tmp_path / "projects"
+    for project, sessions in {
+        "-home-bob-a": [("a1", "2026-03-01T10:00:00Z"), ("a2", "2026-03-05T10:00:00Z")],
+        "-home-bob-b": [("b1", "2026-03-05T11:00:00Z"), ("b2", "2026-03-07T11:00:00Z")],
+        "-home-bob-old": [("o1", "2026-01-02T09:00:00Z")],
+    }.items():
+        (root / project).mkdir(parents=True)
+        for name, ts in sessions:
+            _make_cc_session(root / project, name, ts)
+    return root
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> DiscoveryIndex:
+    return DiscoveryIndex(tmp_path / "discovery.db")
+
+
+def _count_reads():
+    """Patch the first-timestamp reader and count calls."""
+    return patch.object(
+        discovery_index,
+        "_quick_datetime_from_jsonl",
+        wraps=discovery_index._quick_datetime_from_jsonl,
+    )
+
+
+@pytest.mark.parametrize(
+    "start,end",
+    [
+        (date(2026, 3, 5), date(2026, 3, 5)),
+        (date(2026, 3, 1), date(2026, 3, 31)),
+        (date(2025, 1, 1), date(2026, 12, 31)),
+        (date(2026, 2, 1), date(2026, 2, 2)),
+    ],
+)
+def test_indexed_discovery_matches_scan(
+    cc_dir: Path, index: DiscoveryIndex, start: date, end: date
+) -> None:
+    expected = discover_cc_sessions(start, end, cc_dir=cc_dir, min_size=0)
+    # Cold and warm index runs, plus a fresh instance reading the saved db
+    assert discover_cc_sessions(start, end, cc_dir=cc_dir, min_size=0, index=index) == expected
+    assert discover_cc_sessions(start, end, cc_dir=cc_dir, min_size=0, index=index) == expected
+    reloaded = DiscoveryIndex(index.path)
+    assert discover_cc_sessions(start, end, cc_dir=cc_dir, min_size=0, index=reloaded) == expected
+
+
+def test_min_size_uses_indexed_size(cc_dir: Path, index: DiscoveryIndex) -> None:
+    args = (date(2025, 1, 1), date(2026, 12, 31))
+    assert discover_cc_sessions(*args, cc_dir=cc_dir, index=index) == []
+    assert len(discover_cc_sessions(*args, cc_dir=cc_dir, min_size=0, index=index)) == 5
+
+
+def test_warm_index_reads_nothing(cc_dir: Path, index: DiscoveryIndex) -> None:
+    args = (date(2026, 3, 1), date(2026, 3, 31))
+    discover_cc_sessions(*args, cc_dir=cc_dir, min_size=0, index=index)
+
+    with _count_reads() as reader:
+        result = discover_cc_sessions(
+            *args, cc_dir=cc_dir, min_size=0, index=DiscoveryIndex(index.path)
+        )
+    assert reader.call_count == 0
+    assert [p.stem for p in result] == ["a1", "a2", "b1", "b2"]
+
+
+def test_unchanged_dir_skips_out_of_range_files(cc_dir: Path, index: DiscoveryIndex) -> None:
+    """Files known to start outside the range are not even stat'ed."""
+    discover_cc_sessions(date(2025, 1, 1), date(2026, 12, 31), cc_dir=cc_dir, index=index)
+
+    old_dir = cc_dir / "-home-bob-old"
+    assert index.candidates(old_dir, "*.jsonl", date(2026, 3, 1), date(2026, 3, 31)) == []
+    assert index.candidates(old_dir, "*.jsonl", date(2026, 1, 1), date(2026, 1, 31)) == [
+        old_dir / "o1.jsonl"
+    ]
+
+
+def test_new_file_picked_up(cc_dir: Path, index: DiscoveryIndex) -> None:
+    args = (date(2026, 3, 1), date(2026, 3, 31))
+    discover_cc_sessions(*args, cc_dir=cc_dir, min_size=0, index=index)
+
+    project = cc_dir / "-home-bob-old"
+    new = _make_cc_session(project, "o2", "2026-03-10T08:00:00Z")
+    # Make sure the directory mtime moves even on coarse-mtime filesystems
+    st = project.stat()
+    os.utime(project, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    with _count_reads() as reader:
+        result = discover_cc_sessions(*args, cc_dir=cc_dir, min_size=0, index=index)
+    assert new in result
+    assert reader.call_count == 1
+
+
+def test_changed_file_is_reindexed(cc_dir: Path, index: DiscoveryIndex) -> None:
+    path = cc_dir / "-home-bob-a" / "a1.jsonl"
+    assert index.start(path).date() == date(2026, 3, 1)  # type: ignore[union-attr]
+    assert index.cached(path, "model", lambda p: "opus") == "opus"
+
+    path.write_text(json.dumps({"timestamp": "2026-03-02T00:00:00Z", "pad": "x" * 50}) + "\n")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    assert index.start(path).date() == date(2026, 3, 2)  # type: ignore[union-attr]
+    # Lazily cached values are recomputed for the new contents
+    assert index.cached(path, "model", lambda p: "sonnet") == "sonnet"
+
+
+def test_cached_values_persist(cc_dir: Path, index: DiscoveryIndex) -> None:
+    path = cc_dir / "-home-bob-a" / "a2.jsonl"
+    assert index.cached(path, "project", lambda p: "/home/bob/a") == "/home/bob/a"
+    index.save()
+
+    def fail(p: Path) -> str:
+        raise AssertionError("should be cached")
+
+    assert DiscoveryIndex(index.path).cached(path, "project", fail) == "/home/bob/a"
+
+
+def test_missing_file(index: DiscoveryIndex, tmp_path: Path) -> None:
+    assert index.entry(tmp_path / "gone.jsonl") is None
+    assert index.start(tmp_path / "gone.jsonl") is None
+
+
+def test_corrupt_db_is_ignored(cc_dir: Path, tmp_path: Path) -> None:
+    db = tmp_path / "discovery.db"
+    db.write_bytes(b"not a database")
+    index = DiscoveryIndex(db)
+    result = discover_cc_sessions(
+        date(2026, 3, 5), date(2026, 3, 5), cc_dir=cc_dir, min_size=0, index=index
+    )
+    assert [p.stem for p in result] == ["a2", "b1"]
+
+
+def test_copilot_discovery_with_index(tmp_path: Path, index: DiscoveryIndex) -> None:
+    state = tmp_path / "copilot"
+    for uuid, ts in [("u1", "2026-03-05T10:00:00Z"), ("u2", "2026-03-04T10:00:00Z")]:
+        (state / uuid).mkdir(parents=True)
+        (state / uuid / "events.jsonl").write_text(json.dumps({"timestamp": ts}) + "\n")
+    (state / "no-events").mkdir()
+
+    args = (date(2026, 3, 5), date(2026, 3, 5))
+    expected = discover_copilot_sessions(*args, copilot_dir=state)
+    assert discover_copilot_sessions(*args, copilot_dir=state, index=index) == expected
+    with _count_reads() as reader:
+        assert discover_copilot_sessions(*args, copilot_dir=state, index=index) == expected
+    assert reader.call_count == 0
+
+
+def test_default_index_follows_cache_dir(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("GPTME_SESSIONS_CACHE_DIR", str(tmp_path / "c1"))
+    first = discovery_index.default_index()
+    assert first.path == tmp_path / "c1" / "discovery.db"
+    assert discovery_index.default_index() is first
+    monkeypatch.setenv("GPTME_SESSIONS_CACHE_DIR", str(tmp_path / "c2"))
+    assert discovery_index.default_index().path == tmp_path / "c2" / "discovery.db"
@@ -414,6 +414,21 @@ class TestJudgeSession:
         # The adjustment paragraph is always rendered (it self-skips when the
         # block is absent), so we don't assert its presence/absence here.
 
+    def test_judge_session_raise_errors_propagates_api_errors(self) -> None:
+        """raise_errors surfaces API failures but not a missing key."""
+        mock_anthropic = MagicMock()
+        mock_anthropic.Anthropic.return_value.messages.create.side_effect = RuntimeError(
+            "overloaded"
+        )
+
+        with patch.dict("sys.modules", {"anthropic": mock_anthropic}):
+            with patch("gptme_sessions.judge._get_api_key", return_value="test-key"):
+                assert judge_session("session text") is None
+                with pytest.raises(RuntimeError, match="overloaded"):
+                    judge_session("session text", raise_errors=True)
+            with patch("gptme_sessions.judge._get_api_key", return_value=""):
+                assert judge_session("session text", raise_errors=True) is None
+
     def test_parse_judge_payload_handles_think_tags_and_fences(self) -> None:
         parsed = _parse_judge_payload(
             """
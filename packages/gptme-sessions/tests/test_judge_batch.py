@@ -0,0 +1,322 @@
+"""Tests for concurrent batch judging (gptme_sessions.judge_batch)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from gptme_sessions.cli import cli
+from gptme_sessions.judge import JUDGE_VERSION
+from gptme_sessions.judge_batch import JudgeJob, RateLimiter, judge_many
+from gptme_sessions.record import SessionRecord
+from gptme_sessions.store import SessionStore
+
+
+class StubJudge:
+    """Local judge backend: sleeps, then returns a score derived from the text."""
+
+    def __init__(self, delay: float = 0.0, fail_first: int = 0, exc: BaseException | None = None):
+        self.delay = delay
+        self.fail_first = fail_first
+        self.exc = exc
+        self.calls: list[str] = []
+        self.active = self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(
+        self, text: str, *, category=None, goals="", model="", raise_errors=False
+    ) -> dict | None:
+        with self._lock:
+            self.calls.append(text)
+            attempt = self.calls.count(text)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            if attempt <= self.fail_first:
+                if self.exc is not None:
+                    raise self.exc
+                return None
+            return {"score": (len(text) % 10) / 10, "reason": f"stub {text}", "model": model}
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _jobs(n: int) -> list[JudgeJob]:
+    return [JudgeJob(session_id=f"s{i}", text="x" * i, category="code") for i in range(n)]
+
+
+def test_sequential_order_and_scores() -> None:
+    stub = StubJudge()
+    results = list(judge_many(_jobs(5), judge_fn=stub, model="stub/model"))
+    assert [job.session_id for job, _ in results] == ["s0", "s1", "s2", "s3", "s4"]
+    assert [v["score"] for _, v in results if v] == [0.0, 0.1, 0.2, 0.3, 0.4]
+    assert results[2][1] == {"score": 0.2, "reason": "stub xx", "model": "stub/model"}
+
+
+@pytest.mark.parametrize("concurrency", [2, 4, 8])
+def test_concurrent_results_match_sequential(concurrency: int) -> None:
+    sequential = {job.session_id: v for job, v in judge_many(_jobs(20), judge_fn=StubJudge())}
+    stub = StubJudge(delay=0.01)
+    concurrent = {
+        job.session_id: v
+        for job, v in judge_many(_jobs(20), judge_fn=stub, concurrency=concurrency)
+    }
+    assert concurrent == sequential
+    assert stub.max_active <= concurrency
+
+
+def test_near_linear_speedup() -> None:
+    jobs = _jobs(16)
+    timings = {}
+    for n in (1, 2, 4, 8):
+        start = time.perf_counter()
+        list(judge_many(jobs, judge_fn=StubJudge(delay=0.05), concurrency=n))
+        timings[n] = time.perf_counter() - start
+    for n in (2, 4, 8):
+        # Ideal is n×; allow for scheduling overhead
+        assert timings[1] / timings[n] >= 0.7 * n, timings
+
+
+class StatusError(Exception):
+    """Stand-in for an SDK error carrying an HTTP status code."""
+
+    def __init__(self, status_code: int):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+def test_exceptions_are_retried_until_success() -> None:
+    stub = StubJudge(fail_first=2, exc=ConnectionResetError("connection reset"))
+    [(_, verdict)] = judge_many(_jobs(2)[1:], judge_fn=stub, retries=2, backoff=0)
+    assert verdict is not None
+    assert len(stub.calls) == 3
+
+
+def test_gives_up_after_retries() -> None:
+    stub = StubJudge(fail_first=10, exc=StatusError(529))
+    [(_, verdict)] = judge_many(_jobs(1), judge_fn=stub, retries=3, backoff=0)
+    assert verdict is None
+    assert len(stub.calls) == 4
+
+
+def _sdk_error(module: str, name: str) -> Exception:
+    """Instance of an exception class posing as ``module.name`` from an SDK."""
+    return type(name, (Exception,), {"__module__": module})("sdk error")
+
+
+@pytest.mark.parametrize(
+    ("stub", "calls"),
+    [
+        # Unavailable judge (no API key, missing package) or unusable reply
+        (StubJudge(fail_first=10), 1),
+        (StubJudge(fail_first=1, exc=StatusError(429)), 2),
+        (StubJudge(fail_first=1, exc=StatusError(503)), 2),
+        (StubJudge(fail_first=1, exc=_sdk_error("anthropic._exceptions", "APITimeoutError")), 2),
+        (StubJudge(fail_first=1, exc=_sdk_error("openai", "APIConnectionError")), 2),
+    ],
+    ids=["none-verdict", "rate-limited", "server-error", "sdk-timeout", "sdk-connection"],
+)
+def test_only_transient_failures_are_retried(stub: StubJudge, calls: int) -> None:
+    with patch("gptme_sessions.judge_batch.time.sleep") as sleep:
+        list(judge_many(_jobs(1), judge_fn=stub, retries=3))
+    assert len(stub.calls) == calls
+    assert sleep.call_count == calls - 1
+
+
+@pytest.mark.parametrize(
+    "exc",
+    [
+        StatusError(401),
+        ValueError("empty model content"),
+        IndexError("list index out of range"),
+        RuntimeError("ANTHROPIC_API_KEY not set"),
+        _sdk_error("somelib", "RateLimitError"),
+    ],
+    ids=["client-error", "value-error", "index-error", "runtime-error", "foreign-name"],
+)
+def test_permanent_failures_are_raised_without_retry(exc: Exception) -> None:
+    stub = StubJudge(fail_first=10, exc=exc)
+    with patch("gptme_sessions.judge_batch.time.sleep") as sleep:
+        with pytest.raises(type(exc)):
+            list(judge_many(_jobs(1), judge_fn=stub, retries=3))
+    assert len(stub.calls) == 1
+    sleep.assert_not_called()
+
+
+def test_backoff_is_jittered() -> None:
+    stub = StubJudge(fail_first=3, exc=TimeoutError("timeout"))
+    with patch("gptme_sessions.judge_batch.time.sleep") as sleep:
+        list(judge_many(_jobs(1), judge_fn=stub, retries=3, backoff=1.0))
+    delays = [c.args[0] for c in sleep.call_args_list]
+    assert len(delays) == 3
+    assert all(0 <= d <= 2**i for i, d in enumerate(delays))
+
+
+def test_rate_limit_applies_per_backend() -> None:
+    jobs = _jobs(11)
+    start = time.perf_counter()
+    list(
+        judge_many(
+            jobs,
+            judge_fn=StubJudge(),
+            model="claude-haiku-4-5",
+            concurrency=8,
+            rate_limits={"anthropic-direct": 50},
+        )
+    )
+    assert time.perf_counter() - start >= 10 / 50 * 0.9
+
+    # A limit on another backend does not slow this one down
+    start = time.perf_counter()
+    list(
+        judge_many(
+            jobs,
+            judge_fn=StubJudge(),
+            model="claude-haiku-4-5",
+            concurrency=8,
+            rate_limits={"gptme-fallback": 1},
+        )
+    )
+    assert time.perf_counter() - start < 0.5
+
+
+def test_rate_limiter_spacing() -> None:
+    limiter = RateLimiter(100)
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.acquire()
+    assert time.monotonic() - start >= 5 / 100 * 0.9
+    RateLimiter(None).acquire()  # unlimited: returns immediately
+
+
+def test_in_flight_jobs_are_bounded() -> None:
+    consumed = 0
+
+    def jobs() -> Iterator[JudgeJob]:
+        nonlocal consumed
+        for job in _jobs(50):
+            consumed += 1
+            yield job
+
+    for yielded, _ in enumerate(judge_many(jobs(), judge_fn=StubJudge(), concurrency=3), 1):
+        assert consumed - yielded <= 2 * 3
+
+
+# -- CLI ---------------------------------------------------------------------
+
+
+def _journal(tmp_path: Path, n: int) -> Path:
+    journal = tmp_path / "journal"
+    for i in range(n):
+        day = journal / f"2026-03-{1 + i // 10:02d}"
+        day.mkdir(parents=True, exist_ok=True)
+        (day / f"autonomous-session-s{i:03d}.md").write_text(
+            f"```yaml\ncategory: code\noutcome: productive\n```\nsession {i}\n"
+        )
+    return journal
+
+
+def _store(tmp_path: Path, n: int) -> Path:
+    sessions_dir = tmp_path / "sessions"
+    SessionStore(sessions_dir=sessions_dir).append_many(
+        [SessionRecord(session_id=f"s{i:03d}") for i in range(n)]
+    )
+    return sessions_dir
+
+
+def _invoke(sessions_dir: Path, journal: Path, stub: StubJudge, *args: str):
+    with patch("gptme_sessions.judge.judge_session", stub):
+        return CliRunner().invoke(
+            cli,
+            [
+                "--sessions-dir",
+                str(sessions_dir),
+                "judge",
+                "--journal-dir",
+                str(journal),
+                "--last",
+                "100",
+                "--update-store",
+                *args,
+            ],
+        )
+
+
+def test_cli_concurrent_judge_updates_store(tmp_path: Path) -> None:
+    journal, sessions_dir = _journal(tmp_path, 25), _store(tmp_path, 25)
+    result = _invoke(sessions_dir, journal, StubJudge(delay=0.01), "-c", "4", "--json")
+    assert result.exit_code == 0, result.output
+    assert "Updated 25 record(s)" in result.output
+
+    records = SessionStore(sessions_dir=sessions_dir).load_all()
+    assert all(r.llm_judge_score is not None for r in records)
+    assert records[0].llm_judge_meta["judge_version"] == JUDGE_VERSION
+
+
+def test_cli_checkpoints_write_only_scored_records(tmp_path: Path) -> None:
+    journal, sessions_dir = _journal(tmp_path, 25), _store(tmp_path, 25)
+    with open(sessions_dir / "session-records.jsonl", "a") as f:
+        f.write(SessionRecord(session_id="unrelated").to_json() + "\n")
+    with (
+        patch.object(SessionStore, "load_all", side_effect=AssertionError("full load")),
+        patch.object(SessionStore, "rewrite", side_effect=AssertionError("full rewrite")),
+    ):
+        result = _invoke(sessions_dir, journal, StubJudge())
+    assert result.exit_code == 0, result.output
+    assert "Updated 25 record(s)" in result.output
+
+
+def test_cli_does_not_retry_unavailable_judge(tmp_path: Path) -> None:
+    journal, sessions_dir = _journal(tmp_path, 3), _store(tmp_path, 3)
+    stub = StubJudge(fail_first=10)
+    with patch("gptme_sessions.judge_batch.time.sleep") as sleep:
+        result = _invoke(sessions_dir, journal, stub)
+    assert result.exit_code == 0, result.output
+    assert len(stub.calls) == 3
+    sleep.assert_not_called()
+
+
+def test_cli_resume_after_interruption(tmp_path: Path) -> None:
+    journal, sessions_dir = _journal(tmp_path, 30), _store(tmp_path, 30)
+
+    # Interrupt the run on the 25th session: the first checkpoint (20) is
+    # written mid-run and the rest scored so far are flushed on the way out.
+    class Interrupting(StubJudge):
+        def __call__(self, text: str, **kw) -> dict | None:
+            if len(self.calls) == 24:
+                raise KeyboardInterrupt
+            return super().__call__(text, **kw)
+
+    first = _invoke(sessions_dir, journal, Interrupting())
+    assert first.exit_code != 0
+    scored = {
+        r.session_id
+        for r in SessionStore(sessions_dir=sessions_dir).load_all()
+        if r.llm_judge_score is not None
+    }
+    assert scored == {f"s{i:03d}" for i in range(24)}
+
+    stub = StubJudge()
+    second = _invoke(sessions_dir, journal, stub, "--resume", "-c", "3")
+    assert second.exit_code == 0, second.output
+    assert "skipped 24 already-scored" in second.output
+    assert len(stub.calls) == 6
+    records = SessionStore(sessions_dir=sessions_dir).load_all()
+    assert all(r.llm_judge_score is not None for r in records)
+
+
+def test_cli_resume_requires_update_store(tmp_path: Path) -> None:
+    result = CliRunner().invoke(
+        cli, ["judge", "--journal-dir", str(_journal(tmp_path, 1)), "--resume"]
+    )
+    assert result.exit_code != 0
+    assert "--resume requires --update-store" in result.output
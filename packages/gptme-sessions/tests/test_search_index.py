@@ -0,0 +1,306 @@
+"""Tests for the persistent search index (gptme_sessions.search_index)."""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import re
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from gptme_sessions.search import _match_transcript, search_sessions
+from gptme_sessions.search_index import SearchIndex, _fold, _query_runs, _stamp
+from gptme_sessions.transcript import NormalizedMessage, SessionTranscript
+
+WORDS = [
+    "module", "modules", "not", "found", "error", "cors", "bug", "debugging",
+    "fix", "prefix", "test", "tests", "retest", "src/app.py", "import", "foo_bar",
+    "Foo", "BAR", "a", "x", "CORS-bug", "path", "héllo", "naïve",
+    "İstanbul", "istanbul", "ΟΣΤΟ", "λόγος", "µs", "μs", "ſtop", "ﬆ", "straße",
+]  # fmt: skip
+QUERIES = [
+    "module", "module not found", "odule not fou", "bug", "BUG", "cors bug", "CORS-bug",
+    "fix", "test", "tests", "src/app.py", "app.py", "foo_bar", "o_b", "Foo BAR", "héllo",
+    "not", "-", " ", "x x", "a a a", "nonexistent", "found error",
+    "İstanbul", "ISTANBUL", "ΟΣ", "ΛΌΓΟΣ", "μs", "µS", "stop", "ﬅ", "STRASSE", "ı",
+]  # fmt: skip
+# Characters whose re.IGNORECASE matches str.lower() gets wrong
+TRICKY = "iIıİsSſkKKσςΣµμΜθϑ\u0345ι\u1fbe\u0390\u1fd3\u03b0\u1fe3\ufb05\ufb06ßẞ -"
+
+
+def _write_cc(path: Path, texts: list[tuple[str, str]], ts: str | None) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    records = []
+    for role, text in texts:
+        record: dict = {
+            "type": role,
+            "message": {"role": role, "content": [{"type": "text", "text": text}]},
+        }
+        if ts is not None:
+            record["timestamp"] = ts
+        records.append(record)
+    path.write_text("\n".join(json.dumps(r) for r in records) + "\n")
+    return path
+
+
+def _random_corpus(root: Path, n: int, seed: int = 0) -> list[Path]:
+    rng = random.Random(seed)
+    paths = []
+    for i in range(n):
+        texts = [
+            (rng.choice(["user", "assistant"]), " ".join(rng.choices(WORDS, k=rng.randint(1, 25))))
+            for _ in range(rng.randint(1, 4))
+        ]
+        # Few distinct timestamps so ties on start time (and hit count) are common
+        ts = None if i % 11 == 0 else f"2026-03-0{rng.randint(1, 4)}T10:00:00Z"
+        paths.append(_write_cc(root / f"s{i:03d}.jsonl", texts, ts))
+    return paths
+
+
+@contextmanager
+def _discovered(paths: list[Path]):
+    with (
+        patch("gptme_sessions.search.discover_gptme_sessions", return_value=[]),
+        patch("gptme_sessions.search.discover_cc_sessions", return_value=paths),
+        patch("gptme_sessions.search.discover_codex_sessions", return_value=[]),
+        patch("gptme_sessions.search.discover_copilot_sessions", return_value=[]),
+    ):
+        yield
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> Iterator[SearchIndex]:
+    idx = SearchIndex(tmp_path / "search.db")
+    yield idx
+    idx.close()
+
+
+@pytest.mark.parametrize("case_sensitive", [False, True])
+@pytest.mark.parametrize("max_results", [1, 5, 1000])
+def test_index_matches_linear_scan(
+    tmp_path: Path, index: SearchIndex, case_sensitive: bool, max_results: int
+) -> None:
+    paths = _random_corpus(tmp_path / "cc", 120)
+    with _discovered(paths):
+        for query in QUERIES:
+            kwargs = dict(max_results=max_results, case_sensitive=case_sensitive)
+            expected = search_sessions(query, **kwargs)
+            assert search_sessions(query, search_index=index, **kwargs) == expected, query
+
+
+def test_index_matches_linear_scan_non_ascii(tmp_path: Path, index: SearchIndex) -> None:
+    rng = random.Random(7)
+    paths = [
+        _write_cc(
+            tmp_path / "cc" / f"s{i:03d}.jsonl",
+            [("user", "".join(rng.choices(TRICKY, k=rng.randint(1, 12))))],
+            f"2026-03-0{rng.randint(1, 4)}T10:00:00Z",
+        )
+        for i in range(80)
+    ]
+    with _discovered(paths):
+        for _ in range(150):
+            query = "".join(rng.choices(TRICKY, k=rng.randint(1, 4)))
+            expected = search_sessions(query, max_results=1000)
+            assert search_sessions(query, max_results=1000, search_index=index) == expected, query
+
+
+def test_fold_agrees_with_ignorecase() -> None:
+    for a in TRICKY:
+        for b in TRICKY:
+            if re.fullmatch(re.escape(a), b, re.IGNORECASE):
+                assert _fold(a) == _fold(b), (a, b)
+            assert len(_fold(a)) == 1
+
+
+def test_index_rebuilt_on_version_change(tmp_path: Path, index: SearchIndex) -> None:
+    paths = _random_corpus(tmp_path / "cc", 5)
+    index.update(paths)
+    index.conn.execute("PRAGMA user_version = 1")
+    index.close()
+
+    reopened = SearchIndex(index.path)
+    assert len(reopened) == 0
+    assert reopened.update(paths) == 5
+    reopened.close()
+
+
+def test_index_matches_linear_scan_with_file_filter(tmp_path: Path, index: SearchIndex) -> None:
+    paths = _random_corpus(tmp_path / "cc", 60, seed=1)
+    with _discovered(paths):
+        for query in ["module", "fix", "-"]:
+            expected = search_sessions(query, file_path="src/app.py")
+            assert search_sessions(query, file_path="src/app.py", search_index=index) == expected
+
+
+def test_update_is_incremental(tmp_path: Path, index: SearchIndex) -> None:
+    paths = _random_corpus(tmp_path / "cc", 20)
+    assert index.update(paths) == 20
+    assert index.update(paths) == 0
+
+    changed = _write_cc(paths[3], [("user", "brand new zebra content")], "2026-03-09T10:00:00Z")
+    st = changed.stat()
+    os.utime(changed, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    added = _write_cc(tmp_path / "cc" / "new.jsonl", [("user", "zebra")], "2026-03-08T00:00:00Z")
+    assert index.update([*paths, added]) == 2
+
+    pattern = re.compile("zebra", re.IGNORECASE)
+    results = index.search([*paths, added], pattern, "zebra")
+    assert [r.path for r in results] == [str(changed), str(added)]
+    # The old contents of the rewritten file are gone from the postings
+    assert all(r.path != str(changed) for r in index.search(paths, re.compile("module"), "module"))
+
+
+def test_index_persists_across_instances(tmp_path: Path, index: SearchIndex) -> None:
+    paths = _random_corpus(tmp_path / "cc", 10)
+    index.update(paths)
+    index.close()
+
+    reopened = SearchIndex(index.path)
+    assert reopened.update(paths) == 0
+    assert len(reopened) == 10
+    pattern = re.compile("module", re.IGNORECASE)
+    with _discovered(paths):
+        assert reopened.search(paths, pattern, "module", max_results=50) == search_sessions(
+            "module", max_results=50
+        )
+    reopened.close()
+
+
+def test_unreadable_and_missing_paths_are_skipped(tmp_path: Path, index: SearchIndex) -> None:
+    good = _write_cc(tmp_path / "good.jsonl", [("user", "needle")], "2026-03-01T00:00:00Z")
+    bad = tmp_path / "2026-03-01-empty-session"
+    bad.mkdir()  # gptme session dir without conversation.jsonl
+    missing = tmp_path / "missing.jsonl"
+    index.update([good, bad, missing])
+    results = index.search([good, bad, missing], re.compile("needle"), "needle")
+    assert [r.path for r in results] == [str(good)]
+
+
+def test_search_only_covers_given_paths(tmp_path: Path, index: SearchIndex) -> None:
+    a = _write_cc(tmp_path / "a.jsonl", [("user", "needle")], "2026-03-01T00:00:00Z")
+    b = _write_cc(tmp_path / "b.jsonl", [("user", "needle")], "2026-03-02T00:00:00Z")
+    index.update([a, b])
+    assert [r.path for r in index.search([a], re.compile("needle"), "needle")] == [str(a)]
+
+
+def test_bm25_ranks_by_relevance(tmp_path: Path) -> None:
+    dense = _write_cc(
+        tmp_path / "dense.jsonl", [("user", "cors bug cors bug cors")], "2026-03-01T00:00:00Z"
+    )
+    sparse = _write_cc(
+        tmp_path / "sparse.jsonl",
+        [("user", "cors " + " ".join(["filler"] * 40))],
+        "2026-03-05T00:00:00Z",
+    )
+    other = _write_cc(tmp_path / "other.jsonl", [("user", "unrelated")], "2026-03-06T00:00:00Z")
+    with _discovered([dense, sparse, other]):
+        recent = search_sessions("cors")
+        relevant = search_sessions("cors", rank="bm25")
+    assert [Path(r.path).stem for r in recent] == ["sparse", "dense"]
+    assert [Path(r.path).stem for r in relevant] == ["dense", "sparse"]
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("bug", [("bug", True, True)]),
+        ("cors bug", [("cors", True, False), ("bug", False, True)]),
+        ("-x- y", [("x", False, False), ("y", False, True)]),
+        ("  ", []),
+    ],
+)
+def test_query_runs(query: str, expected: list[tuple[str, bool, bool]]) -> None:
+    assert [(r.text, r.open_left, r.open_right) for r in _query_runs(query)] == expected
+
+
+def test_search_cli_uses_index(tmp_path: Path) -> None:
+    from click.testing import CliRunner
+
+    from gptme_sessions.cli import cli
+
+    paths = _random_corpus(tmp_path / "cc", 15)
+    with _discovered(paths):
+        indexed = CliRunner().invoke(cli, ["search", "module", "--json"])
+        linear = CliRunner().invoke(cli, ["--no-cache", "search", "module", "--json"])
+        ranked = CliRunner().invoke(cli, ["search", "module", "--json", "--rank", "bm25"])
+    assert indexed.exit_code == 0, indexed.output
+    assert json.loads(indexed.stdout) == json.loads(linear.stdout)
+    assert ranked.exit_code == 0, ranked.output
+    assert {r["path"] for r in json.loads(ranked.stdout)} == {
+        r["path"] for r in json.loads(linear.stdout)
+    }
+    assert (Path(os.environ["GPTME_SESSIONS_CACHE_DIR"]) / "search.db").exists()
+
+
+@pytest.mark.slow
+def test_benchmark_search_index_50k(tmp_path: Path) -> None:
+    """Query latency over a synthetic 50k-session index vs the linear scorer.
+
+    Run with ``pytest -m slow -s`` to see the timings.
+    """
+    rng = random.Random(42)
+    vocab = [f"w{i}" for i in range(20_000)] + WORDS
+    items: list[tuple[Path, tuple[int, int], SessionTranscript]] = []
+    for i in range(50_000):
+        path = tmp_path / f"s{i}.jsonl"
+        path.touch()  # update() stats every path in the window
+        transcript = SessionTranscript(
+            schema_version=1,
+            session_id=f"s{i}",
+            harness="claude-code",
+            trajectory_path=str(path),
+            messages=[
+                NormalizedMessage(role="user", content=" ".join(rng.choices(vocab, k=20)))
+                for _ in range(2)
+            ],
+            started_at=f"2026-{1 + i % 12:02d}-{1 + i % 28:02d}T{i % 24:02d}:00:00Z",
+        )
+        stamp = _stamp(path)
+        assert stamp is not None
+        items.append((path, stamp, transcript))
+
+    index = SearchIndex(tmp_path / "search.db")
+    start = time.perf_counter()
+    index.add_many(items)
+    print(f"\nindexed 50k sessions in {time.perf_counter() - start:.1f}s")
+    paths = [path for path, _, _ in items]
+    start = time.perf_counter()
+    window = index.window(paths)
+    print(f"window over 50k paths: {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    for query in ["w12345", "w777 w778", "cors bug", "module not found", "src/app.py", "w1"]:
+        pattern = re.compile(re.escape(query), re.IGNORECASE)
+        start = time.perf_counter()
+        linear = [r for path, _, t in items if (r := _match_transcript(path, t, pattern))]
+        linear.sort(
+            key=lambda r: (-(r.started_at.timestamp() if r.started_at else 0.0), -r.hit_count)
+        )
+        linear_ms = (time.perf_counter() - start) * 1000
+
+        index.search(window, pattern, query)  # warm the vocabulary
+        start = time.perf_counter()
+        for _ in range(10):
+            indexed = index.search(window, pattern, query)
+        indexed_ms = (time.perf_counter() - start) * 100
+
+        # What every search_sessions() call pays on top (discovery excluded):
+        # stat all paths for changes, then resolve the (cached) window
+        start = time.perf_counter()
+        assert index.update(paths) == 0
+        end_to_end = index.search(paths, pattern, query)
+        end_to_end_ms = (time.perf_counter() - start) * 1000
+
+        print(
+            f"{query!r:20} linear {linear_ms:8.1f}ms  indexed {indexed_ms:7.2f}ms"
+            f"  with update {end_to_end_ms:7.1f}ms"
+        )
+        assert indexed == end_to_end == linear[:20]
+        assert indexed_ms < linear_ms
+    index.close()
@@ -6437,7 +6437,7 @@ def test_sync_signals_backfills_existing_records(tmp_path: Path, capsys, monkeyp
     # Mock extract_from_path to return a productive result
     monkeypatch.setattr(
         "gptme_sessions.cli.extract_from_path",
-        lambda p: {
+        lambda p, **_kwargs: {
             "productive": True,
             "session_duration_s": 300,
             "deliverables": ["abc123"],
@@ -6481,7 +6481,7 @@ def test_sync_signals_import_persists_usage_fields(tmp_path: Path, capsys, monke
     )
     monkeypatch.setattr(
         "gptme_sessions.cli.extract_from_path",
-        lambda p: {
+        lambda p, **_kwargs: {
             "productive": True,
             "session_duration_s": 45,
             "deliverables": [],
@@ -6538,7 +6538,7 @@ def test_sync_signals_backfills_usage_for_existing_known_record(
     )
     monkeypatch.setattr(
         "gptme_sessions.cli.extract_from_path",
-        lambda p: {
+        lambda p, **_kwargs: {
             "productive": True,
             "session_duration_s": 90,
             "deliverables": [],
@@ -6618,7 +6618,7 @@ def test_sync_signals_does_not_overwrite_existing_deliverables(tmp_path: Path, c
     # Mock extract_from_path returning different deliverables
     monkeypatch.setattr(
         "gptme_sessions.cli.extract_from_path",
-        lambda p: {
+        lambda p, **_kwargs: {
             "productive": True,
             "session_duration_s": 120,
             "deliverables": ["new-deliverable"],
@@ -6638,6 +6638,79 @@ def test_sync_signals_does_not_overwrite_existing_deliverables(tmp_path: Path, c
     assert updated_records[0].deliverables == ["prior-deliverable"]
 
 
+def test_sync_jobs_matches_sequential(tmp_path: Path, capsys, monkeypatch):
+    """sync --signals --jobs N writes the same records as a sequential sync."""
+    import sys
+
+    from gptme_sessions import SessionStore
+    from gptme_sessions.cli import main
+
+    trajectories = []
+    for i in range(6):
+        traj = tmp_path / "trajs" / f"session-{i}.jsonl"
+        traj.parent.mkdir(exist_ok=True)
+        msgs = [
+            {"role": "user", "content": "go", "timestamp": f"2026-03-0{i + 1}T10:00:00"},
+            {
+                "role": "system",
+                "content": f"[master abc{i:04d}] feat: change {i}\n 1 file changed",
+                "timestamp": f"2026-03-0{i + 1}T10:05:00",
+            },
+        ]
+        traj.write_text("".join(json.dumps(m) + "\n" for m in msgs))
+        trajectories.append(traj)
+    # An unreadable trajectory must warn without failing the whole sync
+    broken = tmp_path / "trajs" / "broken.jsonl"
+    broken.write_bytes(b"\xff\xfe not utf-8\n")
+    trajectories.insert(3, broken)
+
+    monkeypatch.setattr("gptme_sessions.cli.discover_gptme_sessions", lambda *a, **kw: [])
+    monkeypatch.setattr("gptme_sessions.cli.discover_cc_sessions", lambda *a, **kw: trajectories)
+    monkeypatch.setattr("gptme_sessions.cli.discover_codex_sessions", lambda *a, **kw: [])
+    monkeypatch.setattr("gptme_sessions.cli.discover_copilot_sessions", lambda *a, **kw: [])
+
+    def synced(name: str, *extra: str) -> list[dict]:
+        sessions_dir = tmp_path / name
+        argv = ["gptme-sessions", "--no-cache", "--sessions-dir", str(sessions_dir)]
+        monkeypatch.setattr(sys, "argv", argv + ["sync", "--since", "all", "--signals", *extra])
+        assert main() == 0
+        records = [r.to_dict() for r in SessionStore(sessions_dir=sessions_dir).load_all()]
+        for r in records:
+            r.pop("session_id")
+            if r["trajectory_path"] == str(broken):
+                r.pop("timestamp")  # no readable start time, so it defaults to now()
+        return records
+
+    sequential = synced("seq")
+    parallel = synced("par", "--jobs", "3")
+    assert parallel == sequential
+    assert len(parallel) == 7
+    assert sorted(r["trajectory_path"] for r in parallel) == sorted(str(t) for t in trajectories)
+    assert capsys.readouterr().err.count("signals extraction failed") == 2
+
+
+def test_extract_signals_ordered_streams_in_input_order(tmp_path: Path, monkeypatch):
+    """Parallel extraction yields results in input order with errors as text."""
+    from gptme_sessions import cli as cli_module
+
+    def fake_extract(path, **_kwargs):
+        if path.name == "bad":
+            raise ValueError("boom")
+        return {"name": path.name}
+
+    monkeypatch.setattr(cli_module, "extract_from_path", fake_extract)
+    paths = [tmp_path / name for name in ["a", "b", "bad", "c", "d", "e"]]
+    results = list(cli_module._extract_signals_ordered(paths, jobs=2, use_cache=False))
+    assert results == [
+        ({"name": "a"}, None),
+        ({"name": "b"}, None),
+        (None, "boom"),
+        ({"name": "c"}, None),
+        ({"name": "d"}, None),
+        ({"name": "e"}, None),
+    ]
+
+
 def test_sync_dry_run_signals_skips_extraction(tmp_path: Path, capsys, monkeypatch):
     """sync --dry-run --signals does NOT call extract_from_path (just previews)."""
     import sys
@@ -6662,7 +6735,7 @@ def test_sync_dry_run_signals_skips_extraction(tmp_path: Path, capsys, monkeypat
 
     extraction_called = []
 
-    def fake_extract(p):
+    def fake_extract(p, **_kwargs):
         extraction_called.append(p)
         return {
             "productive": True,
@@ -6705,7 +6778,7 @@ def test_sync_dry_run_signals_skips_extraction_for_new_records(tmp_path: Path, c
 
     extraction_called = []
 
-    def fake_extract(p):
+    def fake_extract(p, **_kwargs):
         extraction_called.append(p)
         return {
             "productive": True,
@@ -6788,7 +6861,7 @@ def test_sync_signals_failure_does_not_double_count_skipped(tmp_path: Path, caps
     monkeypatch.setattr("gptme_sessions.cli.extract_cc_model", lambda p: "claude-opus-4-6")
 
     # But signals extraction fails
-    def _raise_signals_error(p):
+    def _raise_signals_error(p, **_kwargs):
         raise RuntimeError("signals extraction error")
 
     monkeypatch.setattr("gptme_sessions.cli.extract_from_path", _raise_signals_error)
@@ -6937,9 +7010,9 @@ def test_discover_shows_sync_status_synced(tmp_path: Path, monkeypatch: pytest.M
         "gptme_sessions.cli.discover_gptme_sessions",
         lambda start, end: [session_dir],
     )
-    monkeypatch.setattr("gptme_sessions.cli.discover_cc_sessions", lambda start, end: [])
+    monkeypatch.setattr("gptme_sessions.cli.discover_cc_sessions", lambda start, end, **kw: [])
     monkeypatch.setattr("gptme_sessions.cli.discover_codex_sessions", lambda start, end: [])
-    monkeypatch.setattr("gptme_sessions.cli.discover_copilot_sessions", lambda start, end: [])
+    monkeypatch.setattr("gptme_sessions.cli.discover_copilot_sessions", lambda start, end, **kw: [])
 
     runner = CliRunner()
     result = runner.invoke(
@@ -6965,9 +7038,9 @@ def test_discover_shows_sync_status_unsynced(tmp_path: Path, monkeypatch: pytest
         "gptme_sessions.cli.discover_gptme_sessions",
         lambda start, end: [session_dir],
     )
-    monkeypatch.setattr("gptme_sessions.cli.discover_cc_sessions", lambda start, end: [])
+    monkeypatch.setattr("gptme_sessions.cli.discover_cc_sessions", lambda start, end, **kw: [])
     monkeypatch.setattr("gptme_sessions.cli.discover_codex_sessions", lambda start, end: [])
-    monkeypatch.setattr("gptme_sessions.cli.discover_copilot_sessions", lambda start, end: [])
+    monkeypatch.setattr("gptme_sessions.cli.discover_copilot_sessions", lambda start, end, **kw: [])
 
     runner = CliRunner()
     result = runner.invoke(
@@ -7002,9 +7075,9 @@ def test_discover_unsynced_flag_filters_synced(tmp_path: Path, monkeypatch: pyte
         "gptme_sessions.cli.discover_gptme_sessions",
         lambda start, end: [session_imported, session_pending],
     )
-    monkeypatch.setattr("gptme_sessions.cli.discover_cc_sessions", lambda start, end: [])
+    monkeypatch.setattr("gptme_sessions.cli.discover_cc_sessions", lambda start, end, **kw: [])
     monkeypatch.setattr("gptme_sessions.cli.discover_codex_sessions", lambda start, end: [])
-    monkeypatch.setattr("gptme_sessions.cli.discover_copilot_sessions", lambda start, end: [])
+    monkeypatch.setattr("gptme_sessions.cli.discover_copilot_sessions", lambda start, end, **kw: [])
 
     runner = CliRunner()
     result = runner.invoke(
@@ -7040,9 +7113,9 @@ def test_discover_unsynced_flag_all_synced(tmp_path: Path, monkeypatch: pytest.M
         "gptme_sessions.cli.discover_gptme_sessions",
         lambda start, end: [session_dir],
     )
-    monkeypatch.setattr("gptme_sessions.cli.discover_cc_sessions", lambda start, end: [])
+    monkeypatch.setattr("gptme_sessions.cli.discover_cc_sessions", lambda start, end, **kw: [])
     monkeypatch.setattr("gptme_sessions.cli.discover_codex_sessions", lambda start, end: [])
-    monkeypatch.setattr("gptme_sessions.cli.discover_copilot_sessions", lambda start, end: [])
+    monkeypatch.setattr("gptme_sessions.cli.discover_copilot_sessions", lambda start, end, **kw: [])
 
     runner = CliRunner()
     result = runner.invoke(
@@ -7059,9 +7132,9 @@ def test_discover_unsynced_flag_no_sessions_found(tmp_path: Path, monkeypatch: p
     from gptme_sessions.cli import cli
 
     monkeypatch.setattr("gptme_sessions.cli.discover_gptme_sessions", lambda start, end: [])
-    monkeypatch.setattr("gptme_sessions.cli.discover_cc_sessions", lambda start, end: [])
+    monkeypatch.setattr("gptme_sessions.cli.discover_cc_sessions", lambda start, end, **kw: [])
     monkeypatch.setattr("gptme_sessions.cli.discover_codex_sessions", lambda start, end: [])
-    monkeypatch.setattr("gptme_sessions.cli.discover_copilot_sessions", lambda start, end: [])
+    monkeypatch.setattr("gptme_sessions.cli.discover_copilot_sessions", lambda start, end, **kw: [])
 
     sessions_dir = tmp_path / "sessions"
     runner = CliRunner()
@@ -7084,11 +7157,11 @@ def test_discover_json_unsynced_pending(tmp_path: Path, monkeypatch: pytest.Monk
     fake_file = tmp_path / "pending.jsonl"
     fake_file.touch()
     monkeypatch.setattr("gptme_sessions.cli.discover_gptme_sessions", lambda start, end: [])
-    monkeypatch.setattr("gptme_sessions.cli.discover_cc_sessions", lambda start, end: [])
+    monkeypatch.setattr("gptme_sessions.cli.discover_cc_sessions", lambda start, end, **kw: [])
     monkeypatch.setattr(
         "gptme_sessions.cli.discover_codex_sessions", lambda start, end: [fake_file]
     )
-    monkeypatch.setattr("gptme_sessions.cli.discover_copilot_sessions", lambda start, end: [])
+    monkeypatch.setattr("gptme_sessions.cli.discover_copilot_sessions", lambda start, end, **kw: [])
 
     sessions_dir = tmp_path / "sessions"
     runner = CliRunner()
@@ -7127,9 +7200,9 @@ def test_discover_json_unsynced_all_synced(tmp_path: Path, monkeypatch: pytest.M
         "gptme_sessions.cli.discover_gptme_sessions",
         lambda start, end: [session_dir],
     )
-    monkeypatch.setattr("gptme_sessions.cli.discover_cc_sessions", lambda start, end: [])
+    monkeypatch.setattr("gptme_sessions.cli.discover_cc_sessions", lambda start, end, **kw: [])
     monkeypatch.setattr("gptme_sessions.cli.discover_codex_sessions", lambda start, end: [])
-    monkeypatch.setattr("gptme_sessions.cli.discover_copilot_sessions", lambda start, end: [])
+    monkeypatch.setattr("gptme_sessions.cli.discover_copilot_sessions", lambda start, end, **kw: [])
 
     runner = CliRunner()
     result = runner.invoke(
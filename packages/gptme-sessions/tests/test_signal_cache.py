@@ -0,0 +1,169 @@
+"""Tests for the persistent signal extraction cache."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from gptme_sessions import signal_cache, signals
+from gptme_sessions.cli import cli
+from gptme_sessions.signal_cache import SignalCache, default_cache
+from gptme_sessions.signals import extract_from_path
+
+
+def _write_gptme_trajectory(path: Path, n_commits: int = 1) -> Path:
+    msgs = [{"role": "user", "content": "do it", "timestamp": "2026-03-01T10:00:00"}]
+    for i in range(n_commits):
+        msgs.append(
+            {
+                "role": "system",
+                "content": f"[master abc12{i:02d}] feat: change {i}\n 1 file changed",
+                "timestamp": f"2026-03-01T10:0{i + 1}:00",
+            }
+        )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("".join(json.dumps(m) + "\n" for m in msgs), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def count_extractions(monkeypatch) -> list[Path]:
+    calls: list[Path] = []
+    real = signals._extract_from_file
+
+    def counting(path: Path) -> dict:
+        calls.append(path)
+        return real(path)
+
+    monkeypatch.setattr(signals, "_extract_from_file", counting)
+    return calls
+
+
+def test_cached_result_equals_fresh_extraction(tmp_path, count_extractions):
+    traj = _write_gptme_trajectory(tmp_path / "s1" / "conversation.jsonl")
+    fresh = extract_from_path(traj)
+    first = extract_from_path(traj, use_cache=True)
+    second = extract_from_path(traj, use_cache=True)
+    assert first == fresh
+    assert second == fresh
+    # One uncached call + one cache miss; the third call is a hit
+    assert len(count_extractions) == 2
+
+
+def test_session_directory_uses_same_entry(tmp_path, count_extractions):
+    traj = _write_gptme_trajectory(tmp_path / "s1" / "conversation.jsonl")
+    extract_from_path(traj, use_cache=True)
+    extract_from_path(traj.parent, use_cache=True)
+    assert len(count_extractions) == 1
+
+
+def test_changed_file_is_reextracted(tmp_path, count_extractions):
+    traj = _write_gptme_trajectory(tmp_path / "t.jsonl", n_commits=1)
+    assert len(extract_from_path(traj, use_cache=True)["git_commits"]) == 1
+
+    _write_gptme_trajectory(traj, n_commits=2)
+    st = traj.stat()
+    os.utime(traj, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert len(extract_from_path(traj, use_cache=True)["git_commits"]) == 2
+    assert len(count_extractions) == 2
+
+
+def test_extractor_version_change_invalidates(tmp_path, count_extractions, monkeypatch):
+    traj = _write_gptme_trajectory(tmp_path / "t.jsonl")
+    extract_from_path(traj, use_cache=True)
+    monkeypatch.setattr(signal_cache, "_extractor_version", "other-version")
+    extract_from_path(traj, use_cache=True)
+    assert len(count_extractions) == 2
+
+
+def test_returned_results_are_independent(tmp_path):
+    traj = _write_gptme_trajectory(tmp_path / "t.jsonl")
+    extract_from_path(traj, use_cache=True)
+    hit = extract_from_path(traj, use_cache=True)
+    hit["git_commits"].append("mutated")
+    assert "mutated" not in extract_from_path(traj, use_cache=True)["git_commits"]
+
+
+def test_non_json_results_are_not_cached(tmp_path):
+    cache = SignalCache(tmp_path / "cache")
+    traj = _write_gptme_trajectory(tmp_path / "t.jsonl")
+    cache.put(traj, {"pair": (1, 2)})
+    assert cache.get(traj) is None
+    cache.put(traj, {"pair": [1, 2]})
+    assert cache.get(traj) == {"pair": [1, 2]}
+
+
+def test_prune_drops_deleted_and_outdated(tmp_path, monkeypatch):
+    cache = SignalCache(tmp_path / "cache")
+    kept = _write_gptme_trajectory(tmp_path / "kept.jsonl")
+    gone = _write_gptme_trajectory(tmp_path / "gone.jsonl")
+    cache.put(kept, {"x": 1})
+    cache.put(gone, {"x": 2})
+    gone.unlink()
+    assert cache.prune() == 1
+    assert cache.get(kept) == {"x": 1}
+
+    monkeypatch.setattr(signal_cache, "_extractor_version", "other-version")
+    assert cache.prune() == 1
+
+
+def test_prune_drops_rewritten(tmp_path):
+    cache = SignalCache(tmp_path / "cache")
+    traj = _write_gptme_trajectory(tmp_path / "t.jsonl", n_commits=1)
+    cache.put(traj, {"x": 1})
+    _write_gptme_trajectory(traj, n_commits=2)
+    assert cache.prune() == 1
+    assert cache.conn.execute("SELECT COUNT(*) FROM signal_cache").fetchone() == (0,)
+
+
+def test_extractor_version_covers_deliverables(monkeypatch):
+    from gptme_sessions import deliverables
+
+    before = signal_cache.extractor_version()
+    real_read_bytes = Path.read_bytes
+
+    def read_bytes(self: Path) -> bytes:
+        data = real_read_bytes(self)
+        return data + b"# edited" if self == Path(deliverables.__file__) else data
+
+    monkeypatch.setattr(signal_cache, "_extractor_version", None)
+    monkeypatch.setattr(Path, "read_bytes", read_bytes)
+    assert signal_cache.extractor_version() != before
+
+
+def test_sync_signals_prunes_cache(tmp_path):
+    kept = _write_gptme_trajectory(tmp_path / "kept.jsonl")
+    gone = _write_gptme_trajectory(tmp_path / "gone.jsonl")
+    default_cache().put(gone, {"x": 1})
+    gone.unlink()
+    discovered = [{"harness": "gptme", "path": kept}]
+    with patch("gptme_sessions.cli._discover_all", return_value=discovered):
+        result = CliRunner().invoke(
+            cli, ["--sessions-dir", str(tmp_path / "sessions"), "sync", "--signals"]
+        )
+    assert result.exit_code == 0, result.output
+    cached = default_cache().conn.execute("SELECT path FROM signal_cache").fetchall()
+    assert cached == [(str(kept.resolve()),)]
+
+
+def test_default_cache_respects_env(tmp_path, monkeypatch):
+    monkeypatch.setenv("GPTME_SESSIONS_CACHE_DIR", str(tmp_path / "elsewhere"))
+    assert default_cache().path == tmp_path / "elsewhere" / "signals.db"
+
+
+def test_cli_no_cache_flag(tmp_path, count_extractions):
+    traj = _write_gptme_trajectory(tmp_path / "t.jsonl")
+    runner = CliRunner()
+    for _ in range(2):
+        result = runner.invoke(cli, ["signals", str(traj), "--json"])
+        assert result.exit_code == 0, result.output
+    assert len(count_extractions) == 1
+
+    result = runner.invoke(cli, ["--no-cache", "signals", str(traj), "--json"])
+    assert result.exit_code == 0, result.output
+    assert len(count_extractions) == 2
@@ -0,0 +1,285 @@
+"""Tests for streaming (single-pass) trajectory signal extraction."""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import time
+import tracemalloc
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from gptme_sessions import signals
+from gptme_sessions.signals import (
+    _detect_format,
+    _extract_from_file,
+    _extract_from_msgs,
+    _sniff_format,
+    extract_signals_cc,
+    extract_usage_cc,
+    iter_trajectory,
+    parse_trajectory,
+)
+
+BASH_COMMANDS = [
+    "git commit -m 'fix thing'",
+    "gh pr create --title x --body y",
+    "gh pr merge 12 --squash --repo gptme/gptme",
+    "gh issue close 7",
+    "gh run view 99 --log-failed",
+    "gh pr review 3 --approve",
+    "gh issue comment 4 --body hi",
+    "pytest -q",
+]
+BASH_OUTPUTS = [
+    "[master abc1234] fix thing\n 1 file changed",
+    "https://github.com/gptme/gptme/pull/12",
+    "✓ Squashed and merged pull request #12 (title)",
+    "FAILED tests/test_x.py::test_y - error: boom",
+    "",
+    "all good",
+]
+
+
+@pytest.fixture(autouse=True)
+def _no_gh(monkeypatch):
+    """Never shell out to gh for merge SHAs."""
+    monkeypatch.setattr(signals, "_resolve_merge_shas", lambda merges, context: [])
+
+
+def _random_cc_records(rng: random.Random, n: int) -> list[dict]:
+    """A randomized Claude Code trajectory exercising every accumulator."""
+    records: list[dict] = [{"type": "queue-operation", "operation": "enqueue"}]
+    pending: list[tuple[str, str]] = []
+    for i in range(n):
+        # Out-of-order, missing and offset timestamps
+        minute = rng.randint(0, 59)
+        ts = rng.choice(
+            [f"2026-03-01T10:{minute:02d}:00Z", f"2026-03-01T12:{minute:02d}:00+02:00", "", "bad"]
+        )
+        if pending and rng.random() < 0.6:
+            tool_id, tool = pending.pop(rng.randrange(len(pending)))
+            output = rng.choice(BASH_OUTPUTS) if tool == "Bash" else "file contents"
+            records.append(
+                {
+                    "type": "user",
+                    "timestamp": ts,
+                    "message": {
+                        "content": [
+                            {
+                                "type": "tool_result",
+                                "tool_use_id": tool_id,
+                                "is_error": rng.random() < 0.1,
+                                "content": rng.choice([output, [{"type": "text", "text": output}]]),
+                            }
+                        ]
+                    },
+                }
+            )
+            continue
+        content: list[dict] = [{"type": "text", "text": "thinking"}]
+        for k in range(rng.choice([0, 1, 1, 2, 3])):
+            tool = rng.choice(["Bash", "Bash", "Edit", "Write", "NotebookEdit", "Read"])
+            tool_id = f"t{i}_{k}"
+            inp: dict = {"command": rng.choice(BASH_COMMANDS)}
+            if tool == "NotebookEdit":
+                inp = {"notebook_path": f"/w/nb{rng.randint(0, 3)}.ipynb"}
+            elif tool in ("Edit", "Write"):
+                inp = {"file_path": rng.choice(["/w/a.py", "/w/b.py", "/w/journal/2026.md"])}
+            content.append({"type": "tool_use", "id": tool_id, "name": tool, "input": inp})
+            pending.append((tool_id, tool))
+        records.append(
+            {
+                "type": "assistant",
+                "timestamp": ts,
+                "message": {
+                    "model": rng.choice(["claude-opus-4-6", "claude-sonnet-4-5", None]),
+                    "usage": rng.choice(
+                        [
+                            {},
+                            {"input_tokens": rng.randint(1, 50), "output_tokens": 5},
+                            {"cache_read_input_tokens": rng.randint(100, 900)},
+                        ]
+                    ),
+                    "content": content,
+                },
+            }
+        )
+    if rng.random() < 0.5:
+        records.append({"type": "result", "usage": {"input_tokens": 7, "output_tokens": 3}})
+    return records
+
+
+def _write(path: Path, records: list[dict], junk: bool = True) -> Path:
+    lines = [json.dumps(r) for r in records]
+    if junk:
+        lines[1:1] = ["", "{not json", "   "]
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_streaming_matches_list_extraction(tmp_path: Path, seed: int) -> None:
+    rng = random.Random(seed)
+    path = _write(tmp_path / "cc.jsonl", _random_cc_records(rng, rng.randint(1, 120)))
+    msgs = parse_trajectory(path)
+    assert _extract_from_file(path) == _extract_from_msgs(msgs)
+    assert extract_signals_cc(iter_trajectory(path)) == extract_signals_cc(msgs)
+    assert extract_usage_cc(iter_trajectory(path)) == extract_usage_cc(msgs)
+
+
+def test_iter_trajectory_matches_parse(tmp_path: Path) -> None:
+    path = _write(tmp_path / "cc.jsonl", _random_cc_records(random.Random(1), 30))
+    assert list(iter_trajectory(path)) == parse_trajectory(path)
+
+
+@pytest.mark.parametrize(
+    "records",
+    [
+        [],
+        [{"type": "queue-operation"}, {"type": "summary"}],
+        [{"type": "queue-operation"}, {"type": "assistant"}, {"role": "user"}],
+        [{"role": "system", "content": "hi"}, {"type": "assistant"}],
+        [{"type": "session_meta", "payload": {"originator": "codex_exec"}}, {"type": "user"}],
+        [{"type": "session_meta", "payload": {}}, {"type": "user"}],
+        [{"type": "session.start", "data": {"producer": "copilot-agent"}}],
+        [{"type": "available_commands"}, {"role": "user"}],
+    ],
+)
+def test_sniff_format_matches_detect_format(records: list[dict]) -> None:
+    stream = iter(records)
+    fmt, prefix = _sniff_format(stream)
+    assert fmt == _detect_format(records)
+    assert prefix + list(stream) == records
+
+
+def test_sniff_format_stops_at_first_decisive_record() -> None:
+    def records() -> Iterator[dict]:
+        yield {"type": "queue-operation"}
+        yield {"type": "user", "message": {"content": "hi"}}
+        raise AssertionError("read past the decisive record")
+
+    fmt, prefix = _sniff_format(records())
+    assert fmt == "claude_code"
+    assert len(prefix) == 2
+
+
+def test_non_cc_formats_use_list_path(tmp_path: Path) -> None:
+    path = _write(
+        tmp_path / "conversation.jsonl",
+        [
+            {"role": "system", "content": "sys", "timestamp": "2026-03-01T10:00:00Z"},
+            {
+                "role": "assistant",
+                "content": '@save(c1): {"path": "/w/a.py"}',
+                "timestamp": "2026-03-01T10:01:00Z",
+                "metadata": {"timings": {"ttft_ms": 120, "gen_ms": 800}},
+            },
+        ],
+    )
+    result = _extract_from_file(path)
+    assert result["format"] == "gptme"
+    assert result["file_writes"] == ["/w/a.py"]
+    assert result["timings"]["ttft_ms_avg"] == 120.0
+    assert result == _extract_from_msgs(parse_trajectory(path))
+
+
+def _write_large_cc(path: Path, size_mb: int) -> int:
+    """Write a synthetic Claude Code trajectory of about ``size_mb`` MB; return records."""
+    padding = "lorem ipsum dolor sit amet " * 150  # ~4KB of tool output per result
+    target = size_mb * 1024 * 1024
+    written = count = 0
+    with open(path, "w") as f:
+        while written < target:
+            tool_id = f"toolu_{count:08d}"
+            ts = f"2026-03-01T{(count // 3600) % 24:02d}:{(count // 60) % 60:02d}:{count % 60:02d}Z"
+            command = BASH_COMMANDS[count % len(BASH_COMMANDS)]
+            output = BASH_OUTPUTS[count % len(BASH_OUTPUTS)] + "\n" + padding
+            pair = [
+                {
+                    "type": "assistant",
+                    "timestamp": ts,
+                    "message": {
+                        "model": "claude-opus-4-6",
+                        "usage": {"input_tokens": 10, "cache_read_input_tokens": 2000},
+                        "content": [
+                            {"type": "text", "text": "running a command"},
+                            {
+                                "type": "tool_use",
+                                "id": tool_id,
+                                "name": "Bash",
+                                "input": {"command": command},
+                            },
+                        ],
+                    },
+                },
+                {
+                    "type": "user",
+                    "timestamp": ts,
+                    "message": {
+                        "content": [
+                            {"type": "tool_result", "tool_use_id": tool_id, "content": output}
+                        ]
+                    },
+                },
+            ]
+            chunk = "".join(json.dumps(r) + "\n" for r in pair)
+            f.write(chunk)
+            written += len(chunk)
+            count += 2
+    return count
+
+
+def _measure(fn, path: Path) -> tuple[dict, float, float]:
+    """Run ``fn(path)``; return (result, seconds, peak traced MB).
+
+    Timed and traced separately, since tracemalloc slows allocation down.
+    """
+    start = time.perf_counter()
+    result = fn(path)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    try:
+        fn(path)
+        peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    finally:
+        tracemalloc.stop()
+    return result, elapsed, peak
+
+
+@pytest.mark.slow
+def test_benchmark_streaming_extraction(tmp_path: Path) -> None:
+    """Peak memory and throughput of streaming vs list-based extraction.
+
+    Streams a generated 500MB trajectory (override the size with
+    ``GPTME_SESSIONS_BENCH_MB``); the list-based path, which needs several
+    times the file size in memory, is compared on a 50MB sample.  Run with
+    ``pytest -m slow -s`` to see the numbers.
+    """
+    size_mb = int(os.environ.get("GPTME_SESSIONS_BENCH_MB", "500"))
+    sample_mb = min(size_mb, 50)
+
+    sample = tmp_path / "sample.jsonl"
+    _write_large_cc(sample, sample_mb)
+    streamed, stream_s, stream_peak = _measure(_extract_from_file, sample)
+    listed, list_s, list_peak = _measure(lambda p: _extract_from_msgs(parse_trajectory(p)), sample)
+    assert streamed == listed
+    print(
+        f"\n{sample_mb}MB: streaming {sample_mb / stream_s:.0f}MB/s peak {stream_peak:.1f}MB;"
+        f" list {sample_mb / list_s:.0f}MB/s peak {list_peak:.1f}MB"
+    )
+    sample.unlink()
+
+    large = tmp_path / "large.jsonl"
+    records = _write_large_cc(large, size_mb)
+    result, large_s, large_peak = _measure(_extract_from_file, large)
+    print(
+        f"{size_mb}MB ({records} records): streaming {size_mb / large_s:.0f}MB/s"
+        f" peak {large_peak:.1f}MB"
+    )
+    assert result["tool_calls"] == {"Bash": records // 2}
+    # Streaming memory tracks the accumulators, not the file size
+    assert large_peak < list_peak / 4
@@ -0,0 +1,274 @@
+"""Tests for the SQLite session store backend.
+
+The backend must behave exactly like the JSONL ``SessionStore``; most tests
+run the same operations against both and compare the results.  The 100k
+record benchmark is marked slow — run it with
+``pytest -m slow tests/test_sqlite_store.py -s`` to see timings.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from gptme_sessions import SessionRecord, SessionStore, SqliteSessionStore, open_store
+from gptme_sessions.cli import cli
+
+
+def _records(n: int) -> list[SessionRecord]:
+    now = datetime.now(timezone.utc)
+    models = ["claude-opus-4-6", "opus", "anthropic/claude-sonnet-4-5", "gpt-5.4"]
+    return [
+        SessionRecord(
+            session_id=f"s{i:06d}",
+            timestamp=(now - timedelta(hours=i)).isoformat(),
+            harness=["gptme", "claude-code", "codex"][i % 3],
+            model=models[i % len(models)],
+            run_type=["autonomous", "manual"][i % 2],
+            category=["code", "content", None][i % 3],
+            outcome=["productive", "noop", "failed", "productive"][i % 4],
+            project=f"/home/bob/{['alpha', 'beta'][i % 2]}",
+            duration_seconds=60 * (i % 30),
+        )
+        for i in range(n)
+    ]
+
+
+def _ids(records: list[SessionRecord]) -> list[str]:
+    return [r.session_id for r in records]
+
+
+@pytest.fixture
+def both_stores(tmp_path: Path) -> tuple[SessionStore, SqliteSessionStore]:
+    jsonl = SessionStore(sessions_dir=tmp_path / "jsonl")
+    sqlite = SqliteSessionStore(sessions_dir=tmp_path / "sqlite")
+    for record in _records(200):
+        jsonl.append(record)
+        sqlite.append(record)
+    return jsonl, sqlite
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {},
+        {"model": "opus"},
+        {"model": "claude-opus-4-6"},
+        {"model": "sonnet"},
+        {"model": "missing"},
+        {"harness": "codex", "outcome": "productive"},
+        {"category": "code", "run_type": "manual"},
+        {"project": "alpha"},
+        {"since_days": 3},
+        {"since_days": 0.5, "harness": "gptme"},
+    ],
+)
+def test_query_matches_jsonl_store(both_stores, filters):
+    jsonl, sqlite = both_stores
+    assert _ids(sqlite.query(**filters)) == _ids(jsonl.query(**filters))
+
+
+def test_stats_matches_jsonl_store(both_stores):
+    jsonl, sqlite = both_stores
+    assert sqlite.stats() == jsonl.stats()
+    assert sqlite.stats(sqlite.query(harness="gptme")) == jsonl.stats(jsonl.query(harness="gptme"))
+
+
+def test_rewrite_upserts_in_place(both_stores):
+    jsonl, sqlite = both_stores
+    for store in (jsonl, sqlite):
+        records = store.query(outcome="noop")
+        for r in records:
+            r.outcome = "productive"
+        store.rewrite(records + [SessionRecord(session_id="new", outcome="noop")])
+    # Same additive semantics; insertion order is kept rather than moving
+    # updated rows to the front, so compare as sets.
+    assert sorted(_ids(sqlite.load_all())) == sorted(_ids(jsonl.load_all()))
+    assert _ids(sqlite.query(outcome="noop")) == ["new"]
+    assert len(sqlite.load_all()) == 201
+    # Insertion order is preserved for updated rows
+    assert _ids(sqlite.load_all())[:3] == ["s000000", "s000001", "s000002"]
+
+
+def test_update_many_writes_only_matching_records(both_stores):
+    jsonl, sqlite = both_stores
+    with open(jsonl.path, "a") as f:
+        f.write("not json\n")
+    before = jsonl.path.read_text().splitlines()
+    for store in (jsonl, sqlite):
+
+        def grade(rec: SessionRecord) -> None:
+            rec.outcome = "graded"
+
+        assert store.update_many(["s000003", "s000007", "missing"], grade) == {
+            "s000003",
+            "s000007",
+        }
+        assert store.update_many([], grade) == set()
+    assert _ids(sqlite.query(outcome="graded")) == _ids(jsonl.query(outcome="graded"))
+    assert _ids(sqlite.query(outcome="graded")) == ["s000003", "s000007"]
+    # Every other line, malformed ones included, is copied through byte for byte
+    after = jsonl.path.read_text().splitlines()
+    changed = [i for i, (a, b) in enumerate(zip(before, after)) if a != b]
+    assert len(after) == len(before) and changed == [3, 7]
+
+
+def test_legacy_fields_round_trip(tmp_path):
+    store = SqliteSessionStore(sessions_dir=tmp_path)
+    store.append(SessionRecord.from_dict({"session_id": "old", "notes": "keep me"}))
+    (loaded,) = store.load_all()
+    assert loaded.to_dict()["notes"] == "keep me"
+
+
+def test_missing_db_is_empty(tmp_path):
+    store = SqliteSessionStore(sessions_dir=tmp_path / "none")
+    assert store.load_all() == []
+    assert store.query(model="opus") == []
+    assert store.stats() == {"total": 0}
+    assert not store.path.exists()
+
+
+def test_jsonl_import_export_round_trip(tmp_path):
+    jsonl = SessionStore(sessions_dir=tmp_path)
+    for record in _records(20):
+        jsonl.append(record)
+    with open(jsonl.path, "a", encoding="utf-8") as f:
+        f.write("not json\n")
+
+    sqlite = SqliteSessionStore(sessions_dir=tmp_path)
+    assert sqlite.import_jsonl(jsonl.path) == 20
+    # Re-importing upserts instead of duplicating
+    assert sqlite.import_jsonl(jsonl.path) == 20
+    assert len(sqlite.load_all()) == 20
+
+    out = tmp_path / "export" / "records.jsonl"
+    assert sqlite.export_jsonl(out) == 20
+    exported = [json.loads(line) for line in out.read_text().splitlines()]
+    assert [r["session_id"] for r in exported] == _ids(_records(20))
+
+
+def test_open_store_selects_backend(tmp_path, monkeypatch):
+    monkeypatch.delenv("GPTME_SESSIONS_BACKEND", raising=False)
+    assert type(open_store(tmp_path)) is SessionStore
+
+    SqliteSessionStore(sessions_dir=tmp_path).append(SessionRecord(session_id="x"))
+    assert isinstance(open_store(tmp_path), SqliteSessionStore)
+
+    monkeypatch.setenv("GPTME_SESSIONS_BACKEND", "jsonl")
+    assert type(open_store(tmp_path)) is SessionStore
+    monkeypatch.setenv("GPTME_SESSIONS_BACKEND", "sqlite")
+    assert isinstance(open_store(tmp_path / "fresh"), SqliteSessionStore)
+
+
+def test_cli_import_then_query_uses_sqlite(tmp_path, monkeypatch):
+    monkeypatch.delenv("GPTME_SESSIONS_BACKEND", raising=False)
+    jsonl = SessionStore(sessions_dir=tmp_path)
+    for record in _records(10):
+        jsonl.append(record)
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["--sessions-dir", str(tmp_path), "import-jsonl"])
+    assert result.exit_code == 0, result.output
+    assert "Imported 10 record(s)" in result.output
+
+    # New records now land in the database, not the JSONL file
+    jsonl_size = jsonl.path.stat().st_size
+    result = runner.invoke(
+        cli, ["--sessions-dir", str(tmp_path), "append", "--harness", "gptme", "--model", "opus"]
+    )
+    assert result.exit_code == 0, result.output
+    assert jsonl.path.stat().st_size == jsonl_size
+    assert len(SqliteSessionStore(sessions_dir=tmp_path).load_all()) == 11
+
+    out = tmp_path / "out.jsonl"
+    result = runner.invoke(cli, ["--sessions-dir", str(tmp_path), "export-jsonl", str(out)])
+    assert result.exit_code == 0, result.output
+    assert len(out.read_text().splitlines()) == 11
+
+
+def test_entry_points_follow_store_to_sqlite(tmp_path, monkeypatch):
+    """After import-jsonl, judge writeback, harm detection and replay use the database."""
+    from unittest.mock import patch
+
+    from gptme_sessions import harm_detect, replay
+    from gptme_sessions.judge import write_alignment_grade
+
+    monkeypatch.delenv("GPTME_SESSIONS_BACKEND", raising=False)
+    jsonl = SessionStore(sessions_dir=tmp_path)
+    jsonl.append(SessionRecord(session_id="old00001", harness="gptme"))
+    result = CliRunner().invoke(cli, ["--sessions-dir", str(tmp_path), "import-jsonl"])
+    assert result.exit_code == 0, result.output
+    jsonl_before = jsonl.path.read_bytes()
+
+    # Recorded after the migration, so only the database has it
+    sha = "a1b2c3d4e5f6789012345678901234567890abcd"
+    trajectory = tmp_path / "trajectory.jsonl"
+    open_store(tmp_path).append(
+        SessionRecord(
+            session_id="new00001",
+            harness="codex",
+            deliverables=[sha],
+            trajectory_path=str(trajectory),
+        )
+    )
+
+    assert write_alignment_grade(
+        session_id="new00001",
+        verdict={"score": 0.8, "reason": "ok", "model": "judge"},
+        sessions_dir=tmp_path,
+    )
+    with patch.object(harm_detect, "_is_sha_reverted", return_value=True) as reverted:
+        assert (
+            harm_detect.detect_harm_revert("new00001", repos=[tmp_path], store_path=tmp_path) == 0.0
+        )
+        assert harm_detect.batch_detect_harm_revert(
+            ["new00001"], repos=[tmp_path], store_path=tmp_path
+        ) == {"new00001": 0.0}
+    assert {c.args[0] for c in reverted.call_args_list} == {sha}
+    with patch.object(replay, "read_transcript", side_effect=lambda path: path):
+        assert replay.resolve_replay_target("new0", sessions_dir=tmp_path) == trajectory
+
+    records = {r.session_id: r for r in SqliteSessionStore(sessions_dir=tmp_path).load_all()}
+    assert records["new00001"].llm_judge_score == 0.8
+    assert jsonl.path.read_bytes() == jsonl_before
+
+
+@pytest.mark.slow
+def test_benchmark_100k_records(tmp_path):
+    n = 100_000
+    records = _records(n)
+
+    jsonl = SessionStore(sessions_dir=tmp_path / "jsonl")
+    jsonl.path.parent.mkdir(parents=True)
+    jsonl.path.write_text("".join(r.to_json() + "\n" for r in records))
+
+    sqlite = SqliteSessionStore(sessions_dir=tmp_path / "sqlite")
+    start = time.perf_counter()
+    sqlite.import_jsonl(jsonl.path)
+    print(f"\nimport {n} records: {time.perf_counter() - start:.2f}s")
+
+    def timed(label, fn):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        print(f"{label:<32} {elapsed * 1000:9.1f} ms")
+        return result, elapsed
+
+    filters = {"harness": "codex", "outcome": "noop", "since_days": 30}
+    by_jsonl, jsonl_query = timed("jsonl query", lambda: jsonl.query(**filters))
+    by_sqlite, sqlite_query = timed("sqlite query", lambda: sqlite.query(**filters))
+    assert _ids(by_sqlite) == _ids(by_jsonl)
+    assert sqlite_query < jsonl_query
+
+    updated = by_sqlite
+    for r in updated:
+        r.outcome = "productive"
+    _, jsonl_rewrite = timed("jsonl rewrite (upsert)", lambda: jsonl.rewrite(updated))
+    _, sqlite_rewrite = timed("sqlite rewrite (upsert)", lambda: sqlite.rewrite(updated))
+    assert sqlite_rewrite < jsonl_rewrite
+    assert len(sqlite.load_all()) == n
@@ -58,9 +58,11 @@ from gptodo.checker import (
 
 # Import dependency tree visualization (Issue #255)
 from gptodo.deptree import (
+    analyze_dependencies,
     build_dependency_graph,
     compute_unblocking_power,
     detect_circular_dependencies,
+    get_dependency_cache_path,
     get_dependency_tree,
     render_dag_mermaid,
     render_full_dag_ascii,
@@ -113,10 +115,8 @@ from gptodo.utils import (
     compute_effective_state,
     # URLs
     extract_external_urls,
-    fetch_github_issue_details,
-    fetch_github_issue_state,
     fetch_linear_issue_state,
-    fetch_url_state,
+    fetch_url_states,
     # Core utilities
     check_links,
     find_repo_root,
@@ -2989,8 +2989,15 @@ def next_(output_json, use_cache, pool_filter, exclude_pool):
 
     # Compute unblocking power to use as a secondary sort key
     # Tasks that unblock more downstream work are preferred over equal-priority tasks
-    nodes = build_dependency_graph(all_tasks)
-    power = compute_unblocking_power(nodes)
+    # (persisted in state/, so it is only recomputed when the graph changes)
+    analysis = analyze_dependencies(all_tasks, get_dependency_cache_path(repo_root))
+    power = analysis.unblocking_power
+    if analysis.cycles:
+        cycle_strs = "; ".join(" → ".join(c) for c in analysis.cycles)
+        print(
+            f"Warning: circular dependencies detected: {cycle_strs} (see 'gptodo dep check')",
+            file=sys.stderr,
+        )
 
     # Sort tasks: priority (high first), then unblocking power (high first), then age (oldest first)
     ready_tasks.sort(
@@ -3540,8 +3547,7 @@ def sync(update, output_json, use_cache, light, full, changes_only):
             if urls_to_refresh:
                 console.print(f"[cyan]Refreshing {len(urls_to_refresh)} URLs...[/]")
                 updates: dict[str, Any] = {}
-                for url in urls_to_refresh:
-                    state_info = fetch_url_state(url)
+                for url, state_info in fetch_url_states(urls_to_refresh).items():
                     if state_info:
                         updates[url] = {
                             "state": state_info["state"],
@@ -3572,8 +3578,7 @@ def sync(update, output_json, use_cache, light, full, changes_only):
 
             fetched = 0
             updates = {}
-            for url in sorted(all_urls):
-                state_info = fetch_url_state(url)
+            for url, state_info in fetch_url_states(sorted(all_urls)).items():
                 if state_info:
                     updates[url] = {
                         "state": state_info["state"],
@@ -3633,6 +3638,35 @@ def sync(update, output_json, use_cache, light, full, changes_only):
         )
         return
 
+    # Live mode: look up every tracked GitHub issue/PR up front in batched
+    # GraphQL queries, rather than two gh calls per tracking reference
+    live_states: dict[tuple[str, str], dict[str, Any] | None] = {}
+    if not use_cache:
+        live_urls: dict[str, tuple[str, str]] = {}
+        for _, tracking_ref in tasks_with_tracking:
+            issue_info = parse_tracking_ref(tracking_ref)
+            if issue_info and issue_info.get("source") == "github":
+                # Canonical URL, so refs with fragments, trailing slashes or
+                # /pull/ paths still resolve (and share one cache entry)
+                url = f"https://github.com/{issue_info['repo']}/issues/{issue_info['number']}"
+                live_urls[url] = (issue_info["repo"], issue_info["number"])
+        fetched_states = fetch_url_states(live_urls)
+        live_states = {key: fetched_states[url] for url, key in live_urls.items()}
+        # Keep the issue cache warm for later --use-cache runs
+        fetched_at = datetime.now(timezone.utc).isoformat()
+        live_updates = {
+            url: {
+                "state": state_info["state"],
+                "source": "github",
+                "last_fetched": fetched_at,
+                "updatedAt": state_info.get("updatedAt"),
+            }
+            for url, state_info in fetched_states.items()
+            if state_info
+        }
+        if live_updates:
+            update_cache(cache_path, live_updates)
+
     # Check each task against GitHub
     results = []
     for task, tracking_ref in tasks_with_tracking:
@@ -3676,8 +3710,10 @@ def sync(update, output_json, use_cache, light, full, changes_only):
                     issue_state = cached.get("state")
 
             if issue_state is None and not use_cache:
-                # Fetch from GitHub API
-                issue_state = fetch_github_issue_state(issue_info["repo"], issue_info["number"])
+                # Fetched from GitHub above
+                live_state = live_states.get((issue_info["repo"], issue_info["number"]))
+                if live_state:
+                    issue_state = live_state.get("state")
 
         elif source == "linear":
             identifier = issue_info.get("identifier", "")
@@ -3750,10 +3786,10 @@ def sync(update, output_json, use_cache, light, full, changes_only):
                 if cached:
                     updated_at = cached.get("updatedAt")
             else:
-                # Fetch details including updatedAt
-                details = fetch_github_issue_details(issue_info["repo"], issue_info["number"])
-                if details:
-                    updated_at = details.get("updatedAt")
+                # Details including updatedAt were fetched with the state
+                live_state = live_states.get((issue_info["repo"], issue_info["number"]))
+                if live_state:
+                    updated_at = live_state.get("updatedAt")
 
         # Check if there's new activity since waiting_since
         if waiting_since and updated_at:
@@ -4139,9 +4175,8 @@ def fetch(fetch_all: bool, max_age: int, output_json: bool, urls: tuple[str, ...
     error_count = 0
     updates: dict[str, Any] = {}
 
-    for url in sorted(stale_urls):
+    for url, state_info in fetch_url_states(sorted(stale_urls)).items():
         result = {"url": url}
-        state_info = fetch_url_state(url)
 
         if state_info:
             updates[url] = {
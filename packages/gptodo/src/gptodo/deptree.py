@@ -6,12 +6,13 @@ showing what each task requires and what depends on it.
 Also provides unblocking power computation for priority scoring.
 """
 
+import json
 from dataclasses import dataclass, field
 from hashlib import sha256
 from html import escape
 from pathlib import Path
 
-from .utils import TaskInfo, load_tasks
+from .utils import TaskInfo, load_cache, load_tasks, save_cache
 
 
 @dataclass
@@ -75,6 +76,9 @@ def detect_circular_dependencies(
 ) -> list[list[str]]:
     """Detect circular dependencies in the graph.
 
+    Depth-first search along ``requires`` edges, iterative so that deep
+    dependency chains cannot exhaust the recursion limit.
+
     Returns:
         List of cycles found (each cycle is a list of task names)
     """
@@ -82,36 +86,86 @@ def detect_circular_dependencies(
     visited: set[str] = set()
     rec_stack: set[str] = set()
 
-    def dfs(name: str, path: list[str]) -> None:
-        if name in rec_stack:
-            # Found cycle
-            cycle_start = path.index(name)
-            cycle = path[cycle_start:] + [name]
-            cycles.append(cycle)
-            if name in nodes:
-                nodes[name].is_circular = True
-            return
-
-        if name in visited:
-            return
-
+    def enter(name: str, path: list[str], stack: list) -> None:
         visited.add(name)
         rec_stack.add(name)
         path.append(name)
-
         node = nodes.get(name)
-        if node:
-            for req_node in node.requires:
-                dfs(req_node.name, path.copy())
-
-        rec_stack.remove(name)
+        stack.append(iter(node.requires if node else ()))
 
-    for name in nodes:
-        dfs(name, [])
+    for start in nodes:
+        if start in visited:
+            continue
+        path: list[str] = []
+        stack: list = []
+        enter(start, path, stack)
+        while stack:
+            for req_node in stack[-1]:
+                name = req_node.name
+                if name in rec_stack:
+                    # Found cycle
+                    cycle_start = path.index(name)
+                    cycles.append(path[cycle_start:] + [name])
+                    if name in nodes:
+                        nodes[name].is_circular = True
+                elif name not in visited:
+                    enter(name, path, stack)
+                    break
+            else:
+                stack.pop()
+                rec_stack.remove(path.pop())
 
     return cycles
 
 
+def _strongly_connected_components(successors: dict[str, list[str]]) -> list[list[str]]:
+    """Tarjan's algorithm, iterative.
+
+    Components are returned in reverse topological order: every component
+    comes after all components reachable from it.
+    """
+    index: dict[str, int] = {}
+    low: dict[str, int] = {}
+    stack: list[str] = []
+    on_stack: set[str] = set()
+    components: list[list[str]] = []
+
+    def visit(name: str, work: list) -> None:
+        index[name] = low[name] = len(index)
+        stack.append(name)
+        on_stack.add(name)
+        work.append((name, iter(successors.get(name, ()))))
+
+    for root in successors:
+        if root in index:
+            continue
+        work: list = []
+        visit(root, work)
+        while work:
+            name, edges = work[-1]
+            for succ in edges:
+                if succ not in index:
+                    visit(succ, work)
+                    break
+                if succ in on_stack:
+                    low[name] = min(low[name], index[succ])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[name])
+                if low[name] == index[name]:
+                    component: list[str] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.remove(member)
+                        component.append(member)
+                        if member == name:
+                            break
+                    components.append(component)
+    return components
+
+
 def compute_unblocking_power(
     nodes: dict[str, DependencyNode],
     exclude_states: set[str] | None = None,
@@ -133,22 +187,104 @@ def compute_unblocking_power(
     if exclude_states is None:
         exclude_states = {"done", "cancelled"}
 
-    def _dependents(name: str, seen: set[str]) -> set[str]:
-        """Collect unique transitive dependents (deduplicates diamond patterns)."""
-        result: set[str] = set()
-        node = nodes.get(name)
-        if not node:
-            return result
-        for dep in node.required_by:
-            if dep.name in seen:
-                continue
-            if dep.state not in exclude_states:
-                result.add(dep.name)
-                seen.add(dep.name)
-                result.update(_dependents(dep.name, seen))
-        return result
-
-    return {name: len(_dependents(name, set())) for name in nodes}
+    # Walk required_by edges into non-excluded tasks only; a task's power is
+    # the number of tasks reachable from it along these edges.
+    successors = {
+        name: [dep.name for dep in node.required_by if dep.state not in exclude_states]
+        for name, node in nodes.items()
+    }
+    for targets in list(successors.values()):
+        for target in targets:
+            successors.setdefault(target, [])
+
+    # Propagate reachable sets (as int bitsets) once per strongly connected
+    # component, dependents first, instead of a fresh traversal per task.
+    # Members of a cycle reach each other, themselves included.
+    bit = {name: 1 << i for i, name in enumerate(successors)}
+    component_of: dict[str, int] = {}
+    reach: list[int] = []
+    for i, component in enumerate(_strongly_connected_components(successors)):
+        members = 0
+        for name in component:
+            component_of[name] = i
+            members |= bit[name]
+        reachable = 0
+        cyclic = len(component) > 1
+        for name in component:
+            for succ in successors[name]:
+                j = component_of[succ]
+                if j == i:
+                    cyclic = True
+                else:
+                    reachable |= bit[succ] | reach[j]
+        reach.append(reachable | members if cyclic else reachable)
+
+    return {name: reach[component_of[name]].bit_count() for name in nodes}
+
+
+def get_dependency_cache_path(repo_root: Path) -> Path:
+    """Get path to the persisted dependency analysis."""
+    return repo_root / "state" / "dep-graph.json"
+
+
+def dependency_fingerprint(tasks: list[TaskInfo]) -> str:
+    """Hash of everything the dependency analysis depends on: names, states, requires."""
+    graph = sorted((task.name, task.state or "unknown", list(task.requires)) for task in tasks)
+    return sha256(json.dumps(graph, default=str).encode()).hexdigest()
+
+
+@dataclass
+class DependencyAnalysis:
+    """Cycles and unblocking power for a set of tasks."""
+
+    fingerprint: str
+    cycles: list[list[str]]
+    unblocking_power: dict[str, int]
+
+
+def analyze_dependencies(
+    tasks: list[TaskInfo],
+    cache_path: Path | None = None,
+) -> DependencyAnalysis:
+    """Build the dependency graph once and analyze it.
+
+    When ``cache_path`` is given, the analysis is persisted there together
+    with a fingerprint of task names, states and requires, and reused by
+    later commands for as long as those are unchanged.
+
+    Args:
+        tasks: List of all tasks
+        cache_path: Optional JSON file to persist the analysis in
+
+    Returns:
+        DependencyAnalysis with cycles and default unblocking power
+    """
+    fingerprint = dependency_fingerprint(tasks)
+    if cache_path is not None:
+        cached = load_cache(cache_path)
+        if cached.get("fingerprint") == fingerprint:
+            return DependencyAnalysis(
+                fingerprint=fingerprint,
+                cycles=cached.get("cycles", []),
+                unblocking_power=cached.get("unblocking_power", {}),
+            )
+
+    nodes = build_dependency_graph(tasks)
+    analysis = DependencyAnalysis(
+        fingerprint=fingerprint,
+        cycles=detect_circular_dependencies(nodes),
+        unblocking_power=compute_unblocking_power(nodes),
+    )
+    if cache_path is not None:
+        save_cache(
+            cache_path,
+            {
+                "fingerprint": fingerprint,
+                "cycles": analysis.cycles,
+                "unblocking_power": analysis.unblocking_power,
+            },
+        )
+    return analysis
 
 
 def render_full_dag_ascii(
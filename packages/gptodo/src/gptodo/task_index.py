@@ -0,0 +1,201 @@
+"""Persistent index of parsed task files.
+
+``load_tasks`` parses the YAML frontmatter of every task file on each call, so
+``gptodo ready``/``next``/``list`` pay a full parse of the tasks directory even
+when nothing changed.  The index caches the fields of each parsed ``TaskInfo``
+as JSON in SQLite, keyed by ``(path, mtime_ns, size)``: unchanged files are
+served from the index and only new or modified files are re-parsed.  Entries
+are plain data (never pickles), so a writable ``state/`` directory cannot be
+used to run code.
+
+The index lives in ``state/task-index.db`` next to the tasks directory
+(``state/`` is gitignored, like the issue cache and task locks).  Set
+``GPTODO_TASK_INDEX=0`` to disable it.
+
+Files modified within the last couple of seconds are parsed but not indexed:
+filesystem timestamps are coarse, so a same-size rewrite in the same tick
+(``state: todo`` -> ``state: done``) would otherwise keep a stale entry.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import os
+import sqlite3
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from gptodo.utils import TaskInfo
+
+logger = logging.getLogger(__name__)
+
+TASK_INDEX_ENV = "GPTODO_TASK_INDEX"
+
+# Bump when TaskInfo or the parsing in load_tasks changes, so stale entries
+# from an older gptodo are discarded rather than served.
+INDEX_VERSION = 2
+
+# Entries for files modified more recently than this are not trusted
+_RACY_WINDOW_NS = 2 * 10**9
+
+
+def get_task_index_path(tasks_dir: Path) -> Path:
+    """Get path to the task index for a tasks directory."""
+    return tasks_dir.resolve().parent / "state" / "task-index.db"
+
+
+def task_index_enabled() -> bool:
+    """Whether the persistent task index is enabled (``GPTODO_TASK_INDEX``)."""
+    return os.environ.get(TASK_INDEX_ENV, "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def _json_default(value: Any) -> Any:
+    # YAML frontmatter yields dates and datetimes; anything else is not indexed
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    raise TypeError(f"{type(value).__name__} is not indexable")
+
+
+def _json_object_hook(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1:
+        if "$datetime" in obj:
+            return datetime.fromisoformat(obj["$datetime"])
+        if "$date" in obj:
+            return date.fromisoformat(obj["$date"])
+    return obj
+
+
+def _encode_task(task: TaskInfo) -> str:
+    """Serialize every ``TaskInfo`` field except ``path`` as JSON."""
+    values = {f.name: getattr(task, f.name) for f in dataclasses.fields(task) if f.name != "path"}
+    return json.dumps(values, default=_json_default, separators=(",", ":"))
+
+
+def _decode_task(data: str, file: Path) -> TaskInfo:
+    from gptodo.utils import SubtaskCount, TaskInfo
+
+    values = json.loads(data, object_hook=_json_object_hook)
+    values["subtasks"] = SubtaskCount(*values["subtasks"])
+    return TaskInfo(path=file, **values)
+
+
+class TaskIndex:
+    """SQLite cache of parsed tasks, keyed by path, mtime and size.
+
+    Rows are read once on open; lookups are in-memory.  New entries are
+    buffered by :meth:`put` and written in one transaction by :meth:`save`.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), timeout=5.0, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != INDEX_VERSION:
+            self._conn.executescript(
+                f"""
+                BEGIN IMMEDIATE;
+                DROP TABLE IF EXISTS tasks;
+                CREATE TABLE tasks (
+                    path TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    data TEXT NOT NULL
+                );
+                PRAGMA user_version = {INDEX_VERSION};
+                COMMIT;
+                """
+            )
+        self._rows: Dict[str, Tuple[int, int, str]] = {
+            path: (mtime_ns, size, data)
+            for path, mtime_ns, size, data in self._conn.execute(
+                "SELECT path, mtime_ns, size, data FROM tasks"
+            )
+        }
+        self._pending: List[Tuple[str, int, int, str]] = []
+        self._seen: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get(self, file: Path, st: os.stat_result) -> TaskInfo | None:
+        """Return the indexed task for ``file`` if it is unchanged, else None."""
+        key = os.path.abspath(file)
+        self._seen.add(key)
+        row = self._rows.get(key)
+        if row is None or row[0] != st.st_mtime_ns or row[1] != st.st_size:
+            return None
+        try:
+            # Serve the path as the caller spelled it (relative or absolute)
+            return _decode_task(row[2], file)
+        except Exception as e:
+            logger.debug("Discarding unreadable task index entry for %s: %s", file, e)
+            return None
+
+    def put(self, file: Path, st: os.stat_result, task: TaskInfo) -> None:
+        """Buffer a freshly parsed task for the next :meth:`save`."""
+        if time.time_ns() - st.st_mtime_ns < _RACY_WINDOW_NS:
+            return
+        try:
+            data = _encode_task(task)
+            # Frontmatter JSON cannot represent exactly (e.g. non-string keys,
+            # sets) is left out of the index rather than served altered.
+            if _decode_task(data, task.path) != task:
+                return
+        except (TypeError, ValueError):
+            return
+        self._pending.append((os.path.abspath(file), st.st_mtime_ns, st.st_size, data))
+
+    def save(self, root: Path) -> None:
+        """Write buffered entries and drop entries for deleted files under ``root``."""
+        prefix = os.path.join(os.path.abspath(root), "")
+        removed = [
+            (p,)
+            for p in self._rows
+            if p not in self._seen and p.startswith(prefix) and not os.path.exists(p)
+        ]
+        if not self._pending and not removed:
+            return
+        try:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO tasks (path, mtime_ns, size, data) VALUES (?, ?, ?, ?)",
+                    self._pending,
+                )
+                self._conn.executemany("DELETE FROM tasks WHERE path = ?", removed)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error as e:
+            # Non-critical: the next load re-parses what was not written
+            logger.warning("Could not update task index: %s", e)
+            return
+        for path, mtime_ns, size, data in self._pending:
+            self._rows[path] = (mtime_ns, size, data)
+        for (path,) in removed:
+            self._rows.pop(path, None)
+        self._pending.clear()
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def open_task_index(tasks_dir: Path) -> TaskIndex | None:
+    """Open the index for ``tasks_dir``, or None if disabled or unavailable."""
+    if not task_index_enabled():
+        return None
+    try:
+        return TaskIndex(get_task_index_path(tasks_dir))
+    except (OSError, sqlite3.Error) as e:
+        logger.debug("Task index unavailable, parsing all task files: %s", e)
+        return None
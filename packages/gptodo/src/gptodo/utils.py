@@ -17,6 +17,7 @@ import re
 import subprocess
 import tempfile
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import fcntl as _fcntl
@@ -32,6 +33,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    Iterable,
     List,
     NamedTuple,
     Optional,
@@ -1130,6 +1132,136 @@ def load_task(file: Path) -> Tuple[fmPost, SubtaskCount]:
     return post, subtasks
 
 
+def _warn_multiple_dependency_fields(file: Path, metadata: Dict[str, Any]) -> None:
+    """Warn if a task sets more than one of requires/blocks/depends (potential confusion)."""
+    fields_present = [f for f in ("requires", "blocks", "depends") if metadata.get(f)]
+    if len(fields_present) > 1:
+        warnings.warn(
+            f"Task '{file.stem}' has multiple dependency fields: {fields_present}. "
+            f"Using 'requires' (canonical). Note: 'blocks' has different semantics and is ignored.",
+            DeprecationWarning,
+            stacklevel=3,
+        )
+
+
+def _parse_task_file(file: Path) -> TaskInfo:
+    """Parse a task file's frontmatter and content into a TaskInfo."""
+    frontmatter = _get_frontmatter()
+    # Read frontmatter and content
+    post = frontmatter.load(file)
+    metadata = post.metadata
+
+    # Validate file format and required fields
+    issues = validate_task_file(file, post)
+
+    # Count subtasks
+    subtasks = count_subtasks(post.content)
+
+    # Get state (default to backlog if missing)
+    state = metadata.get("state")
+    if not state:
+        issues.append("No state in frontmatter")
+        state = "backlog"  # Default state (canonical)
+    else:
+        # Normalize deprecated states (new/paused → backlog)
+        # Note: warnings suppressed during load, validated separately
+        state = normalize_state(state, warn=False)
+
+    # Parse timestamps
+    # Helper to parse datetime fields (accepts date-only or full datetime)
+    def parse_datetime_field(value) -> datetime:
+        """Parse datetime field that could be date-only or full datetime."""
+        if isinstance(value, datetime):
+            return value
+        value_str = str(value)
+        try:
+            return datetime.fromisoformat(value_str)
+        except ValueError:
+            # Try parsing as date-only
+            date_obj = date.fromisoformat(value_str)
+            return datetime.combine(date_obj, datetime.min.time())
+
+    # Parse created and modified independently to avoid git fallback
+    # when only one field is missing (common: modified is rarely in frontmatter)
+    stats = file.stat()
+
+    # Parse created timestamp
+    try:
+        created = parse_datetime_field(metadata.get("created", ""))
+    except (ValueError, TypeError):
+        created = datetime.fromtimestamp(stats.st_ctime)
+
+    # Parse modified timestamp — use file mtime as fast fallback
+    # (avoids expensive git log subprocess per task)
+    if "modified" in metadata:
+        try:
+            modified = parse_datetime_field(metadata["modified"])
+        except (ValueError, TypeError):
+            modified = datetime.fromtimestamp(stats.st_mtime)
+    else:
+        modified = datetime.fromtimestamp(stats.st_mtime)
+
+    # Convert to naive datetime if timezone-aware
+    if created.tzinfo:
+        created = created.astimezone().replace(tzinfo=None)
+    if modified.tzinfo:
+        modified = modified.astimezone().replace(tzinfo=None)
+
+    # Create TaskInfo object
+    # Get relationship fields (new typed dependencies)
+    # requires is canonical, depends is deprecated alias, blocks is NOT merged (different semantics)
+    depends_list = metadata.get("depends", [])
+    requires_list = metadata.get("requires", [])
+
+    # Merge depends into requires (depends is deprecated alias with same semantics)
+    # blocks is NOT merged because it has inverse semantics (this task blocks X, not X blocks this)
+    # Priority: requires > depends (blocks is separate)
+    effective_requires = requires_list if requires_list else depends_list
+
+    # Parse assigned_at timestamp if present
+    assigned_at = None
+    if metadata.get("assigned_at"):
+        try:
+            assigned_at = parse_datetime_field(metadata.get("assigned_at"))
+            if assigned_at and assigned_at.tzinfo:
+                assigned_at = assigned_at.astimezone().replace(tzinfo=None)
+        except (ValueError, TypeError):
+            pass  # Leave as None if parsing fails
+
+    return TaskInfo(
+        path=file,
+        name=file.stem,
+        state=state,
+        created=created,
+        modified=modified,
+        priority=metadata.get("priority"),
+        tags=metadata.get("tags", []),
+        depends=depends_list,  # Deprecated, use requires instead
+        requires=effective_requires,  # Canonical required deps
+        related=metadata.get("related", []),
+        parent=metadata.get("parent"),
+        discovered_from=metadata.get("discovered-from", []),
+        subtasks=subtasks,
+        issues=issues,
+        metadata=metadata,
+        # Scheduling fields
+        wait=parse_wait(metadata.get("wait")),
+        recur=metadata.get("recur"),
+        # Multi-agent coordination fields (Phase 2)
+        parallelizable=bool(metadata.get("parallelizable", False)),
+        isolation=metadata.get("isolation"),
+        worktree_path=metadata.get("worktree_path"),
+        assigned_to=metadata.get("assigned_to"),
+        assigned_at=assigned_at,
+        lock_timeout_hours=metadata.get("lock_timeout_hours"),
+        spawned_from=metadata.get("spawned_from"),
+        spawned_tasks=metadata.get("spawned_tasks", []),
+        coordination_mode=metadata.get("coordination_mode"),
+        success_criterion=metadata.get("success_criterion"),
+        pool=metadata.get("pool"),
+    )
+
+
 def load_tasks(
     tasks_dir: Path,
     recursive: bool = False,
@@ -1147,10 +1279,15 @@ def load_tasks(
             ``logging.error`` — preserving the legacy behaviour. Pass a list to
             surface dropped files to the caller (e.g. for ``gptodo check``).
 
+    Directory loads go through the persistent task index
+    (``state/task-index.db``), which re-parses only files whose mtime or size
+    changed since the last load. Set ``GPTODO_TASK_INDEX=0`` to disable it.
+
     Returns:
         List of TaskInfo objects
     """
-    frontmatter = _get_frontmatter()
+    from gptodo.task_index import open_task_index
+
     tasks = []
 
     # Directories to exclude
@@ -1171,144 +1308,30 @@ def load_tasks(
             if not recursive or not any(d in f.parts for d in excluded_dirs)
         ]
 
-    for file in files:
-        try:
-            # Read frontmatter and content
-            post = frontmatter.load(file)
-            metadata = post.metadata
-
-            # Validate file format and required fields
-            issues = validate_task_file(file, post)
-
-            # Count subtasks
-            subtasks = count_subtasks(post.content)
-
-            # Get state (default to backlog if missing)
-            state = metadata.get("state")
-            if not state:
-                issues.append("No state in frontmatter")
-                state = "backlog"  # Default state (canonical)
-            else:
-                # Normalize deprecated states (new/paused → backlog)
-                # Note: warnings suppressed during load, validated separately
-                state = normalize_state(state, warn=False)
-
-            # Parse timestamps
-            # Helper to parse datetime fields (accepts date-only or full datetime)
-            def parse_datetime_field(value) -> datetime:
-                """Parse datetime field that could be date-only or full datetime."""
-                if isinstance(value, datetime):
-                    return value
-                value_str = str(value)
-                try:
-                    return datetime.fromisoformat(value_str)
-                except ValueError:
-                    # Try parsing as date-only
-                    date_obj = date.fromisoformat(value_str)
-                    return datetime.combine(date_obj, datetime.min.time())
-
-            # Parse created and modified independently to avoid git fallback
-            # when only one field is missing (common: modified is rarely in frontmatter)
-            stats = file.stat()
-
-            # Parse created timestamp
+    # Unchanged files are served from the persistent index (see task_index)
+    index = open_task_index(tasks_dir) if files and not single_file else None
+    try:
+        for file in files:
             try:
-                created = parse_datetime_field(metadata.get("created", ""))
-            except (ValueError, TypeError):
-                created = datetime.fromtimestamp(stats.st_ctime)
-
-            # Parse modified timestamp — use file mtime as fast fallback
-            # (avoids expensive git log subprocess per task)
-            if "modified" in metadata:
-                try:
-                    modified = parse_datetime_field(metadata["modified"])
-                except (ValueError, TypeError):
-                    modified = datetime.fromtimestamp(stats.st_mtime)
-            else:
-                modified = datetime.fromtimestamp(stats.st_mtime)
-
-            # Convert to naive datetime if timezone-aware
-            if created.tzinfo:
-                created = created.astimezone().replace(tzinfo=None)
-            if modified.tzinfo:
-                modified = modified.astimezone().replace(tzinfo=None)
-
-            # Create TaskInfo object
-            # Get relationship fields (new typed dependencies)
-            # requires is canonical, depends is deprecated alias, blocks is NOT merged (different semantics)
-            depends_list = metadata.get("depends", [])
-            blocks_list = metadata.get("blocks", [])  # NOT merged - different semantics
-            requires_list = metadata.get("requires", [])
-
-            # Warn if multiple fields are present (potential confusion)
-            fields_present = []
-            if requires_list:
-                fields_present.append("requires")
-            if blocks_list:
-                fields_present.append("blocks")
-            if depends_list:
-                fields_present.append("depends")
-            if len(fields_present) > 1:
-                warnings.warn(
-                    f"Task '{file.stem}' has multiple dependency fields: {fields_present}. "
-                    f"Using 'requires' (canonical). Note: 'blocks' has different semantics and is ignored.",
-                    DeprecationWarning,
-                    stacklevel=2,
-                )
-
-            # Merge depends into requires (depends is deprecated alias with same semantics)
-            # blocks is NOT merged because it has inverse semantics (this task blocks X, not X blocks this)
-            # Priority: requires > depends (blocks is separate)
-            effective_requires = requires_list if requires_list else depends_list
-
-            # Parse assigned_at timestamp if present
-            assigned_at = None
-            if metadata.get("assigned_at"):
-                try:
-                    assigned_at = parse_datetime_field(metadata.get("assigned_at"))
-                    if assigned_at and assigned_at.tzinfo:
-                        assigned_at = assigned_at.astimezone().replace(tzinfo=None)
-                except (ValueError, TypeError):
-                    pass  # Leave as None if parsing fails
-
-            task = TaskInfo(
-                path=file,
-                name=file.stem,
-                state=state,
-                created=created,
-                modified=modified,
-                priority=metadata.get("priority"),
-                tags=metadata.get("tags", []),
-                depends=depends_list,  # Deprecated, use requires instead
-                requires=effective_requires,  # Canonical required deps
-                related=metadata.get("related", []),
-                parent=metadata.get("parent"),
-                discovered_from=metadata.get("discovered-from", []),
-                subtasks=subtasks,
-                issues=issues,
-                metadata=metadata,
-                # Scheduling fields
-                wait=parse_wait(metadata.get("wait")),
-                recur=metadata.get("recur"),
-                # Multi-agent coordination fields (Phase 2)
-                parallelizable=bool(metadata.get("parallelizable", False)),
-                isolation=metadata.get("isolation"),
-                worktree_path=metadata.get("worktree_path"),
-                assigned_to=metadata.get("assigned_to"),
-                assigned_at=assigned_at,
-                lock_timeout_hours=metadata.get("lock_timeout_hours"),
-                spawned_from=metadata.get("spawned_from"),
-                spawned_tasks=metadata.get("spawned_tasks", []),
-                coordination_mode=metadata.get("coordination_mode"),
-                success_criterion=metadata.get("success_criterion"),
-                pool=metadata.get("pool"),
-            )
-            tasks.append(task)
-
-        except Exception as e:
-            logging.error(f"Error reading {file}: {e}")
-            if errors_out is not None:
-                errors_out.append((file, str(e)))
+                task = None
+                if index is not None:
+                    st = file.stat()
+                    task = index.get(file, st)
+                if task is None:
+                    task = _parse_task_file(file)
+                    if index is not None:
+                        index.put(file, st, task)
+                _warn_multiple_dependency_fields(file, task.metadata)
+                tasks.append(task)
+
+            except Exception as e:
+                logging.error(f"Error reading {file}: {e}")
+                if errors_out is not None:
+                    errors_out.append((file, str(e)))
+    finally:
+        if index is not None:
+            index.save(tasks_dir)
+            index.close()
 
     return tasks
 
@@ -1934,6 +1957,25 @@ def extract_external_urls(task: TaskInfo) -> List[str]:
     return urls
 
 
+_GITHUB_URL_RE = re.compile(r"https://github\.com/([^/]+/[^/]+)/(issues|pull)/(\d+)")
+
+# Issue/PR lookups per `gh api graphql` call, kept well under GitHub's node limit
+GRAPHQL_BATCH_SIZE = 50
+
+# Concurrent gh invocations when fetching many URL states
+DEFAULT_FETCH_CONCURRENCY = 8
+
+
+def _github_url_state(repo: str, number: str, details: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "state": details.get("state"),
+        "updatedAt": details.get("updatedAt"),
+        "source": "github",
+        "repo": repo,
+        "number": number,
+    }
+
+
 def fetch_url_state(url: str) -> Dict[str, Any] | None:
     """Fetch state and metadata for a GitHub/Linear URL.
 
@@ -1942,21 +1984,14 @@ def fetch_url_state(url: str) -> Dict[str, Any] | None:
         and optionally 'updatedAt' for activity tracking.
     """
     # Parse GitHub URL
-    gh_match = re.match(r"https://github\.com/([^/]+/[^/]+)/(issues|pull)/(\d+)", url)
+    gh_match = _GITHUB_URL_RE.match(url)
     if gh_match:
         repo = gh_match.group(1)
         number = gh_match.group(3)
         details = fetch_github_issue_details(repo, number)
         if details:
-            return {
-                "state": details.get("state"),
-                "updatedAt": details.get("updatedAt"),
-                "source": "github",
-                "repo": repo,
-                "number": number,
-            }
+            return _github_url_state(repo, number, details)
         return None
-
     # Parse Linear URL
     linear_match = re.match(r"https://linear\.app/([^/]+)/issue/([^/]+)", url)
     if linear_match:
@@ -1979,3 +2014,98 @@ def fetch_url_state(url: str) -> Dict[str, Any] | None:
         return None
 
     return None
+
+
+def fetch_github_issue_details_batch(
+    items: List[Tuple[str, str]],
+) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """Fetch state and updatedAt for many issues/PRs in one GraphQL query.
+
+    Args:
+        items: (repo, number) pairs, possibly spanning several repositories
+
+    Returns:
+        Dict mapping (repo, number) to {'state', 'updatedAt'} for every item
+        GitHub resolved. Items that failed (not found, no access, or the whole
+        query failing) are omitted so callers can fall back to per-item calls.
+    """
+    by_repo: Dict[str, List[str]] = {}
+    for repo, number in items:
+        by_repo.setdefault(repo, [])
+        if number not in by_repo[repo]:
+            by_repo[repo].append(number)
+
+    fields = "... on Issue { state updatedAt } ... on PullRequest { state updatedAt }"
+    repo_queries = []
+    for i, (repo, numbers) in enumerate(by_repo.items()):
+        owner, name = repo.split("/", 1)
+        lookups = " ".join(
+            f"n{number}: issueOrPullRequest(number: {int(number)}) {{ {fields} }}"
+            for number in numbers
+        )
+        repo_queries.append(
+            f"r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{ {lookups} }}"
+        )
+    query = "query { " + " ".join(repo_queries) + " }"
+
+    try:
+        # gh exits non-zero when any aliased field errors, but still prints
+        # the partial data, so parse stdout regardless of the return code
+        result = subprocess.run(
+            ["gh", "api", "graphql", "-f", f"query={query}"],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        data = json.loads(result.stdout or "{}").get("data") or {}
+    except (subprocess.TimeoutExpired, OSError, json.JSONDecodeError, AttributeError):
+        return {}
+
+    details: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for i, (repo, numbers) in enumerate(by_repo.items()):
+        nodes = data.get(f"r{i}") or {}
+        for number in numbers:
+            node = nodes.get(f"n{number}") or {}
+            if node.get("state"):
+                details[(repo, number)] = {
+                    "state": node["state"],
+                    "updatedAt": node.get("updatedAt"),
+                }
+    return details
+
+
+def fetch_url_states(
+    urls: Iterable[str], concurrency: int = DEFAULT_FETCH_CONCURRENCY
+) -> Dict[str, Dict[str, Any] | None]:
+    """Fetch state and metadata for many URLs, like :func:`fetch_url_state` per URL.
+
+    GitHub issues/PRs are looked up with batched GraphQL queries of up to
+    ``GRAPHQL_BATCH_SIZE`` items each. Items a batch could not resolve and
+    non-GitHub URLs (Linear) fall back to :func:`fetch_url_state`. Batches and
+    fallbacks run on a pool of ``concurrency`` threads.
+
+    Returns:
+        Dict mapping each URL to its state info, or None if it could not be fetched.
+    """
+    unique_urls = list(dict.fromkeys(urls))
+    github: Dict[str, Tuple[str, str]] = {}
+    for url in unique_urls:
+        gh_match = _GITHUB_URL_RE.match(url)
+        if gh_match:
+            github[url] = (gh_match.group(1), gh_match.group(3))
+
+    items = list(dict.fromkeys(github.values()))
+    batches = [items[i : i + GRAPHQL_BATCH_SIZE] for i in range(0, len(items), GRAPHQL_BATCH_SIZE)]
+    results: Dict[str, Dict[str, Any] | None] = {}
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        details: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for batch_details in pool.map(fetch_github_issue_details_batch, batches):
+            details.update(batch_details)
+        for url, (repo, number) in github.items():
+            if (repo, number) in details:
+                results[url] = _github_url_state(repo, number, details[(repo, number)])
+
+        fallback = [url for url in unique_urls if url not in results]
+        for url, state_info in zip(fallback, pool.map(fetch_url_state, fallback)):
+            results[url] = state_info
+    return {url: results[url] for url in unique_urls}
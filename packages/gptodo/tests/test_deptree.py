@@ -1,12 +1,19 @@
 """Tests for deptree module: dependency graph, unblocking power, DAG rendering."""
 
+import random
+import sys
+import time
 from datetime import datetime
 from pathlib import Path
 
+import pytest
+
 from gptodo.deptree import (
     DependencyNode,
+    analyze_dependencies,
     build_dependency_graph,
     compute_unblocking_power,
+    detect_circular_dependencies,
     render_dag_mermaid,
     render_full_dag_ascii,
 )
@@ -405,3 +412,179 @@ class TestRenderDagMermaid:
         assert name not in result
         assert "task &quot;quoted&quot; [bracket] &lt;tag&gt;&#10;next" in result
         assert "\nnext" not in result
+
+
+# ---------------------------------------------------------------------------
+# Propagated unblocking power, cycle detection and persisted analysis
+# ---------------------------------------------------------------------------
+
+
+def reference_unblocking_power(
+    nodes: dict[str, DependencyNode], exclude_states: set[str] | None = None
+) -> dict[str, int]:
+    """Per-task traversal, as compute_unblocking_power did before propagation."""
+    if exclude_states is None:
+        exclude_states = {"done", "cancelled"}
+
+    def _dependents(name: str, seen: set[str]) -> set[str]:
+        result: set[str] = set()
+        node = nodes.get(name)
+        if not node:
+            return result
+        for dep in node.required_by:
+            if dep.name in seen:
+                continue
+            if dep.state not in exclude_states:
+                result.add(dep.name)
+                seen.add(dep.name)
+                result.update(_dependents(dep.name, seen))
+        return result
+
+    return {name: len(_dependents(name, set())) for name in nodes}
+
+
+def random_tasks(rng: random.Random, n: int, cycles: bool = False) -> list[TaskInfo]:
+    """Random dependency graph: mostly backward edges, optionally some forward ones."""
+    tasks = []
+    for i in range(n):
+        requires = [f"t{rng.randrange(i)}" for _ in range(rng.randint(0, 3)) if i]
+        if cycles and rng.random() < 0.1:
+            requires.append(f"t{rng.randrange(n)}")
+        if rng.random() < 0.05:
+            requires.append("https://github.com/gptme/gptme/issues/1")
+        if rng.random() < 0.05:
+            requires.append("missing-task")
+        state = rng.choice(["active", "todo", "backlog", "done", "cancelled", "waiting"])
+        tasks.append(make_task(f"t{i}", state=state, requires=requires))
+    return tasks
+
+
+def layered_dag(n: int, width: int = 50) -> list[TaskInfo]:
+    """Deep DAG: each task requires 1-3 tasks from the previous layer."""
+    rng = random.Random(n)
+    tasks = []
+    for i in range(n):
+        layer_start = (i // width - 1) * width
+        requires = (
+            sorted({f"t{layer_start + rng.randrange(width)}" for _ in range(rng.randint(1, 3))})
+            if i >= width
+            else []
+        )
+        tasks.append(
+            make_task(f"t{i}", state=rng.choice(["active", "todo", "done"]), requires=requires)
+        )
+    return tasks
+
+
+class TestPropagatedUnblockingPower:
+    @pytest.mark.parametrize("seed", range(20))
+    @pytest.mark.parametrize("cycles", [False, True])
+    def test_matches_per_task_traversal(self, seed: int, cycles: bool):
+        nodes = build_dependency_graph(random_tasks(random.Random(seed), 60, cycles=cycles))
+        for exclude in (None, {"done", "cancelled", "waiting"}, set()):
+            assert compute_unblocking_power(nodes, exclude) == reference_unblocking_power(
+                nodes, exclude
+            )
+
+    def test_cycle_members_count_each_other(self):
+        tasks = [
+            make_task("a", requires=["c"]),
+            make_task("b", requires=["a"]),
+            make_task("c", requires=["b"]),
+            make_task("d", requires=["c"]),
+        ]
+        power = compute_unblocking_power(build_dependency_graph(tasks))
+        assert power == {"a": 4, "b": 4, "c": 4, "d": 0}
+
+    def test_deep_chain(self):
+        """A 5000-deep chain is handled without recursion."""
+        n = 5000
+        assert n > sys.getrecursionlimit()
+        tasks = [make_task(f"t{i}", requires=[f"t{i - 1}"] if i else []) for i in range(n)]
+        nodes = build_dependency_graph(tasks)
+        power = compute_unblocking_power(nodes)
+        assert power["t0"] == n - 1
+        assert power[f"t{n - 1}"] == 0
+        assert detect_circular_dependencies(nodes) == []
+
+
+class TestDetectCircularDependencies:
+    def test_reports_cycle_path(self):
+        tasks = [
+            make_task("a", requires=["b"]),
+            make_task("b", requires=["c"]),
+            make_task("c", requires=["a"]),
+            make_task("d", requires=["a"]),
+        ]
+        nodes = build_dependency_graph(tasks)
+        assert detect_circular_dependencies(nodes) == [["a", "b", "c", "a"]]
+        assert nodes["a"].is_circular
+        assert not nodes["d"].is_circular
+
+    def test_self_dependency(self):
+        nodes = build_dependency_graph([make_task("a", requires=["a"])])
+        assert detect_circular_dependencies(nodes) == [["a", "a"]]
+
+
+class TestAnalyzeDependencies:
+    def test_persisted_analysis_is_reused_until_graph_changes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        import gptodo.deptree as deptree
+
+        cache_path = tmp_path / "state" / "dep-graph.json"
+        tasks = [make_task("a"), make_task("b", requires=["a"]), make_task("c", requires=["b"])]
+        first = analyze_dependencies(tasks, cache_path)
+        assert first.unblocking_power == {"a": 2, "b": 1, "c": 0}
+        assert first.cycles == []
+
+        calls = []
+        real_compute = deptree.compute_unblocking_power
+        monkeypatch.setattr(
+            deptree,
+            "compute_unblocking_power",
+            lambda nodes, *a: calls.append(1) or real_compute(nodes, *a),
+        )
+        # Same names, states and requires (other metadata may differ): reused
+        assert (
+            analyze_dependencies(
+                [make_task(t.name, t.state, t.requires) for t in tasks], cache_path
+            )
+            == first
+        )
+        assert calls == []
+
+        # A state change invalidates it
+        tasks[1] = make_task("b", state="done", requires=["a"])
+        second = analyze_dependencies(tasks, cache_path)
+        assert calls == [1]
+        assert second.unblocking_power == {"a": 0, "b": 1, "c": 0}
+
+    def test_cycles_reported(self):
+        tasks = [make_task("a", requires=["b"]), make_task("b", requires=["a"])]
+        assert analyze_dependencies(tasks).cycles == [["a", "b", "a"]]
+
+
+@pytest.mark.slow
+def test_benchmark_unblocking_power_10k():
+    """Unblocking power on a generated 10k-task DAG, propagated vs per-task traversal.
+
+    Run with ``pytest -m slow -s`` to see the timings.
+    """
+    nodes = build_dependency_graph(layered_dag(10_000))
+    start = time.perf_counter()
+    power = compute_unblocking_power(nodes)
+    cycles = detect_circular_dependencies(nodes)
+    propagated_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    reference = reference_unblocking_power(nodes)
+    reference_s = time.perf_counter() - start
+
+    print(
+        f"\n10k-task DAG: propagated {propagated_s * 1000:.0f}ms,"
+        f" per-task traversal {reference_s * 1000:.0f}ms"
+    )
+    assert cycles == []
+    assert power == reference
+    assert propagated_s < reference_s
@@ -0,0 +1,219 @@
+"""Tests for batched GitHub state fetching (fetch_url_states) against a fake gh."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from gptodo.cli import cli
+from gptodo.utils import GRAPHQL_BATCH_SIZE, fetch_url_state, fetch_url_states, load_cache
+
+FAKE_GH = r'''#!{python}
+"""Fake gh: logs each invocation and answers from a fixture of issues/PRs."""
+import json, os, re, sys
+
+args = sys.argv[1:]
+with open(os.environ["FAKE_GH_LOG"], "a") as f:
+    f.write(json.dumps(args) + "\n")
+items = json.load(open(os.environ["FAKE_GH_FIXTURES"]))
+
+if args[:2] in (["issue", "view"], ["pr", "view"]):
+    item = items.get(f"{{args[args.index('--repo') + 1]}}#{{args[2]}}")
+    if item is None or item["kind"] != args[0]:
+        sys.exit(1)
+    print(json.dumps({{"state": item["state"], "updatedAt": item["updatedAt"]}}))
+elif args[:2] == ["api", "graphql"]:
+    if os.environ.get("FAKE_GH_GRAPHQL_FAIL"):
+        print("HTTP 502", file=sys.stderr)
+        sys.exit(1)
+    query = args[3].removeprefix("query=")
+    parts = re.split(r'(r\d+): repository\(owner: ("[^"]*"), name: ("[^"]*")\)', query)
+    data, errors = {{}}, []
+    for alias, owner, name, body in zip(parts[1::4], parts[2::4], parts[3::4], parts[4::4]):
+        repo = f"{{json.loads(owner)}}/{{json.loads(name)}}"
+        data[alias] = {{}}
+        for node_alias, number in re.findall(r"(n\d+): issueOrPullRequest\(number: (\d+)\)", body):
+            item = items.get(f"{{repo}}#{{number}}")
+            if item is None:
+                data[alias][node_alias] = None
+                errors.append({{"type": "NOT_FOUND", "path": [alias, node_alias]}})
+            else:
+                data[alias][node_alias] = {{"state": item["state"], "updatedAt": item["updatedAt"]}}
+    print(json.dumps({{"data": data, "errors": errors}} if errors else {{"data": data}}))
+    sys.exit(1 if errors else 0)
+else:
+    sys.exit(2)
+'''
+
+
+class FakeGh:
+    def __init__(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        gh = bin_dir / "gh"
+        gh.write_text(FAKE_GH.format(python=sys.executable))
+        gh.chmod(0o755)
+        self.log = tmp_path / "gh.log"
+        self.log.touch()
+        self.fixtures = tmp_path / "gh-fixtures.json"
+        monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+        monkeypatch.setenv("FAKE_GH_LOG", str(self.log))
+        monkeypatch.setenv("FAKE_GH_FIXTURES", str(self.fixtures))
+        monkeypatch.delenv("LINEAR_API_KEY", raising=False)
+
+    def set_items(self, items: dict[str, dict]) -> None:
+        self.fixtures.write_text(json.dumps(items))
+
+    def calls(self) -> list[list[str]]:
+        return [json.loads(line) for line in self.log.read_text().splitlines()]
+
+    def reset(self) -> None:
+        self.log.write_text("")
+
+
+@pytest.fixture
+def fake_gh(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> FakeGh:
+    return FakeGh(tmp_path, monkeypatch)
+
+
+def _items(n: int) -> dict[str, dict]:
+    items = {}
+    for i in range(n):
+        repo = ["gptme/gptme", "gptme/gptme-contrib", "ErikBjare/bob"][i % 3]
+        kind = "pr" if i % 4 == 0 else "issue"
+        state = {"pr": ["OPEN", "MERGED", "CLOSED"], "issue": ["OPEN", "CLOSED"]}[kind][i % 2]
+        items[f"{repo}#{100 + i}"] = {
+            "kind": kind,
+            "state": state,
+            "updatedAt": f"2026-03-{1 + i % 28:02d}T10:00:00Z",
+        }
+    return items
+
+
+def _urls(items: dict[str, dict]) -> list[str]:
+    urls = []
+    for key, item in items.items():
+        repo, number = key.split("#")
+        urls.append(
+            f"https://github.com/{repo}/{'pull' if item['kind'] == 'pr' else 'issues'}/{number}"
+        )
+    return urls
+
+
+def test_batched_states_match_per_url(fake_gh: FakeGh) -> None:
+    items = _items(45)
+    fake_gh.set_items(items)
+    urls = _urls(items) + [
+        "https://github.com/gptme/gptme/issues/99999",  # not found
+        "https://linear.app/team/issue/ENG-1",  # no LINEAR_API_KEY: None, no gh call
+        "https://example.com/not-tracked",
+    ]
+
+    expected = {url: fetch_url_state(url) for url in urls}
+    sequential_calls = len(fake_gh.calls())
+    fake_gh.reset()
+
+    assert fetch_url_states(urls, concurrency=4) == expected
+    batched_calls = fake_gh.calls()
+    assert expected[urls[0]] == {
+        "state": "OPEN",
+        "updatedAt": "2026-03-01T10:00:00Z",
+        "source": "github",
+        "repo": "gptme/gptme",
+        "number": "100",
+    }
+    # One GraphQL query, plus issue view + pr view for the unresolved URL
+    assert [c[:2] for c in batched_calls].count(["api", "graphql"]) == 1
+    assert len(batched_calls) == 3
+    assert sequential_calls > 45
+
+
+def test_batches_are_split(fake_gh: FakeGh) -> None:
+    items = _items(GRAPHQL_BATCH_SIZE * 2 + 5)
+    fake_gh.set_items(items)
+    states = fetch_url_states(_urls(items))
+    assert all(state is not None for state in states.values())
+    assert len(fake_gh.calls()) == 3
+
+
+def test_graphql_failure_falls_back_to_per_url(
+    fake_gh: FakeGh, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    items = _items(8)
+    fake_gh.set_items(items)
+    urls = _urls(items)
+    expected = {url: fetch_url_state(url) for url in urls}
+    monkeypatch.setenv("FAKE_GH_GRAPHQL_FAIL", "1")
+    assert fetch_url_states(urls) == expected
+
+
+def test_duplicate_urls_are_fetched_once(fake_gh: FakeGh) -> None:
+    items = _items(2)
+    fake_gh.set_items(items)
+    urls = _urls(items)
+    assert list(fetch_url_states(urls + urls[::-1])) == urls
+    assert len(fake_gh.calls()) == 1
+
+
+def test_sync_fetches_tracked_issues_in_one_call(
+    fake_gh: FakeGh, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    items = _items(12)
+    fake_gh.set_items(items)
+    tasks_dir = tmp_path / "repo" / "tasks"
+    tasks_dir.mkdir(parents=True)
+    for i, (key, url) in enumerate(zip(items, _urls(items))):
+        # Mix full URLs and the owner/repo#123 short form
+        tracking = url if i % 2 else key
+        (tasks_dir / f"task-{i}.md").write_text(
+            f"---\nstate: active\ncreated: 2026-03-01\ntracking: {tracking}\n---\n# Task {i}\n"
+        )
+    monkeypatch.setenv("GPTODO_TASKS_DIR", str(tasks_dir))
+
+    result = CliRunner().invoke(cli, ["sync", "--json"])
+    assert result.exit_code == 0, result.output
+    synced = {r["task"]: r for r in json.loads(result.output)["synced_tasks"]}
+    for i, item in enumerate(items.values()):
+        assert synced[f"task-{i}"]["issue_state"] == item["state"]
+        assert synced[f"task-{i}"]["updated_at"] == item["updatedAt"]
+    assert [c[:2] for c in fake_gh.calls()] == [["api", "graphql"]]
+
+    # Live results are written to the issue cache, so --use-cache agrees without gh
+    fake_gh.reset()
+    assert len(load_cache(tmp_path / "repo" / "state" / "issue-cache.json")) == 12
+    cached = CliRunner().invoke(cli, ["sync", "--json", "--use-cache"])
+    assert cached.exit_code == 0, cached.output
+    assert {r["task"]: r["issue_state"] for r in json.loads(cached.output)["synced_tasks"]} == {
+        name: r["issue_state"] for name, r in synced.items()
+    }
+    assert fake_gh.calls() == []
+
+
+def test_sync_keys_live_lookups_by_canonical_url(
+    fake_gh: FakeGh, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    items = _items(4)
+    fake_gh.set_items(items)
+    tasks_dir = tmp_path / "repo" / "tasks"
+    tasks_dir.mkdir(parents=True)
+    suffixes = ["/", "#issuecomment-1", "/files", "?notification_referrer_id=1"]
+    for i, (url, suffix) in enumerate(zip(_urls(items), suffixes)):
+        (tasks_dir / f"task-{i}.md").write_text(
+            f"---\nstate: active\ncreated: 2026-03-01\ntracking: '{url}{suffix}'\n---\n# Task {i}\n"
+        )
+    monkeypatch.setenv("GPTODO_TASKS_DIR", str(tasks_dir))
+
+    result = CliRunner().invoke(cli, ["sync", "--json"])
+    assert result.exit_code == 0, result.output
+    synced = {r["task"]: r for r in json.loads(result.output)["synced_tasks"]}
+    for i, item in enumerate(items.values()):
+        assert synced[f"task-{i}"]["issue_state"] == item["state"]
+    assert [c[:2] for c in fake_gh.calls()] == [["api", "graphql"]]
+    assert set(load_cache(tmp_path / "repo" / "state" / "issue-cache.json")) == {
+        f"https://github.com/{key.replace('#', '/issues/')}" for key in items
+    }
@@ -0,0 +1,233 @@
+"""Tests for the persistent task metadata index used by load_tasks."""
+
+import os
+import sqlite3
+import time
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from gptodo import task_index, utils
+from gptodo.task_index import TaskIndex, get_task_index_path
+from gptodo.utils import load_tasks
+
+TASK = """\
+---
+state: {state}
+created: 2026-04-{day:02d}T10:00:00+00:00
+priority: {priority}
+tags: [infra, t{n}]
+requires: [{requires}]
+---
+# Task {n}
+
+- [x] first
+- [ ] second
+"""
+
+
+def _write(tasks_dir: Path, n: int, state: str = "todo", age_s: float = 60, **kw) -> Path:
+    """Write task ``n``, backdating its mtime so the index trusts it."""
+    path = tasks_dir / f"task-{n:05d}.md"
+    text = TASK.format(
+        state=state,
+        day=1 + n % 28,
+        priority=kw.get("priority", ["high", "medium", "low"][n % 3]),
+        n=n,
+        requires=kw.get("requires", f"task-{n - 1:05d}" if n else ""),
+    )
+    path.write_text(text)
+    mtime = time.time() - age_s
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def _by_name(tasks: list) -> dict:
+    return {t.name: t for t in tasks}
+
+
+def _load_without_index(tasks_dir: Path) -> dict:
+    with patch.dict(os.environ, {task_index.TASK_INDEX_ENV: "0"}):
+        return _by_name(load_tasks(tasks_dir))
+
+
+@pytest.fixture
+def tasks_dir(tmp_path: Path) -> Path:
+    d = tmp_path / "tasks"
+    d.mkdir()
+    for n in range(20):
+        _write(d, n)
+    return d
+
+
+def test_warm_load_serves_index_without_parsing(tasks_dir: Path) -> None:
+    cold = load_tasks(tasks_dir)
+    assert get_task_index_path(tasks_dir).exists()
+    with patch.object(utils, "_parse_task_file", side_effect=AssertionError("parsed")):
+        warm = load_tasks(tasks_dir)
+    assert _by_name(warm) == _by_name(cold) == _load_without_index(tasks_dir)
+    assert warm[0].subtasks == (1, 2)
+
+
+def test_edits_adds_and_deletes_between_loads(tasks_dir: Path) -> None:
+    load_tasks(tasks_dir)
+
+    # A same-size edit (todo -> done), a resized edit, an addition and a deletion
+    _write(tasks_dir, 3, state="done", age_s=30)
+    _write(tasks_dir, 4, state="active", age_s=30, priority="low")
+    _write(tasks_dir, 100, age_s=30)
+    (tasks_dir / "task-00007.md").unlink()
+
+    parsed: list[str] = []
+    real_parse = utils._parse_task_file
+
+    def counting_parse(file: Path):
+        parsed.append(file.name)
+        return real_parse(file)
+
+    with patch.object(utils, "_parse_task_file", counting_parse):
+        tasks = _by_name(load_tasks(tasks_dir))
+    assert sorted(parsed) == ["task-00003.md", "task-00004.md", "task-00100.md"]
+    assert tasks == _load_without_index(tasks_dir)
+    assert tasks["task-00003"].state == "done"
+    assert tasks["task-00004"].priority == "low"
+    assert "task-00007" not in tasks
+
+    index = TaskIndex(get_task_index_path(tasks_dir))
+    assert len(index) == 20  # 19 surviving + 1 added; the deleted entry is pruned
+    index.close()
+
+
+def test_recently_modified_files_are_not_indexed(tasks_dir: Path) -> None:
+    """A same-size rewrite within one timestamp tick must not serve stale data."""
+    path = _write(tasks_dir, 50, state="todo", age_s=0)
+    st = path.stat()
+    assert _by_name(load_tasks(tasks_dir))["task-00050"].state == "todo"
+
+    # Rewrite with identical size and mtime: only safe because it was never indexed
+    path.write_text(path.read_text().replace("state: todo", "state: done"))
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert _by_name(load_tasks(tasks_dir))["task-00050"].state == "done"
+
+
+def test_relative_tasks_dir_paths(tasks_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    load_tasks(tasks_dir)
+    monkeypatch.chdir(tasks_dir.parent)
+    with patch.object(utils, "_parse_task_file", side_effect=AssertionError("parsed")):
+        tasks = load_tasks(Path("tasks"))
+    assert {t.path for t in tasks} == {Path("tasks") / f"task-{n:05d}.md" for n in range(20)}
+
+
+def test_broken_files_are_reported_on_every_load(tasks_dir: Path) -> None:
+    broken = tasks_dir / "broken.md"
+    broken.write_text("---\nstate: [unclosed\n---\n")
+    os.utime(broken, (time.time() - 60, time.time() - 60))
+    for _ in range(2):
+        errors: list = []
+        tasks = load_tasks(tasks_dir, errors_out=errors)
+        assert len(tasks) == 20
+        assert [f.name for f, _ in errors] == ["broken.md"]
+
+
+def test_dependency_field_warning_on_index_hits(tmp_path: Path) -> None:
+    tasks_dir = tmp_path / "tasks"
+    tasks_dir.mkdir()
+    path = _write(tasks_dir, 1)
+    path.write_text(path.read_text().replace("tags:", "depends: [x]\ntags:"))
+    os.utime(path, (time.time() - 60, time.time() - 60))
+    for _ in range(2):
+        with pytest.warns(DeprecationWarning, match="multiple dependency fields"):
+            load_tasks(tasks_dir)
+
+
+def test_index_version_mismatch_rebuilds(tasks_dir: Path) -> None:
+    load_tasks(tasks_dir)
+    db = get_task_index_path(tasks_dir)
+    conn = sqlite3.connect(db)
+    conn.execute("PRAGMA user_version = 0")
+    conn.close()
+    assert len(TaskIndex(db)) == 0
+    assert _by_name(load_tasks(tasks_dir)) == _load_without_index(tasks_dir)
+
+
+def test_index_entries_are_data_not_pickles(tasks_dir: Path, tmp_path: Path) -> None:
+    import pickle
+
+    load_tasks(tasks_dir)
+    marker = tmp_path / "pwned"
+
+    class Exploit:
+        def __reduce__(self):
+            return (Path.touch, (marker,))
+
+    conn = sqlite3.connect(get_task_index_path(tasks_dir))
+    (data,) = conn.execute("SELECT data FROM tasks LIMIT 1").fetchone()
+    assert isinstance(data, str) and data.startswith("{")
+    with conn:
+        conn.execute("UPDATE tasks SET data = ?", (pickle.dumps(Exploit()),))
+    conn.close()
+
+    assert _by_name(load_tasks(tasks_dir)) == _load_without_index(tasks_dir)
+    assert not marker.exists()
+
+
+def test_frontmatter_values_round_trip(tmp_path: Path) -> None:
+    tasks_dir = tmp_path / "tasks"
+    tasks_dir.mkdir()
+    dated = _write(tasks_dir, 1)
+    dated.write_text(
+        dated.read_text().replace(
+            "tags:", "wait: 2026-05-01\nassigned_at: 2026-04-02T08:30:00+02:00\ntags:"
+        )
+    )
+    odd = _write(tasks_dir, 2)
+    odd.write_text(odd.read_text().replace("tags:", "scores: {1: low, 2: high}\ntags:"))
+    for path in (dated, odd):
+        os.utime(path, (time.time() - 60, time.time() - 60))
+
+    cold = _by_name(load_tasks(tasks_dir))
+    assert _by_name(load_tasks(tasks_dir)) == cold == _load_without_index(tasks_dir)
+    assert cold["task-00001"].wait == date(2026, 5, 1)
+    # Integer keys would come back as strings from JSON, so that task is not indexed
+    assert len(TaskIndex(get_task_index_path(tasks_dir))) == 1
+
+
+def test_index_can_be_disabled(tasks_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(task_index.TASK_INDEX_ENV, "0")
+    load_tasks(tasks_dir)
+    assert not get_task_index_path(tasks_dir).exists()
+
+
+def test_single_file_and_missing_dir_skip_index(tmp_path: Path) -> None:
+    tasks_dir = tmp_path / "tasks"
+    assert load_tasks(tasks_dir) == []
+    tasks_dir.mkdir()
+    path = _write(tasks_dir, 1)
+    assert [t.name for t in load_tasks(tasks_dir, single_file=path)] == ["task-00001"]
+    assert not get_task_index_path(tasks_dir).exists()
+
+
+@pytest.mark.slow
+def test_benchmark_load_tasks_5000(tmp_path: Path) -> None:
+    """Cold vs warm load_tasks over 5,000 generated task files.
+
+    Run with ``pytest -m slow -s`` to see the timings.
+    """
+    tasks_dir = tmp_path / "tasks"
+    tasks_dir.mkdir()
+    for n in range(5000):
+        _write(tasks_dir, n, state=["todo", "active", "backlog", "done"][n % 4])
+
+    start = time.perf_counter()
+    cold = load_tasks(tasks_dir)
+    cold_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    warm = load_tasks(tasks_dir)
+    warm_s = time.perf_counter() - start
+
+    print(f"\n5000 tasks: cold {cold_s * 1000:.0f}ms, warm {warm_s * 1000:.0f}ms")
+    assert _by_name(warm) == _by_name(cold)
+    assert warm_s < cold_s / 3
@@ -0,0 +1,89 @@
+"""
+Multi-pattern keyword matching for the attention router.
+
+Compiles every registered keyword into a single Aho-Corasick automaton so a
+turn is matched in one pass over the message, independent of how many files
+and keywords are registered. Semantics are identical to checking
+``kw.lower() in message.lower()`` for each keyword: matching is
+case-insensitive substring matching, and overlapping keywords (e.g. "git"
+inside "github") all match.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Mapping
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton mapping keywords to the paths they activate."""
+
+    def __init__(self, keywords: Mapping[str, list[str]]):
+        """
+        Build the automaton.
+
+        Args:
+            keywords: Mapping of path -> keywords that activate it
+        """
+        # Node 0 is the root. Each node has goto edges, a failure link and
+        # the set of paths whose keywords end at (or are suffixes ending at) it.
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[set[str]] = [set()]
+        # Paths with an empty keyword match every message (like `"" in msg`)
+        self._always: set[str] = set()
+
+        for path, kws in keywords.items():
+            for kw in kws:
+                self._add(kw.lower(), path)
+        self._build_failure_links()
+
+    def _add(self, keyword: str, path: str) -> None:
+        if not keyword:
+            self._always.add(path)
+            return
+        node = 0
+        for ch in keyword:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(set())
+            node = nxt
+        self._out[node].add(path)
+
+    def _build_failure_links(self) -> None:
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                # Merge outputs so each node reports all keywords ending here
+                self._out[child] |= self._out[self._fail[child]]
+
+    def match(self, message: str) -> set[str]:
+        """
+        Return the set of paths with at least one keyword in the message.
+
+        Args:
+            message: Text to scan (matched case-insensitively)
+        """
+        matched = set(self._always)
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        node = 0
+        for ch in message.lower():
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                matched |= out[node]
+        return matched
@@ -11,6 +11,13 @@ Features:
 - Co-activation: Related files can boost each other's scores
 - Keywords: Files activate to HOT tier when keywords match
 - Cache-aware: Batches updates and flushes on cache invalidation
+
+Persistence:
+- Keywords are compiled into one Aho-Corasick matcher, rebuilt only when
+  registrations change, so matching a turn is a single pass over the message
+- State mutations are appended to a delta log next to the snapshot file and
+  replayed on load; the snapshot is rewritten (compacted) on flush or when
+  the log grows past COMPACT_THRESHOLD entries
 """
 
 from __future__ import annotations
@@ -25,6 +32,8 @@ from typing import TYPE_CHECKING
 from gptme.message import Message
 from gptme.tools.base import ToolSpec
 
+from ..keyword_matcher import KeywordMatcher
+
 if TYPE_CHECKING:
     from gptme.logmanager import LogManager
 
@@ -41,6 +50,9 @@ DEFAULT_BATCH_SIZE = 10  # Flush after N turns if no cache invalidation
 # State file location
 STATE_FILE = Path(".gptme/attention_state.json")
 
+# Compact the delta log into the snapshot after this many appended entries
+COMPACT_THRESHOLD = 200
+
 
 @dataclass
 class AttentionState:
@@ -55,6 +67,23 @@ class AttentionState:
     # Batched update tracking
     pending_turns: int = 0  # Turns since last flush
     pending_keyword_matches: list[str] = field(default_factory=list)  # Paths matched
+    # Delta log bookkeeping (log_seq is persisted, the rest is runtime-only)
+    log_seq: int = 0  # Sequence number of the last applied log entry
+    log_entries: int = field(default=0, compare=False)  # Entries since compaction
+    _matcher: KeywordMatcher | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def matcher(self) -> KeywordMatcher:
+        """Compiled keyword matcher, rebuilt lazily after keyword changes."""
+        if self._matcher is None:
+            self._matcher = KeywordMatcher(self.keywords)
+        return self._matcher
+
+    def invalidate_matcher(self) -> None:
+        """Drop the compiled matcher so it is rebuilt on next use."""
+        self._matcher = None
 
     def to_dict(self) -> dict:
         """Convert to serializable dict."""
@@ -67,6 +96,7 @@ class AttentionState:
             "turn_count": self.turn_count,
             "pending_turns": self.pending_turns,
             "pending_keyword_matches": self.pending_keyword_matches,
+            "log_seq": self.log_seq,
         }
 
     @classmethod
@@ -81,6 +111,7 @@ class AttentionState:
             turn_count=data.get("turn_count", 0),
             pending_turns=data.get("pending_turns", 0),
             pending_keyword_matches=data.get("pending_keyword_matches", []),
+            log_seq=data.get("log_seq", 0),
         )
 
 
@@ -96,24 +127,105 @@ def _get_state() -> AttentionState:
     return _state
 
 
+def _log_file() -> Path:
+    """Delta log path, kept next to the snapshot file."""
+    return STATE_FILE.with_name(STATE_FILE.stem + ".log.jsonl")
+
+
 def _load_state() -> AttentionState:
-    """Load state from file or create new."""
+    """Load state from snapshot file and replay the delta log, or create new."""
+    state = AttentionState()
     if STATE_FILE.exists():
         try:
             with open(STATE_FILE) as f:
                 data = json.load(f)
-            return AttentionState.from_dict(data)
+            state = AttentionState.from_dict(data)
         except (json.JSONDecodeError, KeyError) as e:
             logger.warning(f"Failed to load attention state: {e}")
-    return AttentionState()
+
+    log_file = _log_file()
+    if log_file.exists():
+        with open(log_file) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    op = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn write from an interrupted append; skip it
+                    logger.warning("Skipping malformed attention log entry")
+                    continue
+                state.log_entries += 1
+                # Entries already folded into the snapshot are skipped, which
+                # keeps replay correct if we crashed mid-compaction
+                if op.get("seq", 0) <= state.log_seq:
+                    continue
+                _apply_op(state, op)
+                state.log_seq = op["seq"]
+    return state
+
+
+def _apply_op(state: AttentionState, op: dict) -> None:
+    """Apply a single delta-log operation to the state."""
+    kind = op["op"]
+    path = op.get("path", "")
+    if kind == "register":
+        state.scores[path] = op["initial_score"]
+        if op.get("keywords"):
+            state.keywords[path] = op["keywords"]
+            state.invalidate_matcher()
+        if op.get("coactivate_with"):
+            state.coactivation[path] = op["coactivate_with"]
+        if op.get("decay_rate") is not None:
+            state.decay_rates[path] = op["decay_rate"]
+        if op.get("pinned"):
+            state.pinned.add(path)
+    elif kind == "unregister":
+        state.scores.pop(path, None)
+        if state.keywords.pop(path, None) is not None:
+            state.invalidate_matcher()
+        state.coactivation.pop(path, None)
+        state.decay_rates.pop(path, None)
+        state.pinned.discard(path)
+    elif kind == "set_score":
+        state.scores[path] = op["score"]
+    elif kind == "turn":
+        state.turn_count += 1
+        state.pending_turns += 1
+        state.pending_keyword_matches.extend(op["matches"])
+    else:
+        logger.warning(f"Unknown attention log operation: {kind}")
+
+
+def _record(op: dict) -> None:
+    """Apply an operation to the in-memory state and append it to the delta log."""
+    state = _get_state()
+    _apply_op(state, op)
+    state.log_seq += 1
+    state.log_entries += 1
+    op["seq"] = state.log_seq
+
+    log_file = _log_file()
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(log_file, "a") as f:
+        f.write(json.dumps(op) + "\n")
+
+    if state.log_entries >= COMPACT_THRESHOLD:
+        _save_state()
 
 
 def _save_state() -> None:
-    """Persist state to file."""
+    """Write a full snapshot and truncate the delta log (compaction)."""
     state = _get_state()
     STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(STATE_FILE, "w") as f:
+    tmp_file = STATE_FILE.with_name(STATE_FILE.name + ".tmp")
+    with open(tmp_file, "w") as f:
         json.dump(state.to_dict(), f, indent=2)
+    tmp_file.replace(STATE_FILE)
+    # Snapshot now covers every logged entry (via log_seq), so the log can go
+    _log_file().unlink(missing_ok=True)
+    state.log_entries = 0
 
 
 def register_file(
@@ -146,17 +258,17 @@ def register_file(
             pinned=True
         )
     """
-    state = _get_state()
-    state.scores[path] = initial_score
-    if keywords:
-        state.keywords[path] = keywords
-    if coactivate_with:
-        state.coactivation[path] = coactivate_with
-    if decay_rate is not None:
-        state.decay_rates[path] = decay_rate
-    if pinned:
-        state.pinned.add(path)
-    _save_state()
+    _record(
+        {
+            "op": "register",
+            "path": path,
+            "keywords": keywords,
+            "coactivate_with": coactivate_with,
+            "decay_rate": decay_rate,
+            "pinned": pinned,
+            "initial_score": initial_score,
+        }
+    )
     return f"Registered '{path}' with score {initial_score}, keywords={keywords}, pinned={pinned}"
 
 
@@ -170,19 +282,8 @@ def unregister_file(path: str) -> str:
     Returns:
         Status message
     """
-    state = _get_state()
-    removed = False
-    if path in state.scores:
-        del state.scores[path]
-        removed = True
-    if path in state.keywords:
-        del state.keywords[path]
-    if path in state.coactivation:
-        del state.coactivation[path]
-    if path in state.decay_rates:
-        del state.decay_rates[path]
-    state.pinned.discard(path)
-    _save_state()
+    removed = path in _get_state().scores
+    _record({"op": "unregister", "path": path})
     return f"Removed '{path}' from tracking" if removed else f"'{path}' was not tracked"
 
 
@@ -274,17 +375,10 @@ def process_turn(message: str, apply_now: bool = False) -> dict:
         # Files with "git" or "commit" keywords will be queued for activation
     """
     state = _get_state()
-    state.turn_count += 1
-    state.pending_turns += 1
-
-    message_lower = message.lower()
 
     # Track keyword matches (don't apply yet)
-    for path, keywords in state.keywords.items():
-        if any(kw.lower() in message_lower for kw in keywords):
-            state.pending_keyword_matches.append(path)
-
-    _save_state()
+    matches = sorted(state.matcher.match(message))
+    _record({"op": "turn", "matches": matches})
 
     # Check if we should flush
     should_flush = apply_now
@@ -398,8 +492,7 @@ def set_score(path: str, score: float) -> str:
         return f"Error: '{path}' is not tracked. Use register_file first."
 
     old_score = state.scores[path]
-    state.scores[path] = score
-    _save_state()
+    _record({"op": "set_score", "path": path, "score": score})
     return f"Set '{path}' score: {old_score:.3f} → {score:.3f}"
 
 
@@ -500,7 +593,9 @@ def reset_state() -> str:
         Status message
     """
     global _state
-    _state = AttentionState()
+    # Keep the sequence number, so entries still in the delta log are skipped
+    # on replay even if we crash before _save_state() removes the log
+    _state = AttentionState(log_seq=_get_state().log_seq)
     _save_state()
     return "Attention state reset"
 
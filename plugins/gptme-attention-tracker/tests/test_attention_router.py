@@ -286,6 +286,25 @@ def test_reset_state(temp_state_file, reset_state):
     assert status["total_tracked"] == 0
 
 
+def test_reset_state_survives_crash_before_log_removal(temp_state_file, reset_state):
+    """Test that a reset is not undone by replaying a log left behind by a crash."""
+    from gptme_attention_tracker.tools import attention_router
+    from gptme_attention_tracker.tools.attention_router import (
+        get_status,
+        register_file,
+    )
+
+    register_file("test/file.md")
+    log_content = attention_router._log_file().read_text()
+
+    # Simulate a crash after the reset snapshot was written but before the log was removed
+    attention_router.reset_state()
+    attention_router._log_file().write_text(log_content)
+    attention_router._state = None
+
+    assert get_status()["total_tracked"] == 0
+
+
 def test_get_status_includes_pending(temp_state_file, reset_state):
     """Test that status includes pending update info."""
     from gptme_attention_tracker.tools.attention_router import (
@@ -313,3 +332,115 @@ def test_tool_spec_exists():
     assert (
         len(tool.functions) == 11
     )  # All functions registered (added flush_pending_updates)
+
+
+def test_keyword_matcher_matches_substring_semantics():
+    """Test that the compiled matcher agrees with per-keyword substring checks."""
+    from gptme_attention_tracker.keyword_matcher import KeywordMatcher
+
+    keywords = {
+        "a.md": ["git", "Commit"],
+        "b.md": ["github"],
+        "c.md": ["hub", "pull request"],
+        "d.md": ["rebase"],
+    }
+    matcher = KeywordMatcher(keywords)
+
+    for message in [
+        "Open a GitHub pull request",
+        "commit and push",
+        "nothing relevant here",
+        "",
+        "rebasegit",
+    ]:
+        expected = {
+            path
+            for path, kws in keywords.items()
+            if any(kw.lower() in message.lower() for kw in kws)
+        }
+        assert matcher.match(message) == expected
+
+
+def test_process_turn_appends_to_log(temp_state_file, reset_state):
+    """Test that turns append to the delta log instead of rewriting the snapshot."""
+    from gptme_attention_tracker.tools import attention_router
+    from gptme_attention_tracker.tools.attention_router import (
+        process_turn,
+        register_file,
+    )
+
+    register_file("test/file.md", keywords=["hello"])
+    attention_router._save_state()
+    snapshot = temp_state_file.read_text()
+
+    process_turn("hello world")
+    process_turn("unrelated")
+
+    assert temp_state_file.read_text() == snapshot
+    log_lines = attention_router._log_file().read_text().splitlines()
+    assert len(log_lines) == 2
+
+
+def test_state_replayed_from_log(temp_state_file, reset_state):
+    """Test that reloading state replays the delta log on top of the snapshot."""
+    from gptme_attention_tracker.tools import attention_router
+    from gptme_attention_tracker.tools.attention_router import (
+        get_score,
+        get_status,
+        process_turn,
+        register_file,
+        set_score,
+    )
+
+    register_file("test/file.md", keywords=["hello"])
+    register_file("test/other.md")
+    set_score("test/other.md", 0.3)
+    process_turn("hello world")
+
+    attention_router._state = None
+
+    status = get_status()
+    assert status["total_tracked"] == 2
+    assert status["pending_turns"] == 1
+    assert status["pending_matches"] == ["test/file.md"]
+    assert get_score("test/other.md") == 0.3
+
+
+def test_log_compaction(temp_state_file, reset_state):
+    """Test that the log is compacted into the snapshot past the threshold."""
+    from gptme_attention_tracker.tools import attention_router
+    from gptme_attention_tracker.tools.attention_router import (
+        get_status,
+        register_file,
+    )
+
+    with patch.object(attention_router, "COMPACT_THRESHOLD", 3):
+        register_file("a.md")
+        register_file("b.md")
+        assert attention_router._log_file().exists()
+        register_file("c.md")
+
+    assert not attention_router._log_file().exists()
+    attention_router._state = None
+    assert get_status()["total_tracked"] == 3
+
+
+def test_replay_skips_compacted_entries(temp_state_file, reset_state):
+    """Test that entries already in the snapshot are not applied twice."""
+    from gptme_attention_tracker.tools import attention_router
+    from gptme_attention_tracker.tools.attention_router import (
+        get_status,
+        process_turn,
+        register_file,
+    )
+
+    register_file("test/file.md", keywords=["hello"])
+    process_turn("hello")
+    log_content = attention_router._log_file().read_text()
+
+    # Simulate a crash after the snapshot was written but before the log was removed
+    attention_router._save_state()
+    attention_router._log_file().write_text(log_content)
+    attention_router._state = None
+
+    assert get_status()["pending_turns"] == 1